@@ -5,10 +5,14 @@ Handles assembly creation and component management.
 """
 
 from ._base import AssemblyManagerBase
+from ._batch_placement import BatchPlacementMixin
 from ._features import AssemblyFeaturesMixin
+from ._loading import OccurrenceLoadingMixin
+from ._path_members import PathMembersMixin
 from ._placement import PlacementMixin
 from ._properties import PropertiesMixin
 from ._query import QueryMixin
+from ._relation_graph import RelationGraphMixin
 from ._relations import RelationsMixin
 from ._specialized import SpecializedMixin
 from ._transforms import TransformsMixin
@@ -16,12 +20,16 @@ from ._transforms import TransformsMixin
 
 class AssemblyManager(
     PlacementMixin,
+    BatchPlacementMixin,
     QueryMixin,
+    OccurrenceLoadingMixin,
     TransformsMixin,
     PropertiesMixin,
     RelationsMixin,
+    RelationGraphMixin,
     AssemblyFeaturesMixin,
     SpecializedMixin,
+    PathMembersMixin,
     AssemblyManagerBase,
 ):
     """Manages assembly operations"""
@@ -15,6 +15,8 @@ class AssemblyManagerBase:
     def __init__(self, document_manager: Any, sketch_manager: Any | None = None) -> None:
         self.doc_manager = document_manager
         self.sketch_manager = sketch_manager
+        # Occurrence names activated by geometry queries (see OccurrenceLoadingMixin)
+        self._activated_on_demand: set[str] = set()
 
     def _validate_occurrence_index(
         self, doc: Any, component_index: int
@@ -0,0 +1,348 @@
+"""Batch component placement with Python-side pattern generators.
+
+Transforms use Solid Edge's 16-element matrix layout: elements 0-2, 4-6 and
+8-10 hold the component's local X, Y and Z axes in assembly coordinates and
+elements 12-14 hold the origin (meters).
+"""
+
+import contextlib
+import math
+import os
+import traceback
+from typing import Any
+
+from ..logging import get_logger
+
+_logger = get_logger(__name__)
+
+_IDENTITY = [1.0, 0.0, 0.0, 0.0, 0.0, 1.0, 0.0, 0.0, 0.0, 0.0, 1.0, 0.0, 0.0, 0.0, 0.0, 1.0]
+
+# Upper bound on instances per call to keep a mistyped spec from running away
+_MAX_BATCH_INSTANCES = 10000
+
+_AXIS_VECTORS = {"X": (1.0, 0.0, 0.0), "Y": (0.0, 1.0, 0.0), "Z": (0.0, 0.0, 1.0)}
+
+Vec = tuple[float, float, float]
+
+
+def _vec(value: Any, default: Vec) -> Vec:
+    """Accept 'X'/'Y'/'Z' or a 3-element list as a vector."""
+    if value is None:
+        return default
+    if isinstance(value, str):
+        if value.upper() not in _AXIS_VECTORS:
+            raise ValueError(f"Unknown axis: {value}")
+        return _AXIS_VECTORS[value.upper()]
+    if len(value) != 3:
+        raise ValueError(f"Vector must have 3 elements, got {len(value)}")
+    return (float(value[0]), float(value[1]), float(value[2]))
+
+
+def _normalize(v: Vec) -> Vec:
+    length = math.sqrt(v[0] ** 2 + v[1] ** 2 + v[2] ** 2)
+    if length == 0:
+        raise ValueError("Direction vector must be non-zero")
+    return (v[0] / length, v[1] / length, v[2] / length)
+
+
+def _rotate(v: Vec, axis: Vec, angle: float) -> Vec:
+    """Rotate v about a unit axis by angle (radians) using Rodrigues' formula."""
+    c, s = math.cos(angle), math.sin(angle)
+    kx, ky, kz = axis
+    dot = kx * v[0] + ky * v[1] + kz * v[2]
+    cross = (ky * v[2] - kz * v[1], kz * v[0] - kx * v[2], kx * v[1] - ky * v[0])
+    return (
+        v[0] * c + cross[0] * s + kx * dot * (1 - c),
+        v[1] * c + cross[1] * s + ky * dot * (1 - c),
+        v[2] * c + cross[2] * s + kz * dot * (1 - c),
+    )
+
+
+def _matrix_axes(matrix: list[float]) -> tuple[Vec, Vec, Vec, Vec]:
+    """Split a 16-element matrix into (x_axis, y_axis, z_axis, origin)."""
+    return (
+        (matrix[0], matrix[1], matrix[2]),
+        (matrix[4], matrix[5], matrix[6]),
+        (matrix[8], matrix[9], matrix[10]),
+        (matrix[12], matrix[13], matrix[14]),
+    )
+
+
+def _compose_matrix(x_axis: Vec, y_axis: Vec, z_axis: Vec, origin: Vec) -> list[float]:
+    return [*x_axis, 0.0, *y_axis, 0.0, *z_axis, 0.0, *origin, 1.0]
+
+
+def _euler_matrix(
+    x: float, y: float, z: float, rx: float = 0.0, ry: float = 0.0, rz: float = 0.0
+) -> list[float]:
+    """Build a matrix from a position and X-then-Y-then-Z rotations (degrees)."""
+    axes = [(1.0, 0.0, 0.0), (0.0, 1.0, 0.0), (0.0, 0.0, 1.0)]
+    for axis, deg in (((1.0, 0.0, 0.0), rx), ((0.0, 1.0, 0.0), ry), ((0.0, 0.0, 1.0), rz)):
+        if deg:
+            axes = [_rotate(a, axis, math.radians(deg)) for a in axes]
+    return _compose_matrix(axes[0], axes[1], axes[2], (x, y, z))
+
+
+def _to_matrix(transform: list[float]) -> list[float]:
+    """Normalize a transform entry to a 16-element matrix.
+
+    Accepts [x, y, z], [x, y, z, rx, ry, rz] (degrees) or a full 16-element matrix.
+    """
+    values = [float(v) for v in transform]
+    if len(values) == 16:
+        return values
+    if len(values) in (3, 6):
+        return _euler_matrix(*values)
+    raise ValueError(f"Transform must have 3, 6 or 16 elements, got {len(values)}")
+
+
+def _translate(matrix: list[float], offset: Vec) -> list[float]:
+    result = list(matrix)
+    result[12] += offset[0]
+    result[13] += offset[1]
+    result[14] += offset[2]
+    return result
+
+
+def _rotate_matrix(matrix: list[float], center: Vec, axis: Vec, angle: float) -> list[float]:
+    """Rotate a placement (orientation and origin) about an axis through center."""
+    x_axis, y_axis, z_axis, origin = _matrix_axes(matrix)
+    rel = (origin[0] - center[0], origin[1] - center[1], origin[2] - center[2])
+    r = _rotate(rel, axis, angle)
+    return _compose_matrix(
+        _rotate(x_axis, axis, angle),
+        _rotate(y_axis, axis, angle),
+        _rotate(z_axis, axis, angle),
+        (center[0] + r[0], center[1] + r[1], center[2] + r[2]),
+    )
+
+
+def _align_x_to(matrix: list[float], direction: Vec) -> list[float]:
+    """Apply the minimal rotation taking the local X axis onto direction."""
+    x_axis, _, _, origin = _matrix_axes(matrix)
+    x_axis = _normalize(x_axis)
+    d = _normalize(direction)
+    cross = (
+        x_axis[1] * d[2] - x_axis[2] * d[1],
+        x_axis[2] * d[0] - x_axis[0] * d[2],
+        x_axis[0] * d[1] - x_axis[1] * d[0],
+    )
+    sin_a = math.sqrt(cross[0] ** 2 + cross[1] ** 2 + cross[2] ** 2)
+    cos_a = x_axis[0] * d[0] + x_axis[1] * d[1] + x_axis[2] * d[2]
+    if sin_a < 1e-12:
+        if cos_a > 0:
+            return list(matrix)
+        # Opposite direction: turn half way round the local Z axis
+        _, _, z_axis, _ = _matrix_axes(matrix)
+        return _rotate_matrix(matrix, origin, _normalize(z_axis), math.pi)
+    return _rotate_matrix(matrix, origin, _normalize(cross), math.atan2(sin_a, cos_a))
+
+
+def _generate_pattern(spec: dict[str, Any], base: list[float]) -> list[list[float]]:
+    """Expand a pattern spec into placement matrices.
+
+    Spec keys by type:
+        linear: count, spacing, direction ('X'/'Y'/'Z' or [dx, dy, dz])
+        rectangular: count_1, count_2, spacing_1, spacing_2, direction_1, direction_2
+        circular: count, center [x, y, z], axis, total_angle (degrees, default 360)
+        along_curve: points [[x, y, z], ...], count, align (bool, default False)
+
+    For along_curve the points give absolute positions and the base supplies
+    only the orientation (optionally turned so local X follows the curve).
+    """
+    pattern_type = str(spec.get("type", "linear")).lower()
+
+    if pattern_type == "rectangular":
+        requested = int(spec.get("count_1", 1)) * int(spec.get("count_2", 1))
+    else:
+        requested = int(spec.get("count", 1))
+    if requested > _MAX_BATCH_INSTANCES:
+        raise ValueError(f"Too many instances: {requested}. Maximum: {_MAX_BATCH_INSTANCES}")
+
+    if pattern_type == "linear":
+        count = int(spec.get("count", 1))
+        spacing = float(spec.get("spacing", 0.0))
+        d = _normalize(_vec(spec.get("direction"), (1.0, 0.0, 0.0)))
+        return [
+            _translate(base, (d[0] * spacing * i, d[1] * spacing * i, d[2] * spacing * i))
+            for i in range(count)
+        ]
+
+    if pattern_type == "rectangular":
+        count_1 = int(spec.get("count_1", 1))
+        count_2 = int(spec.get("count_2", 1))
+        s1 = float(spec.get("spacing_1", 0.0))
+        s2 = float(spec.get("spacing_2", 0.0))
+        d1 = _normalize(_vec(spec.get("direction_1"), (1.0, 0.0, 0.0)))
+        d2 = _normalize(_vec(spec.get("direction_2"), (0.0, 1.0, 0.0)))
+        return [
+            _translate(
+                base,
+                (
+                    d1[0] * s1 * i + d2[0] * s2 * j,
+                    d1[1] * s1 * i + d2[1] * s2 * j,
+                    d1[2] * s1 * i + d2[2] * s2 * j,
+                ),
+            )
+            for j in range(count_2)
+            for i in range(count_1)
+        ]
+
+    if pattern_type == "circular":
+        count = int(spec.get("count", 1))
+        center = _vec(spec.get("center"), (0.0, 0.0, 0.0))
+        axis = _normalize(_vec(spec.get("axis"), (0.0, 0.0, 1.0)))
+        total = float(spec.get("total_angle", 360.0))
+        # A full circle would put the last instance on top of the first
+        divisions = count if abs(total) >= 360.0 else max(count - 1, 1)
+        step = math.radians(total) / divisions
+        return [_rotate_matrix(base, center, axis, step * i) for i in range(count)]
+
+    if pattern_type == "along_curve":
+        points = [_vec(p, (0.0, 0.0, 0.0)) for p in spec.get("points") or []]
+        if len(points) < 2:
+            raise ValueError("along_curve requires at least 2 points")
+        count = int(spec.get("count", len(points)))
+        align = bool(spec.get("align", False))
+
+        seg_lengths = [math.dist(points[k], points[k + 1]) for k in range(len(points) - 1)]
+        total_length = sum(seg_lengths)
+        if total_length == 0:
+            raise ValueError("along_curve points must not all coincide")
+
+        matrices = []
+        seg, seg_start = 0, 0.0
+        for i in range(count):
+            target = total_length * i / max(count - 1, 1)
+            while seg < len(seg_lengths) - 1 and seg_start + seg_lengths[seg] < target:
+                seg_start += seg_lengths[seg]
+                seg += 1
+            p0, p1 = points[seg], points[seg + 1]
+            t = (target - seg_start) / seg_lengths[seg] if seg_lengths[seg] else 0.0
+            placed = list(base)
+            placed[12:15] = [p0[k] + (p1[k] - p0[k]) * t for k in range(3)]
+            if align and seg_lengths[seg]:
+                tangent = (p1[0] - p0[0], p1[1] - p0[1], p1[2] - p0[2])
+                placed = _align_x_to(placed, tangent)
+            matrices.append(placed)
+        return matrices
+
+    raise ValueError(
+        f"Unknown pattern type: {pattern_type}. Valid: linear, rectangular, circular, along_curve"
+    )
+
+
+class BatchPlacementMixin:
+    """Mixin providing batch component placement."""
+
+    def place_components_batch(
+        self,
+        file_path: str,
+        transforms: list[list[float]] | None = None,
+        pattern: dict[str, Any] | None = None,
+        base_transform: list[float] | None = None,
+    ) -> dict[str, Any]:
+        """
+        Place many instances of one file in a single pass.
+
+        Instances come from an explicit transform list and/or a pattern spec
+        expanded in Python (see _generate_pattern). The source document is held
+        open for the duration so repeated inserts reuse the loaded part, and
+        screen updating is suspended while placing.
+
+        Args:
+            file_path: Path to the part or assembly file
+            transforms: List of [x, y, z], [x, y, z, rx, ry, rz] (degrees)
+                or 16-element matrices
+            pattern: Pattern spec dict with 'type' of 'linear', 'rectangular',
+                'circular' or 'along_curve'
+            base_transform: Placement of the first pattern instance
+                (same formats as transforms; default identity)
+
+        Returns:
+            Dict with placed occurrences and per-instance errors
+        """
+        try:
+            _logger.info(f"Batch placing components: {file_path}")
+            if not os.path.exists(file_path):
+                return {"error": f"File not found: {file_path}"}
+
+            try:
+                matrices = [_to_matrix(t) for t in transforms or []]
+                if pattern:
+                    base = _to_matrix(base_transform) if base_transform else list(_IDENTITY)
+                    matrices.extend(_generate_pattern(pattern, base))
+            except (ValueError, TypeError) as e:
+                return {"error": f"Invalid placement spec: {e}"}
+
+            if not matrices:
+                return {"error": "No transforms or pattern given"}
+            if len(matrices) > _MAX_BATCH_INSTANCES:
+                return {
+                    "error": f"Too many instances: {len(matrices)}. Maximum: {_MAX_BATCH_INSTANCES}"
+                }
+
+            doc = self.doc_manager.get_active_document()
+
+            if not hasattr(doc, "Occurrences"):
+                return {"error": "Active document is not an assembly"}
+
+            app = self.doc_manager.connection.get_application()
+            occurrences = doc.Occurrences
+            first_index = occurrences.Count
+
+            held_doc = self._hold_source_document(app, file_path)
+
+            placed: list[dict[str, Any]] = []
+            errors: list[dict[str, Any]] = []
+            with self.doc_manager.connection.performance_scope():
+                try:
+                    for i, matrix in enumerate(matrices):
+                        try:
+                            occ = occurrences.AddWithMatrix(file_path, matrix)
+                            placed.append(
+                                {
+                                    "instance": i,
+                                    "name": occ.Name if hasattr(occ, "Name") else f"instance_{i}",
+                                    "position": matrix[12:15],
+                                }
+                            )
+                        except Exception as e:
+                            errors.append({"instance": i, "error": str(e)})
+                finally:
+                    if held_doc is not None:
+                        with contextlib.suppress(Exception):
+                            held_doc.Close()
+
+            result: dict[str, Any] = {
+                "status": "placed" if not errors else "partial",
+                "file_path": file_path,
+                "requested": len(matrices),
+                "placed_count": len(placed),
+                "first_index": first_index,
+                "placed": placed,
+            }
+            if errors:
+                result["errors"] = errors
+            return result
+        except Exception as e:
+            _logger.error(f"Failed to batch place components: {e}")
+            return {"error": str(e), "traceback": traceback.format_exc()}
+
+    def _hold_source_document(self, app: Any, file_path: str) -> Any:
+        """Open the source file in the background unless it is already open.
+
+        Returns the document to close afterwards, or None if nothing was opened.
+        """
+        target = os.path.normcase(os.path.abspath(file_path))
+        try:
+            docs = app.Documents
+            for i in range(1, docs.Count + 1):
+                with contextlib.suppress(Exception):
+                    full_name = docs.Item(i).FullName
+                    if full_name and os.path.normcase(os.path.abspath(full_name)) == target:
+                        return None
+            return docs.Open(file_path, 0x8)
+        except Exception as e:
+            _logger.debug(f"Could not hold source document open: {e}")
+            return None
@@ -61,11 +61,12 @@ class AssemblyFeaturesMixin:
             dir_idx = dir_map.get(direction, 12)
 
             placed = []
-            for i in range(1, count):
-                matrix = list(base_matrix)
-                matrix[dir_idx] = base_matrix[dir_idx] + (spacing * i)
-                occ = occurrences.AddWithMatrix(file_path, matrix)
-                placed.append(occ.Name if hasattr(occ, "Name") else f"copy_{i}")
+            with self.doc_manager.connection.performance_scope():
+                for i in range(1, count):
+                    matrix = list(base_matrix)
+                    matrix[dir_idx] = base_matrix[dir_idx] + (spacing * i)
+                    occ = occurrences.AddWithMatrix(file_path, matrix)
+                    placed.append(occ.Name if hasattr(occ, "Name") else f"copy_{i}")
 
             return {
                 "status": "pattern_created",
@@ -0,0 +1,165 @@
+"""Assembly on-demand occurrence loading for lightweight-opened assemblies."""
+
+import contextlib
+import traceback
+from typing import Any
+
+from ..logging import get_logger
+
+_logger = get_logger(__name__)
+
+
+def ensure_occurrences_loaded(occurrences: list[Any]) -> list[str]:
+    """Activate any inactive occurrences in the list.
+
+    Returns the names of occurrences that had to be activated. Failures
+    are logged and left to the subsequent geometry call to report. Used
+    directly by the query and export managers; the assembly manager goes
+    through OccurrenceLoadingMixin so it can report what it activated.
+    """
+    activated: list[str] = []
+    for occurrence in occurrences:
+        is_active = True
+        with contextlib.suppress(Exception):
+            is_active = bool(occurrence.Activate)
+        if is_active:
+            continue
+        try:
+            occurrence.Activate = True
+        except Exception as e:
+            _logger.warning(f"Could not activate occurrence: {e}")
+            continue
+        name = ""
+        with contextlib.suppress(Exception):
+            name = occurrence.Name
+        activated.append(name)
+    if activated:
+        _logger.info(f"Activated {len(activated)} occurrence(s) on demand")
+    return activated
+
+
+class OccurrenceLoadingMixin:
+    """Mixin tracking occurrence activation for lightweight assemblies.
+
+    Assemblies opened via DocumentManager.open_assembly_lightweight come up
+    with inactive occurrences, which keeps BOM/transform/relation queries
+    cheap. Geometry queries call _ensure_occurrences_loaded() so only the
+    occurrences they touch are activated.
+    """
+
+    def _ensure_occurrences_loaded(self, occurrences: list[Any]) -> list[str]:
+        """Activate any inactive occurrences in the list (see
+        ensure_occurrences_loaded) and remember them as activated on demand."""
+        activated = ensure_occurrences_loaded(occurrences)
+        self._activated_on_demand.update(activated)
+        return activated
+
+    def get_occurrence_load_state(self) -> dict[str, Any]:
+        """
+        Report activation/simplification state of each top-level occurrence.
+
+        Reads only occurrence-level properties, so it never forces geometry
+        to load.
+
+        Returns:
+            Dict with per-occurrence state and active/inactive counts
+        """
+        try:
+            doc = self.doc_manager.get_active_document()
+
+            if not hasattr(doc, "Occurrences"):
+                return {"error": "Active document is not an assembly"}
+
+            occurrences = doc.Occurrences
+            items = []
+            active_count = 0
+            for i in range(1, occurrences.Count + 1):
+                occ = occurrences.Item(i)
+                item: dict[str, Any] = {"index": i - 1}
+
+                with contextlib.suppress(Exception):
+                    item["name"] = occ.Name
+                with contextlib.suppress(Exception):
+                    item["active"] = bool(occ.Activate)
+                with contextlib.suppress(Exception):
+                    item["simplified"] = bool(occ.UseSimplified)
+                with contextlib.suppress(Exception):
+                    item["is_subassembly"] = bool(occ.Subassembly)
+
+                if item.get("active", True):
+                    active_count += 1
+                if item.get("name") in self._activated_on_demand:
+                    item["activated_on_demand"] = True
+                items.append(item)
+
+            return {
+                "count": len(items),
+                "active_count": active_count,
+                "inactive_count": len(items) - active_count,
+                "activated_on_demand": sorted(self._activated_on_demand),
+                "occurrences": items,
+            }
+        except Exception as e:
+            return {"error": str(e), "traceback": traceback.format_exc()}
+
+    def set_occurrence_activation(
+        self, component_indices: list[int] | None = None, active: bool = True
+    ) -> dict[str, Any]:
+        """
+        Activate or deactivate occurrences.
+
+        Deactivating unloads an occurrence's geometry to free memory once a
+        query no longer needs it.
+
+        Args:
+            component_indices: 0-based occurrence indices (None = all)
+            active: True to activate (load), False to deactivate (unload)
+
+        Returns:
+            Dict with changed indices and any per-index errors
+        """
+        try:
+            doc = self.doc_manager.get_active_document()
+
+            if not hasattr(doc, "Occurrences"):
+                return {"error": "Active document is not an assembly"}
+
+            occurrences = doc.Occurrences
+            count = occurrences.Count
+            indices = list(range(count)) if component_indices is None else component_indices
+
+            changed: list[int] = []
+            unchanged: list[int] = []
+            errors: list[dict[str, Any]] = []
+            for index in indices:
+                if index < 0 or index >= count:
+                    errors.append(
+                        {"index": index, "error": f"Invalid component index. Count: {count}"}
+                    )
+                    continue
+                occ = occurrences.Item(index + 1)
+                try:
+                    current = None
+                    with contextlib.suppress(Exception):
+                        current = bool(occ.Activate)
+                    if current is active:
+                        unchanged.append(index)
+                        continue
+                    occ.Activate = active
+                    changed.append(index)
+                    if not active:
+                        with contextlib.suppress(Exception):
+                            self._activated_on_demand.discard(occ.Name)
+                except Exception as e:
+                    errors.append({"index": index, "error": str(e)})
+
+            result: dict[str, Any] = {
+                "status": "activated" if active else "deactivated",
+                "changed": changed,
+                "unchanged": unchanged,
+            }
+            if errors:
+                result["errors"] = errors
+            return result
+        except Exception as e:
+            return {"error": str(e), "traceback": traceback.format_exc()}
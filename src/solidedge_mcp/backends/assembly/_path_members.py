@@ -0,0 +1,424 @@
+"""Batch structural frame, tube and wire generation from centerline path data.
+
+Centerlines arrive as segments, polylines, a node/edge graph or a CSV file.
+Endpoints closer than the tolerance are welded into shared nodes so members
+meet at joints (where Solid Edge applies frame end treatments), then every
+segment is drawn into a single 3D sketch and the members are created from
+those lines in one pass. Coordinates are in meters.
+"""
+
+import contextlib
+import csv
+import itertools
+import math
+import os
+import traceback
+from typing import Any
+
+from ..constants import AssemblyGlobalConstants
+from ..logging import get_logger
+
+_logger = get_logger(__name__)
+
+# Upper bound on segments per call to keep a malformed path file from running away
+_MAX_PATH_SEGMENTS = 20000
+
+_DEFAULT_SECTION = ""
+
+# end_treatment keys -> assembly global parameters applied while members are created
+_END_TREATMENT_GLOBALS = {
+    "miter_clearance": AssemblyGlobalConstants.seAssemblyGlobalMiterClearance,
+    "trim_extend_length": AssemblyGlobalConstants.seAssemblyGlobalTrimExtendLength,
+    "cope_clearance": AssemblyGlobalConstants.seAssemblyGlobalCopeClearance,
+    "notch_plate_length": AssemblyGlobalConstants.seAssemblyGlobalNotchPlateLength,
+}
+
+Point = tuple[float, float, float]
+# (start node, end node, section name)
+Edge = tuple[int, int, str]
+
+
+def _point(value: Any) -> Point:
+    """Convert a 3-element sequence to a point."""
+    coords = [float(c) for c in value]
+    if len(coords) != 3 or not all(math.isfinite(c) for c in coords):
+        raise ValueError(f"Expected a finite [x, y, z] point, got {value!r}")
+    return coords[0], coords[1], coords[2]
+
+
+def _collect_segments(
+    segments: list[Any] | None = None,
+    polylines: list[Any] | None = None,
+    nodes: dict[str, Any] | None = None,
+    edges: list[Any] | None = None,
+) -> list[tuple[Point, Point, str]]:
+    """Flatten the supported path inputs into (start, end, section) tuples.
+
+    segments: [[x1, y1, z1], [x2, y2, z2]] pairs or
+        {"start": [...], "end": [...], "section": "name"} dicts
+    polylines: point lists, or {"points": [...], "section": "name"} dicts;
+        consecutive points become segments
+    nodes/edges: {"id": [x, y, z]} plus [id_a, id_b] or
+        {"from": id_a, "to": id_b, "section": "name"} edges
+    """
+    out: list[tuple[Point, Point, str]] = []
+
+    for seg in segments or []:
+        if isinstance(seg, dict):
+            out.append((_point(seg["start"]), _point(seg["end"]), str(seg.get("section") or "")))
+        else:
+            start, end = seg
+            out.append((_point(start), _point(end), _DEFAULT_SECTION))
+
+    for line in polylines or []:
+        section = _DEFAULT_SECTION
+        points = line
+        if isinstance(line, dict):
+            points = line["points"]
+            section = str(line.get("section") or "")
+        pts = [_point(p) for p in points]
+        if len(pts) < 2:
+            raise ValueError("Polyline needs at least 2 points")
+        out.extend((a, b, section) for a, b in itertools.pairwise(pts))
+
+    if edges:
+        if not nodes:
+            raise ValueError("edges given without nodes")
+        node_points = {str(k): _point(v) for k, v in nodes.items()}
+        for edge in edges:
+            if isinstance(edge, dict):
+                a, b, section = edge["from"], edge["to"], str(edge.get("section") or "")
+            else:
+                a, b = edge
+                section = _DEFAULT_SECTION
+            try:
+                out.append((node_points[str(a)], node_points[str(b)], section))
+            except KeyError as e:
+                raise ValueError(f"Edge references unknown node {e}") from None
+
+    return out
+
+
+def _read_path_csv(csv_path: str) -> list[tuple[Point, Point, str]]:
+    """Read centerline segments from a CSV file with a header row.
+
+    Either one segment per row (x1,y1,z1,x2,y2,z2) or one point per row
+    (polyline,x,y,z) with rows of the same polyline id forming a chain.
+    An optional 'section' column picks the member profile per row.
+    """
+    with open(csv_path, newline="", encoding="utf-8-sig") as f:
+        rows = [
+            {(k or "").strip().lower(): (v or "").strip() for k, v in row.items()}
+            for row in csv.DictReader(f)
+        ]
+    if not rows:
+        return []
+
+    columns = set(rows[0])
+    if {"x1", "y1", "z1", "x2", "y2", "z2"} <= columns:
+        return [
+            (
+                _point((r["x1"], r["y1"], r["z1"])),
+                _point((r["x2"], r["y2"], r["z2"])),
+                r.get("section", ""),
+            )
+            for r in rows
+        ]
+    if {"polyline", "x", "y", "z"} <= columns:
+        chains: dict[str, list[tuple[Point, str]]] = {}
+        for r in rows:
+            chains.setdefault(r["polyline"], []).append(
+                (_point((r["x"], r["y"], r["z"])), r.get("section", ""))
+            )
+        out = []
+        for chain in chains.values():
+            for (a, _), (b, section) in itertools.pairwise(chain):
+                out.append((a, b, section))
+        return out
+    raise ValueError("CSV needs columns x1,y1,z1,x2,y2,z2 (segments) or polyline,x,y,z (points)")
+
+
+def _weld_segments(
+    raw: list[tuple[Point, Point, str]], tolerance: float
+) -> tuple[list[Point], list[Edge], int]:
+    """Merge endpoints within tolerance into shared nodes.
+
+    Uses a hash grid with cell size = tolerance and checks neighbouring
+    cells, so merging is O(n). Zero-length and duplicate segments (either
+    direction, same section) are dropped.
+
+    Returns:
+        (node points, edges as (a, b, section), number of dropped segments)
+    """
+    tol = max(tolerance, 1e-12)
+    grid: dict[tuple[int, int, int], list[int]] = {}
+    points: list[Point] = []
+
+    def node_for(p: Point) -> int:
+        cell = (math.floor(p[0] / tol), math.floor(p[1] / tol), math.floor(p[2] / tol))
+        for dx, dy, dz in itertools.product((-1, 0, 1), repeat=3):
+            for idx in grid.get((cell[0] + dx, cell[1] + dy, cell[2] + dz), ()):
+                if math.dist(points[idx], p) <= tol:
+                    return idx
+        points.append(p)
+        grid.setdefault(cell, []).append(len(points) - 1)
+        return len(points) - 1
+
+    edges: list[Edge] = []
+    seen: set[tuple[int, int, str]] = set()
+    dropped = 0
+    for start, end, section in raw:
+        a, b = node_for(start), node_for(end)
+        key = (min(a, b), max(a, b), section)
+        if a == b or key in seen:
+            dropped += 1
+            continue
+        seen.add(key)
+        edges.append((a, b, section))
+    return points, edges, dropped
+
+
+def _chains(edges: list[Edge]) -> list[list[tuple[int, bool]]]:
+    """Split the segment graph into unbranched chains.
+
+    Chains run between nodes whose degree is not 2 (ends and junctions);
+    closed loops become their own chain. Each chain item is
+    (edge index, forward) where forward means traversal runs a -> b.
+    """
+    adjacency: dict[int, list[int]] = {}
+    for i, (a, b, _) in enumerate(edges):
+        adjacency.setdefault(a, []).append(i)
+        adjacency.setdefault(b, []).append(i)
+
+    used = [False] * len(edges)
+    chains: list[list[tuple[int, bool]]] = []
+
+    def walk(node: int, edge: int) -> list[tuple[int, bool]]:
+        chain = []
+        while True:
+            used[edge] = True
+            a, b, _ = edges[edge]
+            forward = a == node
+            chain.append((edge, forward))
+            node = b if forward else a
+            if len(adjacency[node]) != 2:
+                return chain
+            nxt = next((e for e in adjacency[node] if not used[e]), None)
+            if nxt is None:
+                return chain
+            edge = nxt
+
+    for node in sorted(adjacency):
+        if len(adjacency[node]) == 2:
+            continue
+        for edge in adjacency[node]:
+            if not used[edge]:
+                chains.append(walk(node, edge))
+
+    # Remaining edges form closed loops
+    for i, (a, _, _) in enumerate(edges):
+        if not used[i]:
+            chains.append(walk(a, i))
+    return chains
+
+
+class PathMembersMixin:
+    """Mixin providing batch frame/tube/wire generation from path data."""
+
+    def generate_path_members(
+        self,
+        kind: str = "frame",
+        part_filename: str = "",
+        segments: list[Any] | None = None,
+        polylines: list[Any] | None = None,
+        nodes: dict[str, Any] | None = None,
+        edges: list[Any] | None = None,
+        csv_path: str = "",
+        sections: dict[str, str] | None = None,
+        end_treatment: dict[str, float] | None = None,
+        tube_options: dict[str, Any] | None = None,
+        tolerance: float = 1e-6,
+        description: str = "",
+    ) -> dict[str, Any]:
+        """
+        Generate structural frames, tubes or wires from centerline data.
+
+        All centerlines are drawn into one new 3D sketch. Frames are created
+        with one StructuralFrames.Add call per section (so Solid Edge can
+        treat the joints between members), tubes and wires with one
+        AddTube / Wires.Add call per unbranched chain.
+
+        Args:
+            kind: 'frame', 'tube', or 'wire'
+            part_filename: Default profile (frame) or tube part file
+            segments: Segment list (see _collect_segments)
+            polylines: Polyline list (see _collect_segments)
+            nodes: Node id -> [x, y, z] for graph input
+            edges: Node id pairs for graph input
+            csv_path: CSV of segments or polyline points (see _read_path_csv)
+            sections: Section name -> part file for per-member profiles
+            end_treatment: Frame joint defaults, any of miter_clearance,
+                trim_extend_length, cope_clearance, notch_plate_length (meters)
+            tube_options: Tube settings: outer_diameter, wall_thickness,
+                bend_radius (meters), is_solid
+            tolerance: Endpoint welding distance in meters
+            description: Wire description
+
+        Returns:
+            Dict with created members, sketch/segment counts and errors
+        """
+        if kind not in ("frame", "tube", "wire"):
+            return {"error": f"Invalid kind: {kind}. Valid: frame, tube, wire"}
+
+        try:
+            try:
+                raw = _read_path_csv(csv_path) if csv_path else []
+                raw.extend(_collect_segments(segments, polylines, nodes, edges))
+            except FileNotFoundError:
+                return {"error": f"File not found: {csv_path}"}
+            except (ValueError, TypeError, KeyError) as e:
+                return {"error": f"Invalid path data: {e}"}
+
+            if not raw:
+                return {"error": "No path segments given"}
+            if len(raw) > _MAX_PATH_SEGMENTS:
+                return {"error": f"Too many segments: {len(raw)}. Maximum: {_MAX_PATH_SEGMENTS}"}
+
+            points, welded, dropped = _weld_segments(raw, tolerance)
+            if not welded:
+                return {"error": "All path segments are zero-length or duplicates"}
+
+            part_files: dict[str, str] = {}
+            if kind != "wire":
+                for section in {s for _, _, s in welded}:
+                    path = (sections or {}).get(section) if section else part_filename
+                    if not path:
+                        return {"error": f"No part file for section: {section or '(default)'}"}
+                    if not os.path.exists(path):
+                        return {"error": f"File not found: {path}"}
+                    part_files[section] = path
+
+            _logger.info(
+                f"Generating {kind} members from {len(welded)} segments ({len(points)} nodes)"
+            )
+
+            doc = self.doc_manager.get_active_document()
+
+            if not hasattr(doc, "Occurrences"):
+                return {"error": "Active document is not an assembly"}
+
+            app = self.doc_manager.connection.get_application()
+
+            import pythoncom
+            from win32com.client import VARIANT
+
+            saved_globals: list[tuple[int, Any]] = []
+            members: list[dict[str, Any]] = []
+            errors: list[dict[str, Any]] = []
+            with self.doc_manager.connection.performance_scope():
+                try:
+                    if kind == "frame":
+                        for key, value in (end_treatment or {}).items():
+                            param = _END_TREATMENT_GLOBALS.get(key)
+                            if param is None:
+                                errors.append({"end_treatment": key, "error": "Unknown setting"})
+                                continue
+                            try:
+                                previous = app.GetGlobalParameter(param)
+                                app.SetGlobalParameter(param, float(value))
+                                saved_globals.append((param, previous))
+                            except Exception as e:
+                                errors.append({"end_treatment": key, "error": str(e)})
+
+                    sketch = doc.Sketches3D.Add()
+                    lines3d = sketch.Lines3D
+                    lines: list[Any] = []
+                    for i, (a, b, _) in enumerate(welded):
+                        try:
+                            lines.append(lines3d.Add(*points[a], *points[b]))
+                        except Exception as e:
+                            lines.append(None)
+                            errors.append({"segment": i, "error": str(e)})
+
+                    def dispatch_array(items: list[Any]) -> Any:
+                        return VARIANT(pythoncom.VT_ARRAY | pythoncom.VT_DISPATCH, items)
+
+                    if kind == "frame":
+                        by_section: dict[str, list[int]] = {}
+                        for i, (_, _, section) in enumerate(welded):
+                            if lines[i] is not None:
+                                by_section.setdefault(section, []).append(i)
+                        for section, seg_ids in sorted(by_section.items()):
+                            try:
+                                paths = [lines[i] for i in seg_ids]
+                                frame = doc.StructuralFrames.Add(
+                                    part_files[section], len(paths), dispatch_array(paths)
+                                )
+                                member: dict[str, Any] = {
+                                    "section": section or None,
+                                    "part_filename": part_files[section],
+                                    "segments": seg_ids,
+                                }
+                                with contextlib.suppress(Exception):
+                                    member["name"] = frame.Name
+                                members.append(member)
+                            except Exception as e:
+                                errors.append({"section": section or None, "error": str(e)})
+                    else:
+                        opts = tube_options or {}
+                        for chain_no, chain in enumerate(_chains(welded)):
+                            seg_ids = [i for i, _ in chain]
+                            if any(lines[i] is None for i in seg_ids):
+                                errors.append({"chain": chain_no, "error": "Path segment missing"})
+                                continue
+                            paths = [lines[i] for i in seg_ids]
+                            try:
+                                if kind == "tube":
+                                    section = welded[seg_ids[0]][2]
+                                    created = doc.Occurrences.AddTube(
+                                        dispatch_array(paths),
+                                        part_files[section],
+                                        None,  # TemplateFileName
+                                        bool(opts.get("is_solid", False)),
+                                        None,  # Material
+                                        opts.get("bend_radius") or None,
+                                        opts.get("outer_diameter") or None,
+                                        None,  # MinimumFlatLength
+                                        opts.get("wall_thickness") or None,
+                                    )
+                                else:
+                                    directions = [forward for _, forward in chain]
+                                    created = doc.Wires.Add(
+                                        len(paths),
+                                        dispatch_array(paths),
+                                        VARIANT(pythoncom.VT_ARRAY | pythoncom.VT_BOOL, directions),
+                                        description,
+                                    )
+                                member = {"chain": chain_no, "segments": seg_ids}
+                                with contextlib.suppress(Exception):
+                                    member["name"] = created.Name
+                                members.append(member)
+                            except Exception as e:
+                                errors.append({"chain": chain_no, "error": str(e)})
+                finally:
+                    for param, previous in reversed(saved_globals):
+                        with contextlib.suppress(Exception):
+                            app.SetGlobalParameter(param, previous)
+
+            result: dict[str, Any] = {
+                "status": "created" if not errors else "partial",
+                "kind": kind,
+                "segments": len(welded),
+                "nodes": len(points),
+                "dropped_segments": dropped,
+                "member_count": len(members),
+                "members": members,
+            }
+            with contextlib.suppress(Exception):
+                result["sketch"] = sketch.Name
+            if errors:
+                result["errors"] = errors
+            return result
+        except Exception as e:
+            _logger.error(f"Failed to generate {kind} members: {e}")
+            return {"error": str(e), "traceback": traceback.format_exc()}
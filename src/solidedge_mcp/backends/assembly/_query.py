@@ -214,6 +214,7 @@ class QueryMixin:
                 }
 
             occurrence = occurrences.Item(component_index + 1)
+            self._ensure_occurrences_loaded([occurrence])
 
             # GetRangeBox returns two arrays via out params
             import array
@@ -527,6 +528,8 @@ class QueryMixin:
             if err:
                 return err
 
+            self._ensure_occurrences_loaded([occurrence])
+
             bodies_info = []
             try:
                 bodies = occurrence.Bodies
@@ -723,6 +726,11 @@ class QueryMixin:
             else:
                 set1 = [occurrences.Item(i) for i in range(1, occurrences.Count + 1)]
 
+            # Interference is evaluated against every other occurrence
+            self._ensure_occurrences_loaded(
+                [occurrences.Item(i) for i in range(1, occurrences.Count + 1)]
+            )
+
             # Call CheckInterference
             # seInterferenceComparisonSet1vsAllOther = 1
             comparison_method = 1
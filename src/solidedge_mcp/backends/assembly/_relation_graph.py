@@ -0,0 +1,606 @@
+"""Assembly relation graph capture and solver-cost diagnostics.
+
+Captures occurrences (nodes) and Relations3d entries (typed edges) in a single
+COM pass, then answers degree-of-freedom, redundancy and rigid-group queries
+in pure Python so no further COM round-trips are needed.
+"""
+
+import contextlib
+import traceback
+from collections import deque
+from typing import Any
+
+from ..constants import AssemblyRelationConstants
+from ..logging import get_logger
+
+_logger = get_logger(__name__)
+
+# Relation type names keyed by the small Type values reported by Relations3d
+# and by the large COM type identifiers from the type library.
+_RELATION_TYPE_NAMES = {
+    0: "Ground",
+    1: "Axial",
+    2: "Planar",
+    3: "Connect",
+    4: "Angle",
+    5: "Tangent",
+    6: "Cam",
+    7: "Gear",
+    8: "ParallelAxis",
+    9: "Center",
+    AssemblyRelationConstants.igGroundRelation3d: "Ground",
+    AssemblyRelationConstants.igPlanarRelation3d: "Planar",
+    AssemblyRelationConstants.igAxialRelation3d: "Axial",
+    AssemblyRelationConstants.igAngularRelation3d: "Angle",
+    AssemblyRelationConstants.igTangentRelation3d: "Tangent",
+}
+
+# Rigid-body DOF removed by each relation type, split into translations,
+# whether the relation fixes an axis direction (2 rotations), and any extra
+# single rotation it removes.
+# Planar: 1 translation + normal direction. Axial: 2 translations + axis
+# direction. Connect (point-on-point): 3 translations. Gear/Cam couple one DOF.
+_DOF_MODEL: dict[str, tuple[int, bool, int]] = {
+    "Ground": (3, True, 1),
+    "Axial": (2, True, 0),
+    "Planar": (1, True, 0),
+    "Connect": (3, False, 0),
+    "Angle": (0, False, 1),
+    "Tangent": (1, False, 0),
+    "Cam": (1, False, 0),
+    "Gear": (0, False, 1),
+    "ParallelAxis": (0, True, 0),
+    "Center": (1, False, 0),
+}
+
+_RIGID_BODY_DOF = 6
+
+# Virtual node id used to merge all grounded occurrences into one reference body
+_GROUND = -1
+
+
+def _relation_type_name(rel_type: Any) -> str:
+    """Map a Relations3d Type value to a readable name."""
+    return _RELATION_TYPE_NAMES.get(rel_type, f"Unknown({rel_type})")
+
+
+def _nominal_dof(type_name: str) -> int:
+    """DOF a single relation of this type removes on its own."""
+    trans, fixes_dir, extra_rot = _DOF_MODEL.get(type_name, (0, False, 0))
+    return trans + (2 if fixes_dir else 0) + extra_rot
+
+
+def _combine_relations(type_names: list[str]) -> tuple[int, int]:
+    """Combine relations acting on the same body pair.
+
+    Translations add up to 3. The first direction-fixing relation removes 2
+    rotations and a second one removes the third, except for the Axial+Planar
+    insert where the face normal is conventionally parallel to the axis.
+    Removals past these limits are redundant equations the solver must reconcile.
+
+    Returns:
+        (effective DOF removed, excess constraint count)
+    """
+    trans = 0
+    directions: list[str] = []
+    extra_rot = 0
+    for t in type_names:
+        t_trans, fixes_dir, t_extra = _DOF_MODEL.get(t, (0, False, 0))
+        trans += t_trans
+        extra_rot += t_extra
+        if fixes_dir:
+            directions.append(t)
+
+    if not directions:
+        rot = 0
+    elif len(directions) == 1 or sorted(directions) == ["Axial", "Planar"]:
+        rot = 2
+    else:
+        rot = 3
+    rot_total = rot + extra_rot
+
+    removed = min(trans, 3) + min(rot_total, 3)
+    excess = max(trans - 3, 0) + max(rot_total - 3, 0)
+    return removed, excess
+
+
+def _active_edges(edges: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Return non-suppressed edges between two resolved occurrences."""
+    return [
+        e
+        for e in edges
+        if not e.get("suppressed")
+        and e.get("type_name") != "Ground"
+        and e.get("occurrence1_index") is not None
+        and e.get("occurrence2_index") is not None
+        and e["occurrence1_index"] != e["occurrence2_index"]
+    ]
+
+
+def _build_links(
+    nodes: list[dict[str, Any]], edges: list[dict[str, Any]]
+) -> dict[tuple[int, int], dict[str, Any]]:
+    """Aggregate active relations into one link per body pair.
+
+    Grounded occurrences are merged into a single reference node so relations
+    to different grounded parts act on the same body.
+    """
+    grounded = {n["index"] for n in nodes if n["grounded"]}
+    pairs: dict[tuple[int, int], list[dict[str, Any]]] = {}
+    for e in _active_edges(edges):
+        a = _GROUND if e["occurrence1_index"] in grounded else e["occurrence1_index"]
+        b = _GROUND if e["occurrence2_index"] in grounded else e["occurrence2_index"]
+        if a == b:
+            continue
+        pairs.setdefault((min(a, b), max(a, b)), []).append(e)
+
+    links = {}
+    for key, rels in pairs.items():
+        types = [r["type_name"] for r in rels]
+        removed, excess = _combine_relations(types)
+        links[key] = {
+            "relation_indices": [r["index"] for r in rels],
+            "relation_types": types,
+            "dof_removed": removed,
+            "excess_constraints": excess,
+        }
+    return links
+
+
+def _compute_dof(nodes: list[dict[str, Any]], edges: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Estimate remaining degrees of freedom for each occurrence.
+
+    Bodies are placed in breadth-first order outward from ground (floating
+    groups start from their most-related body). Each body combines only the
+    relations to bodies already placed, which mirrors how the solver resolves
+    a chain. Grounded occurrences have 0 DOF.
+    """
+    links = _build_links(nodes, edges)
+    adjacency: dict[int, list[int]] = {}
+    for a, b in links:
+        adjacency.setdefault(a, []).append(b)
+        adjacency.setdefault(b, []).append(a)
+
+    relation_count = {n["index"]: 0 for n in nodes}
+    for e in _active_edges(edges):
+        for key in ("occurrence1_index", "occurrence2_index"):
+            if e[key] in relation_count:
+                relation_count[e[key]] += 1
+
+    placed: set[int] = set()
+    estimates: dict[int, tuple[int, int]] = {}
+    roots = [_GROUND] + sorted(
+        (n["index"] for n in nodes), key=lambda i: -len(adjacency.get(i, []))
+    )
+    for root in roots:
+        if root in placed:
+            continue
+        placed.add(root)
+        queue = deque([root])
+        while queue:
+            cur = queue.popleft()
+            for nbr in adjacency.get(cur, []):
+                if nbr in placed:
+                    continue
+                placed.add(nbr)
+                types = [
+                    t
+                    for other in adjacency[nbr]
+                    if other in placed and other != nbr
+                    for t in links[(min(nbr, other), max(nbr, other))]["relation_types"]
+                ]
+                estimates[nbr] = _combine_relations(types)
+                queue.append(nbr)
+
+    result = []
+    for n in nodes:
+        idx = n["index"]
+        if n["grounded"]:
+            removed, excess = _RIGID_BODY_DOF, 0
+        else:
+            removed, excess = estimates.get(idx, (0, 0))
+        dof = _RIGID_BODY_DOF - removed
+        result.append(
+            {
+                "index": idx,
+                "name": n["name"],
+                "grounded": n["grounded"],
+                "relation_count": relation_count[idx],
+                "dof_removed": removed,
+                "remaining_dof": dof,
+                "excess_constraints": excess,
+                "fully_constrained": dof == 0,
+            }
+        )
+    return result
+
+
+def _find_cycles(
+    nodes: list[dict[str, Any]], edges: list[dict[str, Any]], max_cycles: int
+) -> list[dict[str, Any]]:
+    """Find a fundamental cycle basis and classify each loop's mobility.
+
+    Each link not in the BFS spanning forest closes exactly one independent
+    loop. A loop with ``n`` bodies whose links remove ``c`` DOF has mobility
+    ``6 * (n - 1) - c``; negative mobility means the loop is over-constrained.
+    """
+    links = _build_links(nodes, edges)
+    keys = sorted(links)
+
+    adjacency: dict[int, list[tuple[int, int]]] = {}
+    for pos, (a, b) in enumerate(keys):
+        adjacency.setdefault(a, []).append((b, pos))
+        adjacency.setdefault(b, []).append((a, pos))
+
+    parent: dict[int, tuple[int, int] | None] = {}
+    depth: dict[int, int] = {}
+    tree_links: set[int] = set()
+
+    for root in adjacency:
+        if root in parent:
+            continue
+        parent[root] = None
+        depth[root] = 0
+        queue = deque([root])
+        while queue:
+            cur = queue.popleft()
+            for nbr, pos in adjacency[cur]:
+                if nbr not in parent:
+                    parent[nbr] = (cur, pos)
+                    depth[nbr] = depth[cur] + 1
+                    tree_links.add(pos)
+                    queue.append(nbr)
+
+    cycles = []
+    for pos, (a, b) in enumerate(keys):
+        if pos in tree_links:
+            continue
+
+        # Walk both endpoints up to their lowest common ancestor
+        loop_nodes = {a, b}
+        loop_links = [pos]
+        x, y = a, b
+        while x != y:
+            if depth[x] >= depth[y]:
+                step = parent[x]
+                assert step is not None
+                x, link_pos = step
+            else:
+                step = parent[y]
+                assert step is not None
+                y, link_pos = step
+            loop_links.append(link_pos)
+            loop_nodes.update((x, y))
+
+        constraint_sum = sum(links[keys[p]]["dof_removed"] for p in loop_links)
+        mobility = _RIGID_BODY_DOF * (len(loop_nodes) - 1) - constraint_sum
+        if mobility < 0:
+            classification = "overconstrained"
+        elif mobility == 0:
+            classification = "rigid"
+        else:
+            classification = "mobile"
+
+        cycles.append(
+            {
+                "occurrence_indices": sorted(n for n in loop_nodes if n != _GROUND),
+                "includes_ground": _GROUND in loop_nodes,
+                "relation_indices": sorted(
+                    i for p in loop_links for i in links[keys[p]]["relation_indices"]
+                ),
+                "constraint_sum": constraint_sum,
+                "mobility": mobility,
+                "classification": classification,
+            }
+        )
+
+    # Most over-constrained loops first; these dominate solver cost
+    cycles.sort(key=lambda c: (c["mobility"], -len(c["relation_indices"])))
+    return cycles[:max_cycles] if max_cycles > 0 else cycles
+
+
+def _find_redundant_pairs(
+    nodes: list[dict[str, Any]], edges: list[dict[str, Any]]
+) -> list[dict[str, Any]]:
+    """Return body pairs whose relations contain redundant constraints."""
+    redundant = []
+    for (a, b), link in sorted(_build_links(nodes, edges).items()):
+        if link["excess_constraints"] > 0:
+            redundant.append(
+                {
+                    "occurrence1_index": None if a == _GROUND else a,
+                    "occurrence2_index": None if b == _GROUND else b,
+                    "includes_ground": _GROUND in (a, b),
+                    **link,
+                }
+            )
+    redundant.sort(key=lambda r: -r["excess_constraints"])
+    return redundant
+
+
+def _union_find_groups(node_ids: list[int], links: list[tuple[int, int]]) -> list[list[int]]:
+    """Partition node_ids into connected groups given undirected links."""
+    root = {n: n for n in node_ids}
+
+    def find(n: int) -> int:
+        while root[n] != n:
+            root[n] = root[root[n]]
+            n = root[n]
+        return n
+
+    for a, b in links:
+        if a in root and b in root:
+            ra, rb = find(a), find(b)
+            if ra != rb:
+                root[rb] = ra
+
+    groups: dict[int, list[int]] = {}
+    for n in node_ids:
+        groups.setdefault(find(n), []).append(n)
+    return sorted((sorted(g) for g in groups.values()), key=lambda g: (-len(g), g[0]))
+
+
+def _compute_rigid_groups(
+    nodes: list[dict[str, Any]], edges: list[dict[str, Any]]
+) -> dict[str, Any]:
+    """Compute rigidly connected and merely connected occurrence groups.
+
+    Two bodies are rigidly linked when the relations between them remove all
+    6 relative DOF. All grounded occurrences form one rigid group.
+    """
+    node_ids = [_GROUND] + [n["index"] for n in nodes]
+    grounded = {n["index"] for n in nodes if n["grounded"]}
+    links = _build_links(nodes, edges)
+
+    rigid_links = [k for k, link in links.items() if link["dof_removed"] >= _RIGID_BODY_DOF]
+    connected_links = list(links)
+    ground_links = [(_GROUND, g) for g in grounded]
+
+    def expand(groups: list[list[int]]) -> list[dict[str, Any]]:
+        result = []
+        for g in groups:
+            is_grounded = _GROUND in g
+            members = [i for i in g if i != _GROUND]
+            if members:
+                result.append({"occurrence_indices": members, "grounded": is_grounded})
+        return result
+
+    rigid_groups = [
+        g
+        for g in expand(_union_find_groups(node_ids, rigid_links + ground_links))
+        if len(g["occurrence_indices"]) > 1 or g["grounded"]
+    ]
+    connected_groups = expand(_union_find_groups(node_ids, connected_links + ground_links))
+    floating = [g["occurrence_indices"] for g in connected_groups if not g["grounded"]]
+
+    return {
+        "rigid_groups": rigid_groups,
+        "connected_groups": connected_groups,
+        "floating_groups": floating,
+    }
+
+
+class RelationGraphMixin:
+    """Mixin providing relation graph capture and solver diagnostics."""
+
+    def _capture_relation_graph(
+        self, doc: Any
+    ) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
+        """Read all occurrences and relations in one pass.
+
+        Returns (nodes, edges). Edge endpoints are 0-based occurrence indices,
+        or None when the related occurrence is not a top-level occurrence.
+        """
+        occurrences = doc.Occurrences
+        nodes: list[dict[str, Any]] = []
+        index_by_name: dict[str, int] = {}
+
+        for i in range(1, occurrences.Count + 1):
+            occ = occurrences.Item(i)
+            node: dict[str, Any] = {"index": i - 1, "name": f"Occurrence_{i}", "grounded": False}
+            with contextlib.suppress(Exception):
+                node["name"] = occ.Name
+            with contextlib.suppress(Exception):
+                node["file_path"] = occ.OccurrenceFileName
+            index_by_name[node["name"]] = i - 1
+            nodes.append(node)
+
+        def resolve(rel: Any, attr: str) -> tuple[int | None, str | None]:
+            try:
+                occ = getattr(rel, attr)
+            except Exception:
+                return None, None
+            if occ is None:
+                return None, None
+            name = occ.Name if hasattr(occ, "Name") else str(occ)
+            return index_by_name.get(name), name
+
+        relations = doc.Relations3d
+        edges: list[dict[str, Any]] = []
+
+        for i in range(1, relations.Count + 1):
+            edge: dict[str, Any] = {"index": i - 1, "type_name": "Unknown"}
+            try:
+                rel = relations.Item(i)
+            except Exception:
+                edges.append(edge)
+                continue
+
+            with contextlib.suppress(Exception):
+                edge["type"] = rel.Type
+                edge["type_name"] = _relation_type_name(rel.Type)
+            with contextlib.suppress(Exception):
+                edge["name"] = rel.Name
+            with contextlib.suppress(Exception):
+                edge["status"] = rel.Status
+            edge["suppressed"] = False
+            with contextlib.suppress(Exception):
+                edge["suppressed"] = bool(rel.Suppressed)
+
+            idx1, name1 = resolve(rel, "OccurrencePart1")
+            idx2, name2 = resolve(rel, "OccurrencePart2")
+            edge["occurrence1_index"] = idx1
+            edge["occurrence2_index"] = idx2
+            if name1 is not None:
+                edge["occurrence1_name"] = name1
+            if name2 is not None:
+                edge["occurrence2_name"] = name2
+            edge["dof_removed"] = _nominal_dof(edge["type_name"])
+
+            if edge["type_name"] == "Ground" and not edge["suppressed"]:
+                target = idx1 if idx1 is not None else idx2
+                if target is not None:
+                    nodes[target]["grounded"] = True
+
+            edges.append(edge)
+
+        return nodes, edges
+
+    def _get_relation_graph_doc(self) -> tuple[Any, dict[str, Any] | None]:
+        """Return the active assembly document or an error dict."""
+        doc = self.doc_manager.get_active_document()
+        if not hasattr(doc, "Relations3d") or not hasattr(doc, "Occurrences"):
+            return None, {"error": "Active document is not an assembly"}
+        return doc, None
+
+    def get_relation_graph(self) -> dict[str, Any]:
+        """
+        Capture the assembly relation graph in one pass.
+
+        Occurrences become nodes (grounded nodes marked) and Relations3d
+        entries become typed edges with their nominal DOF removal.
+
+        Returns:
+            Dict with nodes, edges and summary counts
+        """
+        try:
+            doc, err = self._get_relation_graph_doc()
+            if err:
+                return err
+
+            nodes, edges = self._capture_relation_graph(doc)
+
+            type_counts: dict[str, int] = {}
+            for e in edges:
+                type_counts[e["type_name"]] = type_counts.get(e["type_name"], 0) + 1
+
+            unresolved = sum(
+                1
+                for e in edges
+                if e["type_name"] != "Ground"
+                and (e.get("occurrence1_index") is None or e.get("occurrence2_index") is None)
+            )
+
+            return {
+                "nodes": nodes,
+                "edges": edges,
+                "node_count": len(nodes),
+                "edge_count": len(edges),
+                "grounded_count": sum(1 for n in nodes if n["grounded"]),
+                "suppressed_count": sum(1 for e in edges if e.get("suppressed")),
+                "unresolved_count": unresolved,
+                "relation_type_counts": type_counts,
+            }
+        except Exception as e:
+            _logger.error(f"Failed to capture relation graph: {e}")
+            return {"error": str(e), "traceback": traceback.format_exc()}
+
+    def get_relation_dof(self, component_index: int | None = None) -> dict[str, Any]:
+        """
+        Estimate remaining degrees of freedom per component.
+
+        Args:
+            component_index: Optional 0-based index to report a single component
+
+        Returns:
+            Dict with per-component DOF estimates
+        """
+        try:
+            doc, err = self._get_relation_graph_doc()
+            if err:
+                return err
+
+            nodes, edges = self._capture_relation_graph(doc)
+
+            if component_index is not None and (
+                component_index < 0 or component_index >= len(nodes)
+            ):
+                return {"error": f"Invalid component index: {component_index}. Count: {len(nodes)}"}
+
+            dof = _compute_dof(nodes, edges)
+            if component_index is not None:
+                return dof[component_index]
+
+            return {
+                "components": dof,
+                "count": len(dof),
+                "under_constrained": [d["index"] for d in dof if d["remaining_dof"] > 0],
+                "over_constrained": [d["index"] for d in dof if d["excess_constraints"] > 0],
+            }
+        except Exception as e:
+            _logger.error(f"Failed to compute relation DOF: {e}")
+            return {"error": str(e), "traceback": traceback.format_exc()}
+
+    def find_redundant_relations(self, max_cycles: int = 50) -> dict[str, Any]:
+        """
+        Find redundant relations and over-constrained relation loops.
+
+        Reports occurrence pairs whose relations contain redundant constraints
+        and an independent cycle basis of the relation graph, sorted so the
+        most over-constrained loops (the costliest to solve) come first.
+
+        Args:
+            max_cycles: Maximum number of cycles to return (0 for all)
+
+        Returns:
+            Dict with redundant pairs and classified cycles
+        """
+        try:
+            doc, err = self._get_relation_graph_doc()
+            if err:
+                return err
+
+            nodes, edges = self._capture_relation_graph(doc)
+            pairs = _find_redundant_pairs(nodes, edges)
+            cycles = _find_cycles(nodes, edges, max_cycles)
+
+            return {
+                "redundant_pairs": pairs,
+                "redundant_pair_count": len(pairs),
+                "cycles": cycles,
+                "cycle_count": len(cycles),
+                "overconstrained_cycle_count": sum(
+                    1 for c in cycles if c["classification"] == "overconstrained"
+                ),
+            }
+        except Exception as e:
+            _logger.error(f"Failed to find redundant relations: {e}")
+            return {"error": str(e), "traceback": traceback.format_exc()}
+
+    def get_rigid_groups(self) -> dict[str, Any]:
+        """
+        Group components that move together.
+
+        Rigid groups are linked by relations removing all relative DOF;
+        connected groups share any relation path. Floating groups are
+        connected groups with no grounded member.
+
+        Returns:
+            Dict with rigid, connected and floating groups
+        """
+        try:
+            doc, err = self._get_relation_graph_doc()
+            if err:
+                return err
+
+            nodes, edges = self._capture_relation_graph(doc)
+            groups = _compute_rigid_groups(nodes, edges)
+
+            return {
+                **groups,
+                "rigid_group_count": len(groups["rigid_groups"]),
+                "connected_group_count": len(groups["connected_groups"]),
+            }
+        except Exception as e:
+            _logger.error(f"Failed to compute rigid groups: {e}")
+            return {"error": str(e), "traceback": traceback.format_exc()}
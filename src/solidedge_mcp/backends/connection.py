@@ -6,6 +6,7 @@ Handles connecting to and managing Solid Edge application instances.
 
 import contextlib
 import traceback
+from collections.abc import Iterator
 from typing import Any
 
 import win32com.client
@@ -14,6 +15,14 @@ from .logging import get_logger
 
 _logger = get_logger(__name__)
 
+# Application properties managed by performance_scope(), keyed by argument name
+_PERFORMANCE_FLAGS = {
+    "delay_compute": "DelayCompute",
+    "screen_updating": "ScreenUpdating",
+    "interactive": "Interactive",
+    "display_alerts": "DisplayAlerts",
+}
+
 
 class SolidEdgeConnection:
     """Manages connection to Solid Edge application"""
@@ -21,6 +30,8 @@ class SolidEdgeConnection:
     def __init__(self) -> None:
         self.application: Any | None = None
         self._is_connected: bool = False
+        # Values applied by the open performance scopes, innermost last write
+        self._performance_state: dict[str, Any] = {}
 
     def connect(self, start_if_needed: bool = True) -> dict[str, Any]:
         """
@@ -76,6 +87,7 @@ class SolidEdgeConnection:
         """Disconnect from Solid Edge (does not close the application)"""
         self.application = None
         self._is_connected = False
+        self._performance_state.clear()
         _logger.info("Disconnected from Solid Edge")
         return {"status": "disconnected"}
 
@@ -225,7 +237,9 @@ class SolidEdgeConnection:
         Set application performance flags for batch operations.
 
         These flags can significantly speed up batch operations by disabling
-        UI updates and delayed computation. Remember to restore defaults after.
+        UI updates and delayed computation. Remember to restore defaults after;
+        backend code should use performance_scope() instead, which restores
+        the previous values itself.
 
         Args:
             delay_compute: If True, delays feature recomputation until reset
@@ -273,6 +287,74 @@ class SolidEdgeConnection:
         except Exception as e:
             return {"error": str(e), "traceback": traceback.format_exc()}
 
+    @contextlib.contextmanager
+    def performance_scope(
+        self,
+        delay_compute: bool | None = None,
+        screen_updating: bool | None = False,
+        interactive: bool | None = None,
+        display_alerts: bool | None = False,
+    ) -> Iterator[dict[str, Any]]:
+        """
+        Apply performance flags for the duration of a with-block.
+
+        Each flag left as None is not touched. The previous value of every
+        flag the scope changes is read first and written back on exit, even
+        when the block raises. Scopes nest: a flag already held at the same
+        value by an enclosing scope is neither set nor restored again, so
+        nested batch helpers cost no extra COM calls and only the scope that
+        changed a value restores it. COM failures while reading, setting or
+        restoring a flag are logged and skipped; the block always runs, also
+        when not connected.
+
+        Args:
+            delay_compute: If True, delays feature recomputation until exit
+            screen_updating: If False, disables screen refreshes (default)
+            interactive: If False, suppresses all UI dialogs
+            display_alerts: If False, suppresses alert dialogs (default)
+
+        Yields:
+            Dict of the flags this scope changed (argument name -> value)
+        """
+        app = self.application if self._is_connected else None
+        changed: list[tuple[str, Any, Any]] = []
+        applied: dict[str, Any] = {}
+        if app is not None:
+            requested = {
+                "delay_compute": delay_compute,
+                "screen_updating": screen_updating,
+                "interactive": interactive,
+                "display_alerts": display_alerts,
+            }
+            for name, value in requested.items():
+                prop = _PERFORMANCE_FLAGS[name]
+                if value is None:
+                    continue
+                if prop in self._performance_state and self._performance_state[prop] == value:
+                    continue
+                try:
+                    previous = getattr(app, prop)
+                    setattr(app, prop, value)
+                except Exception as e:
+                    _logger.debug(f"Could not set {prop}: {e}")
+                    continue
+                changed.append((prop, previous, self._performance_state.get(prop)))
+                self._performance_state[prop] = value
+                applied[name] = value
+
+        try:
+            yield applied
+        finally:
+            for prop, previous, outer in reversed(changed):
+                try:
+                    setattr(app, prop, previous)
+                except Exception as e:
+                    _logger.warning(f"Could not restore {prop}: {e}")
+                if outer is None:
+                    self._performance_state.pop(prop, None)
+                else:
+                    self._performance_state[prop] = outer
+
     def start_command(self, command_id: int) -> dict[str, Any]:
         """
         Execute a Solid Edge command by its command ID.
@@ -477,6 +559,26 @@ class SolidEdgeConnection:
         except Exception as e:
             return {"error": str(e), "traceback": traceback.format_exc()}
 
+    def resolve_constant(self, name: str) -> int | None:
+        """
+        Look up a type-library constant by name.
+
+        Relies on the gencache wrapper generated by EnsureDispatch in
+        connect(); returns None when the constant (or the cache) is
+        unavailable, e.g. after a late-bound Dispatch fallback.
+
+        Args:
+            name: Constant name, e.g. 'seApplicationGlobalDisplayQuality'
+
+        Returns:
+            Integer value, or None if unknown
+        """
+        try:
+            value = getattr(win32com.client.constants, name)
+        except Exception:
+            return None
+        return int(value)
+
     def convert_by_file_path(
         self, input_path: str, output_path: str
     ) -> dict[str, Any]:
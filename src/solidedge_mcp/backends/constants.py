@@ -316,6 +316,25 @@ class AssemblyGlobalConstants:
     seAssemblyGlobalAdjustableTubes = 21
 
 
+class AssemblyFileOpenPartActivationOptions:
+    """Part activation applied when opening an assembly (from type library)
+
+    Written to the assembly file-open global parameter before Documents.Open.
+    """
+
+    seAssemblyFileOpenPartActivation_ActivateAll = 0
+    seAssemblyFileOpenPartActivation_InactivateAll = 1
+    seAssemblyFileOpenPartActivation_LastSaved = 2
+
+
+class AssemblyFileOpenSimplificationOptions:
+    """Simplified/designed representation applied when opening an assembly (from type library)"""
+
+    seAssemblyFileOpenSimplification_AllSimplified = 0
+    seAssemblyFileOpenSimplification_AllDesigned = 1
+    seAssemblyFileOpenSimplification_LastSaved = 2
+
+
 class FoldTypeConstants:
     """Drawing view fold direction constants (from type library)"""
 
@@ -6,14 +6,38 @@ Handles creating, opening, saving, and closing documents.
 
 import contextlib
 import os
+import time
 import traceback
 from typing import Any
 
-from .constants import DocumentTypeConstants
+from .constants import (
+    AssemblyFileOpenPartActivationOptions,
+    AssemblyFileOpenSimplificationOptions,
+    DocumentTypeConstants,
+)
 from .logging import get_logger
 
 _logger = get_logger(__name__)
 
+# Application globals that drive the assembly file-open load mode. The IDs
+# are resolved from the generated type library at call time.
+_OPEN_PART_ACTIVATION_GLOBAL = "seApplicationGlobalAssemblyFileOpenPartActivation"
+_OPEN_SIMPLIFICATION_GLOBAL = "seApplicationGlobalAssemblyFileOpenSimplification"
+
+_Activation = AssemblyFileOpenPartActivationOptions
+_Simplification = AssemblyFileOpenSimplificationOptions
+
+_OPEN_ACTIVATION_VALUES = {
+    "active": _Activation.seAssemblyFileOpenPartActivation_ActivateAll,
+    "inactive": _Activation.seAssemblyFileOpenPartActivation_InactivateAll,
+    "last_saved": _Activation.seAssemblyFileOpenPartActivation_LastSaved,
+}
+_OPEN_SIMPLIFICATION_VALUES = {
+    "simplified": _Simplification.seAssemblyFileOpenSimplification_AllSimplified,
+    "designed": _Simplification.seAssemblyFileOpenSimplification_AllDesigned,
+    "last_saved": _Simplification.seAssemblyFileOpenSimplification_LastSaved,
+}
+
 
 class DocumentManager:
     """Manages Solid Edge documents"""
@@ -441,6 +465,118 @@ class DocumentManager:
         except Exception as e:
             return {"error": str(e), "traceback": traceback.format_exc()}
 
+    def open_assembly_lightweight(
+        self,
+        file_path: str,
+        activation: str = "inactive",
+        simplification: str = "simplified",
+        background: bool = True,
+    ) -> dict[str, Any]:
+        """
+        Open an assembly in a reduced-load mode.
+
+        Temporarily sets the assembly file-open globals so occurrences come
+        up inactive and/or simplified, then restores the user's settings.
+        Inactive occurrences skip loading part geometry, which makes
+        query-only sessions (BOM, transforms, relations) much faster to
+        start. Geometry queries in AssemblyManager activate occurrences on
+        demand.
+
+        Args:
+            file_path: Path to the .asm file
+            activation: 'inactive', 'active', or 'last_saved'
+            simplification: 'simplified', 'designed', or 'last_saved'
+            background: If True, open without a visible window (0x8 flag)
+
+        Returns:
+            Dict with open status, applied load options, and open time
+        """
+        if activation not in _OPEN_ACTIVATION_VALUES:
+            return {
+                "error": f"Invalid activation: {activation}. "
+                f"Valid: {', '.join(_OPEN_ACTIVATION_VALUES)}"
+            }
+        if simplification not in _OPEN_SIMPLIFICATION_VALUES:
+            return {
+                "error": f"Invalid simplification: {simplification}. "
+                f"Valid: {', '.join(_OPEN_SIMPLIFICATION_VALUES)}"
+            }
+
+        try:
+            if not os.path.exists(file_path):
+                return {"error": f"File not found: {file_path}"}
+            if not file_path.lower().endswith(".asm"):
+                return {"error": "Lightweight open is only supported for .asm files"}
+
+            app = self.connection.get_application()
+
+            requested = {
+                _OPEN_PART_ACTIVATION_GLOBAL: _OPEN_ACTIVATION_VALUES[activation],
+                _OPEN_SIMPLIFICATION_GLOBAL: _OPEN_SIMPLIFICATION_VALUES[simplification],
+            }
+            applied: dict[str, str] = {}
+            skipped: list[str] = []
+            saved: list[tuple[int, Any]] = []
+
+            try:
+                for name, value in requested.items():
+                    param = self.connection.resolve_constant(name)
+                    if param is None:
+                        skipped.append(name)
+                        continue
+                    try:
+                        previous = app.GetGlobalParameter(param)
+                        app.SetGlobalParameter(param, value)
+                    except Exception as e:
+                        _logger.warning(f"Could not set {name}: {e}")
+                        skipped.append(name)
+                        continue
+                    saved.append((param, previous))
+                    applied[name] = (
+                        activation if name == _OPEN_PART_ACTIVATION_GLOBAL else simplification
+                    )
+
+                start = time.perf_counter()
+                if background:
+                    doc = app.Documents.Open(file_path, 0x8)
+                else:
+                    doc = app.Documents.Open(file_path)
+                elapsed = time.perf_counter() - start
+            finally:
+                for param, previous in reversed(saved):
+                    with contextlib.suppress(Exception):
+                        app.SetGlobalParameter(param, previous)
+
+            self._clear_sketch_state()
+            self.active_document = doc
+
+            _logger.info(
+                f"Opened assembly lightweight ({activation}/{simplification}) "
+                f"in {elapsed:.2f}s: {file_path}"
+            )
+            result: dict[str, Any] = {
+                "status": "opened_lightweight",
+                "path": file_path,
+                "name": doc.Name,
+                "type": self._get_document_type(doc),
+                "activation": activation,
+                "simplification": simplification,
+                "background": background,
+                "applied_options": applied,
+                "open_seconds": round(elapsed, 4),
+            }
+            if skipped:
+                result["skipped_options"] = skipped
+                result["note"] = (
+                    "Some load options are not exposed by this Solid Edge "
+                    "installation; the assembly opened with its last-saved state "
+                    "for those settings."
+                )
+            return result
+        except Exception as e:
+            _logger.error(f"Failed to open assembly {file_path}: {e}")
+            return {"error": str(e), "traceback": traceback.format_exc()}
+
     def close_all_documents(self, save: bool = False) -> dict[str, Any]:
         """
         Close all open documents.
@@ -462,28 +598,22 @@ class DocumentManager:
             closed = 0
             errors = []
 
-            if not save:
-                with contextlib.suppress(Exception):
-                    app.DisplayAlerts = False
-
-            # Close in reverse order (COM collections shift on removal)
-            for i in range(count, 0, -1):
-                try:
-                    doc = docs.Item(i)
-                    if save:
-                        with contextlib.suppress(Exception):
-                            doc.Save()
-                    else:
-                        with contextlib.suppress(Exception):
-                            doc.Saved = True
-                    doc.Close()
-                    closed += 1
-                except Exception as e:
-                    errors.append(str(e))
-
-            if not save:
-                with contextlib.suppress(Exception):
-                    app.DisplayAlerts = True
+            # Alerts stay on when saving so save prompts are not answered silently
+            with self.connection.performance_scope(display_alerts=None if save else False):
+                # Close in reverse order (COM collections shift on removal)
+                for i in range(count, 0, -1):
+                    try:
+                        doc = docs.Item(i)
+                        if save:
+                            with contextlib.suppress(Exception):
+                                doc.Save()
+                        else:
+                            with contextlib.suppress(Exception):
+                                doc.Saved = True
+                        doc.Close()
+                        closed += 1
+                    except Exception as e:
+                        errors.append(str(e))
 
             self.active_document = None
 
@@ -492,11 +622,6 @@ class DocumentManager:
                 result["errors"] = errors
             return result
         except Exception as e:
-            try:
-                app = self.connection.get_application()
-                app.DisplayAlerts = True
-            except Exception:
-                pass
             return {"error": str(e), "traceback": traceback.format_exc()}
 
     def save_copy_as(self, file_path: str) -> dict[str, Any]:
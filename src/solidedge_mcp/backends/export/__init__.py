@@ -5,20 +5,40 @@ Handles exporting to various formats, creating drawings, and view manipulation.
 """
 
 from ._annotations import AnnotationsMixin
+from ._balloon_layout import BalloonLayoutMixin
 from ._base import ExportManagerBase
+from ._batch_drafting import BatchDraftingMixin
+from ._bulk_annotations import BulkAnnotationsMixin
 from ._draft import DraftMixin
 from ._drawing import DrawingMixin
 from ._file_export import FileExportMixin
+from ._gltf import GltfExportMixin
+from ._inspection import InspectionReportMixin
+from ._parts_list_sync import PartsListSyncMixin
+from ._publishing import PublishingMixin
+from ._snapshot import DraftSnapshotMixin
+from ._template_cache import TemplateCacheMixin
 from ._view_model import ViewModel
+from ._view_updates import ViewUpdateSchedulerMixin
 from ._views import ViewsMixin
 
 
 class ExportManager(
     FileExportMixin,
+    GltfExportMixin,
     DrawingMixin,
     ViewsMixin,
+    ViewUpdateSchedulerMixin,
     AnnotationsMixin,
+    BulkAnnotationsMixin,
+    BalloonLayoutMixin,
     DraftMixin,
+    TemplateCacheMixin,
+    DraftSnapshotMixin,
+    InspectionReportMixin,
+    PartsListSyncMixin,
+    BatchDraftingMixin,
+    PublishingMixin,
     ExportManagerBase,
 ):
     """Manages export and drawing operations"""
@@ -0,0 +1,370 @@
+"""Automatic balloon layout around a drawing view with collision avoidance."""
+
+import bisect
+import contextlib
+import math
+import time
+import traceback
+from collections import defaultdict
+from typing import Any
+
+from ..logging import get_logger
+
+_logger = get_logger(__name__)
+
+Box = tuple[float, float, float, float]  # xmin, ymin, xmax, ymax
+
+
+class _Grid:
+    """Uniform hash grid over obstacles, keyed by bounding-box cells."""
+
+    def __init__(self, cell: float) -> None:
+        self.cell = cell
+        self.cells: defaultdict[tuple[int, int], list[Any]] = defaultdict(list)
+
+    def _keys(self, box: Box) -> list[tuple[int, int]]:
+        c = self.cell
+        i0, i1 = math.floor(box[0] / c), math.floor(box[2] / c)
+        j0, j1 = math.floor(box[1] / c), math.floor(box[3] / c)
+        return [(i, j) for i in range(i0, i1 + 1) for j in range(j0, j1 + 1)]
+
+    def insert(self, box: Box, item: Any) -> None:
+        for key in self._keys(box):
+            self.cells[key].append(item)
+
+    def near(self, box: Box) -> set[Any]:
+        found: set[Any] = set()
+        for key in self._keys(box):
+            found.update(self.cells.get(key, ()))
+        return found
+
+
+def _segment_distance(px: float, py: float, seg: tuple[float, ...]) -> float:
+    x1, y1, x2, y2 = seg
+    dx, dy = x2 - x1, y2 - y1
+    length2 = dx * dx + dy * dy
+    t = 0.0 if length2 == 0 else max(0.0, min(1.0, ((px - x1) * dx + (py - y1) * dy) / length2))
+    return math.hypot(px - (x1 + t * dx), py - (y1 + t * dy))
+
+
+def _hits_obstacle(x: float, y: float, r: float, obstacle: tuple[Any, ...]) -> bool:
+    if obstacle[0] == "segment":
+        return _segment_distance(x, y, obstacle[1:]) < r
+    # Circles and arcs: does the balloon touch the curve?
+    _, cx, cy, radius = obstacle
+    return abs(math.hypot(x - cx, y - cy) - radius) < r
+
+
+def _ring_points(box: Box, offset: float, spacing: float) -> list[tuple[float, float, float]]:
+    """Points at even spacing around box grown by offset, as (t, x, y) in perimeter order."""
+    x0, y0, x1, y1 = box[0] - offset, box[1] - offset, box[2] + offset, box[3] + offset
+    w, h = x1 - x0, y1 - y0
+    perimeter = 2 * (w + h)
+    count = max(4, int(perimeter / spacing))
+    step = perimeter / count
+    points = []
+    for k in range(count):
+        t = k * step
+        points.append((t, *_perimeter_point(x0, y0, w, h, t)))
+    return points
+
+
+def _perimeter_point(x0: float, y0: float, w: float, h: float, t: float) -> tuple[float, float]:
+    # Counter-clockwise from the bottom-left corner
+    if t < w:
+        return x0 + t, y0
+    t -= w
+    if t < h:
+        return x0 + w, y0 + t
+    t -= h
+    if t < w:
+        return x0 + w - t, y0 + h
+    t -= w
+    return x0, y0 + h - t
+
+
+def _perimeter_param(box: Box, offset: float, x: float, y: float) -> float:
+    """Perimeter parameter of the point on the grown box closest to (x, y)."""
+    x0, y0, x1, y1 = box[0] - offset, box[1] - offset, box[2] + offset, box[3] + offset
+    w, h = x1 - x0, y1 - y0
+    cx, cy = min(max(x, x0), x1), min(max(y, y0), y1)
+    # Snap to the nearest edge
+    d = {"b": cy - y0, "r": x1 - cx, "t": y1 - cy, "l": cx - x0}
+    edge = min(d, key=lambda k: d[k])
+    if edge == "b":
+        return cx - x0
+    if edge == "r":
+        return w + (cy - y0)
+    if edge == "t":
+        return w + h + (x1 - cx)
+    return 2 * w + h + (y1 - cy)
+
+
+def layout_balloons(
+    view_box: Box,
+    anchors: list[tuple[float, float]],
+    obstacles: list[tuple[Any, ...]] | None = None,
+    radius: float = 0.004,
+    gap: float = 0.002,
+    margin: float = 0.01,
+    sheet_box: Box | None = None,
+    max_rings: int = 4,
+) -> list[dict[str, Any] | None]:
+    """
+    Assign each anchor a balloon position on rings around the view box.
+
+    Candidates sit on up to max_rings concentric rectangles outside the view.
+    Anchors are processed in perimeter order and take the nearest free
+    candidate, which keeps leaders short and mostly non-crossing. Geometry
+    obstacles ('segment', x1, y1, x2, y2) / ('circle', cx, cy, r) and
+    already-placed balloons are looked up through hash grids.
+
+    Returns:
+        One entry per anchor: {"x", "y", "ring"} or None if no room was found
+    """
+    spacing = 2 * radius + gap
+    clearance = radius + gap / 2
+
+    geometry = _Grid(spacing)
+    for ob in obstacles or []:
+        if ob[0] == "segment":
+            _, x1, y1, x2, y2 = ob
+            box = (min(x1, x2), min(y1, y2), max(x1, x2), max(y1, y2))
+        else:
+            _, cx, cy, r = ob
+            box = (cx - r, cy - r, cx + r, cy + r)
+        geometry.insert(box, ob)
+
+    rings = []
+    for k in range(max_rings):
+        offset = margin + radius + k * spacing
+        points = []
+        for t, x, y in _ring_points(view_box, offset, spacing):
+            if sheet_box and not (
+                sheet_box[0] + radius <= x <= sheet_box[2] - radius
+                and sheet_box[1] + radius <= y <= sheet_box[3] - radius
+            ):
+                continue
+            probe = (x - clearance, y - clearance, x + clearance, y + clearance)
+            if any(_hits_obstacle(x, y, clearance, ob) for ob in geometry.near(probe)):
+                continue
+            points.append((t, x, y))
+        rings.append((offset, [p[0] for p in points], points))
+
+    placed = _Grid(spacing)
+    placed_xy: list[tuple[float, float]] = []
+    taken: set[tuple[int, int]] = set()
+
+    def free(x: float, y: float) -> bool:
+        box = (x - spacing, y - spacing, x + spacing, y + spacing)
+        for i in placed.near(box):
+            px, py = placed_xy[i]
+            if math.hypot(px - x, py - y) < spacing - 1e-12:
+                return False
+        return True
+
+    order = sorted(
+        range(len(anchors)),
+        key=lambda i: _perimeter_param(view_box, margin, *anchors[i]),
+    )
+    result: list[dict[str, Any] | None] = [None] * len(anchors)
+    for i in order:
+        ax, ay = anchors[i]
+        # Nearest free candidate on each ring; the closest one to the anchor wins,
+        # so a crowded inner ring spills outward instead of wrapping around.
+        best: tuple[float, int, int] | None = None
+        for k, (offset, ts, points) in enumerate(rings):
+            if not points:
+                continue
+            n = len(points)
+            start = bisect.bisect_left(ts, _perimeter_param(view_box, offset, ax, ay)) % n
+            for step in range(n):
+                # Alternate outward: start, start+1, start-1, start+2, ...
+                j = (start + (step + 1) // 2 * (1 if step % 2 else -1)) % n
+                if (k, j) in taken:
+                    continue
+                _, x, y = points[j]
+                if free(x, y):
+                    d = math.hypot(x - ax, y - ay)
+                    if best is None or d < best[0]:
+                        best = (d, k, j)
+                    break
+        if best is not None:
+            _, k, j = best
+            _, x, y = rings[k][2][j]
+            taken.add((k, j))
+            placed.insert((x, y, x, y), len(placed_xy))
+            placed_xy.append((x, y))
+            result[i] = {"x": x, "y": y, "ring": k}
+    return result
+
+
+class BalloonLayoutMixin:
+    """Mixin providing automatic balloon placement around drawing views."""
+
+    @staticmethod
+    def _view_box(view: Any) -> Box | None:
+        """Sheet-space range of a drawing view (Range returns its out-params)."""
+        with contextlib.suppress(Exception):
+            x0, y0, x1, y1 = view.Range()[:4]
+            return (min(x0, x1), min(y0, y1), max(x0, x1), max(y0, y1))
+        return None
+
+    @staticmethod
+    def _sheet_obstacles(sheet: Any, region: Box) -> list[tuple[Any, ...]]:
+        """Lines, circles and arcs of the sheet that fall inside region."""
+        obstacles: list[tuple[Any, ...]] = []
+
+        def inside(box: Box) -> bool:
+            return not (
+                box[2] < region[0] or box[0] > region[2] or box[3] < region[1] or box[1] > region[3]
+            )
+
+        with contextlib.suppress(Exception):
+            lines = sheet.Lines2d
+            for i in range(1, lines.Count + 1):
+                with contextlib.suppress(Exception):
+                    ln = lines.Item(i)
+                    x1, y1, x2, y2 = ln.StartX, ln.StartY, ln.EndX, ln.EndY
+                    if inside((min(x1, x2), min(y1, y2), max(x1, x2), max(y1, y2))):
+                        obstacles.append(("segment", x1, y1, x2, y2))
+        for collection in ("Circles2d", "Arcs2d"):
+            with contextlib.suppress(Exception):
+                items = getattr(sheet, collection)
+                for i in range(1, items.Count + 1):
+                    with contextlib.suppress(Exception):
+                        c = items.Item(i)
+                        cx, cy, r = c.CenterX, c.CenterY, c.Radius
+                        if inside((cx - r, cy - r, cx + r, cy + r)):
+                            obstacles.append(("circle", cx, cy, r))
+        return obstacles
+
+    def auto_balloon_view(
+        self,
+        view_index: int,
+        items: list[dict[str, Any]],
+        sheet_index: int | None = None,
+        radius: float = 0.004,
+        gap: float = 0.002,
+        margin: float = 0.01,
+        max_rings: int = 4,
+        view_box: list[float] | None = None,
+        dry_run: bool = False,
+    ) -> dict[str, Any]:
+        """
+        Lay out balloons around a drawing view and place them in bulk.
+
+        Balloons are placed on rings outside the view's range, avoiding
+        sheet geometry, the sheet border and each other, with leaders to
+        each item's anchor point.
+
+        Args:
+            view_index: 0-based view index on the sheet
+            items: [{"text": "3", "x": ..., "y": ...}] - x/y is the leader
+                anchor on the part (sheet coordinates, meters)
+            sheet_index: 0-based sheet (default: active sheet)
+            radius: Balloon radius used for spacing (meters)
+            gap: Minimum clearance between balloons (meters)
+            margin: Distance from the view range to the first ring (meters)
+            max_rings: Number of rings to try before giving up on an item
+            view_box: [xmin, ymin, xmax, ymax] override for the view range
+            dry_run: Compute the layout without placing balloons
+
+        Returns:
+            Dict with per-item positions, unplaced items, timing and the
+            bulk placement result
+        """
+        if not items:
+            return {"error": "No balloon items given"}
+        try:
+            anchors = [(float(it["x"]), float(it["y"])) for it in items]
+        except (KeyError, TypeError, ValueError):
+            return {"error": "Each item needs numeric 'x' and 'y' anchor coordinates"}
+
+        try:
+            doc = self.doc_manager.get_active_document()
+            if not hasattr(doc, "Sheets"):
+                return {"error": "Active document is not a draft document"}
+
+            try:
+                sheet = self._resolve_sheet(doc, sheet_index)
+            except IndexError as e:
+                return {"error": str(e)}
+
+            dvs = sheet.DrawingViews
+            with contextlib.suppress(Exception):
+                import win32com.client.dynamic
+
+                dvs = win32com.client.dynamic.Dispatch(dvs._oleobj_)
+            if view_index < 0 or view_index >= dvs.Count:
+                return {"error": f"Invalid view index: {view_index}. Count: {dvs.Count}"}
+            box = self._view_box(dvs.Item(view_index + 1))
+            if view_box is not None:
+                if len(view_box) != 4:
+                    return {"error": "view_box must be [xmin, ymin, xmax, ymax]"}
+                box = (view_box[0], view_box[1], view_box[2], view_box[3])
+            if box is None:
+                return {"error": "Could not read the view range; pass view_box"}
+
+            sheet_box = None
+            with contextlib.suppress(Exception):
+                sheet_box = (0.0, 0.0, float(sheet.SheetWidth), float(sheet.SheetHeight))
+
+            reach = margin + radius + max_rings * (2 * radius + gap)
+            region = (box[0] - reach, box[1] - reach, box[2] + reach, box[3] + reach)
+            obstacles = self._sheet_obstacles(sheet, region)
+
+            start = time.perf_counter()
+            positions = layout_balloons(
+                box, anchors, obstacles, radius, gap, margin, sheet_box, max_rings
+            )
+            layout_seconds = time.perf_counter() - start
+
+            layout = []
+            unplaced = []
+            specs = []
+            for item, (ax, ay), pos in zip(items, anchors, positions, strict=True):
+                text = str(item.get("text", ""))
+                if pos is None:
+                    unplaced.append({"text": text, "anchor": [ax, ay]})
+                    continue
+                layout.append(
+                    {
+                        "text": text,
+                        "anchor": [ax, ay],
+                        "position": [pos["x"], pos["y"]],
+                        "ring": pos["ring"],
+                    }
+                )
+                specs.append(
+                    {
+                        "type": "balloon",
+                        "x": pos["x"],
+                        "y": pos["y"],
+                        "text": text,
+                        "leader_x": ax,
+                        "leader_y": ay,
+                    }
+                )
+
+            result: dict[str, Any] = {
+                "status": "dry_run" if dry_run else "placed",
+                "view_box": list(box),
+                "obstacles": len(obstacles),
+                "layout": layout,
+                "unplaced": unplaced,
+                "layout_seconds": round(layout_seconds, 4),
+            }
+            if dry_run or not specs:
+                return result
+
+            with self.doc_manager.connection.performance_scope():
+                created, errors = self._place_annotations(sheet, specs)
+
+            result["added"] = len(created)
+            result["errors"] = errors
+            if errors or unplaced:
+                result["status"] = "partial"
+            return result
+        except Exception as e:
+            return {"error": str(e), "traceback": traceback.format_exc()}
@@ -5,7 +5,9 @@ Base class for ExportManager providing constructor and shared helpers.
 import contextlib
 from typing import Any
 
+from ..facet_cache import FacetCache
 from ..logging import get_logger
+from ._template_cache import TemplateCache
 
 _logger = get_logger(__name__)
 
@@ -15,6 +17,16 @@ class ExportManagerBase:
 
     def __init__(self, document_manager: Any) -> None:
         self.doc_manager = document_manager
+        # Cached whole-draft snapshot (see DraftSnapshotMixin)
+        self._draft_snapshot: dict[str, Any] | None = None
+        # Model generation per view at its last scheduled update, and
+        # queued (draft, sheet, view) update requests (see ViewUpdateSchedulerMixin)
+        self._view_generations: dict[Any, Any] = {}
+        self._pending_view_updates: dict[tuple[str, int, int], int] = {}
+        # Resolved symbol sources and smart-frame styles (see TemplateCacheMixin)
+        self._template_cache = TemplateCache()
+        # Tessellations of saved documents, kept on disk (see GltfExportMixin)
+        self._facet_cache = FacetCache()
 
     def _get_drawing_views(self) -> Any:
         """Get the DrawingViews collection from the active sheet."""
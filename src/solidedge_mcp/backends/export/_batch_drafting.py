@@ -0,0 +1,328 @@
+"""Batch drawing generation: one draft per model from a view-layout template."""
+
+import contextlib
+import json
+import os
+import time
+import traceback
+from typing import Any
+
+from ..constants import DrawingViewOrientationConstants
+from ..logging import get_logger
+
+_logger = get_logger(__name__)
+
+_ORIENTATIONS = {
+    "Front": DrawingViewOrientationConstants.Front,
+    "Back": DrawingViewOrientationConstants.Back,
+    "Top": DrawingViewOrientationConstants.Top,
+    "Bottom": DrawingViewOrientationConstants.Bottom,
+    "Right": DrawingViewOrientationConstants.Right,
+    "Left": DrawingViewOrientationConstants.Left,
+    "Isometric": DrawingViewOrientationConstants.Isometric,
+    "Iso": DrawingViewOrientationConstants.Isometric,
+}
+
+_SUMMARY_PROPERTIES = (
+    "Title",
+    "Subject",
+    "Author",
+    "Manager",
+    "Company",
+    "Category",
+    "Keywords",
+    "Comments",
+)
+
+_DEFAULT_LAYOUT: dict[str, Any] = {
+    "views": [
+        {"orientation": "Front", "x": 0.10, "y": 0.15},
+        {"orientation": "Top", "x": 0.10, "y": 0.06},
+        {"orientation": "Right", "x": 0.22, "y": 0.15},
+        {"orientation": "Isometric", "x": 0.22, "y": 0.06},
+    ],
+    "scale": 1.0,
+}
+
+
+def _load_layout(layout: dict[str, Any] | str | None) -> dict[str, Any]:
+    """Normalize a layout given inline, as a JSON file path, or omitted."""
+    if layout is None:
+        return dict(_DEFAULT_LAYOUT)
+    if isinstance(layout, str):
+        with open(layout, encoding="utf-8") as f:
+            layout = json.load(f)
+    if not isinstance(layout, dict):
+        raise ValueError("Layout must be a JSON object")
+
+    merged = {**_DEFAULT_LAYOUT, **layout}
+    if not isinstance(merged["views"], list):
+        raise ValueError("'views' must be a list")
+    for i, view in enumerate(merged["views"]):
+        if not isinstance(view, dict):
+            raise ValueError(f"views[{i}]: must be an object")
+        orientation = view.get("orientation")
+        if orientation not in _ORIENTATIONS:
+            valid = ", ".join(_ORIENTATIONS)
+            raise ValueError(f"views[{i}]: invalid orientation {orientation!r}. Valid: {valid}")
+        if "x" not in view or "y" not in view:
+            raise ValueError(f"views[{i}]: 'x' and 'y' are required")
+    return merged
+
+
+def _model_tokens(model_path: str) -> dict[str, str]:
+    name = os.path.basename(model_path)
+    return {
+        "path": model_path,
+        "name": name,
+        "stem": os.path.splitext(name)[0],
+        "folder": os.path.basename(os.path.dirname(model_path)),
+    }
+
+
+def _draft_stems(model_paths: list[str]) -> dict[str, str]:
+    """Draft file stem per model, unique within the batch.
+
+    Models sharing a stem get their extension added (bracket_psm), then
+    their folder (left_bracket_par), and a counter as a last resort.
+    """
+    by_stem: dict[str, list[str]] = {}
+    for path in dict.fromkeys(model_paths):
+        by_stem.setdefault(_model_tokens(path)["stem"].lower(), []).append(path)
+
+    stems: dict[str, str] = {}
+    for paths in by_stem.values():
+        tokens = [_model_tokens(p) for p in paths]
+        if len(paths) == 1:
+            stems[paths[0]] = tokens[0]["stem"]
+            continue
+        with_ext = [f"{t['stem']}_{os.path.splitext(t['name'])[1].lstrip('.')}" for t in tokens]
+        if len({n.lower() for n in with_ext}) < len(with_ext):
+            with_ext = [
+                f"{t['folder']}_{n}" if t["folder"] else n
+                for t, n in zip(tokens, with_ext, strict=True)
+            ]
+        stems.update(zip(paths, with_ext, strict=True))
+
+    used: set[str] = set()
+    for path, stem in stems.items():
+        unique, n = stem, 2
+        while unique.lower() in used:
+            unique, n = f"{stem}_{n}", n + 1
+        used.add(unique.lower())
+        stems[path] = unique
+    return stems
+
+
+class BatchDraftingMixin:
+    """Mixin providing batch draft generation from a list of models."""
+
+    def _set_draft_properties(self, draft: Any, properties: dict[str, str]) -> list[str]:
+        """Write title-block properties; returns the names that could not be set."""
+        failed = []
+        custom = None
+        for name, value in properties.items():
+            try:
+                if name in _SUMMARY_PROPERTIES:
+                    setattr(draft.SummaryInfo, name, value)
+                    continue
+                if custom is None:
+                    prop_sets = draft.Properties
+                    for i in range(1, prop_sets.Count + 1):
+                        ps = prop_sets.Item(i)
+                        if ps.Name == "Custom":
+                            custom = ps
+                            break
+                    if custom is None:
+                        raise RuntimeError("Custom property set not found")
+                for i in range(1, custom.Count + 1):
+                    prop = custom.Item(i)
+                    if prop.Name == name:
+                        prop.Value = value
+                        break
+                else:
+                    custom.Add(name, value)
+            except Exception:
+                failed.append(name)
+        return failed
+
+    def _generate_one_drawing(
+        self,
+        app: Any,
+        model_path: str,
+        layout: dict[str, Any],
+        output_dir: str,
+        export_pdf: bool,
+        overwrite: bool,
+        draft_stem: str | None = None,
+    ) -> dict[str, Any]:
+        """Create, populate, save (and optionally publish) one draft."""
+        tokens = _model_tokens(model_path)
+        draft_path = os.path.join(output_dir, (draft_stem or tokens["stem"]) + ".dft")
+        entry: dict[str, Any] = {"model": model_path, "draft": draft_path}
+
+        if not os.path.exists(model_path):
+            return {**entry, "status": "error", "error": "Model file not found"}
+        if os.path.exists(draft_path) and not overwrite:
+            return {**entry, "status": "skipped", "reason": "Draft already exists"}
+
+        start = time.perf_counter()
+        template = layout.get("template")
+        if template and os.path.exists(template):
+            draft = app.Documents.Add(template)
+        else:
+            draft = app.Documents.Add("SolidEdge.DraftDocument")
+
+        try:
+            model_link = draft.ModelLinks.Add(model_path)
+            dvs = draft.ActiveSheet.DrawingViews
+            # Force late binding to avoid Part type library mismatch
+            with contextlib.suppress(Exception):
+                import win32com.client.dynamic
+
+                dvs = win32com.client.dynamic.Dispatch(dvs._oleobj_)
+            is_assembly = model_path.lower().endswith(".asm")
+
+            views_added = []
+            for spec in layout["views"]:
+                orient = _ORIENTATIONS[spec["orientation"]]
+                scale = spec.get("scale", layout["scale"])
+                try:
+                    if is_assembly:
+                        dvs.AddAssemblyView(model_link, orient, scale, spec["x"], spec["y"], 0)
+                    else:
+                        dvs.AddPartView(model_link, orient, scale, spec["x"], spec["y"], 0)
+                    views_added.append(spec["orientation"])
+                except Exception as e:
+                    entry.setdefault("warnings", []).append(
+                        f"View {spec['orientation']} failed: {e}"
+                    )
+            entry["views"] = views_added
+
+            parts_list = layout.get("parts_list")
+            if parts_list and is_assembly and views_added:
+                try:
+                    view = dvs.Item(parts_list.get("view", 0) + 1)
+                    draft.ActiveSheet.PartsLists.Add(
+                        view,
+                        parts_list.get("saved_settings", ""),
+                        1 if parts_list.get("auto_balloon", True) else 0,
+                        1,
+                    )
+                    entry["parts_list"] = True
+                except Exception as e:
+                    entry.setdefault("warnings", []).append(f"Parts list failed: {e}")
+
+            properties = {
+                name: str(value).format(**tokens)
+                for name, value in layout.get("properties", {}).items()
+            }
+            failed = self._set_draft_properties(draft, properties)
+            if failed:
+                entry.setdefault("warnings", []).append(f"Properties not set: {', '.join(failed)}")
+
+            draft.SaveAs(draft_path)
+            if export_pdf:
+                pdf_path = os.path.splitext(draft_path)[0] + ".pdf"
+                try:
+                    draft.SaveAs(pdf_path)
+                    entry["pdf"] = pdf_path
+                except Exception as e:
+                    entry.setdefault("warnings", []).append(f"PDF export failed: {e}")
+
+            entry["status"] = "created" if views_added else "partial"
+        finally:
+            with contextlib.suppress(Exception):
+                draft.Close(False)
+        entry["seconds"] = round(time.perf_counter() - start, 4)
+        return entry
+
+    def generate_drawings(
+        self,
+        model_paths: list[str],
+        output_dir: str,
+        layout: dict[str, Any] | str | None = None,
+        export_pdf: bool = False,
+        overwrite: bool = False,
+        results_path: str | None = None,
+    ) -> dict[str, Any]:
+        """
+        Generate one draft per model from a shared view-layout template.
+
+        Each draft is created, populated with the layout's views (plus a
+        parts list for assemblies), given title-block properties, saved as
+        <output_dir>/<model stem>.dft and closed before the next model is
+        processed. Models sharing a stem (bracket.par and bracket.psm, or
+        one name in two folders) get the extension, then the folder, added
+        to the draft name so they never overwrite each other. One failed
+        model does not stop the batch.
+
+        Layout keys:
+            views: [{"orientation", "x", "y", "scale"?}] - positions in meters
+            scale: default view scale (1.0)
+            template: draft template (.dft) to start from
+            parts_list: {"view": 0, "auto_balloon": true, "saved_settings": ""}
+            properties: {name: value}; values may use {stem}, {name},
+                {folder} and {path} of the model
+
+        Args:
+            model_paths: Part/assembly files to draft
+            output_dir: Folder for the generated drafts (created if missing)
+            layout: Layout dict or path to a JSON layout file (default: 4 views)
+            export_pdf: Also publish each draft as <stem>.pdf
+            overwrite: Replace drafts that already exist (otherwise skipped)
+            results_path: Optional JSONL file; one line is appended per model
+                as soon as it finishes so progress can be followed
+
+        Returns:
+            Dict with per-model results and totals
+        """
+        try:
+            layout = _load_layout(layout)
+        except (OSError, ValueError) as e:
+            return {"error": f"Invalid layout: {e}"}
+        if not model_paths:
+            return {"error": "No model paths given"}
+
+        try:
+            app = self.doc_manager.connection.get_application()
+            os.makedirs(output_dir, exist_ok=True)
+
+            results = []
+            start = time.perf_counter()
+            stems = _draft_stems(model_paths)
+            with self.doc_manager.connection.performance_scope():
+                for model_path in model_paths:
+                    try:
+                        entry = self._generate_one_drawing(
+                            app,
+                            model_path,
+                            layout,
+                            output_dir,
+                            export_pdf,
+                            overwrite,
+                            stems[model_path],
+                        )
+                    except Exception as e:
+                        _logger.error(f"Drawing generation failed for {model_path}: {e}")
+                        entry = {"model": model_path, "status": "error", "error": str(e)}
+                    results.append(entry)
+                    if results_path:
+                        # Append per model so a partial batch still leaves a record
+                        with open(results_path, "a", encoding="utf-8") as f:
+                            f.write(json.dumps(entry) + "\n")
+
+            counts: dict[str, int] = {}
+            for entry in results:
+                counts[entry["status"]] = counts.get(entry["status"], 0) + 1
+            return {
+                "status": "completed",
+                "total": len(results),
+                "counts": counts,
+                "output_dir": output_dir,
+                "results_path": results_path,
+                "results": results,
+                "total_seconds": round(time.perf_counter() - start, 4),
+            }
+        except Exception as e:
+            return {"error": str(e), "traceback": traceback.format_exc()}
@@ -0,0 +1,276 @@
+"""Bulk annotation placement: many heterogeneous annotations in one pass."""
+
+import contextlib
+import time
+import traceback
+from collections.abc import Callable
+from typing import Any
+
+from ..logging import get_logger
+
+_logger = get_logger(__name__)
+
+_X_KEYS = ("x", "x1", "x2", "x3", "dim_x", "center_x", "point_x", "origin_x", "leader_x")
+_Y_KEYS = ("y", "y1", "y2", "y3", "dim_y", "center_y", "point_y", "origin_y", "leader_y")
+
+_SURFACE_FINISH_TYPES = {"machined": 1, "any": 0, "prohibited": 2}
+_WELD_TYPES = {"fillet": 0, "groove": 1, "plug": 2, "spot": 3, "seam": 4}
+
+
+def _text_box(s: dict[str, Any]) -> tuple[str, str, tuple[Any, ...]]:
+    return "TextBoxes", "Add", (s["x"], s["y"], 0)
+
+
+def _leader(s: dict[str, Any]) -> tuple[str, str, tuple[Any, ...]]:
+    return "Leaders", "Add", (s["x1"], s["y1"], 0, s["x2"], s["y2"], 0)
+
+
+def _balloon(s: dict[str, Any]) -> tuple[str, str, tuple[Any, ...]]:
+    if s.get("leader_x") is not None and s.get("leader_y") is not None:
+        return "Balloons", "Add", (s["leader_x"], s["leader_y"], 0, s["x"], s["y"], 0)
+    return "Balloons", "Add", (s["x"], s["y"], 0, s["x"] + 0.02, s["y"] + 0.02, 0)
+
+
+def _linear(s: dict[str, Any]) -> tuple[str, str, tuple[Any, ...]]:
+    dim_x = s.get("dim_x")
+    dim_y = s.get("dim_y")
+    if dim_x is None:
+        dim_x = (s["x1"] + s["x2"]) / 2
+    if dim_y is None:
+        dim_y = max(s["y1"], s["y2"]) + 0.02
+    return "Dimensions", "AddLength", (s["x1"], s["y1"], 0, s["x2"], s["y2"], 0, dim_x, dim_y, 0)
+
+
+def _angular(s: dict[str, Any]) -> tuple[str, str, tuple[Any, ...]]:
+    text_x = s.get("dim_x")
+    text_y = s.get("dim_y")
+    if text_x is None:
+        text_x = (s["x1"] + s["x3"]) / 2
+    if text_y is None:
+        text_y = (s["y1"] + s["y3"]) / 2 + 0.02
+    args = (s["x1"], s["y1"], s["x2"], s["y2"], s["x3"], s["y3"], text_x, text_y)
+    return "Dimensions", "AddAngular", args
+
+
+def _radial(s: dict[str, Any]) -> tuple[str, str, tuple[Any, ...]]:
+    cx, cy, px, py = s["center_x"], s["center_y"], s["point_x"], s["point_y"]
+    text_x = s.get("dim_x")
+    text_y = s.get("dim_y")
+    if text_x is None:
+        text_x = (cx + px) / 2
+    if text_y is None:
+        text_y = (cy + py) / 2 + 0.02
+    return "Dimensions", "AddRadial", (cx, cy, px, py, text_x, text_y)
+
+
+def _diameter(s: dict[str, Any]) -> tuple[str, str, tuple[Any, ...]]:
+    cx, cy, px, py = s["center_x"], s["center_y"], s["point_x"], s["point_y"]
+    text_x = s.get("dim_x")
+    text_y = s.get("dim_y")
+    if text_x is None:
+        text_x = cx + (px - cx) * 1.3
+    if text_y is None:
+        text_y = cy + (py - cy) * 1.3 + 0.02
+    return "Dimensions", "AddDiameter", (cx, cy, px, py, text_x, text_y)
+
+
+def _ordinate(s: dict[str, Any]) -> tuple[str, str, tuple[Any, ...]]:
+    px, py = s["point_x"], s["point_y"]
+    text_x = s.get("dim_x")
+    text_y = s.get("dim_y")
+    if text_x is None:
+        text_x = px
+    if text_y is None:
+        text_y = py + 0.02
+    return "Dimensions", "AddOrdinate", (s["origin_x"], s["origin_y"], px, py, text_x, text_y)
+
+
+def _center_mark(s: dict[str, Any]) -> tuple[str, str, tuple[Any, ...]]:
+    return "CenterMarks", "Add", (s["x"], s["y"], 0)
+
+
+def _centerline(s: dict[str, Any]) -> tuple[str, str, tuple[Any, ...]]:
+    return "Centerlines", "Add", (s["x1"], s["y1"], 0, s["x2"], s["y2"], 0)
+
+
+def _surface_finish(s: dict[str, Any]) -> tuple[str, str, tuple[Any, ...]]:
+    symbol_type = str(s.get("symbol_type", "machined")).lower()
+    if symbol_type not in _SURFACE_FINISH_TYPES:
+        valid = ", ".join(_SURFACE_FINISH_TYPES)
+        raise ValueError(f"Invalid symbol_type: '{symbol_type}'. Valid: {valid}")
+    args = (s["x"], s["y"], 0, _SURFACE_FINISH_TYPES[symbol_type])
+    return "SurfaceFinishSymbols", "Add", args
+
+
+def _weld(s: dict[str, Any]) -> tuple[str, str, tuple[Any, ...]]:
+    weld_type = str(s.get("weld_type", "fillet")).lower()
+    if weld_type not in _WELD_TYPES:
+        raise ValueError(f"Invalid weld_type: '{weld_type}'. Valid: {', '.join(_WELD_TYPES)}")
+    return "WeldSymbols", "Add", (s["x"], s["y"], 0, _WELD_TYPES[weld_type])
+
+
+def _fcf(s: dict[str, Any]) -> tuple[str, str, tuple[Any, ...]]:
+    return "FCFs", "Add", (s["x"], s["y"], 0)
+
+
+# type -> (builder returning (sheet collection, method, args), text property to set)
+_ANNOTATION_BUILDERS: dict[
+    str, tuple[Callable[[dict[str, Any]], tuple[str, str, tuple[Any, ...]]], str | None]
+] = {
+    "text_box": (_text_box, "Text"),
+    "note": (_text_box, "Text"),
+    "leader": (_leader, "Text"),
+    "balloon": (_balloon, "BalloonText"),
+    "dimension": (_linear, None),
+    "angular_dimension": (_angular, None),
+    "radial_dimension": (_radial, None),
+    "diameter_dimension": (_diameter, None),
+    "ordinate_dimension": (_ordinate, None),
+    "center_mark": (_center_mark, None),
+    "centerline": (_centerline, None),
+    "surface_finish": (_surface_finish, None),
+    "weld_symbol": (_weld, None),
+    "geometric_tolerance": (_fcf, "Text"),
+}
+
+
+class BulkAnnotationsMixin:
+    """Mixin providing bulk annotation placement on a draft sheet."""
+
+    def _resolve_sheet(self, doc: Any, sheet_index: int | None) -> Any:
+        """Return the sheet at a 0-based index, or the active sheet."""
+        if sheet_index is None:
+            return doc.ActiveSheet
+        sheets = doc.Sheets
+        if sheet_index < 0 or sheet_index >= sheets.Count:
+            raise IndexError(f"Invalid sheet index: {sheet_index}. Count: {sheets.Count}")
+        return sheets.Item(sheet_index + 1)
+
+    def _place_annotations(
+        self,
+        sheet: Any,
+        specs: list[dict[str, Any]],
+        offset: tuple[float, float] = (0.0, 0.0),
+        stop_on_error: bool = False,
+    ) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
+        """Place specs on an already-resolved sheet; returns (created, errors).
+
+        Collections are looked up once per batch. Screen updates are
+        suspended by the caller.
+        """
+        collections: dict[str, Any] = {}
+        created: list[dict[str, Any]] = []
+        errors: list[dict[str, Any]] = []
+        ox, oy = offset
+
+        for i, spec in enumerate(specs):
+            kind = spec.get("type")
+            try:
+                if kind not in _ANNOTATION_BUILDERS:
+                    raise ValueError(f"Unknown annotation type: {kind}")
+                builder, text_prop = _ANNOTATION_BUILDERS[kind]
+                placed = dict(spec)
+                for key in _X_KEYS:
+                    if placed.get(key) is not None:
+                        placed[key] += ox
+                for key in _Y_KEYS:
+                    if placed.get(key) is not None:
+                        placed[key] += oy
+                try:
+                    collection_name, method, args = builder(placed)
+                except KeyError as e:
+                    raise ValueError(f"Missing coordinate {e} for {kind}") from None
+
+                if collection_name not in collections:
+                    collections[collection_name] = getattr(sheet, collection_name)
+                collection = collections[collection_name]
+                obj = getattr(collection, method)(*args)
+
+                text = spec.get("text", spec.get("tolerance_text"))
+                if text and text_prop:
+                    setattr(obj, text_prop, text)
+                if spec.get("height") is not None:
+                    with contextlib.suppress(Exception):
+                        obj.TextHeight = spec["height"]
+
+                item: dict[str, Any] = {
+                    "index": i,
+                    "type": kind,
+                    "collection": collection_name,
+                    "collection_index": collection.Count - 1,
+                }
+                with contextlib.suppress(Exception):
+                    item["name"] = obj.Name
+                created.append(item)
+            except Exception as e:
+                errors.append({"index": i, "type": kind, "error": str(e)})
+                if stop_on_error:
+                    break
+        return created, errors
+
+    def add_annotations_bulk(
+        self,
+        specs: list[dict[str, Any]],
+        sheet_index: int | None = None,
+        view_index: int | None = None,
+        stop_on_error: bool = False,
+    ) -> dict[str, Any]:
+        """
+        Place many annotations on a draft sheet in one pass.
+
+        Each spec is a dict with a 'type' plus the same parameters the
+        single-annotation methods take, e.g.
+        {"type": "balloon", "x": 0.1, "y": 0.2, "text": "3"} or
+        {"type": "dimension", "x1": 0, "y1": 0, "x2": 0.05, "y2": 0}.
+
+        Types: text_box, note, leader, balloon, dimension, angular_dimension,
+        radial_dimension, diameter_dimension, ordinate_dimension, center_mark,
+        centerline, surface_finish, weld_symbol, geometric_tolerance.
+
+        Args:
+            specs: Annotation specs (coordinates in meters)
+            sheet_index: 0-based sheet (default: active sheet)
+            view_index: If given, coordinates are offsets from this view's origin
+            stop_on_error: Stop at the first failing spec
+
+        Returns:
+            Dict with created annotation IDs (collection, index, name) and
+            per-item errors
+        """
+        if not specs:
+            return {"error": "No annotation specs given"}
+
+        try:
+            doc = self.doc_manager.get_active_document()
+            if not hasattr(doc, "Sheets"):
+                return {"error": "Active document is not a draft document"}
+
+            try:
+                sheet = self._resolve_sheet(doc, sheet_index)
+            except IndexError as e:
+                return {"error": str(e)}
+
+            offset = (0.0, 0.0)
+            if view_index is not None:
+                dvs = sheet.DrawingViews
+                if view_index < 0 or view_index >= dvs.Count:
+                    return {"error": f"Invalid view index: {view_index}. Count: {dvs.Count}"}
+                view = dvs.Item(view_index + 1)
+                offset = (view.OriginX, view.OriginY)
+
+            start = time.perf_counter()
+            with self.doc_manager.connection.performance_scope():
+                created, errors = self._place_annotations(sheet, specs, offset, stop_on_error)
+            elapsed = time.perf_counter() - start
+            _logger.info(f"Placed {len(created)} of {len(specs)} annotations in {elapsed:.2f}s")
+
+            return {
+                "status": "added" if not errors else "partial",
+                "requested": len(specs),
+                "added": len(created),
+                "created": created,
+                "errors": errors,
+                "seconds": round(elapsed, 4),
+            }
+        except Exception as e:
+            return {"error": str(e), "traceback": traceback.format_exc()}
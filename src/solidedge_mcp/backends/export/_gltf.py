@@ -0,0 +1,411 @@
+"""glTF 2.0 (binary GLB) export of parts and assemblies.
+
+Meshes are built from cached facet data (see FacetCache) with one
+primitive per color, from body and face styles. An assembly keeps its
+occurrence tree as nodes, and every occurrence of the same part file
+points at one shared mesh, so the file grows with unique parts rather
+than with occurrences. All attribute data goes into a single binary
+buffer.
+"""
+
+import json
+import math
+import os
+import struct
+import time
+import traceback
+from array import array
+from typing import Any
+
+from ..assembly._loading import ensure_occurrences_loaded
+from ..constants import FaceQueryConstants
+from ..facet_cache import FacetArrays, FacetCache
+from ..logging import get_logger
+
+_logger = get_logger(__name__)
+
+_GLB_MAGIC = 0x46546C67  # "glTF"
+_CHUNK_JSON = 0x4E4F534A
+_CHUNK_BIN = 0x004E4942
+_FLOAT = 5126
+_ARRAY_BUFFER = 34962
+
+# Solid Edge is Z-up, glTF is Y-up: -90 degrees about X
+Z_UP_TO_Y_UP = [-math.sqrt(0.5), 0.0, 0.0, math.sqrt(0.5)]
+DEFAULT_RGB = (192, 192, 192)
+
+_IDENTITY_MATRIX = [1.0, 0, 0, 0, 0, 1.0, 0, 0, 0, 0, 1.0, 0, 0, 0, 0, 1.0]
+
+
+def ole_rgb(color: Any) -> tuple[int, int, int]:
+    """(r, g, b) of an OLE color value (0x00BBGGRR)."""
+    value = int(color)
+    return value & 0xFF, (value >> 8) & 0xFF, (value >> 16) & 0xFF
+
+
+def _linear(channel: int) -> float:
+    """sRGB 0-255 to the linear 0-1 value glTF expects in baseColorFactor."""
+    c = channel / 255.0
+    return c / 12.92 if c <= 0.04045 else ((c + 0.055) / 1.055) ** 2.4
+
+
+def node_matrix(matrix: Any) -> list[float] | None:
+    """glTF node matrix of a Solid Edge occurrence matrix, None for identity.
+
+    Solid Edge transforms row vectors with translation in elements 12-14;
+    that is the column-major layout glTF uses, so the values carry over.
+    """
+    values = [float(v) for v in matrix]
+    if len(values) != 16:
+        raise ValueError(f"Expected 16 matrix values, got {len(values)}")
+    if all(abs(a - b) < 1e-12 for a, b in zip(values, _IDENTITY_MATRIX, strict=True)):
+        return None
+    return values
+
+
+def _facet_normals(facets: FacetArrays, i: int) -> list[float]:
+    """Unit normals of the three vertices of facet i.
+
+    Uses Solid Edge's per-vertex or per-facet normals when present, and
+    the triangle's own normal otherwise (or where a normal is zero).
+    """
+    count = len(facets)
+    if len(facets.normals) >= 9 * count and count:
+        given = list(facets.normals[9 * i : 9 * i + 9])
+    elif len(facets.normals) >= 3 * count and count:
+        given = list(facets.normals[3 * i : 3 * i + 3]) * 3
+    else:
+        given = [0.0] * 9
+    p = facets.points[9 * i : 9 * i + 9]
+    ux, uy, uz = p[3] - p[0], p[4] - p[1], p[5] - p[2]
+    vx, vy, vz = p[6] - p[0], p[7] - p[1], p[8] - p[2]
+    face = [uy * vz - uz * vy, uz * vx - ux * vz, ux * vy - uy * vx]
+    out: list[float] = []
+    for v in range(3):
+        n = given[3 * v : 3 * v + 3]
+        length = math.sqrt(n[0] * n[0] + n[1] * n[1] + n[2] * n[2])
+        if length == 0.0:
+            n = face
+            length = math.sqrt(n[0] * n[0] + n[1] * n[1] + n[2] * n[2]) or 1.0
+        out.extend(c / length for c in n)
+    return out
+
+
+class GltfBuilder:
+    """Accumulates meshes, materials and nodes into one glTF document and
+    one contiguous binary buffer."""
+
+    def __init__(self) -> None:
+        self.buffer = bytearray()
+        self.buffer_views: list[dict[str, Any]] = []
+        self.accessors: list[dict[str, Any]] = []
+        self.materials: list[dict[str, Any]] = []
+        self.meshes: list[dict[str, Any]] = []
+        self.nodes: list[dict[str, Any]] = []
+        self._material_index: dict[tuple[int, int, int], int] = {}
+        self.facet_count = 0
+
+    def material(self, rgb: tuple[int, int, int]) -> int:
+        """Index of the material for an sRGB color, added on first use."""
+        if rgb not in self._material_index:
+            self._material_index[rgb] = len(self.materials)
+            self.materials.append(
+                {
+                    "name": "#{:02x}{:02x}{:02x}".format(*rgb),
+                    "pbrMetallicRoughness": {
+                        "baseColorFactor": [*(_linear(c) for c in rgb), 1.0],
+                        "metallicFactor": 0.0,
+                        "roughnessFactor": 0.6,
+                    },
+                }
+            )
+        return self._material_index[rgb]
+
+    def _accessor(self, values: "array[float]", with_bounds: bool) -> int:
+        """Append float32 VEC3 data as a bufferView + accessor; 4-byte aligned."""
+        self.buffer.extend(b"\0" * (-len(self.buffer) % 4))
+        data = values.tobytes()
+        self.buffer_views.append(
+            {
+                "buffer": 0,
+                "byteOffset": len(self.buffer),
+                "byteLength": len(data),
+                "target": _ARRAY_BUFFER,
+            }
+        )
+        self.buffer.extend(data)
+        accessor: dict[str, Any] = {
+            "bufferView": len(self.buffer_views) - 1,
+            "componentType": _FLOAT,
+            "count": len(values) // 3,
+            "type": "VEC3",
+        }
+        if with_bounds:
+            accessor["min"] = [min(values[axis::3]) for axis in range(3)]
+            accessor["max"] = [max(values[axis::3]) for axis in range(3)]
+        self.accessors.append(accessor)
+        return len(self.accessors) - 1
+
+    def add_primitives(
+        self,
+        primitives: list[dict[str, Any]],
+        facets: FacetArrays,
+        body_rgb: tuple[int, int, int],
+        face_colors: dict[int, tuple[int, int, int]] | None = None,
+    ) -> None:
+        """Append one primitive per color of a body's facets to primitives.
+
+        face_colors maps face ID -> color for faces styled apart from the
+        body; the data is copied, so facets may be closed afterwards.
+        """
+        count = len(facets)
+        if not count:
+            return
+        groups: dict[tuple[int, int, int], list[int]] = {}
+        if face_colors:
+            for i, face_id in enumerate(facets.face_ids):
+                groups.setdefault(face_colors.get(face_id, body_rgb), []).append(i)
+        else:
+            groups[body_rgb] = list(range(count))
+
+        for rgb, indices in groups.items():
+            if len(indices) == count:
+                positions = array("f", facets.points)
+            else:
+                positions = array("f")
+                for i in indices:
+                    positions.fromlist(facets.points[9 * i : 9 * i + 9].tolist())
+            normals = array("f")
+            for i in indices:
+                normals.extend(_facet_normals(facets, i))
+            primitives.append(
+                {
+                    "attributes": {
+                        "POSITION": self._accessor(positions, True),
+                        "NORMAL": self._accessor(normals, False),
+                    },
+                    "material": self.material(rgb),
+                }
+            )
+        self.facet_count += count
+
+    def add_mesh(self, name: str, primitives: list[dict[str, Any]]) -> int | None:
+        """Index of a new mesh, None if there is nothing to draw."""
+        if not primitives:
+            return None
+        self.meshes.append({"name": name, "primitives": primitives})
+        return len(self.meshes) - 1
+
+    def add_node(self, node: dict[str, Any]) -> int:
+        self.nodes.append(node)
+        return len(self.nodes) - 1
+
+    def to_glb(self, root: int) -> bytes:
+        """The binary glTF file with root as the only scene node."""
+        document: dict[str, Any] = {
+            "asset": {"version": "2.0", "generator": "SolidEdge-MCP"},
+            "scene": 0,
+            "scenes": [{"nodes": [root]}],
+            "nodes": self.nodes,
+        }
+        if self.meshes:
+            document.update(
+                meshes=self.meshes,
+                materials=self.materials,
+                accessors=self.accessors,
+                bufferViews=self.buffer_views,
+                buffers=[{"byteLength": len(self.buffer)}],
+            )
+        encoded = json.dumps(document, separators=(",", ":")).encode()
+        encoded += b" " * (-len(encoded) % 4)
+        chunks = struct.pack("<II", len(encoded), _CHUNK_JSON) + encoded
+        if self.buffer:
+            binary = bytes(self.buffer) + b"\0" * (-len(self.buffer) % 4)
+            chunks += struct.pack("<II", len(binary), _CHUNK_BIN) + binary
+        return struct.pack("<III", _GLB_MAGIC, 2, 12 + len(chunks)) + chunks
+
+
+class GltfExportMixin:
+    """Mixin providing glTF/GLB export."""
+
+    doc_manager: Any
+    _facet_cache: FacetCache
+
+    @staticmethod
+    def _body_rgb(body: Any) -> tuple[int, int, int]:
+        """Body color from its style, falling back to GetColor and grey."""
+        try:
+            return ole_rgb(body.Style.ForegroundColor)
+        except Exception:
+            pass
+        try:
+            r, g, b = body.GetColor()
+            return int(r), int(g), int(b)
+        except Exception:
+            return DEFAULT_RGB
+
+    @staticmethod
+    def _face_colors(body: Any, body_rgb: tuple[int, int, int]) -> dict[int, tuple[int, int, int]]:
+        """face ID -> color for faces whose style differs from the body's."""
+        colors: dict[int, tuple[int, int, int]] = {}
+        try:
+            faces = body.Faces(FaceQueryConstants.igQueryAll)
+            count = faces.Count
+        except Exception:
+            return colors
+        for i in range(1, count + 1):
+            try:
+                face = faces.Item(i)
+                style = face.Style
+                if style is None:
+                    continue
+                rgb = ole_rgb(style.ForegroundColor)
+                if rgb != body_rgb:
+                    colors[int(face.ID)] = rgb
+            except Exception:
+                continue
+        return colors
+
+    def _part_mesh(
+        self,
+        builder: GltfBuilder,
+        doc: Any,
+        name: str,
+        tolerance: float,
+        include_colors: bool,
+        stats: dict[str, int],
+    ) -> int | None:
+        """Mesh of every body in a part document (one primitive per color)."""
+        primitives: list[dict[str, Any]] = []
+        models = doc.Models
+        for i in range(1, models.Count + 1):
+            body = models.Item(i).Body
+            body_rgb = self._body_rgb(body) if include_colors else DEFAULT_RGB
+            face_colors = self._face_colors(body, body_rgb) if include_colors else None
+            facets, cached = self._facet_cache.body_facets(doc, body, tolerance, f"model{i}")
+            stats["cached_bodies"] += cached
+            with facets:
+                builder.add_primitives(primitives, facets, body_rgb, face_colors)
+        return builder.add_mesh(name, primitives)
+
+    def export_to_gltf(
+        self, file_path: str, tolerance: float = 0.0, include_colors: bool = True
+    ) -> dict[str, Any]:
+        """
+        Export the active part or assembly to binary glTF 2.0 (.glb).
+
+        Meshes come from Body.GetFacetData through the facet cache, with a
+        material per body/face color. An assembly keeps its occurrence
+        tree as nodes (local matrices, sub-assemblies as child nodes);
+        each unique part file is tessellated once and its mesh is shared
+        by every occurrence. Suppressed occurrences are left out. The
+        scene is rotated from Solid Edge's Z-up to glTF's Y-up; units
+        stay meters.
+
+        Args:
+            file_path: Output file path (.glb is appended if missing)
+            tolerance: Tessellation tolerance in meters (<= 0 uses the
+                cached display mesh)
+            include_colors: Read body and face colors (False: one grey
+                material)
+
+        Returns:
+            Dict with status, path, size and node/mesh/occurrence counts
+        """
+        try:
+            doc = self.doc_manager.get_active_document()
+
+            # Ensure file has .glb extension
+            if not file_path.lower().endswith(".glb"):
+                file_path += ".glb"
+
+            start = time.perf_counter()
+            builder = GltfBuilder()
+            stats = {"cached_bodies": 0, "occurrences": 0}
+            meshes: dict[str, int | None] = {}
+            skipped: list[dict[str, Any]] = []
+            doc_name = str(getattr(doc, "Name", "") or "root")
+            root: dict[str, Any] = {"name": doc_name, "rotation": Z_UP_TO_Y_UP}
+
+            def walk(occurrences: Any) -> list[int]:
+                children = []
+                for i in range(1, occurrences.Count + 1):
+                    occ = occurrences.Item(i)
+                    name = str(getattr(occ, "Name", f"Occurrence_{i}"))
+                    try:
+                        if getattr(occ, "IsSuppressed", False) is True:
+                            continue
+                        file_name = str(occ.OccurrenceFileName)
+                        node: dict[str, Any] = {"name": name}
+                        matrix = node_matrix(occ.GetMatrix())
+                        if matrix is not None:
+                            node["matrix"] = matrix
+                        # Lightweight-opened assemblies have inactive occurrences
+                        ensure_occurrences_loaded([occ])
+                        if file_name.lower().endswith(".asm"):
+                            sub = walk(occ.OccurrenceDocument.Occurrences)
+                            if sub:
+                                node["children"] = sub
+                        else:
+                            if file_name not in meshes:
+                                # Recorded before building so a failing part is tried once
+                                meshes[file_name] = None
+                                meshes[file_name] = self._part_mesh(
+                                    builder,
+                                    occ.OccurrenceDocument,
+                                    os.path.basename(file_name),
+                                    tolerance,
+                                    include_colors,
+                                    stats,
+                                )
+                            if meshes[file_name] is not None:
+                                node["mesh"] = meshes[file_name]
+                            stats["occurrences"] += 1
+                        children.append(builder.add_node(node))
+                    except Exception as e:
+                        skipped.append({"name": name, "error": str(e)})
+                return children
+
+            if hasattr(doc, "Occurrences"):
+                children = walk(doc.Occurrences)
+                if children:
+                    root["children"] = children
+            else:
+                if doc.Models.Count == 0:
+                    return {"error": "No bodies to export"}
+                mesh = self._part_mesh(builder, doc, doc_name, tolerance, include_colors, stats)
+                if mesh is not None:
+                    root["mesh"] = mesh
+                meshes[doc_name] = mesh
+                stats["occurrences"] = 1
+
+            if not builder.meshes:
+                return {"error": "Nothing to export: no tessellated bodies", "skipped": skipped}
+
+            glb = builder.to_glb(builder.add_node(root))
+            with open(file_path, "wb") as f:
+                f.write(glb)
+
+            elapsed = time.perf_counter() - start
+            _logger.info(
+                f"Exported glTF: {file_path} ({stats['occurrences']} occurrences, "
+                f"{len(builder.meshes)} meshes) in {elapsed:.2f}s"
+            )
+            return {
+                "status": "exported",
+                "format": "GLB",
+                "path": file_path,
+                "size_bytes": len(glb),
+                "node_count": len(builder.nodes),
+                "mesh_count": len(builder.meshes),
+                "material_count": len(builder.materials),
+                "occurrence_count": stats["occurrences"],
+                "unique_parts": len(meshes),
+                "facet_count": builder.facet_count,
+                "cached_bodies": stats["cached_bodies"],
+                "skipped": skipped,
+                "seconds": round(elapsed, 4),
+            }
+        except Exception as e:
+            _logger.error(f"glTF export failed: {e}")
+            return {"error": str(e), "traceback": traceback.format_exc()}
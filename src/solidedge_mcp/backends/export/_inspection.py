@@ -0,0 +1,220 @@
+"""Inspection reports: every drawing dimension as a numbered table row."""
+
+import contextlib
+import csv
+import json
+import os
+import time
+import traceback
+from collections.abc import Callable, Iterator
+from typing import IO, Any
+
+from ..logging import get_logger
+from ._publishing import _expand_draft_paths
+from ._snapshot import _DIM_TYPE_NAMES, _read
+
+_logger = get_logger(__name__)
+
+REPORT_COLUMNS = [
+    "draft",
+    "characteristic",
+    "sheet",
+    "sheet_name",
+    "view",
+    "name",
+    "type",
+    "value",
+    "units",
+    "display_text",
+    "upper_tolerance",
+    "lower_tolerance",
+    "display_type",
+]
+
+_ANGULAR_TYPES = {"Angular", "ArcAngle", "AngularCoordinate"}
+
+# Documents.Open flag: open without a window (read-only extraction)
+_OPEN_IN_BACKGROUND = 0x8
+
+
+def _dimension_row(dim: Any, view_name: str | None) -> dict[str, Any]:
+    """Read one dimension into a report row (without numbering)."""
+    dim_type = _read(dim, "DimensionType")
+    if dim_type is None:
+        dim_type = _read(dim, "Type")
+    type_name = _DIM_TYPE_NAMES.get(dim_type) if dim_type is not None else None
+    value = _read(dim, "Value")
+    override = _read(dim, "OverrideString")
+    shown = override if override else (value if value is not None else "")
+    text = f"{_read(dim, 'PrefixString') or ''}{shown}{_read(dim, 'SuffixString') or ''}"
+    return {
+        "view": view_name,
+        "name": _read(dim, "Name"),
+        "type": type_name or dim_type,
+        "value": value,
+        "units": "rad" if type_name in _ANGULAR_TYPES else "m",
+        "display_text": text,
+        "upper_tolerance": _read(dim, "PrimaryUpperTolerance"),
+        "lower_tolerance": _read(dim, "PrimaryLowerTolerance"),
+        "display_type": _read(dim, "DisplayType"),
+    }
+
+
+def _iter_dimension_rows(doc: Any, include_background: bool) -> Iterator[dict[str, Any]]:
+    """Yield rows sheet by sheet: view dimensions first, then unattached ones."""
+    sheets = doc.Sheets
+    for s in range(1, sheets.Count + 1):
+        sheet = sheets.Item(s)
+        if _read(sheet, "Background") and not include_background:
+            continue
+        base = {"sheet": s - 1, "sheet_name": _read(sheet, "Name")}
+
+        seen: set[str] = set()
+        views = _read(sheet, "DrawingViews")
+        if views is not None:
+            with contextlib.suppress(Exception):
+                import win32com.client.dynamic
+
+                views = win32com.client.dynamic.Dispatch(views._oleobj_)
+        for v in range(1, (_read(views, "Count") or 0) + 1):
+            view = views.Item(v)
+            view_name = _read(view, "Name") or f"View{v}"
+            view_dims = _read(view, "Dimensions")
+            for d in range(1, (_read(view_dims, "Count") or 0) + 1):
+                row = _dimension_row(view_dims.Item(d), view_name)
+                if row["name"] is not None:
+                    seen.add(row["name"])
+                yield {**base, **row}
+
+        dims = _read(sheet, "Dimensions")
+        for d in range(1, (_read(dims, "Count") or 0) + 1):
+            dim = dims.Item(d)
+            if _read(dim, "Name") in seen:
+                continue
+            yield {**base, **_dimension_row(dim, None)}
+
+
+def _row_writer(f: IO[str], fmt: str, write_header: bool) -> Callable[[dict[str, Any]], Any]:
+    """Return a function that streams one row to an open CSV or JSON Lines file."""
+    if fmt == "csv":
+        writer = csv.DictWriter(f, fieldnames=REPORT_COLUMNS)
+        if write_header:
+            writer.writeheader()
+        return writer.writerow
+    return lambda row: f.write(json.dumps(row) + "\n")
+
+
+class InspectionReportMixin:
+    """Mixin providing dimension extraction into inspection reports."""
+
+    def export_dimension_report(
+        self,
+        output_path: str,
+        drafts: list[str] | None = None,
+        output_format: str | None = None,
+        start_number: int = 1,
+        restart_numbering: bool = False,
+        include_background: bool = False,
+        append: bool = False,
+    ) -> dict[str, Any]:
+        """
+        Write every dimension of one or many drafts to a CSV or JSON Lines table.
+
+        Each row holds draft, characteristic number, sheet, view, dimension
+        name, type, value (meters or radians), displayed text, tolerances and
+        display type. Dimensions are numbered sheet by sheet, view by view;
+        dimensions not attached to a view come last on their sheet with an
+        empty view.
+
+        Rows are written as they are read, so a vault-sized run keeps memory
+        flat and a failed draft does not lose earlier rows. Drafts are opened
+        without a window and closed again; one failing draft does not stop
+        the run.
+
+        Args:
+            output_path: .csv or .jsonl file to write
+            drafts: .dft files, folders or glob patterns (default: active draft)
+            output_format: 'csv' | 'jsonl' (default: from the file extension)
+            start_number: First characteristic number
+            restart_numbering: Start again at start_number for each draft
+            include_background: Also read background sheets
+            append: Append to an existing report instead of replacing it
+
+        Returns:
+            Dict with per-draft row counts and totals
+        """
+        fmt = (output_format or os.path.splitext(output_path)[1].lstrip(".") or "csv").lower()
+        if fmt == "jsonl" or fmt == "ndjson":
+            fmt = "jsonl"
+        elif fmt != "csv":
+            return {"error": f"Invalid format: {fmt}. Valid: csv, jsonl"}
+
+        try:
+            if drafts:
+                paths = _expand_draft_paths(drafts)
+                if not paths:
+                    return {"error": "No draft files matched"}
+                app = self.doc_manager.connection.get_application()
+            else:
+                doc = self.doc_manager.get_active_document()
+                if not hasattr(doc, "Sheets"):
+                    return {"error": "Active document is not a draft document"}
+
+            out_dir = os.path.dirname(output_path)
+            if out_dir:
+                os.makedirs(out_dir, exist_ok=True)
+
+            start = time.perf_counter()
+            results = []
+            total = 0
+            number = start_number
+            write_header = not (append and os.path.exists(output_path))
+            mode = "a" if append else "w"
+            with (
+                open(output_path, mode, newline="", encoding="utf-8") as f,
+                self.doc_manager.connection.performance_scope(),
+            ):
+                write_row = _row_writer(f, fmt, write_header)
+                sources = paths if drafts else [None]
+                for path in sources:
+                    if restart_numbering:
+                        number = start_number
+                    entry: dict[str, Any] = {"draft": path}
+                    opened = None
+                    rows = 0
+                    try:
+                        if path is None:
+                            source = doc
+                            entry["draft"] = _read(doc, "FullName")
+                        else:
+                            if not os.path.exists(path):
+                                raise FileNotFoundError("Draft file not found")
+                            opened = source = app.Documents.Open(path, _OPEN_IN_BACKGROUND)
+                        for row in _iter_dimension_rows(source, include_background):
+                            write_row({"draft": entry["draft"], "characteristic": number, **row})
+                            number += 1
+                            rows += 1
+                        entry["status"] = "extracted"
+                    except Exception as e:
+                        _logger.error(f"Dimension extraction failed for {path}: {e}")
+                        entry.update(status="error", error=str(e))
+                    finally:
+                        if opened is not None:
+                            with contextlib.suppress(Exception):
+                                opened.Close(False)
+                    entry["rows"] = rows
+                    total += rows
+                    results.append(entry)
+
+            elapsed = time.perf_counter() - start
+            _logger.info(f"Wrote {total} dimension rows from {len(results)} draft(s)")
+            return {
+                "status": "completed",
+                "output_path": output_path,
+                "format": fmt,
+                "rows": total,
+                "drafts": results,
+                "total_seconds": round(elapsed, 4),
+            }
+        except Exception as e:
+            return {"error": str(e), "traceback": traceback.format_exc()}
@@ -0,0 +1,270 @@
+"""Parts list sync: diff an existing parts list against the assembly BOM."""
+
+import contextlib
+import os
+import time
+import traceback
+from typing import Any
+
+from ..logging import get_logger
+from ._snapshot import _read
+
+_logger = get_logger(__name__)
+
+# Header names tried (case-insensitive) when no column is given
+_KEY_HEADERS = ("file name", "filename", "document number", "part number", "name")
+_QUANTITY_HEADERS = ("quantity", "qty", "qty.")
+# Key headers showing the occurrence's file name; any other key column is
+# matched against the document property of the same name
+_FILE_NAME_HEADERS = ("file name", "filename", "name")
+
+# Documents.Open flag: open without a window
+_OPEN_IN_BACKGROUND = 0x8
+
+
+def _part_key(value: Any) -> str:
+    """Compare file names and part numbers without folder, extension or case."""
+    name = str(value or "").replace("\\", "/").rsplit("/", 1)[-1]
+    stem, ext = os.path.splitext(name)
+    if ext.lower() in (".par", ".psm", ".asm", ".pwd"):
+        name = stem
+    return name.strip().lower()
+
+
+def _find_column(headers: list[str], wanted: str | None, candidates: tuple[str, ...]) -> int:
+    """1-based column index by explicit header or the first known candidate."""
+    lowered = [h.strip().lower() for h in headers]
+    names = (wanted.lower(),) if wanted else candidates
+    for name in names:
+        if name in lowered:
+            return lowered.index(name) + 1
+    raise ValueError(f"Column not found: {wanted or candidates[0]}. Headers: {', '.join(headers)}")
+
+
+def _document_property(doc: Any, name: str) -> Any:
+    """Value of a document property by name (case-insensitive) in any
+    property set, e.g. 'Document Number' in ProjectInformation."""
+    wanted = name.strip().lower()
+    prop_sets = _read(doc, "Properties")
+    for s in range(1, (_read(prop_sets, "Count") or 0) + 1):
+        with contextlib.suppress(Exception):
+            props = prop_sets.Item(s)
+            for p in range(1, props.Count + 1):
+                prop = props.Item(p)
+                if str(_read(prop, "Name") or "").strip().lower() == wanted:
+                    return _read(prop, "Value")
+    return None
+
+
+def _bom_quantities(asm_doc: Any, key_property: str | None = None) -> dict[str, dict[str, Any]]:
+    """Top-level BOM keyed by part key, with the same rules as get_bom.
+
+    Keys are file names, or with key_property the value of that property
+    of each occurrence's document (the file name where it is missing).
+    """
+    bom: dict[str, dict[str, Any]] = {}
+    # Property read once per file, however many occurrences share it
+    file_keys: dict[str, str] = {}
+    occurrences = asm_doc.Occurrences
+    for i in range(1, occurrences.Count + 1):
+        occ = occurrences.Item(i)
+        if _read(occ, "IncludeInBom") is False or _read(occ, "IsPatternItem"):
+            continue
+        file_path = _read(occ, "OccurrenceFileName") or f"Unknown_{i}"
+        if file_path not in file_keys:
+            value = None
+            if key_property is not None:
+                value = _document_property(_read(occ, "OccurrenceDocument"), key_property)
+            file_keys[file_path] = _part_key(value) or _part_key(file_path)
+        key = file_keys[file_path]
+        if key in bom:
+            bom[key]["quantity"] += 1
+        else:
+            bom[key] = {"file_path": file_path, "quantity": 1}
+    return bom
+
+
+def _as_quantity(value: Any) -> float | None:
+    try:
+        return float(str(value).strip())
+    except (TypeError, ValueError):
+        return None
+
+
+class PartsListSyncMixin:
+    """Mixin providing parts list diff and in-place sync against the BOM."""
+
+    def _parts_list_model(self, parts_list: Any, sheet: Any) -> tuple[Any, Any]:
+        """Return (assembly document, document opened here or None)."""
+        link = None
+        view = _read(parts_list, "DrawingView")
+        if view is not None:
+            link = _read(view, "ModelLink")
+        if link is None:
+            views = sheet.DrawingViews
+            for v in range(1, views.Count + 1):
+                link = _read(views.Item(v), "ModelLink")
+                if link is not None:
+                    break
+        if link is None:
+            raise RuntimeError("Parts list has no linked model")
+
+        model = _read(link, "ModelDocument")
+        if model is not None and hasattr(model, "Occurrences"):
+            return model, None
+        path = _read(link, "FileName")
+        if not path or not os.path.exists(path):
+            raise RuntimeError(f"Linked assembly not found: {path}")
+        app = self.doc_manager.connection.get_application()
+        opened = app.Documents.Open(path, _OPEN_IN_BACKGROUND)
+        if not hasattr(opened, "Occurrences"):
+            with contextlib.suppress(Exception):
+                opened.Close(False)
+            raise RuntimeError(f"Linked model is not an assembly: {path}")
+        return opened, opened
+
+    def sync_parts_list(
+        self,
+        parts_list_index: int = 0,
+        sheet_index: int | None = None,
+        key_column: str | None = None,
+        quantity_column: str | None = None,
+        dry_run: bool = False,
+    ) -> dict[str, Any]:
+        """
+        Compare a parts list with its assembly's BOM and bring it up to date.
+
+        Rows are matched on a key column (folder, extension and case are
+        ignored). A File Name or Name column is compared with each
+        occurrence's file name; any other column (Document Number, Part
+        Number, ...) with the document property of the same name, falling
+        back to the file name for documents without it. Quantity-only differences are
+        written to just the affected quantity cells. When parts were added or
+        removed the existing parts list is updated in place with
+        PartsList.Update(): parts list rows are generated from the model
+        (row membership, item numbers, sort order and balloon links), and
+        the API has no way to add or delete a single associative row.
+        Nothing is touched when the list is in sync.
+
+        Keys that appear on more than one row are reported as conflicts and
+        left out of the diff, so no quantity is written to an ambiguous row.
+
+        Args:
+            parts_list_index: 0-based parts list on the sheet
+            sheet_index: 0-based sheet (default: active sheet)
+            key_column: Header of the column identifying parts
+                (default: File Name, Document Number, Part Number or Name)
+            quantity_column: Header of the quantity column (default: Quantity)
+            dry_run: Only report the diff
+
+        Returns:
+            Dict with added, removed and changed rows and the action taken
+        """
+        try:
+            doc = self.doc_manager.get_active_document()
+            if not hasattr(doc, "Sheets"):
+                return {"error": "Active document is not a draft document"}
+            try:
+                sheet = self._resolve_sheet(doc, sheet_index)
+            except IndexError as e:
+                return {"error": str(e)}
+
+            parts_lists = sheet.PartsLists
+            if parts_list_index < 0 or parts_list_index >= parts_lists.Count:
+                return {
+                    "error": f"Invalid parts list index: {parts_list_index}. "
+                    f"Count: {parts_lists.Count}"
+                }
+            pl = parts_lists.Item(parts_list_index + 1)
+
+            start = time.perf_counter()
+            columns = pl.Columns
+            headers = [
+                str(_read(columns.Item(c), "HeaderRowValue") or "")
+                for c in range(1, columns.Count + 1)
+            ]
+            try:
+                key_col = _find_column(headers, key_column, _KEY_HEADERS)
+                qty_col = _find_column(headers, quantity_column, _QUANTITY_HEADERS)
+            except ValueError as e:
+                return {"error": str(e)}
+
+            keyed: dict[str, list[dict[str, Any]]] = {}
+            for r in range(1, pl.Rows.Count + 1):
+                key = _part_key(_read(pl.Cell(r, key_col), "value"))
+                if key:
+                    keyed.setdefault(key, []).append(
+                        {"row": r - 1, "quantity": _read(pl.Cell(r, qty_col), "value")}
+                    )
+            rows = {key: found[0] for key, found in keyed.items() if len(found) == 1}
+            conflicts = [
+                {"key": key, "rows": [row["row"] for row in found]}
+                for key, found in keyed.items()
+                if len(found) > 1
+            ]
+
+            key_header = headers[key_col - 1].strip()
+            key_property = None if key_header.lower() in _FILE_NAME_HEADERS else key_header
+            model, opened = self._parts_list_model(pl, sheet)
+            try:
+                bom = _bom_quantities(model, key_property)
+            finally:
+                if opened is not None:
+                    with contextlib.suppress(Exception):
+                        opened.Close(False)
+
+            added = [
+                {"key": key, "file_path": item["file_path"], "quantity": item["quantity"]}
+                for key, item in bom.items()
+                if key not in keyed
+            ]
+            removed = [
+                {"key": key, "row": row["row"], "quantity": row["quantity"]}
+                for key, row in rows.items()
+                if key not in bom
+            ]
+            changed = [
+                {
+                    "key": key,
+                    "row": row["row"],
+                    "old_quantity": row["quantity"],
+                    "new_quantity": bom[key]["quantity"],
+                }
+                for key, row in rows.items()
+                if key in bom and _as_quantity(row["quantity"]) != bom[key]["quantity"]
+            ]
+
+            if not (added or removed or changed):
+                action = "none"
+            elif dry_run:
+                action = "dry_run"
+            elif added or removed:
+                pl.Update()
+                action = "updated_list"
+            else:
+                for change in changed:
+                    pl.Cell(change["row"] + 1, qty_col).value = str(change["new_quantity"])
+                action = "updated_rows"
+
+            elapsed = time.perf_counter() - start
+            _logger.info(
+                f"Parts list sync: {len(added)} added, {len(removed)} removed, "
+                f"{len(changed)} changed, {len(conflicts)} conflicts ({action}) "
+                f"in {elapsed:.2f}s"
+            )
+            return {
+                "status": "in_sync" if action == "none" else action,
+                "rows": sum(len(found) for found in keyed.values()),
+                "bom_items": len(bom),
+                "added": added,
+                "removed": removed,
+                "changed": changed,
+                "conflicts": conflicts,
+                "unchanged": len(rows) - len(removed) - len(changed),
+                "rows_touched": len(changed) if action == "updated_rows" else 0,
+                "key_column": headers[key_col - 1],
+                "quantity_column": headers[qty_col - 1],
+                "seconds": round(elapsed, 4),
+            }
+        except Exception as e:
+            return {"error": str(e), "traceback": traceback.format_exc()}
@@ -0,0 +1,348 @@
+"""Batch publishing of drafts to PDF/DXF over a pool of Solid Edge instances."""
+
+import contextlib
+import glob
+import os
+import queue
+import re
+import threading
+import time
+import traceback
+from typing import Any
+
+from ..logging import get_logger
+
+_logger = get_logger(__name__)
+
+PUBLISH_FORMATS = ("pdf", "dxf")
+
+# Global parameter controlling which sheets Draft SaveAs-PDF writes, and its
+# "active sheet only" value (used when exporting selected sheets one by one)
+_PDF_SHEET_OPTION_GLOBAL = "seApplicationGlobalDraftSaveAsPDFSheetOptions"
+_PDF_ACTIVE_SHEET_ONLY = "seDraftSaveAsPDFSheetOptionsConstantsActiveSheetOnly"
+
+_UNSAFE_CHARS = re.compile(r'[<>:"/\\|?*]+')
+
+
+def _expand_draft_paths(paths: list[str]) -> list[str]:
+    """Expand directories and glob patterns into an ordered, de-duplicated .dft list."""
+    found: list[str] = []
+    for entry in paths:
+        if glob.has_magic(entry):
+            matches = sorted(glob.glob(entry, recursive=True))
+        elif os.path.isdir(entry):
+            matches = sorted(glob.glob(os.path.join(entry, "*.dft")))
+        else:
+            matches = [entry]
+        found.extend(m for m in matches if m.lower().endswith(".dft") or m == entry)
+
+    seen: set[str] = set()
+    unique = []
+    for path in found:
+        key = os.path.normcase(os.path.abspath(path))
+        if key not in seen:
+            seen.add(key)
+            unique.append(path)
+    return unique
+
+
+def _select_sheets(doc: Any, sheets: list[int | str]) -> list[tuple[int, Any, str]]:
+    """Resolve 0-based indices or sheet names to (index, sheet, name) tuples."""
+    collection = doc.Sheets
+    by_name: dict[str, int] = {}
+    for i in range(collection.Count):
+        with contextlib.suppress(Exception):
+            by_name[str(collection.Item(i + 1).Name).lower()] = i
+
+    selected = []
+    for key in sheets:
+        if isinstance(key, int):
+            if key < 0 or key >= collection.Count:
+                raise IndexError(f"Invalid sheet index: {key}. Count: {collection.Count}")
+            index = key
+        else:
+            if key.lower() not in by_name:
+                raise KeyError(f"Sheet not found: {key}")
+            index = by_name[key.lower()]
+        sheet = collection.Item(index + 1)
+        name = f"Sheet{index + 1}"
+        with contextlib.suppress(Exception):
+            name = str(sheet.Name)
+        selected.append((index, sheet, name))
+    return selected
+
+
+def _merge_pdfs(pdf_paths: list[str], merged_path: str) -> dict[str, Any]:
+    """Concatenate PDFs with pypdf when it is installed."""
+    try:
+        from pypdf import PdfWriter
+    except ImportError:
+        return {"status": "skipped", "reason": "pypdf is not installed"}
+    if not pdf_paths:
+        return {"status": "skipped", "reason": "No PDFs were published"}
+
+    writer = PdfWriter()
+    for path in pdf_paths:
+        writer.append(path)
+    with open(merged_path, "wb") as f:
+        writer.write(f)
+    return {"status": "merged", "path": merged_path, "inputs": len(pdf_paths)}
+
+
+class PublishingMixin:
+    """Mixin providing batch PDF/DXF publishing of draft files."""
+
+    def _new_publish_instance(self) -> Any:
+        """Start a dedicated, hidden Solid Edge instance for a pool worker."""
+        import win32com.client
+
+        app = win32com.client.DispatchEx("SolidEdge.Application")
+        with contextlib.suppress(Exception):
+            app.Visible = False
+            app.DisplayAlerts = False
+        return app
+
+    def _publish_one(self, app: Any, path: str, options: dict[str, Any]) -> dict[str, Any]:
+        """Open one draft, optionally update its views, and write its outputs."""
+        stem = os.path.splitext(os.path.basename(path))[0]
+        output_dir = options["output_dir"]
+        entry: dict[str, Any] = {"draft": path, "outputs": []}
+
+        if not os.path.exists(path):
+            return {**entry, "status": "error", "error": "Draft file not found"}
+
+        if not options["sheets"] and not options["overwrite"]:
+            targets = {fmt: os.path.join(output_dir, f"{stem}.{fmt}") for fmt in options["formats"]}
+            if all(os.path.exists(t) for t in targets.values()):
+                # Existing outputs are still listed so a package merge includes them
+                entry["outputs"] = [
+                    {"format": fmt, "path": t, "status": "skipped"} for fmt, t in targets.items()
+                ]
+                return {**entry, "status": "skipped", "reason": "Outputs already exist"}
+
+        start = time.perf_counter()
+        doc = app.Documents.Open(path)
+        saved_global = None
+        try:
+            if options["update_views"]:
+                try:
+                    doc.UpdateAll(False)
+                    entry["views_updated"] = True
+                except Exception as e:
+                    entry.setdefault("warnings", []).append(f"View update failed: {e}")
+
+            if options["sheets"]:
+                selected = _select_sheets(doc, options["sheets"])
+                param = self.doc_manager.connection.resolve_constant(_PDF_SHEET_OPTION_GLOBAL)
+                active_only = self.doc_manager.connection.resolve_constant(_PDF_ACTIVE_SHEET_ONLY)
+                if "pdf" in options["formats"]:
+                    if param is None:
+                        entry.setdefault("warnings", []).append(
+                            f"{_PDF_SHEET_OPTION_GLOBAL} unavailable; PDFs may contain every sheet"
+                        )
+                    else:
+                        with contextlib.suppress(Exception):
+                            previous = app.GetGlobalParameter(param)
+                            app.SetGlobalParameter(param, active_only or 0)
+                            saved_global = (param, previous)
+                jobs: list[tuple[Any, str, str | None]] = [
+                    (sheet, f"{stem}_{_UNSAFE_CHARS.sub('_', name)}", name)
+                    for _, sheet, name in selected
+                ]
+            else:
+                jobs = [(None, stem, None)]
+
+            for sheet, out_stem, sheet_name in jobs:
+                if sheet is not None:
+                    sheet.Activate()
+                for fmt in options["formats"]:
+                    target = os.path.join(output_dir, f"{out_stem}.{fmt}")
+                    output: dict[str, Any] = {"format": fmt, "path": target}
+                    if sheet_name is not None:
+                        output["sheet"] = sheet_name
+                    if os.path.exists(target) and not options["overwrite"]:
+                        output["status"] = "skipped"
+                    else:
+                        doc.SaveAs(target)
+                        output["status"] = "exported"
+                    entry["outputs"].append(output)
+            entry["status"] = "published"
+        finally:
+            if saved_global is not None:
+                with contextlib.suppress(Exception):
+                    app.SetGlobalParameter(*saved_global)
+            with contextlib.suppress(Exception):
+                doc.Close(False)
+        entry["seconds"] = round(time.perf_counter() - start, 4)
+        return entry
+
+    def _publish_worker(
+        self,
+        jobs: "queue.Queue[tuple[int, str] | None]",
+        results: list[dict[str, Any] | None],
+        options: dict[str, Any],
+    ) -> None:
+        """Pool worker: own COM apartment and Solid Edge instance, drains the job queue."""
+        com_initialized = False
+        app = None
+        startup_error = None
+        try:
+            with contextlib.suppress(ImportError):
+                import pythoncom
+
+                pythoncom.CoInitialize()
+                com_initialized = True
+            try:
+                app = self._new_publish_instance()
+            except Exception as e:
+                # Keep draining so the producer never blocks on a full queue
+                startup_error = f"Solid Edge instance failed to start: {e}"
+                _logger.error(startup_error)
+
+            while True:
+                job = jobs.get()
+                if job is None:
+                    break
+                index, path = job
+                if startup_error is not None:
+                    results[index] = {"draft": path, "status": "error", "error": startup_error}
+                    continue
+                try:
+                    results[index] = self._publish_one(app, path, options)
+                except Exception as e:
+                    _logger.error(f"Publishing failed for {path}: {e}")
+                    results[index] = {"draft": path, "status": "error", "error": str(e)}
+        finally:
+            if app is not None:
+                with contextlib.suppress(Exception):
+                    app.Quit()
+            if com_initialized:
+                import pythoncom
+
+                pythoncom.CoUninitialize()
+
+    def publish_drafts(
+        self,
+        paths: list[str],
+        output_dir: str,
+        formats: list[str] | None = None,
+        sheets: list[int | str] | None = None,
+        update_views: bool = False,
+        package_name: str | None = None,
+        workers: int = 1,
+        queue_size: int = 8,
+        overwrite: bool = True,
+    ) -> dict[str, Any]:
+        """
+        Publish many drafts to PDF and/or DXF.
+
+        Each draft is opened, optionally brought up to date, exported and
+        closed. With workers > 1 the drafts are fed through a bounded queue
+        to that many dedicated, hidden Solid Edge instances (one per worker
+        thread); with workers = 1 the connected instance is used.
+
+        Args:
+            paths: .dft files, folders (all .dft inside) or glob patterns
+                such as 'C:/release/**/*.dft'
+            output_dir: Folder for the published files (created if missing)
+            formats: Any of 'pdf', 'dxf' (default: ['pdf'])
+            sheets: 0-based sheet indices or sheet names to publish; each is
+                written as <stem>_<sheet>.<ext>. Default: whole draft as <stem>.<ext>
+            update_views: Update out-of-date drawing views before exporting
+            package_name: Merge all published PDFs into <output_dir>/<name>.pdf
+                (requires the optional pypdf package)
+            workers: Number of Solid Edge instances to publish with
+            queue_size: Maximum number of drafts waiting for a worker
+            overwrite: Replace existing output files (otherwise skipped)
+
+        Returns:
+            Dict with per-draft results, merge result and totals
+        """
+        formats = [f.lower().lstrip(".") for f in (formats or ["pdf"])]
+        invalid = [f for f in formats if f not in PUBLISH_FORMATS]
+        if invalid:
+            return {
+                "error": f"Invalid formats: {', '.join(invalid)}. "
+                f"Valid: {', '.join(PUBLISH_FORMATS)}"
+            }
+        if workers < 1 or queue_size < 1:
+            return {"error": "workers and queue_size must be at least 1"}
+
+        drafts = _expand_draft_paths(paths)
+        if not drafts:
+            return {"error": "No draft files matched"}
+
+        try:
+            os.makedirs(output_dir, exist_ok=True)
+            options = {
+                "output_dir": output_dir,
+                "formats": formats,
+                "sheets": list(sheets or []),
+                "update_views": update_views,
+                "overwrite": overwrite,
+            }
+            results: list[dict[str, Any] | None] = [None] * len(drafts)
+            start = time.perf_counter()
+
+            if workers == 1:
+                app = self.doc_manager.connection.get_application()
+                with self.doc_manager.connection.performance_scope():
+                    for i, path in enumerate(drafts):
+                        try:
+                            results[i] = self._publish_one(app, path, options)
+                        except Exception as e:
+                            _logger.error(f"Publishing failed for {path}: {e}")
+                            results[i] = {"draft": path, "status": "error", "error": str(e)}
+            else:
+                pool_size = min(workers, len(drafts))
+                jobs: queue.Queue[tuple[int, str] | None] = queue.Queue(maxsize=queue_size)
+                threads = [
+                    threading.Thread(
+                        target=self._publish_worker,
+                        args=(jobs, results, options),
+                        name=f"draft-publisher-{n}",
+                        daemon=True,
+                    )
+                    for n in range(pool_size)
+                ]
+                for thread in threads:
+                    thread.start()
+                for job in enumerate(drafts):
+                    jobs.put(job)
+                for _ in threads:
+                    jobs.put(None)
+                for thread in threads:
+                    thread.join()
+
+            entries = [
+                r or {"draft": p, "status": "error"} for r, p in zip(results, drafts, strict=True)
+            ]
+            response: dict[str, Any] = {
+                "status": "completed",
+                "total": len(entries),
+                "workers": 1 if workers == 1 else min(workers, len(drafts)),
+                "output_dir": output_dir,
+                "results": entries,
+            }
+            counts: dict[str, int] = {}
+            for entry in entries:
+                counts[entry["status"]] = counts.get(entry["status"], 0) + 1
+            response["counts"] = counts
+
+            if package_name:
+                pdfs = [
+                    out["path"]
+                    for entry in entries
+                    for out in entry.get("outputs", [])
+                    if out["format"] == "pdf" and os.path.exists(out["path"])
+                ]
+                merged_path = os.path.join(output_dir, f"{package_name}.pdf")
+                try:
+                    response["merge"] = _merge_pdfs(pdfs, merged_path)
+                except Exception as e:
+                    response["merge"] = {"status": "error", "error": str(e)}
+
+            response["total_seconds"] = round(time.perf_counter() - start, 4)
+            return response
+        except Exception as e:
+            return {"error": str(e), "traceback": traceback.format_exc()}
@@ -0,0 +1,385 @@
+"""Whole-draft content snapshot: one traversal, columnar tables, paged queries."""
+
+import contextlib
+import time
+import traceback
+from typing import Any
+
+from ..logging import get_logger
+
+_logger = get_logger(__name__)
+
+_DIM_TYPE_NAMES = {
+    1: "Linear",
+    2: "Radial",
+    3: "Angular",
+    4: "RadialDiameter",
+    5: "CircularDiameter",
+    6: "ArcLength",
+    7: "ArcAngle",
+    8: "Coordinate",
+    9: "SymmetricalDiameter",
+    10: "Chamfer",
+    11: "AngularCoordinate",
+    12: "CurveLength",
+}
+
+# table -> (sheet collection, {column: COM property})
+_SHEET_COLLECTIONS: dict[str, tuple[str, dict[str, str]]] = {
+    "balloons": ("Balloons", {"text": "BalloonText", "x": "x", "y": "y"}),
+    "text_boxes": ("TextBoxes", {"text": "Text", "x": "x", "y": "y", "height": "Height"}),
+    "lines": ("Lines2d", {"x1": "StartX", "y1": "StartY", "x2": "EndX", "y2": "EndY"}),
+    "circles": ("Circles2d", {"cx": "CenterX", "cy": "CenterY", "radius": "Radius"}),
+    "arcs": (
+        "Arcs2d",
+        {
+            "cx": "CenterX",
+            "cy": "CenterY",
+            "radius": "Radius",
+            "start_angle": "StartAngle",
+            "end_angle": "EndAngle",
+        },
+    ),
+}
+
+_TABLE_COLUMNS: dict[str, list[str]] = {
+    "sheets": ["sheet", "name", "width", "height", "background", "view_count"],
+    "views": [
+        "sheet",
+        "view",
+        "name",
+        "type",
+        "scale",
+        "origin_x",
+        "origin_y",
+        "model_path",
+        "up_to_date",
+    ],
+    "dimensions": [
+        "sheet",
+        "index",
+        "view",
+        "name",
+        "type",
+        "type_name",
+        "value",
+        "prefix",
+        "suffix",
+        "override",
+    ],
+    **{table: ["sheet", "index", *props] for table, (_, props) in _SHEET_COLLECTIONS.items()},
+}
+
+
+def _read(obj: Any, attr: str) -> Any:
+    """Read one COM property, None if unavailable."""
+    try:
+        return getattr(obj, attr)
+    except Exception:
+        return None
+
+
+def _sheet_views(sheet: Any) -> Any:
+    """DrawingViews of a sheet, late-bound; None if unavailable."""
+    views = _read(sheet, "DrawingViews")
+    if views is not None:
+        with contextlib.suppress(Exception):
+            import win32com.client.dynamic
+
+            views = win32com.client.dynamic.Dispatch(views._oleobj_)
+    return views
+
+
+def _sheet_fingerprint(sheet: Any) -> tuple[Any, ...]:
+    """Name, per-view up-to-date flags and item counts of one sheet.
+
+    Cheap next to a capture (no per-item reads besides views) and changes
+    with any added or deleted view, dimension, balloon, text or 2D
+    element, and with view updates.
+    """
+    views = _sheet_views(sheet)
+    up_to_date = tuple(
+        _read(views.Item(v), "IsUpToDate") for v in range(1, (_read(views, "Count") or 0) + 1)
+    )
+    counts = tuple(
+        _read(_read(sheet, collection), "Count")
+        for collection in ("Dimensions", *(c for c, _ in _SHEET_COLLECTIONS.values()))
+    )
+    return (_read(sheet, "Name"), up_to_date, counts)
+
+
+def _draft_fingerprint(doc: Any) -> list[tuple[Any, ...]]:
+    sheets = doc.Sheets
+    return [_sheet_fingerprint(sheets.Item(s)) for s in range(1, sheets.Count + 1)]
+
+
+class _Table:
+    """Column-oriented storage: one list per column, rows aligned by position."""
+
+    def __init__(self, columns: list[str]) -> None:
+        self.columns: dict[str, list[Any]] = {name: [] for name in columns}
+        self.count = 0
+
+    def append(self, **values: Any) -> None:
+        for name, column in self.columns.items():
+            column.append(values.get(name))
+        self.count += 1
+
+    def matching(self, filters: dict[str, Any]) -> list[int]:
+        """Row positions satisfying every filter.
+
+        A filter value is either a scalar (equality), a list (membership) or
+        a dict with any of 'min', 'max' (inclusive range) and 'contains'
+        (case-insensitive substring).
+        """
+        rows = list(range(self.count))
+        for name, cond in filters.items():
+            if name not in self.columns:
+                raise ValueError(f"Unknown column: {name}. Valid: {', '.join(self.columns)}")
+            column = self.columns[name]
+            if isinstance(cond, dict):
+                lo, hi, sub = cond.get("min"), cond.get("max"), cond.get("contains")
+                needle = str(sub).lower() if sub is not None else None
+
+                def ok(v: Any, lo: Any = lo, hi: Any = hi, needle: str | None = needle) -> bool:
+                    if v is None:
+                        return False
+                    if lo is not None and v < lo:
+                        return False
+                    if hi is not None and v > hi:
+                        return False
+                    return needle is None or needle in str(v).lower()
+
+                rows = [r for r in rows if ok(column[r])]
+            elif isinstance(cond, list):
+                allowed = set(cond)
+                rows = [r for r in rows if column[r] in allowed]
+            else:
+                rows = [r for r in rows if column[r] == cond]
+        return rows
+
+
+class DraftSnapshotMixin:
+    """Mixin providing a cached whole-draft snapshot with paged queries."""
+
+    _draft_snapshot: dict[str, Any] | None
+
+    def _capture_draft_snapshot(self, doc: Any) -> dict[str, Any]:
+        """Walk every sheet once and fill the columnar tables."""
+        start = time.perf_counter()
+        tables = {name: _Table(cols) for name, cols in _TABLE_COLUMNS.items()}
+        fingerprint = []
+
+        sheets = doc.Sheets
+        for s in range(1, sheets.Count + 1):
+            sheet = sheets.Item(s)
+            sheet_no = s - 1
+            fingerprint.append(_sheet_fingerprint(sheet))
+
+            # Views: record dimension names per view so sheet-level
+            # dimensions can be attributed without a second full walk.
+            dim_view: dict[str, str] = {}
+            view_count = 0
+            views = _sheet_views(sheet)
+            if views is not None:
+                for v in range(1, (_read(views, "Count") or 0) + 1):
+                    view = views.Item(v)
+                    view_name = _read(view, "Name")
+                    model_link = _read(view, "ModelLink")
+                    tables["views"].append(
+                        sheet=sheet_no,
+                        view=v - 1,
+                        name=view_name,
+                        type=_read(view, "Type"),
+                        scale=_read(view, "ScaleFactor"),
+                        origin_x=_read(view, "OriginX"),
+                        origin_y=_read(view, "OriginY"),
+                        model_path=_read(model_link, "FileName") if model_link else None,
+                        up_to_date=_read(view, "IsUpToDate"),
+                    )
+                    view_count += 1
+                    view_dims = _read(view, "Dimensions")
+                    for d in range(1, (_read(view_dims, "Count") or 0) + 1):
+                        with contextlib.suppress(Exception):
+                            dim_view[view_dims.Item(d).Name] = view_name
+
+            tables["sheets"].append(
+                sheet=sheet_no,
+                name=_read(sheet, "Name"),
+                width=_read(sheet, "SheetWidth"),
+                height=_read(sheet, "SheetHeight"),
+                background=_read(sheet, "Background"),
+                view_count=view_count,
+            )
+
+            dims = _read(sheet, "Dimensions")
+            for d in range(1, (_read(dims, "Count") or 0) + 1):
+                dim = dims.Item(d)
+                name = _read(dim, "Name")
+                dim_type = _read(dim, "DimensionType")
+                if dim_type is None:
+                    dim_type = _read(dim, "Type")
+                tables["dimensions"].append(
+                    sheet=sheet_no,
+                    index=d - 1,
+                    view=dim_view.get(name) if name is not None else None,
+                    name=name,
+                    type=dim_type,
+                    type_name=_DIM_TYPE_NAMES.get(dim_type) if dim_type is not None else None,
+                    value=_read(dim, "Value"),
+                    prefix=_read(dim, "PrefixString"),
+                    suffix=_read(dim, "SuffixString"),
+                    override=_read(dim, "OverrideString"),
+                )
+
+            for table, (collection, props) in _SHEET_COLLECTIONS.items():
+                items = _read(sheet, collection)
+                for i in range(1, (_read(items, "Count") or 0) + 1):
+                    item = items.Item(i)
+                    tables[table].append(
+                        sheet=sheet_no,
+                        index=i - 1,
+                        **{col: _read(item, prop) for col, prop in props.items()},
+                    )
+
+        elapsed = time.perf_counter() - start
+        _logger.info(f"Captured draft snapshot of {sheets.Count} sheet(s) in {elapsed:.2f}s")
+        return {
+            "document": _read(doc, "FullName") or _read(doc, "Name"),
+            "fingerprint": fingerprint,
+            "captured_at": time.time(),
+            "capture_seconds": round(elapsed, 4),
+            "tables": tables,
+        }
+
+    def _get_draft_snapshot(self, refresh: bool = False) -> tuple[Any, dict[str, Any] | None]:
+        """Return (snapshot, error).
+
+        Re-captures when refreshed, for another document, or when the
+        draft's fingerprint (sheets, per-sheet item counts and view
+        up-to-date flags) changed. Edits that keep every count, such as
+        moving a balloon or editing a dimension, need refresh=True.
+        """
+        doc = self.doc_manager.get_active_document()
+        if not hasattr(doc, "Sheets"):
+            return None, {"error": "Active document is not a draft document"}
+
+        snapshot = self._draft_snapshot
+        doc_key = _read(doc, "FullName") or _read(doc, "Name")
+        if (
+            refresh
+            or snapshot is None
+            or snapshot["document"] != doc_key
+            or snapshot["fingerprint"] != _draft_fingerprint(doc)
+        ):
+            snapshot = self._capture_draft_snapshot(doc)
+            self._draft_snapshot = snapshot
+        return snapshot, None
+
+    def get_draft_snapshot_summary(self, refresh: bool = False) -> dict[str, Any]:
+        """
+        Capture (or reuse) the draft snapshot and summarize it.
+
+        Args:
+            refresh: Force a new traversal even if a snapshot is cached
+
+        Returns:
+            Dict with row counts per table, per-sheet counts and capture timing
+        """
+        try:
+            snapshot, err = self._get_draft_snapshot(refresh)
+            if err:
+                return err
+
+            tables = snapshot["tables"]
+            per_sheet = []
+            sheets = tables["sheets"]
+            for row in range(sheets.count):
+                sheet_no = sheets.columns["sheet"][row]
+                counts = {
+                    name: tables[name].columns["sheet"].count(sheet_no)
+                    for name in tables
+                    if name != "sheets"
+                }
+                per_sheet.append({"sheet": sheet_no, "name": sheets.columns["name"][row], **counts})
+
+            return {
+                "document": snapshot["document"],
+                "captured_at": snapshot["captured_at"],
+                "capture_seconds": snapshot["capture_seconds"],
+                "tables": {name: t.count for name, t in tables.items()},
+                "sheets": per_sheet,
+            }
+        except Exception as e:
+            return {"error": str(e), "traceback": traceback.format_exc()}
+
+    def query_draft_snapshot(
+        self,
+        table: str,
+        filters: dict[str, Any] | None = None,
+        columns: list[str] | None = None,
+        offset: int = 0,
+        limit: int = 100,
+        refresh: bool = False,
+    ) -> dict[str, Any]:
+        """
+        Page through one snapshot table.
+
+        Rows are returned as lists aligned with the 'columns' header to keep
+        responses compact.
+
+        Args:
+            table: 'sheets', 'views', 'dimensions', 'balloons', 'text_boxes',
+                'lines', 'circles', or 'arcs'
+            filters: Column filters, e.g. {"sheet": 2, "value": {"min": 0.01}}
+            columns: Subset of columns to return (default: all)
+            offset: First matching row to return
+            limit: Maximum rows to return
+            refresh: Force a new traversal before querying
+
+        Returns:
+            Dict with total matches, page bounds, column names and rows
+        """
+        if table not in _TABLE_COLUMNS:
+            return {"error": f"Unknown table: {table}. Valid: {', '.join(_TABLE_COLUMNS)}"}
+        if offset < 0 or limit < 1:
+            return {"error": "offset must be >= 0 and limit >= 1"}
+
+        try:
+            snapshot, err = self._get_draft_snapshot(refresh)
+            if err:
+                return err
+
+            data = snapshot["tables"][table]
+            selected = columns or list(data.columns)
+            unknown = [c for c in selected if c not in data.columns]
+            if unknown:
+                return {
+                    "error": f"Unknown column(s): {', '.join(unknown)}. "
+                    f"Valid: {', '.join(data.columns)}"
+                }
+            try:
+                matched = data.matching(filters or {})
+            except (ValueError, TypeError) as e:
+                return {"error": f"Invalid filter: {e}"}
+
+            page = matched[offset : offset + limit]
+            cols = [data.columns[c] for c in selected]
+            return {
+                "table": table,
+                "total": len(matched),
+                "offset": offset,
+                "limit": limit,
+                "has_more": offset + limit < len(matched),
+                "columns": selected,
+                "rows": [[col[r] for col in cols] for r in page],
+                "captured_at": snapshot["captured_at"],
+            }
+        except Exception as e:
+            return {"error": str(e), "traceback": traceback.format_exc()}
+
+    def clear_draft_snapshot(self) -> dict[str, Any]:
+        """Drop the cached snapshot so the next query re-walks the draft."""
+        had = self._draft_snapshot is not None
+        self._draft_snapshot = None
+        return {"status": "cleared", "had_snapshot": had}
@@ -0,0 +1,246 @@
+"""Symbol and smart-frame template cache with bulk insertion."""
+
+import contextlib
+import os
+import time
+import traceback
+from collections import OrderedDict
+from collections.abc import Callable
+from typing import Any
+
+from ..logging import get_logger
+from ._snapshot import _read
+
+_logger = get_logger(__name__)
+
+DEFAULT_TEMPLATE_CACHE_SIZE = 32
+
+
+class TemplateCache:
+    """LRU cache of loaded templates.
+
+    File templates are keyed by ("file", normalized path, mtime, size), so
+    an edited source file is reloaded; other templates (smart-frame styles)
+    use any other hashable key. Evicted entries are released with their
+    'close' callback.
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_TEMPLATE_CACHE_SIZE) -> None:
+        self.max_entries = max_entries
+        self._entries: OrderedDict[Any, dict[str, Any]] = OrderedDict()
+        self.hits = 0
+        self.loads = 0
+        self.evictions = 0
+
+    @staticmethod
+    def file_key(path: str) -> tuple[str, str, int, int]:
+        """Cache key for a source file; raises FileNotFoundError if it is missing."""
+        try:
+            stat = os.stat(path)
+        except OSError:
+            raise FileNotFoundError(f"Template file not found: {path}") from None
+        return ("file", os.path.normcase(os.path.abspath(path)), stat.st_mtime_ns, stat.st_size)
+
+    def get(self, key: Any, loader: Callable[[], dict[str, Any]]) -> dict[str, Any]:
+        """Return the cached entry for key, loading (and maybe evicting) on a miss."""
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry
+
+        # A file whose mtime/size changed leaves a stale entry under its old key
+        if isinstance(key, tuple) and key[:1] == ("file",):
+            for old in [k for k in self._entries if isinstance(k, tuple) and k[:2] == key[:2]]:
+                self._release(old)
+
+        entry = loader()
+        self.loads += 1
+        self._entries[key] = entry
+        while len(self._entries) > self.max_entries:
+            self._release(next(iter(self._entries)))
+            self.evictions += 1
+        return entry
+
+    def _release(self, key: Any) -> None:
+        entry = self._entries.pop(key)
+        close = entry.get("close")
+        if close is not None:
+            with contextlib.suppress(Exception):
+                close()
+
+    def clear(self) -> int:
+        """Release every entry; returns how many there were."""
+        count = len(self._entries)
+        for key in list(self._entries):
+            self._release(key)
+        return count
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "hits": self.hits,
+            "loads": self.loads,
+            "evictions": self.evictions,
+            "templates": [
+                {k: v for k, v in entry.items() if k != "close"} for entry in self._entries.values()
+            ],
+        }
+
+
+class TemplateCacheMixin:
+    """Mixin providing cached symbol/smart-frame sources and bulk insertion."""
+
+    _template_cache: TemplateCache
+
+    def _symbol_source(self, file_path: str) -> dict[str, Any] | None:
+        """Resolve a symbol file once per session (per mtime).
+
+        The entry holds the absolute path passed to Symbols.Add. Paths that
+        are not on disk (e.g. resolved by Solid Edge from its symbol
+        library) are not cached.
+        """
+        try:
+            key = TemplateCache.file_key(file_path)
+        except FileNotFoundError:
+            return None
+
+        def load() -> dict[str, Any]:
+            return {"kind": "symbol", "path": os.path.abspath(file_path), "size": key[3]}
+
+        return self._template_cache.get(key, load)
+
+    def _smart_frame_style(self, doc: Any, style_name: str) -> dict[str, Any]:
+        """Validate a smart-frame style name once per draft."""
+        doc_key = _read(doc, "FullName") or id(doc)
+
+        def load() -> dict[str, Any]:
+            styles = _read(doc, "SmartFrame2dStyles")
+            count = _read(styles, "Count")
+            if count is not None:
+                names = []
+                for i in range(1, count + 1):
+                    with contextlib.suppress(Exception):
+                        names.append(styles.Item(i).Name)
+                if names and style_name not in names:
+                    raise ValueError(f"Smart frame style not found: {style_name}")
+            return {"kind": "smart_frame_style", "style": style_name, "draft": str(doc_key)}
+
+        return self._template_cache.get(("smart_frame_style", doc_key, style_name), load)
+
+    def place_symbols_bulk(
+        self, placements: list[dict[str, Any]], sheet_index: int | None = None
+    ) -> dict[str, Any]:
+        """
+        Place many symbols, resolving each source file once.
+
+        Args:
+            placements: [{"file_path", "x", "y", "insertion_type"?}] - meters
+            sheet_index: 0-based sheet (default: active sheet)
+
+        Returns:
+            Dict with placed count, per-item errors and cache loads/hits
+        """
+        return self._place_templates(placements, sheet_index, self._add_one_symbol)
+
+    def place_smart_frames_bulk(
+        self, frames: list[dict[str, Any]], sheet_index: int | None = None
+    ) -> dict[str, Any]:
+        """
+        Place many smart frames, validating each style once per draft.
+
+        Args:
+            frames: [{"style", "x1", "y1", "x2", "y2"}] or
+                [{"style", "x", "y", "top", "bottom", "left", "right"}] - meters
+            sheet_index: 0-based sheet (default: active sheet)
+
+        Returns:
+            Dict with placed count, per-item errors and cache loads/hits
+        """
+        return self._place_templates(frames, sheet_index, self._add_one_smart_frame)
+
+    def _add_one_symbol(self, doc: Any, sheet: Any, spec: dict[str, Any]) -> None:
+        source = self._symbol_source(spec["file_path"])
+        file_path = source["path"] if source is not None else spec["file_path"]
+        sheet.Symbols.Add(spec.get("insertion_type", 0), file_path, spec["x"], spec["y"])
+
+    def _add_one_smart_frame(self, doc: Any, sheet: Any, spec: dict[str, Any]) -> None:
+        style = spec["style"]
+        self._smart_frame_style(doc, style)
+        frames = sheet.SmartFrames2d
+        if "x1" in spec:
+            frames.AddBy2Points(style, spec["x1"], spec["y1"], spec["x2"], spec["y2"])
+        else:
+            frames.AddByOrigin(
+                style,
+                spec["x"],
+                spec["y"],
+                spec["top"],
+                spec["bottom"],
+                spec["left"],
+                spec["right"],
+            )
+
+    def _place_templates(
+        self,
+        specs: list[dict[str, Any]],
+        sheet_index: int | None,
+        add_one: Callable[[Any, Any, dict[str, Any]], None],
+    ) -> dict[str, Any]:
+        if not specs:
+            return {"error": "No placements given"}
+        try:
+            doc = self.doc_manager.get_active_document()
+            if not hasattr(doc, "Sheets"):
+                return {"error": "Active document is not a draft document"}
+            try:
+                sheet = self._resolve_sheet(doc, sheet_index)
+            except IndexError as e:
+                return {"error": str(e)}
+
+            cache = self._template_cache
+            loads_before, hits_before = cache.loads, cache.hits
+            placed = 0
+            errors = []
+            start = time.perf_counter()
+            with self.doc_manager.connection.performance_scope():
+                for i, spec in enumerate(specs):
+                    try:
+                        add_one(doc, sheet, dict(spec))
+                        placed += 1
+                    except KeyError as e:
+                        errors.append({"index": i, "error": f"Missing field {e}"})
+                    except Exception as e:
+                        errors.append({"index": i, "error": str(e)})
+
+            elapsed = time.perf_counter() - start
+            _logger.info(f"Placed {placed} of {len(specs)} templates in {elapsed:.2f}s")
+            return {
+                "status": "placed" if not errors else "partial",
+                "requested": len(specs),
+                "placed": placed,
+                "errors": errors,
+                "template_loads": cache.loads - loads_before,
+                "cache_hits": cache.hits - hits_before,
+                "seconds": round(elapsed, 4),
+            }
+        except Exception as e:
+            return {"error": str(e), "traceback": traceback.format_exc()}
+
+    def get_template_cache_stats(self) -> dict[str, Any]:
+        """Entries, hit/load/eviction counters of the template cache."""
+        return self._template_cache.stats()
+
+    def clear_template_cache(self, max_entries: int | None = None) -> dict[str, Any]:
+        """Forget every cached template."""
+        if max_entries is not None and max_entries < 1:
+            return {"error": "max_entries must be at least 1"}
+        removed = self._template_cache.clear()
+        if max_entries is not None:
+            self._template_cache.max_entries = max_entries
+        return {
+            "status": "cleared",
+            "removed": removed,
+            "max_entries": self._template_cache.max_entries,
+        }
@@ -0,0 +1,315 @@
+"""Incremental drawing view updates: stale tracking, coalesced requests, timing."""
+
+import contextlib
+import os
+import time
+import traceback
+from typing import Any
+
+from ..logging import get_logger
+
+_logger = get_logger(__name__)
+
+# (draft path, sheet name, view name)
+_ViewKey = tuple[str, str, str]
+# (draft path, 0-based sheet index, 0-based view index)
+_PendingKey = tuple[str, int, int]
+# (file mtime_ns, file size, open-document Dirty flag)
+_Generation = tuple[int | None, int | None, bool | None]
+
+
+class ViewUpdateSchedulerMixin:
+    """Mixin that updates only drawing views whose source model has changed.
+
+    Each time the scheduler updates a view it records the generation of the
+    linked model (file mtime and size, plus the Dirty flag when the model is
+    open in this session). A view is stale when Solid Edge reports it out of
+    date, or when its model's generation differs from the one recorded.
+    """
+
+    _view_generations: dict[_ViewKey, _Generation]
+    _pending_view_updates: dict[_PendingKey, int]
+
+    @staticmethod
+    def _draft_key(doc: Any) -> str:
+        return str(getattr(doc, "FullName", "") or getattr(doc, "Name", ""))
+
+    def _open_document_dirty_flags(self) -> dict[str, bool]:
+        """Map normalized FullName -> Dirty for documents open in the session."""
+        flags: dict[str, bool] = {}
+        with contextlib.suppress(Exception):
+            docs = self.doc_manager.connection.get_application().Documents
+            for i in range(1, docs.Count + 1):
+                with contextlib.suppress(Exception):
+                    d = docs.Item(i)
+                    flags[os.path.normcase(d.FullName)] = bool(d.Dirty)
+        return flags
+
+    @staticmethod
+    def _model_generation(path: str, dirty_flags: dict[str, bool]) -> _Generation:
+        mtime: int | None = None
+        size: int | None = None
+        with contextlib.suppress(OSError):
+            st = os.stat(path)
+            mtime, size = st.st_mtime_ns, st.st_size
+        return (mtime, size, dirty_flags.get(os.path.normcase(path)))
+
+    def _scan_view_states(self, doc: Any, sheet_index: int | None = None) -> list[dict[str, Any]]:
+        """Classify every view (optionally on one sheet) as stale or current."""
+        draft = self._draft_key(doc)
+        dirty_flags = self._open_document_dirty_flags()
+        generations: dict[str, _Generation] = {}
+        states: list[dict[str, Any]] = []
+
+        sheets = doc.Sheets
+        for s in range(1, sheets.Count + 1):
+            if sheet_index is not None and s - 1 != sheet_index:
+                continue
+            sheet = sheets.Item(s)
+            dvs = sheet.DrawingViews
+            with contextlib.suppress(Exception):
+                import win32com.client.dynamic
+
+                dvs = win32com.client.dynamic.Dispatch(dvs._oleobj_)
+
+            for v in range(1, dvs.Count + 1):
+                view = dvs.Item(v)
+                state: dict[str, Any] = {
+                    "sheet_index": s - 1,
+                    "view_index": v - 1,
+                    "name": None,
+                    "model_path": None,
+                }
+                with contextlib.suppress(Exception):
+                    state["name"] = view.Name
+                with contextlib.suppress(Exception):
+                    state["model_path"] = view.ModelLink.FileName
+                up_to_date = None
+                with contextlib.suppress(Exception):
+                    up_to_date = bool(view.IsUpToDate)
+
+                key = (draft, str(sheet.Name), str(state["name"] or v))
+                model = state["model_path"]
+                reason = None
+                generation = None
+                if model:
+                    if model not in generations:
+                        generations[model] = self._model_generation(model, dirty_flags)
+                    generation = generations[model]
+                    recorded = self._view_generations.get(key)
+                    if up_to_date is False:
+                        reason = "out_of_date"
+                    elif recorded is not None and recorded != generation:
+                        reason = "model_changed"
+                    elif recorded is None and up_to_date is None:
+                        reason = "untracked"
+                elif up_to_date is False:
+                    reason = "out_of_date"
+
+                state["stale"] = reason is not None
+                state["reason"] = reason
+                state["_view"] = view
+                state["_key"] = key
+                state["_generation"] = generation
+                states.append(state)
+        return states
+
+    @staticmethod
+    def _public_state(state: dict[str, Any]) -> dict[str, Any]:
+        return {k: v for k, v in state.items() if not k.startswith("_")}
+
+    def _run_view_updates(self, targets: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """Update each target view once, timing it and recording its generation."""
+        results = []
+        with self.doc_manager.connection.performance_scope():
+            for state in targets:
+                entry = self._public_state(state)
+                start = time.perf_counter()
+                try:
+                    state["_view"].Update()
+                    entry["status"] = "updated"
+                    if state["_generation"] is not None:
+                        self._view_generations[state["_key"]] = state["_generation"]
+                except Exception as e:
+                    entry["status"] = "error"
+                    entry["error"] = str(e)
+                entry["seconds"] = round(time.perf_counter() - start, 4)
+                results.append(entry)
+        return results
+
+    def get_view_update_status(self, sheet_index: int | None = None) -> dict[str, Any]:
+        """
+        Report which drawing views are stale without updating anything.
+
+        Args:
+            sheet_index: 0-based sheet to inspect (default: all sheets)
+
+        Returns:
+            Dict with per-view state, stale count and pending requests
+        """
+        try:
+            doc = self.doc_manager.get_active_document()
+            if not hasattr(doc, "Sheets"):
+                return {"error": "Active document is not a draft document"}
+
+            states = self._scan_view_states(doc, sheet_index)
+            draft = self._draft_key(doc)
+            return {
+                "views": [self._public_state(s) for s in states],
+                "count": len(states),
+                "stale_count": sum(1 for s in states if s["stale"]),
+                "pending": [
+                    {"sheet_index": s, "view_index": v, "requests": n}
+                    for (d, s, v), n in sorted(self._pending_view_updates.items())
+                    if d == draft
+                ],
+            }
+        except Exception as e:
+            return {"error": str(e), "traceback": traceback.format_exc()}
+
+    def request_view_updates(
+        self, view_indices: list[int], sheet_index: int | None = None
+    ) -> dict[str, Any]:
+        """
+        Queue drawing views for the next flush.
+
+        Repeated requests for the same view before a flush are coalesced into
+        a single update.
+
+        Args:
+            view_indices: 0-based view indices on the sheet
+            sheet_index: 0-based sheet (default: the active sheet)
+
+        Returns:
+            Dict with queued views and the size of the pending batch
+        """
+        try:
+            doc = self.doc_manager.get_active_document()
+            if not hasattr(doc, "Sheets"):
+                return {"error": "Active document is not a draft document"}
+
+            sheets = doc.Sheets
+            if sheet_index is None:
+                active = doc.ActiveSheet.Name
+                sheet_index = next(
+                    (i - 1 for i in range(1, sheets.Count + 1) if sheets.Item(i).Name == active),
+                    0,
+                )
+            if sheet_index < 0 or sheet_index >= sheets.Count:
+                return {"error": f"Invalid sheet index: {sheet_index}. Count: {sheets.Count}"}
+
+            view_count = sheets.Item(sheet_index + 1).DrawingViews.Count
+            bad = [i for i in view_indices if i < 0 or i >= view_count]
+            if bad:
+                return {"error": f"Invalid view index: {bad[0]}. Count: {view_count}"}
+
+            draft = self._draft_key(doc)
+            for i in view_indices:
+                key = (draft, sheet_index, i)
+                self._pending_view_updates[key] = self._pending_view_updates.get(key, 0) + 1
+
+            pending = {k: n for k, n in self._pending_view_updates.items() if k[0] == draft}
+            return {
+                "status": "queued",
+                "sheet_index": sheet_index,
+                "view_indices": sorted(set(view_indices)),
+                "pending_views": len(pending),
+                "pending_requests": sum(pending.values()),
+            }
+        except Exception as e:
+            return {"error": str(e), "traceback": traceback.format_exc()}
+
+    def flush_view_updates(self, stale_only: bool = True) -> dict[str, Any]:
+        """
+        Run all view updates queued for the active draft as one batch.
+
+        Requests queued for other drafts stay queued.
+
+        Args:
+            stale_only: Skip queued views that are already current
+
+        Returns:
+            Dict with per-view status and timing, skipped and coalesced counts
+        """
+        try:
+            doc = self.doc_manager.get_active_document()
+            if not hasattr(doc, "Sheets"):
+                return {"error": "Active document is not a draft document"}
+
+            draft = self._draft_key(doc)
+            pending = {
+                (s, v): n for (d, s, v), n in self._pending_view_updates.items() if d == draft
+            }
+            self._pending_view_updates = {
+                k: n for k, n in self._pending_view_updates.items() if k[0] != draft
+            }
+            requests = sum(pending.values())
+            states = [
+                s
+                for s in self._scan_view_states(doc)
+                if (s["sheet_index"], s["view_index"]) in pending
+            ]
+            targets = [s for s in states if s["stale"] or not stale_only]
+            skipped = [self._public_state(s) for s in states if stale_only and not s["stale"]]
+
+            start = time.perf_counter()
+            results = self._run_view_updates(targets)
+            return {
+                "status": "flushed",
+                "requests": requests,
+                "coalesced": requests - len(pending),
+                "updated": sum(1 for r in results if r["status"] == "updated"),
+                "skipped_current": skipped,
+                "views": results,
+                "total_seconds": round(time.perf_counter() - start, 4),
+            }
+        except Exception as e:
+            return {"error": str(e), "traceback": traceback.format_exc()}
+
+    def update_stale_views(
+        self, sheet_index: int | None = None, dry_run: bool = False
+    ) -> dict[str, Any]:
+        """
+        Update only the drawing views whose source model changed.
+
+        An incremental alternative to update_all_views(force_update=True).
+
+        Args:
+            sheet_index: 0-based sheet to update (default: all sheets)
+            dry_run: Only report which views would be updated
+
+        Returns:
+            Dict with per-view status and timing
+        """
+        try:
+            doc = self.doc_manager.get_active_document()
+            if not hasattr(doc, "Sheets"):
+                return {"error": "Active document is not a draft document"}
+
+            states = self._scan_view_states(doc, sheet_index)
+            stale = [s for s in states if s["stale"]]
+            if dry_run:
+                return {
+                    "status": "dry_run",
+                    "total_views": len(states),
+                    "stale": [self._public_state(s) for s in stale],
+                }
+
+            start = time.perf_counter()
+            results = self._run_view_updates(stale)
+            # Anything queued for these views is now satisfied
+            draft = self._draft_key(doc)
+            for s in stale:
+                self._pending_view_updates.pop((draft, s["sheet_index"], s["view_index"]), None)
+
+            elapsed = time.perf_counter() - start
+            _logger.info(f"Updated {len(results)} of {len(states)} views in {elapsed:.2f}s")
+            return {
+                "status": "updated",
+                "total_views": len(states),
+                "updated": sum(1 for r in results if r["status"] == "updated"),
+                "views": results,
+                "total_seconds": round(elapsed, 4),
+            }
+        except Exception as e:
+            return {"error": str(e), "traceback": traceback.format_exc()}
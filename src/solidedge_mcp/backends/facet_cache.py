@@ -0,0 +1,338 @@
+"""
+Solid Edge Tessellation Cache
+
+Stores Body.GetFacetData results on disk, one file per (file hash, body,
+tolerance), so meshes are reused across sessions without asking Solid
+Edge to tessellate again. Points, normals and face IDs are stored as raw
+float64/int64 arrays behind a small header and read back through mmap,
+so opening a cached mesh copies nothing until the data is touched.
+
+Documents with unsaved edits bypass the cache, since their file on disk
+no longer describes the body. Entries are also stamped with the body's
+volume and range as a cheap guard. The cache directory is bounded in
+bytes; the least recently used entries are evicted first (a hit refreshes
+the file's mtime).
+"""
+
+import contextlib
+import hashlib
+import json
+import mmap
+import os
+import struct
+import tempfile
+import threading
+from array import array
+from typing import Any
+
+from .logging import get_logger
+
+_logger = get_logger(__name__)
+
+DEFAULT_FACET_CACHE_BYTES = 1 << 30
+FACET_FILE_SUFFIX = ".facets"
+
+# magic, metadata length, point values, normal values, face IDs
+_HEADER = struct.Struct("<8sQQQQ")
+_MAGIC = b"SEFACET1"
+# Bytes read at a time when hashing a document file
+_HASH_CHUNK = 1 << 20
+
+
+def _default_cache_dir() -> str:
+    base = os.environ.get("LOCALAPPDATA") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(base, "solidedge_mcp", "facets")
+
+
+def split_facet_data(data: Any) -> tuple["array[float]", "array[float]", "array[int]"]:
+    """(points, normals, face IDs) arrays from a Body.GetFacetData result tuple.
+
+    The tuple holds (facet count, points, normals, texture coordinates,
+    style IDs, face IDs); points are three vertices per facet. Facets
+    without a face ID get -1.
+    """
+    if not isinstance(data, tuple) or len(data) < 2:
+        raise ValueError("Unexpected GetFacetData result")
+    points = array("d", data[1] or ())
+    count = int(data[0] or 0) or len(points) // 9
+    count = min(count, len(points) // 9)
+    normals = array("d", (data[2] or ()) if len(data) > 2 else ())
+    # Per-vertex (9 per facet) or per-facet (3) normals, whichever was returned
+    if len(normals) >= 9 * count:
+        normals = normals[: 9 * count]
+    elif len(normals) >= 3 * count:
+        normals = normals[: 3 * count]
+    else:
+        normals = array("d")
+    ids = list(data[5] or ()) if len(data) > 5 else []
+    face_ids = array("q", (int(i) for i in ids[:count]))
+    face_ids.extend([-1] * (count - len(face_ids)))
+    return points[: 9 * count], normals, face_ids
+
+
+def body_stamp(body: Any) -> str | None:
+    """Volume and range of a body: a guard against a stale entry, not a
+    complete change indicator (edits can keep both)."""
+    try:
+        return repr((body.Volume, tuple(tuple(p) for p in body.GetRange())))
+    except Exception:
+        return None
+
+
+class FacetArrays:
+    """Facet data of one body: a mapped cache entry or in-memory arrays.
+
+    points: 9 float64 per facet; normals: as returned by Solid Edge (9 or
+    3 per facet, or empty); face_ids: one int64 per facet. For a cache
+    entry all three are memoryviews into the mapped file; close()
+    releases the mapping.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        meta: dict[str, Any],
+        mapped: mmap.mmap | None,
+        views: list[Any],
+    ) -> None:
+        self.path = path
+        self.meta = meta
+        self._mmap = mapped
+        self.points, self.normals, self.face_ids = views
+
+    @classmethod
+    def from_arrays(
+        cls, points: "array[float]", normals: "array[float]", face_ids: "array[int]"
+    ) -> "FacetArrays":
+        return cls("", {}, None, [points, normals, face_ids])
+
+    def __len__(self) -> int:
+        return len(self.face_ids)
+
+    @property
+    def nbytes(self) -> int:
+        return sum(len(v) * v.itemsize for v in (self.points, self.normals, self.face_ids))
+
+    def close(self) -> None:
+        if self._mmap is None:
+            return
+        for view in (self.points, self.normals, self.face_ids):
+            view.release()
+        self._mmap.close()
+        self._mmap = None
+
+    def __enter__(self) -> "FacetArrays":
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+
+def _map_entry(path: str) -> FacetArrays:
+    with open(path, "rb") as f:
+        mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    try:
+        magic, meta_len, n_points, n_normals, n_ids = _HEADER.unpack_from(mapped, 0)
+        if magic != _MAGIC:
+            raise ValueError(f"Not a facet cache file: {path}")
+        meta = json.loads(mapped[_HEADER.size : _HEADER.size + meta_len])
+        offset = _HEADER.size + meta_len
+        offset += -offset % 8
+        if offset + 8 * (n_points + n_normals + n_ids) > len(mapped):
+            raise ValueError(f"Truncated facet cache file: {path}")
+        normals_at = offset + 8 * n_points
+        ids_at = normals_at + 8 * n_normals
+        view = memoryview(mapped)
+        views = [
+            view[offset:normals_at].cast("d"),
+            view[normals_at:ids_at].cast("d"),
+            view[ids_at : ids_at + 8 * n_ids].cast("q"),
+        ]
+        view.release()
+        return FacetArrays(path, meta, mapped, views)
+    except Exception:
+        mapped.close()
+        raise
+
+
+class FacetCache:
+    """Size-bounded on-disk cache of body tessellations."""
+
+    def __init__(
+        self, cache_dir: str | None = None, max_bytes: int = DEFAULT_FACET_CACHE_BYTES
+    ) -> None:
+        self.cache_dir = cache_dir or _default_cache_dir()
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        # path -> (size, mtime, digest); files are only re-hashed when they change
+        self._hashes: dict[str, tuple[int, float, str]] = {}
+
+    def file_hash(self, path: str) -> str | None:
+        """Content hash of a saved document, None if the file cannot be read."""
+        try:
+            stat = os.stat(path)
+        except (OSError, TypeError, ValueError):
+            return None
+        known = self._hashes.get(path)
+        if known is not None and known[:2] == (stat.st_size, stat.st_mtime):
+            return known[2]
+        digest = hashlib.blake2b(digest_size=16)
+        try:
+            with open(path, "rb") as f:
+                while chunk := f.read(_HASH_CHUNK):
+                    digest.update(chunk)
+        except OSError:
+            return None
+        self._hashes[path] = (stat.st_size, stat.st_mtime, digest.hexdigest())
+        return digest.hexdigest()
+
+    def _entry_path(self, file_hash: str, body: str, tolerance: float) -> str:
+        key = hashlib.blake2b(f"{file_hash}|{body}|{tolerance!r}".encode(), digest_size=16)
+        return os.path.join(self.cache_dir, key.hexdigest() + FACET_FILE_SUFFIX)
+
+    def get(
+        self, file_hash: str, body: str, tolerance: float, stamp: str | None = None
+    ) -> FacetArrays | None:
+        """Mapped entry, or None if absent, unreadable or stamped differently."""
+        path = self._entry_path(file_hash, body, tolerance)
+        try:
+            entry = _map_entry(path)
+        except FileNotFoundError:
+            self.misses += 1
+            return None
+        except (OSError, ValueError) as e:
+            _logger.warning(f"Discarding facet cache entry {path}: {e}")
+            with contextlib.suppress(OSError):
+                os.remove(path)
+            self.misses += 1
+            return None
+        if stamp is not None and entry.meta.get("stamp") not in (None, stamp):
+            entry.close()
+            self.misses += 1
+            return None
+        with contextlib.suppress(OSError):
+            os.utime(path)
+        self.hits += 1
+        return entry
+
+    def put(
+        self,
+        file_hash: str,
+        body: str,
+        tolerance: float,
+        points: "array[float]",
+        normals: "array[float]",
+        face_ids: "array[int]",
+        meta: dict[str, Any] | None = None,
+    ) -> FacetArrays:
+        """Write an entry (atomically), evict down to max_bytes and map it.
+
+        If the entry cannot be written the arrays are returned unmapped.
+        """
+        path = self._entry_path(file_hash, body, tolerance)
+        info = dict(meta or {})
+        info.update(file_hash=file_hash, body=body, tolerance=tolerance)
+        encoded = json.dumps(info).encode()
+        header = _HEADER.pack(_MAGIC, len(encoded), len(points), len(normals), len(face_ids))
+        padding = b"\0" * (-(len(header) + len(encoded)) % 8)
+
+        tmp = None
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+            with os.fdopen(fd, "wb") as f:
+                f.write(header + encoded + padding)
+                for values in (points, normals, face_ids):
+                    f.write(values.tobytes())
+            os.replace(tmp, path)
+            self.evict(keep=path)
+            return _map_entry(path)
+        except (OSError, ValueError) as e:
+            _logger.warning(f"Could not write facet cache entry {path}: {e}")
+            if tmp is not None:
+                with contextlib.suppress(OSError):
+                    os.remove(tmp)
+            facets = FacetArrays.from_arrays(points, normals, face_ids)
+            facets.meta = info
+            return facets
+
+    def body_facets(
+        self, doc: Any, body: Any, tolerance: float = 0.0, body_key: str = "model1"
+    ) -> tuple[FacetArrays, bool]:
+        """(facets, cached) of a body, from the cache when the document is
+        saved and has no unsaved edits; otherwise tessellated with
+        Body.GetFacetData."""
+        try:
+            path = doc.FullName if doc.Dirty is False else None
+        except Exception:
+            path = None
+        file_hash = self.file_hash(path) if isinstance(path, str) and path else None
+        stamp = body_stamp(body) if file_hash else None
+        if file_hash:
+            facets = self.get(file_hash, body_key, tolerance, stamp)
+            if facets is not None:
+                return facets, True
+        points, normals, face_ids = split_facet_data(body.GetFacetData(tolerance))
+        if not file_hash:
+            return FacetArrays.from_arrays(points, normals, face_ids), False
+        meta = {"source": path, "stamp": stamp}
+        return self.put(file_hash, body_key, tolerance, points, normals, face_ids, meta), False
+
+    def _entries(self) -> list[tuple[float, int, str]]:
+        """(mtime, size, path) of every entry, oldest first."""
+        entries = []
+        try:
+            scanned = list(os.scandir(self.cache_dir))
+        except OSError:
+            return []
+        for entry in scanned:
+            if entry.name.endswith(FACET_FILE_SUFFIX):
+                with contextlib.suppress(OSError):
+                    stat = entry.stat()
+                    entries.append((stat.st_mtime, stat.st_size, entry.path))
+        entries.sort()
+        return entries
+
+    def evict(self, keep: str | None = None) -> int:
+        """Delete least recently used entries until the cache fits max_bytes."""
+        removed = 0
+        with self._lock:
+            entries = self._entries()
+            total = sum(size for _mtime, size, _path in entries)
+            for _mtime, size, path in entries:
+                if total <= self.max_bytes:
+                    break
+                if path == keep:
+                    continue
+                try:
+                    os.remove(path)
+                except OSError:
+                    # Still mapped (Windows) or already gone
+                    continue
+                total -= size
+                removed += 1
+        if removed:
+            _logger.info(f"Evicted {removed} facet cache entries")
+        return removed
+
+    def clear(self) -> int:
+        removed = 0
+        with self._lock:
+            for _mtime, _size, path in self._entries():
+                with contextlib.suppress(OSError):
+                    os.remove(path)
+                    removed += 1
+        return removed
+
+    def get_status(self) -> dict[str, Any]:
+        entries = self._entries()
+        return {
+            "directory": self.cache_dir,
+            "entries": len(entries),
+            "bytes": sum(size for _mtime, size, _path in entries),
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
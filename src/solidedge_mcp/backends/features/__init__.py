@@ -5,6 +5,7 @@ Handles creating 3D features like extrusions, revolves, holes, fillets, etc.
 """
 
 from ._base import FeatureManagerBase
+from ._batch_edges import BatchEdgeFeaturesMixin
 from ._cutout import CutoutMixin
 from ._extrude import ExtrudeMixin
 from ._holes import HolesMixin
@@ -26,6 +27,7 @@ class FeatureManager(
     RefPlaneMixin,
     LoftSweepMixin,
     RoundsChamfersMixin,
+    BatchEdgeFeaturesMixin,
     HolesMixin,
     SheetMetalMixin,
     SurfacesMixin,
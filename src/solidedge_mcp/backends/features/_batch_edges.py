@@ -0,0 +1,209 @@
+"""Bulk rounds and chamfers on explicit edge sets, grouped by size."""
+
+import contextlib
+import time
+import traceback
+from typing import Any
+
+import pythoncom
+from win32com.client import VARIANT
+
+from ..constants import FaceQueryConstants
+from ..logging import get_logger
+
+_logger = get_logger(__name__)
+
+# Sizes closer than this are the same group (meters)
+_SIZE_DIGITS = 9
+
+
+class BatchEdgeFeaturesMixin:
+    """Mixin creating rounds/chamfers on many edges with as few features as possible."""
+
+    doc_manager: Any
+
+    def create_rounds_bulk(
+        self,
+        edges: list[list[int]],
+        radius: float | None = None,
+        radii: list[float] | None = None,
+        combine: bool = True,
+    ) -> dict[str, Any]:
+        """
+        Round many edges, creating the fewest round features.
+
+        Edges are grouped by radius. With combine, all groups go into one
+        Rounds.Add call (one edge set per radius group), falling back to one
+        feature per radius if Solid Edge rejects the combined feature.
+        Every edge is resolved before the first feature is added, and
+        recompute is deferred until all features exist.
+
+        Args:
+            edges: [[face_index, edge_index], ...] (0-based, e.g. the 'edges'
+                result of select_topology)
+            radius: Radius for every edge (meters)
+            radii: Per-edge radii (meters), instead of radius
+            combine: Put all radius groups in a single feature
+
+        Returns:
+            Dict with created features (radius, edge count), edge count
+            and per-edge errors
+        """
+        return self._bulk_edge_features("round", edges, radius, radii, combine)
+
+    def create_chamfers_bulk(
+        self,
+        edges: list[list[int]],
+        distance: float | None = None,
+        distances: list[float] | None = None,
+    ) -> dict[str, Any]:
+        """
+        Chamfer many edges with one equal-setback feature per distance.
+
+        Args:
+            edges: [[face_index, edge_index], ...] (0-based, e.g. the 'edges'
+                result of select_topology)
+            distance: Setback for every edge (meters)
+            distances: Per-edge setbacks (meters), instead of distance
+
+        Returns:
+            Dict with created features (distance, edge count), edge count
+            and per-edge errors
+        """
+        return self._bulk_edge_features("chamfer", edges, distance, distances, False)
+
+    def _bulk_edge_features(
+        self,
+        kind: str,
+        edges: list[list[int]],
+        size: float | None,
+        sizes: list[float] | None,
+        combine: bool,
+    ) -> dict[str, Any]:
+        label = "radius" if kind == "round" else "distance"
+        if not edges:
+            return {"error": "No edges given"}
+        if (size is None) == (sizes is None):
+            return {"error": f"Give either one {label} or a list with one per edge"}
+        if sizes is not None and len(sizes) != len(edges):
+            return {"error": f"Got {len(sizes)} sizes for {len(edges)} edges"}
+        per_edge = [size] * len(edges) if size is not None else list(sizes or [])
+        if any(s <= 0 for s in per_edge):
+            return {"error": f"Every {label} must be positive"}
+
+        try:
+            doc = self.doc_manager.get_active_document()
+            models = doc.Models
+            if models.Count == 0:
+                return {"error": f"No features exist to add {kind}s to"}
+            model = models.Item(1)
+            faces = model.Body.Faces(FaceQueryConstants.igQueryAll)
+            start = time.perf_counter()
+
+            # Resolve every edge up front; shared edges may be listed from both faces
+            groups: dict[float, list[Any]] = {}
+            seen: dict[Any, float] = {}
+            errors: list[dict[str, Any]] = []
+            for i, (ref, edge_size) in enumerate(zip(edges, per_edge, strict=True)):
+                try:
+                    face_index, edge_index = ref
+                    if face_index < 0 or face_index >= faces.Count:
+                        raise IndexError(f"Invalid face index: {face_index}")
+                    face_edges = faces.Item(face_index + 1).Edges
+                    if edge_index < 0 or edge_index >= face_edges.Count:
+                        raise IndexError(f"Invalid edge index: {edge_index} on face {face_index}")
+                    edge = face_edges.Item(edge_index + 1)
+                except (TypeError, ValueError):
+                    errors.append({"index": i, "error": "Edge must be [face_index, edge_index]"})
+                    continue
+                except Exception as e:
+                    errors.append({"index": i, "error": str(e)})
+                    continue
+                key = round(float(edge_size), _SIZE_DIGITS)
+                edge_id = None
+                with contextlib.suppress(Exception):
+                    edge_id = edge.ID
+                if edge_id is not None and edge_id in seen:
+                    if seen[edge_id] != key:
+                        errors.append(
+                            {"index": i, "error": f"Edge listed twice with different {label}s"}
+                        )
+                    continue
+                if edge_id is not None:
+                    seen[edge_id] = key
+                groups.setdefault(key, []).append(edge)
+
+            if not groups:
+                return {"error": "No valid edges", "errors": errors}
+
+            features: list[dict[str, Any]] = []
+            with self.doc_manager.connection.performance_scope(delay_compute=True):
+                if kind == "round":
+                    features = self._add_rounds(model, groups, combine, errors)
+                else:
+                    for distance, group in groups.items():
+                        try:
+                            model.Chamfers.AddEqualSetback(len(group), group, distance)
+                            features.append(
+                                {
+                                    "feature": len(features),
+                                    "distance": distance,
+                                    "edge_count": len(group),
+                                }
+                            )
+                        except Exception as e:
+                            errors.append({"distance": distance, "error": str(e)})
+
+            elapsed = time.perf_counter() - start
+            created_edges = sum(f["edge_count"] for f in features)
+            _logger.info(
+                f"Bulk {kind}: {created_edges} edges in {len(features)} feature(s) "
+                f"in {elapsed:.2f}s"
+            )
+            return {
+                "status": "created" if not errors else ("partial" if features else "failed"),
+                "type": kind,
+                "feature_count": len({f["feature"] for f in features}),
+                "features": features,
+                "edge_count": created_edges,
+                "errors": errors,
+                "seconds": round(elapsed, 4),
+            }
+        except Exception as e:
+            return {"error": str(e), "traceback": traceback.format_exc()}
+
+    @staticmethod
+    def _add_rounds(
+        model: Any, groups: dict[float, list[Any]], combine: bool, errors: list[dict[str, Any]]
+    ) -> list[dict[str, Any]]:
+        """Rounds.Add with one edge set per radius group, or one feature per radius."""
+        if combine and len(groups) > 1:
+            all_edges = [edge for group in groups.values() for edge in group]
+            all_radii = [radius for radius, group in groups.items() for _ in group]
+            try:
+                model.Rounds.Add(
+                    len(all_edges),
+                    VARIANT(pythoncom.VT_ARRAY | pythoncom.VT_DISPATCH, all_edges),
+                    VARIANT(pythoncom.VT_ARRAY | pythoncom.VT_R8, all_radii),
+                )
+                return [
+                    {"feature": 0, "radius": radius, "edge_count": len(group)}
+                    for radius, group in groups.items()
+                ]
+            except Exception as e:
+                _logger.info(f"Combined round rejected ({e}); creating one per radius")
+
+        features: list[dict[str, Any]] = []
+        for radius, group in groups.items():
+            try:
+                model.Rounds.Add(
+                    len(group),
+                    VARIANT(pythoncom.VT_ARRAY | pythoncom.VT_DISPATCH, group),
+                    VARIANT(pythoncom.VT_ARRAY | pythoncom.VT_R8, [radius] * len(group)),
+                )
+                features.append(
+                    {"feature": len(features), "radius": radius, "edge_count": len(group)}
+                )
+            except Exception as e:
+                errors.append({"radius": radius, "error": str(e)})
+        return features
@@ -0,0 +1,368 @@
+"""
+Solid Edge Print Queue
+
+Spools print jobs for many documents and prints them on a background
+worker thread, so a drawing package never blocks interactive tools.
+
+The worker drives its own hidden Solid Edge instance (started on the
+first job, shut down when the queue drains). Each job opens its document,
+applies printer and paper settings through DraftPrintUtility, prints and
+closes it. Transient COM failures (busy or restarted server) are retried
+with a growing delay; other failures fail the job without stopping the
+queue.
+"""
+
+import contextlib
+import itertools
+import os
+import queue
+import threading
+import time
+import traceback
+from collections import deque
+from collections.abc import Callable
+from typing import Any
+
+from .logging import get_logger
+
+_logger = get_logger(__name__)
+
+# COM failures worth retrying: the server was busy or went away
+_RPC_E_CALL_REJECTED = -2147418111
+_RPC_E_SERVERCALL_RETRYLATER = -2147417846
+_RPC_E_DISCONNECTED = -2147417848
+_RPC_S_SERVER_UNAVAILABLE = -2147023174
+_RPC_S_CALL_FAILED = -2147023170
+
+_TRANSIENT_HRESULTS = {
+    _RPC_E_CALL_REJECTED,
+    _RPC_E_SERVERCALL_RETRYLATER,
+    _RPC_E_DISCONNECTED,
+    _RPC_S_SERVER_UNAVAILABLE,
+    _RPC_S_CALL_FAILED,
+}
+# After these the instance is gone and has to be restarted
+_INSTANCE_LOST_HRESULTS = {_RPC_E_DISCONNECTED, _RPC_S_SERVER_UNAVAILABLE, _RPC_S_CALL_FAILED}
+
+# Seconds the worker waits for more jobs before releasing its instance
+_IDLE_TIMEOUT = 30.0
+
+# Finished jobs kept for status queries
+_HISTORY_SIZE = 200
+
+_ORIENTATIONS = {"portrait": 1, "landscape": 2}
+
+AppFactory = Callable[[], Any]
+
+
+def _hresult(error: Exception) -> int | None:
+    """HRESULT of a pywintypes.com_error (first arg), if any."""
+    code = getattr(error, "hresult", None)
+    if code is None and error.args and isinstance(error.args[0], int):
+        code = error.args[0]
+    return code
+
+
+def _is_transient(error: Exception) -> bool:
+    if isinstance(error, FileNotFoundError):
+        return False
+    if isinstance(error, (TimeoutError, ConnectionError)):
+        return True
+    return _hresult(error) in _TRANSIENT_HRESULTS
+
+
+def _hidden_instance() -> Any:
+    import win32com.client
+
+    app = win32com.client.DispatchEx("SolidEdge.Application")
+    with contextlib.suppress(Exception):
+        app.Visible = False
+        app.DisplayAlerts = False
+    return app
+
+
+def _print_one(app: Any, job: dict[str, Any]) -> None:
+    """Open, configure, print and close one document."""
+    path = job["path"]
+    if not os.path.exists(path):
+        raise FileNotFoundError(f"File not found: {path}")
+
+    doc = app.Documents.Open(path)
+    try:
+        if hasattr(doc, "DraftPrintUtility"):
+            dpu = doc.DraftPrintUtility
+            if job.get("printer"):
+                dpu.Printer = job["printer"]
+            paper = job.get("paper")
+            if paper:
+                with contextlib.suppress(Exception):
+                    dpu.PaperWidth = paper["width"]
+                with contextlib.suppress(Exception):
+                    dpu.PaperHeight = paper["height"]
+                with contextlib.suppress(Exception):
+                    dpu.Orientation = _ORIENTATIONS[paper.get("orientation", "landscape")]
+            with contextlib.suppress(Exception):
+                dpu.Copies = job["copies"]
+            with contextlib.suppress(Exception):
+                dpu.PrintAllSheets = job["all_sheets"]
+            dpu.PrintOut()
+        else:
+            kwargs: dict[str, Any] = {}
+            if job.get("printer"):
+                kwargs["Printer"] = job["printer"]
+            if job["copies"] != 1:
+                kwargs["NumCopies"] = job["copies"]
+            doc.PrintOut(**kwargs)
+    finally:
+        with contextlib.suppress(Exception):
+            doc.Close(False)
+
+
+class PrintQueue:
+    """Background print spooler with retry for transient failures"""
+
+    def __init__(
+        self,
+        app_factory: AppFactory | None = None,
+        max_retries: int = 3,
+        retry_delay: float = 2.0,
+        idle_timeout: float = _IDLE_TIMEOUT,
+    ) -> None:
+        self._app_factory = app_factory or _hidden_instance
+        self.max_retries = max_retries
+        self.retry_delay = retry_delay
+        self.idle_timeout = idle_timeout
+
+        self._queue: queue.Queue[int] = queue.Queue()
+        self._jobs: dict[int, dict[str, Any]] = {}
+        self._history: deque[int] = deque()
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+        self._idle = threading.Condition(self._lock)
+        self._worker: threading.Thread | None = None
+        self._active = 0
+
+    # -----------------------------------------------------------------
+    # Submission
+    # -----------------------------------------------------------------
+
+    def submit(
+        self,
+        documents: list[str | dict[str, Any]],
+        printer: str | None = None,
+        copies: int = 1,
+        all_sheets: bool = True,
+        paper: dict[str, Any] | None = None,
+    ) -> dict[str, Any]:
+        """
+        Queue documents for printing and return immediately.
+
+        Args:
+            documents: File paths, or dicts {"path", "printer"?, "copies"?,
+                "all_sheets"?, "paper"?} overriding the shared settings
+            printer: Printer name (default: each document's saved printer)
+            copies: Number of copies
+            all_sheets: Print every sheet of a draft (False: active sheet)
+            paper: {"width", "height", "orientation"} - meters and
+                'Landscape' | 'Portrait'
+
+        Returns:
+            Dict with the queued job IDs
+        """
+        if not documents:
+            return {"error": "No documents given"}
+
+        jobs = []
+        for i, document in enumerate(documents):
+            spec = {"path": document} if isinstance(document, str) else dict(document)
+            if not spec.get("path"):
+                return {"error": f"documents[{i}]: 'path' is required"}
+            job: dict[str, Any] = {
+                "path": spec["path"],
+                "printer": spec.get("printer", printer),
+                "copies": int(spec.get("copies", copies)),
+                "all_sheets": bool(spec.get("all_sheets", all_sheets)),
+                "paper": spec.get("paper", paper),
+            }
+            if job["copies"] < 1:
+                return {"error": f"documents[{i}]: copies must be at least 1"}
+            if job["paper"]:
+                orientation = str(job["paper"].get("orientation", "Landscape")).lower()
+                if orientation not in _ORIENTATIONS:
+                    return {"error": f"documents[{i}]: invalid orientation {orientation!r}"}
+                if "width" not in job["paper"] or "height" not in job["paper"]:
+                    return {"error": f"documents[{i}]: paper needs 'width' and 'height'"}
+                job["paper"] = {**job["paper"], "orientation": orientation}
+            jobs.append(job)
+
+        with self._lock:
+            ids = []
+            for job in jobs:
+                job_id = next(self._ids)
+                self._jobs[job_id] = {
+                    "id": job_id,
+                    **job,
+                    "state": "queued",
+                    "attempts": 0,
+                    "submitted_at": time.time(),
+                }
+                self._queue.put(job_id)
+                self._active += 1
+                ids.append(job_id)
+            if self._worker is None:
+                self._worker = threading.Thread(target=self._run, name="print-queue", daemon=True)
+                self._worker.start()
+        return {"status": "queued", "job_ids": ids, "queued": self._queue.qsize()}
+
+    def cancel(self, job_ids: list[int] | None = None) -> dict[str, Any]:
+        """Cancel queued jobs (all queued jobs if job_ids is None)."""
+        cancelled = []
+        with self._lock:
+            for job_id, job in self._jobs.items():
+                if job["state"] == "queued" and (job_ids is None or job_id in job_ids):
+                    job["state"] = "cancelled"
+                    cancelled.append(job_id)
+        return {"status": "cancelled", "job_ids": cancelled}
+
+    # -----------------------------------------------------------------
+    # Worker
+    # -----------------------------------------------------------------
+
+    def _run(self) -> None:
+        com_initialized = False
+        app = None
+        try:
+            with contextlib.suppress(ImportError):
+                import pythoncom
+
+                pythoncom.CoInitialize()
+                com_initialized = True
+
+            while True:
+                try:
+                    job_id = self._queue.get(timeout=self.idle_timeout)
+                except queue.Empty:
+                    with self._lock:
+                        if self._queue.empty():
+                            self._worker = None
+                            return
+                    continue
+
+                with self._lock:
+                    job = self._jobs[job_id]
+                    if job["state"] == "cancelled":
+                        self._finish(job_id)
+                        continue
+                    job["state"] = "running"
+                    job["started_at"] = time.time()
+                app = self._process(job, app)
+                with self._lock:
+                    self._finish(job_id)
+        except Exception as e:
+            _logger.error(f"Print queue worker stopped: {e}")
+            with self._lock:
+                self._worker = None
+        finally:
+            if app is not None:
+                with contextlib.suppress(Exception):
+                    app.Quit()
+            if com_initialized:
+                import pythoncom
+
+                pythoncom.CoUninitialize()
+
+    def _process(self, job: dict[str, Any], app: Any) -> Any:
+        """Print one job with retries; returns the (possibly restarted) instance."""
+        while True:
+            job["attempts"] += 1
+            try:
+                if app is None:
+                    app = self._app_factory()
+                _print_one(app, job)
+                job["state"] = "done"
+                break
+            except Exception as e:
+                job["error"] = str(e)
+                if _hresult(e) in _INSTANCE_LOST_HRESULTS:
+                    with contextlib.suppress(Exception):
+                        app.Quit()
+                    app = None
+                if not _is_transient(e) or job["attempts"] > self.max_retries:
+                    job["state"] = "failed"
+                    _logger.error(f"Print job {job['id']} failed: {job['path']}: {e}")
+                    break
+                delay = self.retry_delay * 2 ** (job["attempts"] - 1)
+                _logger.warning(
+                    f"Print job {job['id']} attempt {job['attempts']} failed, "
+                    f"retrying in {delay:.1f}s: {e}"
+                )
+                job["state"] = "retrying"
+                time.sleep(delay)
+        if job["state"] == "done":
+            job.pop("error", None)
+        job["finished_at"] = time.time()
+        return app
+
+    def _finish(self, job_id: int) -> None:
+        """Move a job to history (lock held)."""
+        self._active -= 1
+        self._history.append(job_id)
+        while len(self._history) > _HISTORY_SIZE:
+            self._jobs.pop(self._history.popleft(), None)
+        if self._active == 0:
+            self._idle.notify_all()
+
+    def wait(self, timeout: float | None = None) -> bool:
+        """Block until every submitted job has finished. Returns False on timeout."""
+        with self._idle:
+            return self._idle.wait_for(lambda: self._active == 0, timeout)
+
+    # -----------------------------------------------------------------
+    # Status
+    # -----------------------------------------------------------------
+
+    def get_job(self, job_id: int) -> dict[str, Any]:
+        """Return one job's state, attempts and last error."""
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is None:
+                return {"error": f"Unknown print job: {job_id}"}
+            return dict(job)
+
+    def get_status(self) -> dict[str, Any]:
+        """
+        Summarize the queue.
+
+        Returns:
+            Dict with worker state, per-state counts, the running job and
+            recent jobs (newest first)
+        """
+        try:
+            with self._lock:
+                jobs = [dict(job) for job in self._jobs.values()]
+                worker_alive = self._worker is not None
+            counts: dict[str, int] = {}
+            for job in jobs:
+                counts[job["state"]] = counts.get(job["state"], 0) + 1
+            running = [j for j in jobs if j["state"] in ("running", "retrying")]
+            return {
+                "state": "printing" if running else ("waiting" if worker_alive else "idle"),
+                "counts": counts,
+                "running": running[0] if running else None,
+                "jobs": sorted(jobs, key=lambda j: j["id"], reverse=True),
+            }
+        except Exception as e:
+            return {"error": str(e), "traceback": traceback.format_exc()}
+
+    def clear_finished(self) -> dict[str, Any]:
+        """Forget done, failed and cancelled jobs."""
+        with self._lock:
+            finished = [
+                job_id
+                for job_id in self._history
+                if self._jobs.get(job_id, {}).get("state") in ("done", "failed", "cancelled")
+            ]
+            for job_id in finished:
+                self._jobs.pop(job_id, None)
+            self._history = deque(j for j in self._history if j in self._jobs)
+        return {"status": "cleared", "removed": len(finished)}
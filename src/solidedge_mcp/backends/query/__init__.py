@@ -9,8 +9,13 @@ from ._brep import BRepMixin
 from ._document import DocumentQueryMixin
 from ._features import FeatureQueryMixin
 from ._materials import MaterialsMixin
+from ._moldability import MoldabilityMixin
 from ._physical_props import PhysicalPropsMixin
+from ._ray_queries import RayQueryMixin
 from ._selection import SelectionMixin
+from ._surface_sampling import SurfaceSamplingMixin
+from ._thickness import ThicknessMixin
+from ._topology import TopologyMixin
 from ._variables import VariablesMixin
 
 
@@ -19,6 +24,11 @@ class QueryManager(
     DocumentQueryMixin,
     VariablesMixin,
     BRepMixin,
+    RayQueryMixin,
+    SurfaceSamplingMixin,
+    MoldabilityMixin,
+    ThicknessMixin,
+    TopologyMixin,
     SelectionMixin,
     FeatureQueryMixin,
     MaterialsMixin,
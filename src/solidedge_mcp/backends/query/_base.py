@@ -5,7 +5,10 @@ Base class for QueryManager providing constructor and shared helpers.
 from typing import Any
 
 from ..constants import FaceQueryConstants
+from ..facet_cache import FacetCache
 from ..logging import get_logger
+from ._mass import MassPropertiesCache
+from ._mesh import MeshCache
 
 _logger = get_logger(__name__)
 
@@ -17,6 +20,14 @@ class QueryManagerBase:
 
     def __init__(self, document_manager: Any) -> None:
         self.doc_manager = document_manager
+        # BVHs of recently tessellated bodies (see RayQueryMixin._cached_bvh)
+        self._mesh_cache = MeshCache()
+        # Tessellations of saved documents, kept on disk (see RayQueryMixin._body_facets)
+        self._facet_cache = FacetCache()
+        # Physical properties per document generation (see PhysicalPropsMixin)
+        self._mass_cache = MassPropertiesCache()
+        # Cached face/edge snapshot (see TopologyMixin)
+        self._topology_snapshot: dict[str, Any] | None = None
 
     def _get_first_model(self) -> tuple[Any, Any]:
         """Get the first model from the active document."""
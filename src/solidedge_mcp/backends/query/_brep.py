@@ -183,6 +183,87 @@ class BRepMixin:
         except Exception as e:
             return {"error": str(e), "traceback": traceback.format_exc()}
 
+    def _face_geometry_data(self, geom: Any) -> dict[str, Any]:
+        """Geometry type and defining data of a face surface (probing each surface type)."""
+        result: dict[str, Any] = {}
+
+        # Try Plane
+        try:
+            plane_data = geom.GetPlaneData()
+            if isinstance(plane_data, tuple) and len(plane_data) >= 2:
+                result["geometry_type"] = "Plane"
+                result["root_point"] = self._to_list(plane_data[0])
+                result["normal"] = self._to_list(plane_data[1])
+                return result
+        except Exception:
+            pass
+
+        # Try Cylinder
+        try:
+            cyl_data = geom.GetCylinderData()
+            if isinstance(cyl_data, tuple) and len(cyl_data) >= 3:
+                result["geometry_type"] = "Cylinder"
+                result["base_point"] = self._to_list(cyl_data[0])
+                result["axis"] = self._to_list(cyl_data[1])
+                result["radius"] = cyl_data[2]
+                return result
+        except Exception:
+            pass
+
+        # Try Cone
+        try:
+            cone_data = geom.GetConeData()
+            if isinstance(cone_data, tuple) and len(cone_data) >= 4:
+                result["geometry_type"] = "Cone"
+                result["base_point"] = self._to_list(cone_data[0])
+                result["axis"] = self._to_list(cone_data[1])
+                result["radius"] = cone_data[2]
+                result["half_angle"] = cone_data[3]
+                if len(cone_data) > 4:
+                    result["expanding"] = bool(cone_data[4])
+                return result
+        except Exception:
+            pass
+
+        # Try Sphere
+        try:
+            sphere_data = geom.GetSphereData()
+            if isinstance(sphere_data, tuple) and len(sphere_data) >= 2:
+                result["geometry_type"] = "Sphere"
+                result["center"] = self._to_list(sphere_data[0])
+                result["radius"] = sphere_data[1]
+                return result
+        except Exception:
+            pass
+
+        # Try Torus
+        try:
+            torus_data = geom.GetTorusData()
+            if isinstance(torus_data, tuple) and len(torus_data) >= 4:
+                result["geometry_type"] = "Torus"
+                result["center"] = self._to_list(torus_data[0])
+                result["axis"] = self._to_list(torus_data[1])
+                result["major_radius"] = torus_data[2]
+                result["minor_radius"] = torus_data[3]
+                return result
+        except Exception:
+            pass
+
+        # Try BSplineSurface
+        try:
+            bspline_info = geom.GetBSplineInfo()
+            if isinstance(bspline_info, tuple) and len(bspline_info) >= 2:
+                result["geometry_type"] = "BSplineSurface"
+                result["raw_info"] = list(bspline_info)
+                return result
+        except Exception:
+            pass
+
+        result["geometry_type"] = "Unknown"
+        with contextlib.suppress(Exception):
+            result["raw_type"] = geom.Type
+        return result
+
     def get_face_geometry(self, face_index: int) -> dict[str, Any]:
         """
         Get the underlying geometry type and data of a face.
@@ -199,84 +280,8 @@ class BRepMixin:
         try:
             _doc, _model, _body, face = self._get_face(face_index)
 
-            geom = face.Geometry
             result: dict[str, Any] = {"face_index": face_index}
-
-            # Try Plane
-            try:
-                plane_data = geom.GetPlaneData()
-                if isinstance(plane_data, tuple) and len(plane_data) >= 2:
-                    result["geometry_type"] = "Plane"
-                    result["root_point"] = self._to_list(plane_data[0])
-                    result["normal"] = self._to_list(plane_data[1])
-                    return result
-            except Exception:
-                pass
-
-            # Try Cylinder
-            try:
-                cyl_data = geom.GetCylinderData()
-                if isinstance(cyl_data, tuple) and len(cyl_data) >= 3:
-                    result["geometry_type"] = "Cylinder"
-                    result["base_point"] = self._to_list(cyl_data[0])
-                    result["axis"] = self._to_list(cyl_data[1])
-                    result["radius"] = cyl_data[2]
-                    return result
-            except Exception:
-                pass
-
-            # Try Cone
-            try:
-                cone_data = geom.GetConeData()
-                if isinstance(cone_data, tuple) and len(cone_data) >= 4:
-                    result["geometry_type"] = "Cone"
-                    result["base_point"] = self._to_list(cone_data[0])
-                    result["axis"] = self._to_list(cone_data[1])
-                    result["radius"] = cone_data[2]
-                    result["half_angle"] = cone_data[3]
-                    if len(cone_data) > 4:
-                        result["expanding"] = bool(cone_data[4])
-                    return result
-            except Exception:
-                pass
-
-            # Try Sphere
-            try:
-                sphere_data = geom.GetSphereData()
-                if isinstance(sphere_data, tuple) and len(sphere_data) >= 2:
-                    result["geometry_type"] = "Sphere"
-                    result["center"] = self._to_list(sphere_data[0])
-                    result["radius"] = sphere_data[1]
-                    return result
-            except Exception:
-                pass
-
-            # Try Torus
-            try:
-                torus_data = geom.GetTorusData()
-                if isinstance(torus_data, tuple) and len(torus_data) >= 4:
-                    result["geometry_type"] = "Torus"
-                    result["center"] = self._to_list(torus_data[0])
-                    result["axis"] = self._to_list(torus_data[1])
-                    result["major_radius"] = torus_data[2]
-                    result["minor_radius"] = torus_data[3]
-                    return result
-            except Exception:
-                pass
-
-            # Try BSplineSurface
-            try:
-                bspline_info = geom.GetBSplineInfo()
-                if isinstance(bspline_info, tuple) and len(bspline_info) >= 2:
-                    result["geometry_type"] = "BSplineSurface"
-                    result["raw_info"] = list(bspline_info)
-                    return result
-            except Exception:
-                pass
-
-            result["geometry_type"] = "Unknown"
-            with contextlib.suppress(Exception):
-                result["raw_type"] = geom.Type
+            result.update(self._face_geometry_data(face.Geometry))
             return result
         except Exception as e:
             return {"error": str(e), "traceback": traceback.format_exc()}
@@ -370,6 +375,14 @@ class BRepMixin:
         except Exception as e:
             return {"error": str(e), "traceback": traceback.format_exc()}
 
+    @staticmethod
+    def _apply_face_color(face: Any, red: int, green: int, blue: int) -> None:
+        """Color one face with SetColor, falling back to an OLE color value."""
+        try:
+            face.SetColor(red, green, blue)
+        except Exception:
+            face.Color = red | (green << 8) | (blue << 16)
+
     def set_face_color(self, face_index: int, red: int, green: int, blue: int) -> dict[str, Any]:
         """
         Set the color of a specific face.
@@ -392,18 +405,7 @@ class BRepMixin:
                 return {"error": f"Invalid face index: {face_index}. Count: {faces.Count}"}
 
             face = faces.Item(face_index + 1)
-
-            # SetFaceStyle or put color directly
-            try:
-                face.SetColor(red, green, blue)
-            except Exception:
-                # Try alternative: FaceStyle
-                try:
-                    face.Color = (red << 0) | (green << 8) | (blue << 16)
-                except Exception:
-                    # Final fallback using OLE color
-                    ole_color = red | (green << 8) | (blue << 16)
-                    face.Color = ole_color
+            self._apply_face_color(face, red, green, blue)
 
             return {"status": "updated", "face_index": face_index, "color": [red, green, blue]}
         except Exception as e:
@@ -661,6 +663,65 @@ class BRepMixin:
         except Exception as e:
             return {"error": str(e), "traceback": traceback.format_exc()}
 
+    def _edge_geometry_data(self, geom: Any) -> dict[str, Any]:
+        """Geometry type and defining data of an edge curve (probing each curve type)."""
+        result: dict[str, Any] = {}
+
+        # Try to determine geometry type
+        geom_type = "Unknown"
+        with contextlib.suppress(Exception):
+            geom_type_val = geom.Type
+            geom_type = str(geom_type_val)
+
+        # Attempt Circle data
+        try:
+            circle_data = geom.GetCircleData()
+            if isinstance(circle_data, tuple) and len(circle_data) >= 3:
+                result["geometry_type"] = "Circle"
+                result["center"] = self._to_list(circle_data[0])
+                result["axis"] = self._to_list(circle_data[1])
+                result["radius"] = circle_data[2]
+                return result
+        except Exception:
+            pass
+
+        # Attempt Ellipse data
+        try:
+            ellipse_data = geom.GetEllipseData()
+            if isinstance(ellipse_data, tuple) and len(ellipse_data) >= 4:
+                result["geometry_type"] = "Ellipse"
+                result["center"] = self._to_list(ellipse_data[0])
+                result["axis"] = self._to_list(ellipse_data[1])
+                result["major_axis"] = self._to_list(ellipse_data[2])
+                result["minor_major_ratio"] = ellipse_data[3]
+                return result
+        except Exception:
+            pass
+
+        # Attempt BSplineCurve info
+        try:
+            bspline_info = geom.GetBSplineInfo()
+            if isinstance(bspline_info, tuple) and len(bspline_info) >= 4:
+                result["geometry_type"] = "BSplineCurve"
+                result["order"] = bspline_info[0]
+                result["num_poles"] = bspline_info[1]
+                result["num_knots"] = bspline_info[2]
+                result["rational"] = bool(bspline_info[3])
+                if len(bspline_info) > 4:
+                    result["closed"] = bool(bspline_info[4])
+                if len(bspline_info) > 5:
+                    result["periodic"] = bool(bspline_info[5])
+                if len(bspline_info) > 6:
+                    result["planar"] = bool(bspline_info[6])
+                return result
+        except Exception:
+            pass
+
+        # Default: Line (no extra data needed beyond endpoints)
+        result["geometry_type"] = "Line"
+        result["raw_type"] = geom_type
+        return result
+
     def get_edge_geometry(self, face_index: int, edge_index: int) -> dict[str, Any]:
         """
         Get the underlying geometry type and data of an edge.
@@ -678,65 +739,11 @@ class BRepMixin:
         try:
             _doc, _model, _body, _face, edge = self._get_face_edge(face_index, edge_index)
 
-            geom = edge.Geometry
             result: dict[str, Any] = {
                 "face_index": face_index,
                 "edge_index": edge_index,
             }
-
-            # Try to determine geometry type
-            geom_type = "Unknown"
-            with contextlib.suppress(Exception):
-                geom_type_val = geom.Type
-                geom_type = str(geom_type_val)
-
-            # Attempt Circle data
-            try:
-                circle_data = geom.GetCircleData()
-                if isinstance(circle_data, tuple) and len(circle_data) >= 3:
-                    result["geometry_type"] = "Circle"
-                    result["center"] = self._to_list(circle_data[0])
-                    result["axis"] = self._to_list(circle_data[1])
-                    result["radius"] = circle_data[2]
-                    return result
-            except Exception:
-                pass
-
-            # Attempt Ellipse data
-            try:
-                ellipse_data = geom.GetEllipseData()
-                if isinstance(ellipse_data, tuple) and len(ellipse_data) >= 4:
-                    result["geometry_type"] = "Ellipse"
-                    result["center"] = self._to_list(ellipse_data[0])
-                    result["axis"] = self._to_list(ellipse_data[1])
-                    result["major_axis"] = self._to_list(ellipse_data[2])
-                    result["minor_major_ratio"] = ellipse_data[3]
-                    return result
-            except Exception:
-                pass
-
-            # Attempt BSplineCurve info
-            try:
-                bspline_info = geom.GetBSplineInfo()
-                if isinstance(bspline_info, tuple) and len(bspline_info) >= 4:
-                    result["geometry_type"] = "BSplineCurve"
-                    result["order"] = bspline_info[0]
-                    result["num_poles"] = bspline_info[1]
-                    result["num_knots"] = bspline_info[2]
-                    result["rational"] = bool(bspline_info[3])
-                    if len(bspline_info) > 4:
-                        result["closed"] = bool(bspline_info[4])
-                    if len(bspline_info) > 5:
-                        result["periodic"] = bool(bspline_info[5])
-                    if len(bspline_info) > 6:
-                        result["planar"] = bool(bspline_info[6])
-                    return result
-            except Exception:
-                pass
-
-            # Default: Line (no extra data needed beyond endpoints)
-            result["geometry_type"] = "Line"
-            result["raw_type"] = geom_type
+            result.update(self._edge_geometry_data(edge.Geometry))
             return result
         except Exception as e:
             return {"error": str(e), "traceback": traceback.format_exc()}
@@ -789,19 +796,25 @@ class BRepMixin:
     # BODY / VERTEX / SHELL QUERIES
     # =================================================================
 
-    def get_body_facet_data(self, tolerance: float = 0.0) -> dict[str, Any]:
+    def get_body_facet_data(
+        self, tolerance: float = 0.0, include_data: bool = False, max_facets: int = 10_000
+    ) -> dict[str, Any]:
         """
         Get tessellation/mesh data from the model body.
 
         Returns triangulated facet data (vertices, normals, face IDs).
-        Useful for 3D printing previews and mesh export.
+        Useful for 3D printing previews and mesh export. Tessellations of
+        saved documents are kept in the on-disk facet cache, keyed by
+        file content, body and tolerance, and reused across sessions.
 
         Args:
             tolerance: Mesh tolerance in meters. If <= 0, returns cached data.
                        If > 0, recomputes from Parasolid (slower but more accurate).
+            include_data: Also return points, normals and face IDs
+            max_facets: Most facets returned with include_data
 
         Returns:
-            Dict with facet count, point count, and sample data
+            Dict with facet count, point count, cache info and optionally the data
         """
         try:
             doc = self.doc_manager.get_active_document()
@@ -814,38 +827,39 @@ class BRepMixin:
 
             import array as arr_mod
 
-            # Prepare out parameters for COM call
-            # GetFacetData(Tolerance, FacetCount, Points,
-            # Normals, TextureCoords, StyleIDs, FaceIDs,
-            # bHonourPrefs)
-            points = arr_mod.array("d", [])
-            normals = arr_mod.array("d", [])
-            texture_coords = arr_mod.array("d", [])
-            style_ids = arr_mod.array("i", [])
-            face_ids = arr_mod.array("i", [])
-
             try:
-                result_data = body.GetFacetData(
-                    tolerance,  # Tolerance
-                )
-
-                # GetFacetData returns a tuple of
-                # (facetCount, points, normals,
-                # textureCoords, styleIds, faceIds)
-                if isinstance(result_data, tuple) and len(result_data) >= 2:
-                    facet_count = result_data[0] if isinstance(result_data[0], int) else 0
-                    pts = result_data[1] if len(result_data) > 1 else []
-
-                    return {
+                facets, cached = self._body_facets(doc, body, tolerance)
+                with facets:
+                    facet_count = len(facets)
+                    result: dict[str, Any] = {
                         "facet_count": facet_count,
-                        "point_count": len(pts) // 3 if pts else 0,
+                        "point_count": len(facets.points) // 3,
+                        "normal_count": len(facets.normals) // 3,
                         "tolerance": tolerance,
                         "has_data": facet_count > 0,
+                        "cached": cached,
+                        "cache_file": facets.path or None,
                     }
+                    if include_data:
+                        shown = min(facet_count, max(0, max_facets))
+                        per_facet = len(facets.normals) // facet_count if facet_count else 0
+                        result["points"] = facets.points[: 9 * shown].tolist()
+                        result["normals"] = facets.normals[: per_facet * shown].tolist()
+                        result["face_ids"] = facets.face_ids[:shown].tolist()
+                        result["truncated"] = shown < facet_count
+                    return result
             except Exception:
                 pass
 
             # Alternative: try with explicit out params
+            # GetFacetData(Tolerance, FacetCount, Points,
+            # Normals, TextureCoords, StyleIDs, FaceIDs,
+            # bHonourPrefs)
+            points = arr_mod.array("d", [])
+            normals = arr_mod.array("d", [])
+            texture_coords = arr_mod.array("d", [])
+            style_ids = arr_mod.array("i", [])
+            face_ids = arr_mod.array("i", [])
             try:
                 facet_count = 0
                 body.GetFacetData(
@@ -877,6 +891,30 @@ class BRepMixin:
         except Exception as e:
             return {"error": str(e), "traceback": traceback.format_exc()}
 
+    def get_facet_cache_status(self) -> dict[str, Any]:
+        """
+        Report the on-disk facet cache (directory, entries, bytes, hits).
+
+        Returns:
+            Dict with cache statistics
+        """
+        try:
+            return self._facet_cache.get_status()
+        except Exception as e:
+            return {"error": str(e), "traceback": traceback.format_exc()}
+
+    def clear_facet_cache(self) -> dict[str, Any]:
+        """
+        Delete every cached tessellation.
+
+        Returns:
+            Dict with the number of entries removed
+        """
+        try:
+            return {"status": "cleared", "removed": self._facet_cache.clear()}
+        except Exception as e:
+            return {"error": str(e), "traceback": traceback.format_exc()}
+
     def get_solid_bodies(self) -> dict[str, Any]:
         """
         Report all solid bodies in the active part document.
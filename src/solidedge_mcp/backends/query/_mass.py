@@ -0,0 +1,233 @@
+"""Mass-properties cache and rigid-body aggregation of part results.
+
+Pure Python; the COM calls live in PhysicalPropsMixin.
+"""
+
+import math
+from collections import OrderedDict
+from typing import Any
+
+# Accuracy passed to ComputePhysicalPropertiesWithSpecifiedDensity
+DEFAULT_MASS_ACCURACY = 0.99
+DEFAULT_DENSITY = 7850.0
+# Part results kept; an assembly rollup needs one per unique part file
+DEFAULT_MASS_CACHE_SIZE = 1024
+
+_IDENTITY = [1.0, 0.0, 0.0, 0.0, 1.0, 0.0, 0.0, 0.0, 1.0]
+
+
+def parse_physical_properties(result: Any) -> dict[str, Any]:
+    """Name the fields of a ComputePhysicalProperties* result tuple.
+
+    (volume, area, mass, cog, cov, moments, principal moments,
+    principal axes, radii of gyration, ...)
+    """
+
+    def item(i: int, default: Any) -> Any:
+        value = result[i] if len(result) > i else default
+        return list(value) if hasattr(value, "__iter__") else value
+
+    return {
+        "volume": item(0, 0),
+        "surface_area": item(1, 0),
+        "mass": item(2, 0),
+        "center_of_gravity": item(3, [0, 0, 0]) or [0, 0, 0],
+        "center_of_volume": item(4, [0, 0, 0]) or [0, 0, 0],
+        "moments": item(5, [0, 0, 0, 0, 0, 0]),
+        "principal_moments": item(6, [0, 0, 0]) or [0, 0, 0],
+        "principal_axes": item(7, []),
+        "radii_of_gyration": item(8, []),
+    }
+
+
+def scale_density(props: dict[str, Any], ratio: float) -> dict[str, Any]:
+    """Properties of the same solid at ratio times the density.
+
+    Mass and moments scale linearly; geometry, axes and radii of gyration
+    do not change.
+    """
+    scaled = dict(props)
+    scaled["mass"] = props["mass"] * ratio
+    scaled["moments"] = [m * ratio for m in props["moments"]]
+    scaled["principal_moments"] = [m * ratio for m in props["principal_moments"]]
+    return scaled
+
+
+class MassPropertiesCache:
+    """LRU cache of computed physical properties.
+
+    Entries are keyed by (document, density, accuracy) and stamped with
+    the model generation, so an edit to the body invalidates them. A miss
+    at one density is served from another density of the same generation
+    by scaling, since mass and inertia are linear in density.
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_MASS_CACHE_SIZE) -> None:
+        self.max_entries = max_entries
+        self._entries: OrderedDict[Any, tuple[Any, dict[str, Any]]] = OrderedDict()
+        self.hits = 0
+        self.computes = 0
+
+    def get(
+        self, document: Any, generation: Any, density: float | None, accuracy: float
+    ) -> dict[str, Any] | None:
+        """Cached properties, or None. density None accepts any density."""
+        key = (document, density, accuracy)
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] == generation:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+        match = next(
+            (
+                (other, props)
+                for (doc, other, acc), (gen, props) in reversed(self._entries.items())
+                if doc == document and acc == accuracy and gen == generation and other
+            ),
+            None,
+        )
+        if match is None:
+            return None
+        self.hits += 1
+        other, props = match
+        if density is None:
+            return props
+        scaled = scale_density(props, density / other)
+        self.put(document, generation, density, accuracy, scaled)
+        return scaled
+
+    def put(
+        self,
+        document: Any,
+        generation: Any,
+        density: float,
+        accuracy: float,
+        props: dict[str, Any],
+    ) -> None:
+        key = (document, density, accuracy)
+        self._entries[key] = (generation, props)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> int:
+        count = len(self._entries)
+        self._entries.clear()
+        return count
+
+
+def matrix_parts(matrix: Any) -> tuple[list[float], list[float]]:
+    """Rotation (row-major 3x3, column vectors) and translation of a
+    Solid Edge 4x4 occurrence matrix (translation in elements 12-14)."""
+    m = list(matrix)
+    rotation = [m[0], m[4], m[8], m[1], m[5], m[9], m[2], m[6], m[10]]
+    return rotation, [m[12], m[13], m[14]]
+
+
+def compose(
+    outer: tuple[list[float], list[float]], inner: tuple[list[float], list[float]]
+) -> tuple[list[float], list[float]]:
+    """Transform applying inner first, then outer."""
+    r_out, t_out = outer
+    r_in, t_in = inner
+    rotation = _mat_mul(r_out, r_in)
+    translation = [a + b for a, b in zip(_mat_vec(r_out, t_in), t_out, strict=True)]
+    return rotation, translation
+
+
+def identity_transform() -> tuple[list[float], list[float]]:
+    return list(_IDENTITY), [0.0, 0.0, 0.0]
+
+
+def _mat_mul(a: list[float], b: list[float]) -> list[float]:
+    return [sum(a[3 * i + k] * b[3 * k + j] for k in range(3)) for i in range(3) for j in range(3)]
+
+
+def _mat_vec(a: list[float], v: list[float]) -> list[float]:
+    return [a[3 * i] * v[0] + a[3 * i + 1] * v[1] + a[3 * i + 2] * v[2] for i in range(3)]
+
+
+def _transpose(a: list[float]) -> list[float]:
+    return [a[0], a[3], a[6], a[1], a[4], a[7], a[2], a[5], a[8]]
+
+
+def inertia_tensor(moments: list[float]) -> list[float]:
+    """3x3 tensor from (Ixx, Iyy, Izz, Ixy, Ixz, Iyz), products taken as
+    integral(xy dm) (the tensor holds their negatives)."""
+    ixx, iyy, izz, ixy, ixz, iyz = (list(moments) + [0.0] * 6)[:6]
+    return [ixx, -ixy, -ixz, -ixy, iyy, -iyz, -ixz, -iyz, izz]
+
+
+def tensor_moments(tensor: list[float]) -> list[float]:
+    """(Ixx, Iyy, Izz, Ixy, Ixz, Iyz) of a 3x3 inertia tensor."""
+    return [tensor[0], tensor[4], tensor[8], -tensor[1], -tensor[2], -tensor[5]]
+
+
+def principal_moments(tensor: list[float]) -> list[float]:
+    """Eigenvalues of a symmetric 3x3 tensor, ascending."""
+    a, b, c = tensor[0], tensor[4], tensor[8]
+    d, e, f = tensor[1], tensor[2], tensor[5]
+    p1 = d * d + e * e + f * f
+    if p1 == 0.0:
+        return sorted([a, b, c])
+    q = (a + b + c) / 3.0
+    p = math.sqrt(((a - q) ** 2 + (b - q) ** 2 + (c - q) ** 2 + 2.0 * p1) / 6.0)
+    if p == 0.0:
+        return [q, q, q]
+    # Determinant of (tensor - qI) / p
+    ba, bb, bc = (a - q) / p, (b - q) / p, (c - q) / p
+    bd, be, bf = d / p, e / p, f / p
+    r = (ba * (bb * bc - bf * bf) - bd * (bd * bc - bf * be) + be * (bd * bf - bb * be)) / 2.0
+    phi = math.acos(max(-1.0, min(1.0, r))) / 3.0
+    largest = q + 2.0 * p * math.cos(phi)
+    smallest = q + 2.0 * p * math.cos(phi + 2.0 * math.pi / 3.0)
+    return [smallest, 3.0 * q - largest - smallest, largest]
+
+
+def aggregate(
+    parts: list[tuple[dict[str, Any], tuple[list[float], list[float]]]],
+) -> dict[str, Any]:
+    """Combine part properties placed by (rotation, translation) transforms.
+
+    Part moments are taken about each part's center of gravity; each is
+    rotated into assembly axes and moved to the combined center of
+    gravity with the parallel-axis theorem.
+    """
+    mass = volume = area = 0.0
+    weighted = [0.0, 0.0, 0.0]
+    placed = []
+    for props, (rotation, translation) in parts:
+        cog = [
+            c + t
+            for c, t in zip(
+                _mat_vec(rotation, props["center_of_gravity"]), translation, strict=True
+            )
+        ]
+        tensor = _mat_mul(
+            _mat_mul(rotation, inertia_tensor(props["moments"])), _transpose(rotation)
+        )
+        placed.append((props["mass"], cog, tensor))
+        mass += props["mass"]
+        volume += props["volume"]
+        area += props["surface_area"]
+        for i in range(3):
+            weighted[i] += props["mass"] * cog[i]
+
+    center = [w / mass for w in weighted] if mass else [0.0, 0.0, 0.0]
+    total = [0.0] * 9
+    for m, cog, tensor in placed:
+        d = [cog[i] - center[i] for i in range(3)]
+        d2 = d[0] * d[0] + d[1] * d[1] + d[2] * d[2]
+        for i in range(3):
+            for j in range(3):
+                shift = m * ((d2 if i == j else 0.0) - d[i] * d[j])
+                total[3 * i + j] += tensor[3 * i + j] + shift
+
+    return {
+        "volume": volume,
+        "surface_area": area,
+        "mass": mass,
+        "center_of_gravity": center,
+        "moments": tensor_moments(total),
+        "principal_moments": principal_moments(total),
+    }
@@ -0,0 +1,328 @@
+"""Triangle meshes from Body.GetFacetData and a BVH for ray and containment queries.
+
+Pure Python (array module only) so the analyses run wherever the server does.
+Coordinates are meters, as returned by Solid Edge.
+"""
+
+import hashlib
+import math
+from array import array
+from collections import OrderedDict
+from collections.abc import Iterable, Sequence
+from typing import Any
+
+from ..facet_cache import split_facet_data
+
+# Triangles per BVH leaf
+LEAF_SIZE = 8
+
+# Rays start this far along their direction to skip the surface they start on
+_RAY_START = 1e-9
+# Hits closer than this along one ray are the same crossing (shared edge/vertex)
+_SAME_HIT = 1e-9
+
+# Three skewed directions for the containment vote (avoid axis-aligned edges)
+_INSIDE_DIRECTIONS = (
+    (0.5773502691896258, 0.5773502691896258, 0.5773502691896258),
+    (-0.2672612419124244, 0.5345224838248488, 0.8017837257372732),
+    (0.8728715609439696, -0.2182178902359924, 0.4364357804719848),
+)
+
+
+class TriangleMesh:
+    """Unindexed triangle list: 9 coordinates and one face ID per triangle."""
+
+    def __init__(self, coords: Iterable[float], face_ids: Iterable[int]) -> None:
+        self.coords = array("d", coords)
+        self.face_ids = array("q", face_ids)
+        if len(self.coords) != 9 * len(self.face_ids):
+            raise ValueError(
+                f"Mesh needs 9 coordinates per triangle: {len(self.coords)} coordinates, "
+                f"{len(self.face_ids)} face IDs"
+            )
+
+    @classmethod
+    def from_facet_data(cls, data: Any) -> "TriangleMesh":
+        """Build a mesh from a Body.GetFacetData result tuple (see split_facet_data)."""
+        points, _normals, face_ids = split_facet_data(data)
+        return cls.from_buffers(points, face_ids)
+
+    @classmethod
+    def from_buffers(cls, points: Any, face_ids: Any) -> "TriangleMesh":
+        """Build a mesh from float64 point and int64 face-ID buffers (e.g. a
+        mapped facet cache entry) with one bulk copy each."""
+        mesh = cls((), ())
+        mesh.coords.frombytes(memoryview(points).cast("B"))
+        mesh.face_ids.frombytes(memoryview(face_ids).cast("B"))
+        if len(mesh.coords) != 9 * len(mesh.face_ids):
+            raise ValueError("Mesh needs 9 coordinates per triangle")
+        return mesh
+
+    def __len__(self) -> int:
+        return len(self.face_ids)
+
+    def facet_normals(self) -> tuple["array[float]", "array[float]"]:
+        """Unit normal (3 per triangle, from vertex order) and area of every triangle."""
+        c = self.coords
+        normals = array("d", bytes(8 * 3 * len(self)))
+        areas = array("d", bytes(8 * len(self)))
+        for t in range(len(self)):
+            b = 9 * t
+            ax, ay, az = c[b + 3] - c[b], c[b + 4] - c[b + 1], c[b + 5] - c[b + 2]
+            bx, by, bz = c[b + 6] - c[b], c[b + 7] - c[b + 1], c[b + 8] - c[b + 2]
+            nx, ny, nz = ay * bz - az * by, az * bx - ax * bz, ax * by - ay * bx
+            length = math.sqrt(nx * nx + ny * ny + nz * nz)
+            areas[t] = 0.5 * length
+            if length > 0.0:
+                normals[3 * t] = nx / length
+                normals[3 * t + 1] = ny / length
+                normals[3 * t + 2] = nz / length
+        return normals, areas
+
+    def centroid(self, t: int) -> tuple[float, float, float]:
+        c, b = self.coords, 9 * t
+        return (
+            (c[b] + c[b + 3] + c[b + 6]) / 3.0,
+            (c[b + 1] + c[b + 4] + c[b + 7]) / 3.0,
+            (c[b + 2] + c[b + 5] + c[b + 8]) / 3.0,
+        )
+
+    def bounds(self) -> tuple[list[float], list[float]]:
+        c = self.coords
+        if not c:
+            return [0.0, 0.0, 0.0], [0.0, 0.0, 0.0]
+        return [min(c[a::3]) for a in range(3)], [max(c[a::3]) for a in range(3)]
+
+
+class BVH:
+    """Bounding volume hierarchy over a TriangleMesh (median split, flat arrays).
+
+    Nodes live in parallel arrays; a node with left < 0 is a leaf covering
+    ordered triangles [start, start + count). Triangles are stored in leaf
+    order as (v0, edge1, edge2) for the Moller-Trumbore test. Everything is
+    an array, so a BVH pickles cheaply to worker processes.
+    """
+
+    def __init__(self, mesh: TriangleMesh, leaf_size: int = LEAF_SIZE) -> None:
+        n = len(mesh)
+        c = mesh.coords
+        self.triangle_count = n
+        self._box = array("d")
+        self._left = array("q")
+        self._right = array("q")
+        self._start = array("q")
+        self._count = array("q")
+
+        lo = [array("d", map(min, c[a::9], c[a + 3 :: 9], c[a + 6 :: 9])) for a in range(3)]
+        hi = [array("d", map(max, c[a::9], c[a + 3 :: 9], c[a + 6 :: 9])) for a in range(3)]
+        mid = [
+            array("d", ((x + y) * 0.5 for x, y in zip(lo[a], hi[a], strict=True))) for a in range(3)
+        ]
+
+        order = list(range(n))
+        stack = [(self._new_node(), 0, n)] if n else []
+        while stack:
+            node, start, end = stack.pop()
+            idx = order[start:end]
+            box = [min(lo[a][i] for i in idx) for a in range(3)]
+            box += [max(hi[a][i] for i in idx) for a in range(3)]
+            self._box[6 * node : 6 * node + 6] = array("d", box)
+            if end - start <= leaf_size:
+                self._start[node], self._count[node] = start, end - start
+                continue
+            spans = [max(mid[a][i] for i in idx) - min(mid[a][i] for i in idx) for a in range(3)]
+            axis = spans.index(max(spans))
+            if spans[axis] <= 0.0:
+                self._start[node], self._count[node] = start, end - start
+                continue
+            key = mid[axis]
+            idx.sort(key=key.__getitem__)
+            order[start:end] = idx
+            half = (start + end) // 2
+            left, right = self._new_node(), self._new_node()
+            self._left[node], self._right[node] = left, right
+            stack.append((right, half, end))
+            stack.append((left, start, half))
+
+        self.order = array("q", order)
+        self.face_ids = array("q", (mesh.face_ids[t] for t in order))
+        tri = array("d")
+        for t in order:
+            b = 9 * t
+            x0, y0, z0 = c[b], c[b + 1], c[b + 2]
+            tri.extend(
+                (
+                    x0,
+                    y0,
+                    z0,
+                    c[b + 3] - x0,
+                    c[b + 4] - y0,
+                    c[b + 5] - z0,
+                    c[b + 6] - x0,
+                    c[b + 7] - y0,
+                    c[b + 8] - z0,
+                )
+            )
+        self._tri = tri
+
+    def _new_node(self) -> int:
+        self._box.extend((0.0,) * 6)
+        for column in (self._left, self._right, self._start, self._count):
+            column.append(-1)
+        return len(self._left) - 1
+
+    @property
+    def node_count(self) -> int:
+        return len(self._left)
+
+    def ray_hits(
+        self,
+        origin: Sequence[float],
+        direction: Sequence[float],
+        first_only: bool = False,
+        max_distance: float = math.inf,
+        any_hit: bool = False,
+    ) -> list[tuple[float, int]]:
+        """(distance, ordered triangle) for each crossing along a ray, nearest first.
+
+        Distances are in units of the direction vector's length. With
+        first_only only the nearest hit is returned; with any_hit the search
+        stops at the first hit found, which need not be the nearest.
+        """
+        ox, oy, oz = origin
+        dx, dy, dz = direction
+        ix = 1.0 / dx if dx else 1e300
+        iy = 1.0 / dy if dy else 1e300
+        iz = 1.0 / dz if dz else 1e300
+        box, left_of, right_of = self._box, self._left, self._right
+        start_of, count_of, tri = self._start, self._count, self._tri
+        best = max_distance
+        hits: list[tuple[float, int]] = []
+        stack = [0] if self.triangle_count else []
+        while stack:
+            node = stack.pop()
+            b = 6 * node
+            t1, t2 = (box[b] - ox) * ix, (box[b + 3] - ox) * ix
+            near, far = (t1, t2) if t1 < t2 else (t2, t1)
+            t1, t2 = (box[b + 1] - oy) * iy, (box[b + 4] - oy) * iy
+            if t1 > t2:
+                t1, t2 = t2, t1
+            near, far = max(near, t1), min(far, t2)
+            t1, t2 = (box[b + 2] - oz) * iz, (box[b + 5] - oz) * iz
+            if t1 > t2:
+                t1, t2 = t2, t1
+            near, far = max(near, t1), min(far, t2)
+            if near > far or far < _RAY_START or near > best:
+                continue
+            left = left_of[node]
+            if left >= 0:
+                stack.append(right_of[node])
+                stack.append(left)
+                continue
+            first = start_of[node]
+            for t in range(first, first + count_of[node]):
+                k = 9 * t
+                e1x, e1y, e1z = tri[k + 3], tri[k + 4], tri[k + 5]
+                e2x, e2y, e2z = tri[k + 6], tri[k + 7], tri[k + 8]
+                px, py, pz = dy * e2z - dz * e2y, dz * e2x - dx * e2z, dx * e2y - dy * e2x
+                det = e1x * px + e1y * py + e1z * pz
+                if -1e-30 < det < 1e-30:
+                    continue
+                inv = 1.0 / det
+                sx, sy, sz = ox - tri[k], oy - tri[k + 1], oz - tri[k + 2]
+                u = (sx * px + sy * py + sz * pz) * inv
+                if u < 0.0 or u > 1.0:
+                    continue
+                qx, qy, qz = sy * e1z - sz * e1y, sz * e1x - sx * e1z, sx * e1y - sy * e1x
+                v = (dx * qx + dy * qy + dz * qz) * inv
+                if v < 0.0 or u + v > 1.0:
+                    continue
+                dist = (e2x * qx + e2y * qy + e2z * qz) * inv
+                if dist < _RAY_START or dist > best:
+                    continue
+                if any_hit:
+                    return [(dist, t)]
+                if first_only:
+                    best = dist
+                    hits = [(dist, t)]
+                else:
+                    hits.append((dist, t))
+        hits.sort()
+        return hits
+
+    def first_hit(
+        self, origin: Sequence[float], direction: Sequence[float]
+    ) -> tuple[float, int] | None:
+        hits = self.ray_hits(origin, direction, first_only=True)
+        return hits[0] if hits else None
+
+    def occluded(
+        self,
+        origin: Sequence[float],
+        direction: Sequence[float],
+        max_distance: float = math.inf,
+    ) -> bool:
+        """True if the ray hits any triangle within max_distance."""
+        return bool(self.ray_hits(origin, direction, max_distance=max_distance, any_hit=True))
+
+    def crossings(self, origin: Sequence[float], direction: Sequence[float]) -> int:
+        """Number of distinct surface crossings along a ray."""
+        count = 0
+        last = -math.inf
+        for dist, _ in self.ray_hits(origin, direction):
+            if dist - last > _SAME_HIT:
+                count += 1
+            last = dist
+        return count
+
+    def contains(self, point: Sequence[float]) -> bool:
+        """Point-in-solid by crossing parity, majority of three skewed rays."""
+        votes = sum(self.crossings(point, d) % 2 for d in _INSIDE_DIRECTIONS)
+        return votes >= 2
+
+
+DEFAULT_MESH_CACHE_SIZE = 2
+
+
+class MeshCache:
+    """LRU cache of BVHs, reused while a body's tessellation is unchanged.
+
+    Entries are keyed by (document, tolerance) and stamped with the model
+    generation: a digest of the tessellation itself, so any edit that
+    changes the body geometry invalidates the entry without tracking
+    feature edits.
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_MESH_CACHE_SIZE) -> None:
+        self.max_entries = max_entries
+        self._entries: OrderedDict[Any, tuple[str, BVH]] = OrderedDict()
+        self.hits = 0
+        self.builds = 0
+
+    @staticmethod
+    def generation(mesh: TriangleMesh) -> str:
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(mesh.coords.tobytes())
+        digest.update(mesh.face_ids.tobytes())
+        return digest.hexdigest()
+
+    def bvh(self, key: Any, mesh: TriangleMesh) -> tuple[BVH, bool]:
+        """BVH for the mesh under key, and whether it came from the cache."""
+        generation = self.generation(mesh)
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] == generation:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1], True
+        bvh = BVH(mesh)
+        self.builds += 1
+        self._entries[key] = (generation, bvh)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        return bvh, False
+
+    def clear(self) -> int:
+        count = len(self._entries)
+        self._entries.clear()
+        return count
@@ -0,0 +1,211 @@
+"""Draft-angle and undercut analysis of molded parts from the body tessellation."""
+
+import math
+import time
+import traceback
+from typing import Any
+
+from ..constants import FaceQueryConstants
+from ..logging import get_logger
+
+_logger = get_logger(__name__)
+
+DRAFT_CLASSES = ("positive", "negative", "insufficient", "undercut")
+
+# Default face colors (RGB) per class when coloring the model
+DRAFT_COLORS = {
+    "positive": (0, 170, 0),
+    "negative": (0, 90, 220),
+    "insufficient": (240, 200, 0),
+    "undercut": (220, 0, 0),
+}
+
+# A face is an undercut when at least this share of its area is trapped
+_UNDERCUT_AREA_SHARE = 0.05
+# Largest facets ray-tested per face; the rest are weighted by these
+_MAX_UNDERCUT_RAYS_PER_FACE = 8
+# Ray origins are lifted this far off the facet (meters)
+_RAY_LIFT = 1e-7
+
+
+def _unit(vector: list[float]) -> tuple[float, float, float]:
+    x, y, z = (float(c) for c in vector)
+    length = math.sqrt(x * x + y * y + z * z)
+    if length == 0.0:
+        raise ValueError("pull_direction must not be zero")
+    return x / length, y / length, z / length
+
+
+class MoldabilityMixin:
+    """Mixin providing draft-angle and undercut classification per face."""
+
+    doc_manager: Any
+
+    def analyze_draft(
+        self,
+        pull_direction: list[float] | None = None,
+        min_draft: float = 1.0,
+        check_undercuts: bool = True,
+        tolerance: float = 0.0,
+        only_problems: bool = True,
+        color_faces: bool = False,
+    ) -> dict[str, Any]:
+        """
+        Classify every face of the body by draft angle relative to a pull direction.
+
+        The body is tessellated once (GetFacetData). Each facet's draft is
+        the angle between it and the pull direction: positive facets release
+        along +pull, negative along -pull. Facets are aggregated per face
+        (area-weighted). A face is 'insufficient' when any part of it has
+        less than min_draft, and an 'undercut' when part of it cannot
+        release: rays cast from its largest facets in their release
+        direction hit the body again.
+
+        Args:
+            pull_direction: Mold opening direction [x, y, z] (default: [0, 0, 1])
+            min_draft: Required draft in degrees
+            check_undercuts: Ray-test release directions (slower)
+            tolerance: Tessellation tolerance (meters, <= 0 uses the cached mesh)
+            only_problems: List only insufficient and undercut faces
+            color_faces: Color every face by class (green +, blue -,
+                yellow insufficient, red undercut)
+
+        Returns:
+            Dict with per-class counts and per-face min/max/mean draft,
+            area and problem areas
+        """
+        try:
+            pull = _unit(pull_direction or [0.0, 0.0, 1.0])
+        except (TypeError, ValueError) as e:
+            return {"error": f"Invalid pull_direction: {e}"}
+        if min_draft < 0 or min_draft >= 90:
+            return {"error": "min_draft must be between 0 and 90 degrees"}
+
+        try:
+            doc, _model, body = self._get_body()
+            start = time.perf_counter()
+            mesh = self._body_mesh(body, tolerance, doc)
+            if not len(mesh):
+                return {"error": "Body has no tessellation"}
+            face_index = self._face_index_by_id(body)
+            normals, areas = mesh.facet_normals()
+            px, py, pz = pull
+            threshold = math.sin(math.radians(min_draft))
+
+            # Per-face accumulators keyed by face ID
+            stats: dict[int, dict[str, Any]] = {}
+            for t in range(len(mesh)):
+                area = areas[t]
+                if area <= 0.0:
+                    continue
+                dot = normals[3 * t] * px + normals[3 * t + 1] * py + normals[3 * t + 2] * pz
+                dot = max(-1.0, min(1.0, dot))
+                s = stats.get(mesh.face_ids[t])
+                if s is None:
+                    s = stats[mesh.face_ids[t]] = {
+                        "area": 0.0,
+                        "weighted": 0.0,
+                        "min": dot,
+                        "max": dot,
+                        "insufficient_area": 0.0,
+                        "facets": [],
+                    }
+                s["area"] += area
+                s["weighted"] += dot * area
+                s["min"] = min(s["min"], dot)
+                s["max"] = max(s["max"], dot)
+                if abs(dot) < threshold:
+                    s["insufficient_area"] += area
+                else:
+                    s["facets"].append((area, t, 1.0 if dot > 0 else -1.0))
+            mesh_seconds = time.perf_counter() - start
+
+            rays = 0
+            if check_undercuts:
+                bvh, _cached = self._cached_bvh(doc, mesh, tolerance)
+                for s in stats.values():
+                    facets = sorted(s["facets"], reverse=True)[:_MAX_UNDERCUT_RAYS_PER_FACE]
+                    tested = trapped = 0.0
+                    for area, t, sign in facets:
+                        cx, cy, cz = mesh.centroid(t)
+                        nx, ny, nz = normals[3 * t], normals[3 * t + 1], normals[3 * t + 2]
+                        origin = (cx + nx * _RAY_LIFT, cy + ny * _RAY_LIFT, cz + nz * _RAY_LIFT)
+                        rays += 1
+                        tested += area
+                        if bvh.occluded(origin, (px * sign, py * sign, pz * sign)):
+                            trapped += area
+                    s["undercut_area"] = (
+                        (s["area"] - s["insufficient_area"]) * trapped / tested if tested else 0.0
+                    )
+
+            faces = []
+            counts = dict.fromkeys(DRAFT_CLASSES, 0)
+            for face_id, s in stats.items():
+                low = math.degrees(math.asin(s["min"]))
+                high = math.degrees(math.asin(s["max"]))
+                mean = math.degrees(math.asin(max(-1.0, min(1.0, s["weighted"] / s["area"]))))
+                undercut_area = s.get("undercut_area", 0.0)
+                if undercut_area >= _UNDERCUT_AREA_SHARE * s["area"]:
+                    cls = "undercut"
+                elif s["insufficient_area"] > 0.0 or (low < 0.0 < high):
+                    cls = "insufficient"
+                else:
+                    cls = "positive" if low > 0 else "negative"
+                counts[cls] += 1
+                faces.append(
+                    {
+                        "face_index": face_index.get(face_id),
+                        "face_id": face_id,
+                        "class": cls,
+                        "min_draft": round(low, 4),
+                        "max_draft": round(high, 4),
+                        "mean_draft": round(mean, 4),
+                        "area": s["area"],
+                        "insufficient_area": s["insufficient_area"],
+                        "undercut_area": undercut_area,
+                    }
+                )
+            faces.sort(key=lambda f: (f["face_index"] is None, f["face_index"] or 0))
+
+            colored = 0
+            color_errors = []
+            if color_faces:
+                collection = body.Faces(FaceQueryConstants.igQueryAll)
+                with self.doc_manager.connection.performance_scope():
+                    for entry in faces:
+                        if entry["face_index"] is None:
+                            continue
+                        try:
+                            face = collection.Item(entry["face_index"] + 1)
+                            self._apply_face_color(face, *DRAFT_COLORS[entry["class"]])
+                            colored += 1
+                        except Exception as e:
+                            color_errors.append(
+                                {"face_index": entry["face_index"], "error": str(e)}
+                            )
+
+            elapsed = time.perf_counter() - start
+            _logger.info(
+                f"Draft analysis: {len(faces)} faces, {len(mesh)} facets, {rays} rays "
+                f"in {elapsed:.2f}s"
+            )
+            result: dict[str, Any] = {
+                "pull_direction": list(pull),
+                "min_draft": min_draft,
+                "facet_count": len(mesh),
+                "face_count": len(faces),
+                "counts": counts,
+                "faces": [f for f in faces if f["class"] in ("insufficient", "undercut")]
+                if only_problems
+                else faces,
+                "undercut_rays": rays,
+                "mesh_seconds": round(mesh_seconds, 4),
+                "seconds": round(elapsed, 4),
+            }
+            if color_faces:
+                result["colored"] = colored
+                if color_errors:
+                    result["color_errors"] = color_errors
+            return result
+        except Exception as e:
+            return {"error": str(e), "traceback": traceback.format_exc()}
@@ -1,11 +1,24 @@
 """Physical properties, measurements, and body appearance operations."""
 
+import contextlib
 import math
+import os
+import time
 import traceback
 from typing import Any
 
+from ..assembly._loading import ensure_occurrences_loaded
 from ..logging import get_logger
 from ._base import QueryManagerBase
+from ._mass import (
+    DEFAULT_DENSITY,
+    DEFAULT_MASS_ACCURACY,
+    aggregate,
+    compose,
+    identity_transform,
+    matrix_parts,
+    parse_physical_properties,
+)
 
 _logger = get_logger(__name__)
 
@@ -15,15 +28,95 @@ class PhysicalPropsMixin(QueryManagerBase):
 
     doc_manager: Any
 
-    def get_mass_properties(self, density: float = 7850) -> dict[str, Any]:
+    @staticmethod
+    def _document_key(doc: Any) -> Any:
+        for attr in ("FullName", "Name"):
+            try:
+                value = getattr(doc, attr)
+            except Exception:
+                continue
+            if value:
+                return value
+        return id(doc)
+
+    @staticmethod
+    def _mass_generation(doc: Any, model: Any) -> Any:
+        """Body volume and range plus a change indicator: the saved file's
+        mtime and size while the document is clean, or the (ID, area) of
+        every face once it has unsaved edits, which can keep volume and
+        range. Costs far less than a physical-properties computation; None
+        when the body cannot be read."""
+        from ..constants import FaceQueryConstants
+
+        try:
+            body = model.Body
+            generation = (body.Volume, tuple(tuple(p) for p in body.GetRange()))
+            if doc.Dirty is False:
+                try:
+                    stat = os.stat(doc.FullName)
+                except (OSError, TypeError, ValueError):
+                    return (*generation, "saved")
+                return (*generation, "saved", stat.st_mtime_ns, stat.st_size)
+            faces = body.Faces(FaceQueryConstants.igQueryAll)
+            fingerprint = []
+            for i in range(1, faces.Count + 1):
+                face = faces.Item(i)
+                fingerprint.append((face.ID, face.Area))
+            return (*generation, tuple(fingerprint))
+        except Exception:
+            return None
+
+    def _physical_properties(
+        self,
+        doc: Any,
+        model: Any,
+        density: float = DEFAULT_DENSITY,
+        accuracy: float = DEFAULT_MASS_ACCURACY,
+        refresh: bool = False,
+    ) -> tuple[dict[str, Any], bool]:
+        """(properties, cached) of a part model, computed once per
+        (document, generation, density, accuracy)."""
+        key = self._document_key(doc)
+        generation = self._mass_generation(doc, model)
+        if not refresh and generation is not None:
+            props = self._mass_cache.get(key, generation, density, accuracy)
+            if props is not None:
+                return props, True
+        result = model.ComputePhysicalPropertiesWithSpecifiedDensity(density, accuracy)
+        props = parse_physical_properties(result)
+        self._mass_cache.computes += 1
+        if generation is not None:
+            self._mass_cache.put(key, generation, density, accuracy, props)
+        return props, False
+
+    def _cached_physical_properties(self, doc: Any, model: Any) -> dict[str, Any] | None:
+        """Density-independent properties already computed for this generation, if any."""
+        generation = self._mass_generation(doc, model)
+        if generation is None:
+            return None
+        return self._mass_cache.get(
+            self._document_key(doc), generation, None, DEFAULT_MASS_ACCURACY
+        )
+
+    def get_mass_properties(
+        self,
+        density: float = DEFAULT_DENSITY,
+        accuracy: float = DEFAULT_MASS_ACCURACY,
+        refresh: bool = False,
+    ) -> dict[str, Any]:
         """
         Get mass properties of the part.
 
-        Uses Model.ComputePhysicalProperties(status, density, accuracy) which
-        returns a tuple: (volume, area, mass, cog_tuple, cov_tuple, moi_tuple, ...)
+        Uses Model.ComputePhysicalPropertiesWithSpecifiedDensity(density, accuracy)
+        which returns a tuple: (volume, area, mass, cog_tuple, cov_tuple, moi_tuple, ...)
+        The result is cached per document, density and accuracy until the
+        body changes, and also serves get_volume, get_surface_area,
+        get_center_of_gravity and get_moments_of_inertia.
 
         Args:
             density: Material density in kg/m³ (default: 7850 for steel)
+            accuracy: Computation accuracy passed to Solid Edge
+            refresh: Recompute even if a cached result is current
 
         Returns:
             Dict with volume, mass, surface area, center of gravity, moments of inertia
@@ -31,28 +124,21 @@ class PhysicalPropsMixin(QueryManagerBase):
         try:
             _logger.info(f"Computing mass properties with density={density} kg/m³")
             doc, model = self._get_first_model()
-
-            # ComputePhysicalPropertiesWithSpecifiedDensity(Density, Accuracy)
-            # Returns tuple: (volume, area, mass, cog, cov, moi, principal_moi,
-            #                  principal_axes, radii_of_gyration, ?, ?)
-            result = model.ComputePhysicalPropertiesWithSpecifiedDensity(density, 0.99)
-
-            volume = result[0] if len(result) > 0 else 0
-            surface_area = result[1] if len(result) > 1 else 0
-            mass_val = result[2] if len(result) > 2 else 0
-            cog = result[3] if len(result) > 3 else (0, 0, 0)
-            cov = result[4] if len(result) > 4 else (0, 0, 0)
-            moi = result[5] if len(result) > 5 else (0, 0, 0, 0, 0, 0)
-            principal_moi = result[6] if len(result) > 6 else (0, 0, 0)
+            props, cached = self._physical_properties(doc, model, density, accuracy, refresh)
+            moi = props["moments"]
+            if not hasattr(moi, "__len__"):
+                moi = [moi]
 
             return {
                 "status": "computed",
                 "density": density,
-                "volume": volume,
-                "surface_area": surface_area,
-                "mass": mass_val,
-                "center_of_gravity": list(cog) if cog else [0, 0, 0],
-                "center_of_volume": list(cov) if cov else [0, 0, 0],
+                "accuracy": accuracy,
+                "cached": cached,
+                "volume": props["volume"],
+                "surface_area": props["surface_area"],
+                "mass": props["mass"],
+                "center_of_gravity": props["center_of_gravity"],
+                "center_of_volume": props["center_of_volume"],
                 "moments_of_inertia": {
                     "Ixx": moi[0] if len(moi) > 0 else 0,
                     "Iyy": moi[1] if len(moi) > 1 else 0,
@@ -61,7 +147,7 @@ class PhysicalPropsMixin(QueryManagerBase):
                     "Ixz": moi[4] if len(moi) > 4 else 0,
                     "Iyz": moi[5] if len(moi) > 5 else 0,
                 },
-                "principal_moments": list(principal_moi) if principal_moi else [0, 0, 0],
+                "principal_moments": props["principal_moments"],
                 "units": {
                     "volume": "m³",
                     "surface_area": "m²",
@@ -75,6 +161,118 @@ class PhysicalPropsMixin(QueryManagerBase):
             _logger.error(f"Mass properties computation failed: {e}")
             return {"error": str(e), "traceback": traceback.format_exc()}
 
+    def get_assembly_mass_properties(
+        self,
+        density: float = DEFAULT_DENSITY,
+        accuracy: float = DEFAULT_MASS_ACCURACY,
+        refresh: bool = False,
+    ) -> dict[str, Any]:
+        """
+        Roll up mass properties of the active assembly from its parts.
+
+        Each unique part file is computed once (and cached like
+        get_mass_properties); every occurrence then places that result
+        with its matrix, composed through sub-assemblies. Moments about
+        the assembly's center of gravity use the parallel-axis theorem,
+        taking part moments as about the part's center of gravity and
+        products of inertia as integral(xy dm).
+
+        Args:
+            density: Density applied to every part (kg/m³)
+            accuracy: Computation accuracy passed to Solid Edge
+            refresh: Recompute part results even if cached ones are current
+
+        Returns:
+            Dict with the combined volume, area, mass, center of gravity,
+            moments of inertia and per-part masses and occurrence counts
+        """
+        try:
+            doc = self.doc_manager.get_active_document()
+            if not hasattr(doc, "Occurrences"):
+                return {"error": "Active document is not an assembly"}
+            start = time.perf_counter()
+
+            per_file: dict[str, dict[str, Any]] = {}
+            placed: list[tuple[dict[str, Any], tuple[list[float], list[float]]]] = []
+            skipped: list[dict[str, Any]] = []
+            computed = 0
+
+            def walk(occurrences: Any, transform: tuple[list[float], list[float]]) -> None:
+                nonlocal computed
+                for i in range(1, occurrences.Count + 1):
+                    occ = occurrences.Item(i)
+                    name = getattr(occ, "Name", f"Occurrence_{i}")
+                    try:
+                        if getattr(occ, "IsSuppressed", False) is True:
+                            continue
+                        file_name = str(occ.OccurrenceFileName)
+                        placement = compose(transform, matrix_parts(occ.GetMatrix()))
+                        # Lightweight-opened assemblies have inactive occurrences
+                        ensure_occurrences_loaded([occ])
+                        occ_doc = occ.OccurrenceDocument
+                        if file_name.lower().endswith(".asm"):
+                            walk(occ_doc.Occurrences, placement)
+                            continue
+                        if file_name not in per_file:
+                            if occ_doc.Models.Count == 0:
+                                raise ValueError("Part has no model")
+                            props, cached = self._physical_properties(
+                                occ_doc, occ_doc.Models.Item(1), density, accuracy, refresh
+                            )
+                            computed += not cached
+                            per_file[file_name] = {"props": props, "occurrences": 0}
+                        per_file[file_name]["occurrences"] += 1
+                        placed.append((per_file[file_name]["props"], placement))
+                    except Exception as e:
+                        skipped.append({"name": name, "error": str(e)})
+
+            walk(doc.Occurrences, identity_transform())
+            if not placed:
+                return {"error": "No part occurrences with mass", "skipped": skipped}
+
+            total = aggregate(placed)
+            moi = total["moments"]
+            elapsed = time.perf_counter() - start
+            _logger.info(
+                f"Assembly mass rollup: {len(placed)} occurrences of {len(per_file)} parts "
+                f"({computed} computed) in {elapsed:.2f}s"
+            )
+            return {
+                "status": "computed",
+                "density": density,
+                "accuracy": accuracy,
+                "occurrence_count": len(placed),
+                "unique_parts": len(per_file),
+                "computed_parts": computed,
+                "volume": total["volume"],
+                "surface_area": total["surface_area"],
+                "mass": total["mass"],
+                "center_of_gravity": total["center_of_gravity"],
+                "moments_of_inertia": dict(
+                    zip(("Ixx", "Iyy", "Izz", "Ixy", "Ixz", "Iyz"), moi, strict=True)
+                ),
+                "principal_moments": total["principal_moments"],
+                "parts": [
+                    {
+                        "file": file_name,
+                        "occurrences": entry["occurrences"],
+                        "mass": entry["props"]["mass"],
+                    }
+                    for file_name, entry in per_file.items()
+                ],
+                "skipped": skipped,
+                "seconds": round(elapsed, 4),
+                "units": {
+                    "volume": "m³",
+                    "surface_area": "m²",
+                    "mass": "kg",
+                    "moments_of_inertia": "kg·m²",
+                    "coordinates": "meters",
+                },
+            }
+        except Exception as e:
+            return {"error": str(e), "traceback": traceback.format_exc()}
+
     def get_bounding_box(self) -> dict[str, Any]:
         """
         Get the bounding box of the model.
@@ -118,6 +316,11 @@ class PhysicalPropsMixin(QueryManagerBase):
             doc, model = self._get_first_model()
             body = model.Body
 
+            props = self._cached_physical_properties(doc, model)
+            if props is not None:
+                area = props["surface_area"]
+                return {"surface_area": area, "surface_area_mm2": area * 1e6}
+
             # Try body.SurfaceArea first
             try:
                 area = body.SurfaceArea
@@ -155,8 +358,8 @@ class PhysicalPropsMixin(QueryManagerBase):
         """
         try:
             doc, model = self._get_first_model()
-            body = model.Body
-            volume = body.Volume
+            props = self._cached_physical_properties(doc, model)
+            volume = props["volume"] if props is not None else model.Body.Volume
 
             return {
                 "volume": volume,
@@ -208,6 +411,16 @@ class PhysicalPropsMixin(QueryManagerBase):
         try:
             doc = self.doc_manager.get_active_document()
 
+            props = None
+            with contextlib.suppress(Exception):
+                props = self._cached_physical_properties(*self._get_first_model())
+            if props is not None:
+                cog = props["center_of_gravity"]
+                return {
+                    "center_of_gravity": list(cog),
+                    "center_of_gravity_mm": [c * 1000 for c in cog],
+                }
+
             # Try using named variables first (most reliable)
             try:
                 variables = doc.Variables
@@ -233,30 +446,31 @@ class PhysicalPropsMixin(QueryManagerBase):
             except Exception:
                 pass
 
-            # Fallback: compute physical properties
+            # Fallback: compute (and cache) physical properties
             doc, model = self._get_first_model()
-            result = model.ComputePhysicalPropertiesWithSpecifiedDensity(7850.0, 0.001)
-            # result[3] is the center of gravity tuple
-            cog = result[3]
+            props, _cached = self._physical_properties(doc, model)
+            cog = props["center_of_gravity"]
             return {"center_of_gravity": list(cog), "center_of_gravity_mm": [c * 1000 for c in cog]}
         except Exception as e:
             return {"error": str(e), "traceback": traceback.format_exc()}
 
-    def get_moments_of_inertia(self) -> dict[str, Any]:
+    def get_moments_of_inertia(self, density: float = DEFAULT_DENSITY) -> dict[str, Any]:
         """
         Get the moments of inertia of the part.
 
+        Served from the cached physical properties (see get_mass_properties).
+
+        Args:
+            density: Material density in kg/m³ (default: 7850 for steel)
+
         Returns:
             Dict with moments of inertia values
         """
         try:
             doc, model = self._get_first_model()
-            result = model.ComputePhysicalPropertiesWithSpecifiedDensity(7850.0, 0.001)
-            # result: (volume, area, mass, cog, cov, moi,
-            # principal_moi, principal_axes,
-            # radii_of_gyration, ?, ?)
-            moi = result[5]
-            principal_moi = result[6]
+            props, _cached = self._physical_properties(doc, model, density)
+            moi = props["moments"]
+            principal_moi = props["principal_moments"]
 
             return {
                 "moments_of_inertia": list(moi) if hasattr(moi, "__iter__") else moi,
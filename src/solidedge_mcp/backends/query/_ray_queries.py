@@ -0,0 +1,251 @@
+"""Batch ray casting and point containment against the active body."""
+
+import contextlib
+import time
+import traceback
+from typing import Any
+
+from ..constants import FaceQueryConstants
+from ..facet_cache import FacetArrays, FacetCache
+from ..logging import get_logger
+from ._mesh import BVH, MeshCache, TriangleMesh
+
+_logger = get_logger(__name__)
+
+BATCH_QUERY_METHODS = ("com", "mesh", "auto")
+
+# Largest batch accepted in one call
+_MAX_BATCH_QUERIES = 100_000
+# method='auto' switches from COM to the mesh BVH at this many queries
+_AUTO_MESH_THRESHOLD = 500
+
+
+def _resolve_method(method: str, count: int) -> str:
+    if method not in BATCH_QUERY_METHODS:
+        raise ValueError(f"Invalid method: {method}. Valid: {', '.join(BATCH_QUERY_METHODS)}")
+    if method == "auto":
+        return "mesh" if count >= _AUTO_MESH_THRESHOLD else "com"
+    return method
+
+
+def _check_flat(values: list[float], stride: int, what: str) -> int:
+    """Number of stride-sized records in a flat list; raises ValueError if malformed."""
+    if not values:
+        raise ValueError(f"No {what} given")
+    if len(values) % stride:
+        raise ValueError(f"{what} must be a flat list of {stride} values each, got {len(values)}")
+    count = len(values) // stride
+    if count > _MAX_BATCH_QUERIES:
+        raise ValueError(f"Too many {what}: {count}. Maximum: {_MAX_BATCH_QUERIES}")
+    return count
+
+
+class RayQueryMixin:
+    """Mixin providing batched ray casts and point-in-body tests."""
+
+    doc_manager: Any
+    _mesh_cache: MeshCache
+    _facet_cache: FacetCache
+
+    def _body_facets(
+        self, doc: Any, body: Any, tolerance: float = 0.0, body_key: str = "model1"
+    ) -> tuple[FacetArrays, bool]:
+        """(facets, cached) of a body, from the on-disk facet cache when the
+        document is saved; otherwise tessellated with Body.GetFacetData."""
+        return self._facet_cache.body_facets(doc, body, tolerance, body_key)
+
+    def _body_mesh(self, body: Any, tolerance: float = 0.0, doc: Any = None) -> TriangleMesh:
+        """Tessellate a body with Body.GetFacetData (tolerance <= 0: cached display mesh).
+
+        With doc given, the tessellation goes through the facet cache.
+        """
+        if doc is None:
+            return TriangleMesh.from_facet_data(body.GetFacetData(tolerance))
+        facets, _cached = self._body_facets(doc, body, tolerance)
+        with facets:
+            return TriangleMesh.from_buffers(facets.points, facets.face_ids)
+
+    def _cached_bvh(self, doc: Any, mesh: TriangleMesh, tolerance: float) -> tuple[BVH, bool]:
+        """BVH of the active body's mesh, rebuilt only when the tessellation changed."""
+        name = getattr(doc, "FullName", None) or getattr(doc, "Name", None)
+        key = (str(name) if name else id(doc), tolerance)
+        return self._mesh_cache.bvh(key, mesh)
+
+    @staticmethod
+    def _face_index_by_id(body: Any) -> dict[int, int]:
+        """Map face ID -> 0-based index in body.Faces(igQueryAll)."""
+        faces = body.Faces(FaceQueryConstants.igQueryAll)
+        index: dict[int, int] = {}
+        for i in range(1, faces.Count + 1):
+            with contextlib.suppress(Exception):
+                index[int(faces.Item(i).ID)] = i - 1
+        return index
+
+    def get_faces_by_rays(
+        self,
+        rays: list[float],
+        method: str = "com",
+        first_hit_only: bool = False,
+        tolerance: float = 0.0,
+    ) -> dict[str, Any]:
+        """
+        Ray-cast many rays against the active body in one call.
+
+        The body and its face ID table are resolved once. With method='com'
+        each ray is a Body.FacesByRay call; with method='mesh' the body is
+        tessellated once (GetFacetData) and rays are traced through a BVH
+        in Python, which is much faster for large batches but only as
+        accurate as the tessellation. method='auto' uses the mesh from
+        500 rays up.
+
+        Args:
+            rays: Flat list [ox, oy, oz, dx, dy, dz, ...] - 6 values per ray
+            method: 'com' | 'mesh' | 'auto'
+            first_hit_only: Return only the nearest face per ray
+            tolerance: Tessellation tolerance for the mesh method (meters,
+                <= 0 uses the cached display mesh)
+
+        Returns:
+            Dict with per-ray 0-based face indices ('hits'; -1 for no hit
+            when first_hit_only), and distances along each ray for the mesh
+        """
+        try:
+            count = _check_flat(rays, 6, "rays")
+            resolved = _resolve_method(method, count)
+        except ValueError as e:
+            return {"error": str(e)}
+
+        try:
+            doc, _model, body = self._get_body()
+            face_index = self._face_index_by_id(body)
+            start = time.perf_counter()
+
+            hits: list[Any] = []
+            distances: list[Any] = []
+            errors: list[dict[str, Any]] = []
+            if resolved == "mesh":
+                bvh, _cached = self._cached_bvh(
+                    doc, self._body_mesh(body, tolerance, doc), tolerance
+                )
+                for r in range(count):
+                    k = 6 * r
+                    found = bvh.ray_hits(rays[k : k + 3], rays[k + 3 : k + 6], first_hit_only)
+                    faces: list[int] = []
+                    dists: list[float] = []
+                    for dist, tri in found:
+                        face = face_index.get(bvh.face_ids[tri], -1)
+                        if not faces or faces[-1] != face:
+                            faces.append(face)
+                            dists.append(round(dist, 9))
+                    if first_hit_only:
+                        hits.append(faces[0] if faces else -1)
+                        distances.append(dists[0] if dists else None)
+                    else:
+                        hits.append(faces)
+                        distances.append(dists)
+            else:
+                for r in range(count):
+                    k = 6 * r
+                    try:
+                        found_faces = body.FacesByRay(*rays[k : k + 6])
+                        faces = []
+                        for i in range(1, found_faces.Count + 1):
+                            face_id = found_faces.Item(i).ID
+                            faces.append(face_index.get(int(face_id), -1))
+                    except Exception as e:
+                        errors.append({"ray": r, "error": str(e)})
+                        faces = []
+                    if first_hit_only:
+                        hits.append(faces[0] if faces else -1)
+                    else:
+                        hits.append(faces)
+
+            elapsed = time.perf_counter() - start
+            _logger.info(f"Cast {count} rays ({resolved}) in {elapsed:.2f}s")
+            result: dict[str, Any] = {
+                "method": resolved,
+                "ray_count": count,
+                "hits": hits,
+                "hit_count": sum(1 for h in hits if h != -1 and h != []),
+                "seconds": round(elapsed, 4),
+            }
+            if resolved == "mesh":
+                result["distances"] = distances
+            if errors:
+                result["errors"] = errors
+            return result
+        except Exception as e:
+            return {"error": str(e), "traceback": traceback.format_exc()}
+
+    def are_points_inside_body(
+        self, points: list[float], method: str = "com", tolerance: float = 0.0
+    ) -> dict[str, Any]:
+        """
+        Test many 3D points for containment in the active body.
+
+        The body and its first shell are resolved once. With method='com'
+        one SAFEARRAY buffer is reused for every Shell.IsPointInside call;
+        with method='mesh' the body is tessellated once and each point is
+        classified by ray-crossing parity through a BVH (majority of three
+        rays). Points within the tessellation tolerance of the surface may
+        be classified either way by the mesh. method='auto' uses the mesh
+        from 500 points up.
+
+        Args:
+            points: Flat list [x, y, z, ...] - 3 values per point (meters)
+            method: 'com' | 'mesh' | 'auto'
+            tolerance: Tessellation tolerance for the mesh method (meters)
+
+        Returns:
+            Dict with 'inside' flags (1/0 per point) and the inside count
+        """
+        try:
+            count = _check_flat(points, 3, "points")
+            resolved = _resolve_method(method, count)
+        except ValueError as e:
+            return {"error": str(e)}
+
+        try:
+            doc, _model, body = self._get_body()
+            start = time.perf_counter()
+
+            inside: list[int] = []
+            errors: list[dict[str, Any]] = []
+            if resolved == "mesh":
+                bvh, _cached = self._cached_bvh(
+                    doc, self._body_mesh(body, tolerance, doc), tolerance
+                )
+                for p in range(count):
+                    inside.append(1 if bvh.contains(points[3 * p : 3 * p + 3]) else 0)
+            else:
+                import pythoncom
+                from win32com.client import VARIANT
+
+                shells = body.Shells
+                if shells.Count == 0:
+                    return {"error": "Body has no shells"}
+                shell = shells.Item(1)
+
+                buffer = VARIANT(pythoncom.VT_ARRAY | pythoncom.VT_R8, [0.0, 0.0, 0.0])
+                for p in range(count):
+                    buffer.value = points[3 * p : 3 * p + 3]
+                    try:
+                        inside.append(1 if shell.IsPointInside(buffer) else 0)
+                    except Exception as e:
+                        errors.append({"point": p, "error": str(e)})
+                        inside.append(0)
+
+            elapsed = time.perf_counter() - start
+            _logger.info(f"Classified {count} points ({resolved}) in {elapsed:.2f}s")
+            result: dict[str, Any] = {
+                "method": resolved,
+                "point_count": count,
+                "inside": inside,
+                "inside_count": sum(inside),
+                "seconds": round(elapsed, 4),
+            }
+            if errors:
+                result["errors"] = errors
+            return result
+        except Exception as e:
+            return {"error": str(e), "traceback": traceback.format_exc()}
@@ -0,0 +1,393 @@
+"""Face/edge selector language evaluated against a topology snapshot.
+
+A selector names the entity kind and a condition, for example::
+
+    edges where type=line and parallel to Z and length>10mm
+    faces of type cylinder with radius<3mm
+    edges on face 4 and not (type=circle or length<=2mm)
+
+Conditions combine with 'and', 'or', 'not' and parentheses. Predicates:
+
+- ``type=<name>``, ``type in (a, b)``, ``type!=<name>`` or a bare type name
+- ``<attribute> <op> <value>[unit]`` with op one of < <= > >= = !=, or
+  ``<attribute> between <low> and <high>``
+- ``parallel to <dir>`` / ``perpendicular to <dir>``, dir being X, Y, Z or
+  [x, y, z]; the direction of a line edge is its tangent, of a circle its
+  axis, of a plane its normal and of a revolved face its axis
+- ``on face <n>`` (edges bounding face n) / ``adjacent to face <n>`` (faces
+  sharing an edge with face n)
+
+Values without a unit are meters (m^2 for areas, radians for angles).
+Filler words (where, with, of, that, is, are, has) are ignored.
+"""
+
+import math
+import re
+from collections.abc import Callable
+from typing import Any
+
+Record = dict[str, Any]
+Predicate = Callable[[Record], bool]
+
+ENTITY_KINDS = {"face": "faces", "faces": "faces", "edge": "edges", "edges": "edges"}
+
+FACE_TYPES = ("plane", "cylinder", "cone", "sphere", "torus", "spline", "unknown")
+EDGE_TYPES = ("line", "circle", "ellipse", "spline")
+
+_TYPE_ALIASES = {
+    "planar": "plane",
+    "flat": "plane",
+    "cylindrical": "cylinder",
+    "conical": "cone",
+    "spherical": "sphere",
+    "toroidal": "torus",
+    "bspline": "spline",
+    "freeform": "spline",
+    "linear": "line",
+    "straight": "line",
+    "arc": "circle",
+    "circular": "circle",
+    "elliptical": "ellipse",
+}
+
+# attribute -> dimension, per entity kind
+_ATTRIBUTES = {
+    "faces": {
+        "area": "area",
+        "radius": "length",
+        "diameter": "length",
+        "minor_radius": "length",
+        "half_angle": "angle",
+        "edge_count": "count",
+    },
+    "edges": {
+        "length": "length",
+        "radius": "length",
+        "diameter": "length",
+        "face_count": "count",
+    },
+}
+
+_UNITS = {
+    "length": {"m": 1.0, "cm": 1e-2, "mm": 1e-3, "um": 1e-6, "in": 0.0254, "inch": 0.0254},
+    "area": {"m2": 1.0, "cm2": 1e-4, "mm2": 1e-6, "in2": 0.0254**2},
+    "angle": {"rad": 1.0, "deg": math.pi / 180.0},
+    "count": {},
+}
+
+_AXES = {
+    "x": (1.0, 0.0, 0.0),
+    "y": (0.0, 1.0, 0.0),
+    "z": (0.0, 0.0, 1.0),
+}
+
+_FILLERS = {"where", "with", "of", "that", "which", "is", "are", "has", "have"}
+
+# Directions within this angle count as parallel (or perpendicular)
+_ANGLE_TOLERANCE = math.radians(0.01)
+
+_TOKEN = re.compile(
+    r"\s*(?:"
+    r"(?P<num>[-+]?(?:\d+\.?\d*|\.\d+)(?:e[-+]?\d+)?)(?P<unit>[a-z]+(?:\^?2)?)?"
+    r"|(?P<op><=|>=|!=|==|=|<|>)"
+    r"|(?P<punct>[(),\[\]])"
+    r"|(?P<word>[+-]?[a-z_]+(?:\^?2)?)"
+    r")"
+)
+
+
+def _tokenize(text: str) -> list[tuple[str, Any]]:
+    tokens: list[tuple[str, Any]] = []
+    text = text.strip().lower()
+    pos = 0
+    while pos < len(text):
+        match = _TOKEN.match(text, pos)
+        if not match or match.end() == pos:
+            raise ValueError(f"Unexpected text at {pos}: {text[pos : pos + 12]!r}")
+        pos = match.end()
+        if match.group("num") is not None:
+            tokens.append(("num", float(match.group("num"))))
+            if match.group("unit"):
+                tokens.append(("unit", match.group("unit").replace("^", "")))
+        elif match.group("op"):
+            tokens.append(("op", "=" if match.group("op") == "==" else match.group("op")))
+        elif match.group("punct"):
+            tokens.append((match.group("punct"), match.group("punct")))
+        elif match.group("word"):
+            tokens.append(("word", match.group("word").replace("^", "")))
+    return tokens
+
+
+def _direction_of(record: Record) -> list[float] | None:
+    return record.get("direction") or record.get("normal") or record.get("axis")
+
+
+def _angle_between_axes(a: list[float], b: tuple[float, float, float]) -> float:
+    """Angle between two lines (0..pi/2), ignoring orientation."""
+    la = math.sqrt(sum(c * c for c in a))
+    lb = math.sqrt(sum(c * c for c in b))
+    if la == 0.0 or lb == 0.0:
+        return math.nan
+    cos = abs(sum(x * y for x, y in zip(a, b, strict=True))) / (la * lb)
+    return math.acos(min(1.0, cos))
+
+
+def _any(record: Record) -> bool:
+    return True
+
+
+class Selector:
+    """A parsed selector: entity kind plus a predicate over snapshot records."""
+
+    def __init__(self, text: str, kind: str, predicate: Predicate) -> None:
+        self.text = text
+        self.kind = kind
+        self.predicate = predicate
+
+    def matching(self, records: list[Record]) -> list[int]:
+        """Indices of the records satisfying the selector."""
+        return [r["index"] for r in records if self.predicate(r)]
+
+
+class _Parser:
+    def __init__(self, text: str) -> None:
+        self.text = text
+        self.tokens = _tokenize(text)
+        self.pos = 0
+        self.kind = ""
+
+    # -- token helpers
+
+    def _peek(self) -> tuple[str, Any] | None:
+        return self.tokens[self.pos] if self.pos < len(self.tokens) else None
+
+    def _is_word(self, *words: str) -> bool:
+        token = self._peek()
+        return token is not None and token[0] == "word" and token[1] in words
+
+    def _next(self, what: str) -> tuple[str, Any]:
+        token = self._peek()
+        if token is None:
+            raise ValueError(f"Expected {what} at end of selector")
+        self.pos += 1
+        return token
+
+    def _expect(self, kind: str, what: str) -> Any:
+        token = self._next(what)
+        if token[0] != kind:
+            raise ValueError(f"Expected {what}, got {token[1]!r}")
+        return token[1]
+
+    def _skip_fillers(self) -> None:
+        while self._is_word(*_FILLERS):
+            self.pos += 1
+
+    # -- grammar
+
+    def parse(self) -> Selector:
+        kind = self._expect("word", "'faces' or 'edges'")
+        if kind not in ENTITY_KINDS:
+            raise ValueError(f"Selector must start with 'faces' or 'edges', got {kind!r}")
+        self.kind = ENTITY_KINDS[kind]
+        self._skip_fillers()
+        predicate = self._expr() if self._peek() is not None else _any
+        token = self._peek()
+        if token is not None:
+            raise ValueError(f"Unexpected {token[1]!r}")
+        return Selector(self.text, self.kind, predicate)
+
+    def _expr(self) -> Predicate:
+        terms = [self._term()]
+        while self._is_word("or"):
+            self.pos += 1
+            terms.append(self._term())
+        if len(terms) == 1:
+            return terms[0]
+        return lambda r: any(t(r) for t in terms)
+
+    def _term(self) -> Predicate:
+        factors = [self._factor()]
+        # 'and' or a filler ("cylinders with radius<3mm") joins conditions
+        while self._is_word("and", *_FILLERS):
+            if self._is_word("and"):
+                self.pos += 1
+            factors.append(self._factor())
+        if len(factors) == 1:
+            return factors[0]
+        return lambda r: all(f(r) for f in factors)
+
+    def _factor(self) -> Predicate:
+        self._skip_fillers()
+        if self._is_word("not"):
+            self.pos += 1
+            inner = self._factor()
+            return lambda r: not inner(r)
+        token = self._peek()
+        if token is not None and token[0] == "(":
+            self.pos += 1
+            inner = self._expr()
+            self._expect(")", "')'")
+            return inner
+        return self._predicate()
+
+    def _predicate(self) -> Predicate:
+        word = self._expect("word", "a condition")
+        if word == "type":
+            return self._type_predicate()
+        if word in ("parallel", "perpendicular"):
+            if self._is_word("to"):
+                self.pos += 1
+            axis = self._direction()
+            if word == "parallel":
+                return lambda r: self._angle(r, axis) <= _ANGLE_TOLERANCE
+            return lambda r: abs(self._angle(r, axis) - math.pi / 2) <= _ANGLE_TOLERANCE
+        if word == "on" and self.kind == "edges":
+            face = self._face_reference()
+            return lambda r: face in r.get("faces", ())
+        if word == "adjacent" and self.kind == "faces":
+            if self._is_word("to"):
+                self.pos += 1
+            face = self._face_reference()
+            return lambda r: face in r.get("adjacent", ()) and r["index"] != face
+        name = _TYPE_ALIASES.get(word, word)
+        if name in self._types():
+            return lambda r: r.get("type") == name
+        if word in _ATTRIBUTES[self.kind]:
+            return self._comparison(word)
+        raise ValueError(
+            f"Unknown condition {word!r} for {self.kind}. Types: {', '.join(self._types())}; "
+            f"attributes: {', '.join(_ATTRIBUTES[self.kind])}"
+        )
+
+    def _types(self) -> tuple[str, ...]:
+        return FACE_TYPES if self.kind == "faces" else EDGE_TYPES
+
+    def _type_name(self) -> str:
+        word = self._expect("word", "a type name")
+        name = _TYPE_ALIASES.get(word, word)
+        if name not in self._types():
+            raise ValueError(
+                f"Unknown {self.kind[:-1]} type {word!r}. Valid: {', '.join(self._types())}"
+            )
+        return name
+
+    def _type_predicate(self) -> Predicate:
+        negate = False
+        if self._is_word("in"):
+            self.pos += 1
+            self._expect("(", "'('")
+            names = {self._type_name()}
+            while (token := self._peek()) is not None and token[0] == ",":
+                self.pos += 1
+                names.add(self._type_name())
+            self._expect(")", "')'")
+            return lambda r: r.get("type") in names
+        token = self._peek()
+        if token is not None and token[0] == "op":
+            if token[1] not in ("=", "!="):
+                raise ValueError(f"Types compare with = or !=, got {token[1]!r}")
+            negate = token[1] == "!="
+            self.pos += 1
+        self._skip_fillers()
+        name = self._type_name()
+        if negate:
+            return lambda r: r.get("type") != name
+        return lambda r: r.get("type") == name
+
+    def _direction(self) -> tuple[float, float, float]:
+        token = self._next("a direction")
+        if token[0] == "word":
+            axis = token[1].lstrip("+-")
+            if axis in _AXES:
+                return _AXES[axis]
+            raise ValueError(f"Unknown direction {token[1]!r}. Use X, Y, Z or [x, y, z]")
+        if token[0] in ("[", "("):
+            values = [self._expect("num", "a direction component")]
+            for _ in range(2):
+                self._expect(",", "','")
+                values.append(self._expect("num", "a direction component"))
+            self._expect("]" if token[0] == "[" else ")", "closing bracket")
+            if not any(values):
+                raise ValueError("Direction must not be zero")
+            return values[0], values[1], values[2]
+        raise ValueError(f"Expected a direction, got {token[1]!r}")
+
+    def _face_reference(self) -> int:
+        if self._is_word("face"):
+            self.pos += 1
+        value = self._expect("num", "a face index")
+        if value != int(value) or value < 0:
+            raise ValueError(f"Face index must be a non-negative integer, got {value}")
+        return int(value)
+
+    def _number(self, dimension: str) -> float:
+        value = self._expect("num", "a number")
+        token = self._peek()
+        units = _UNITS[dimension]
+        if token is None or not (token[0] == "unit" or (token[0] == "word" and token[1] in units)):
+            return float(value)
+        unit = token[1]
+        self.pos += 1
+        if unit not in units:
+            valid = ", ".join(units) or "none"
+            raise ValueError(f"Unit {unit!r} does not fit a {dimension}. Valid: {valid}")
+        return float(value) * units[unit]
+
+    def _comparison(self, attribute: str) -> Predicate:
+        dimension = _ATTRIBUTES[self.kind][attribute]
+        self._skip_fillers()
+
+        def value_of(r: Record) -> Any:
+            if attribute == "diameter":
+                radius = r.get("radius")
+                return 2.0 * radius if radius is not None else None
+            return r.get(attribute)
+
+        if self._is_word("between"):
+            self.pos += 1
+            low = self._number(dimension)
+            if not self._is_word("and"):
+                raise ValueError("Expected 'and' in 'between <low> and <high>'")
+            self.pos += 1
+            high = self._number(dimension)
+            low, high = min(low, high), max(low, high)
+
+            def between(r: Record) -> bool:
+                v = value_of(r)
+                return v is not None and low <= v <= high
+
+            return between
+
+        op = self._expect("op", f"a comparison after {attribute!r}")
+        target = self._number(dimension)
+        # Equality allows for the float noise of values read back from COM
+        tolerance = 1e-9 * max(1.0, abs(target))
+        compare: dict[str, Callable[[float], bool]] = {
+            "<": lambda v: v < target,
+            "<=": lambda v: v <= target + tolerance,
+            ">": lambda v: v > target,
+            ">=": lambda v: v >= target - tolerance,
+            "=": lambda v: abs(v - target) <= tolerance,
+            "!=": lambda v: abs(v - target) > tolerance,
+        }
+        test = compare[op]
+
+        def predicate(r: Record) -> bool:
+            v = value_of(r)
+            return v is not None and test(v)
+
+        return predicate
+
+    @staticmethod
+    def _angle(record: Record, axis: tuple[float, float, float]) -> float:
+        direction = _direction_of(record)
+        if not direction:
+            return math.nan
+        return _angle_between_axes(direction, axis)
+
+
+def parse_selector(text: str) -> Selector:
+    """Parse a selector; raises ValueError describing the first problem."""
+    if not text or not text.strip():
+        raise ValueError("Empty selector")
+    return _Parser(text).parse()
@@ -0,0 +1,205 @@
+"""Surface property sampling: positions, normals and curvatures over a parameter grid."""
+
+import contextlib
+import time
+import traceback
+from typing import Any
+
+from ..constants import FaceQueryConstants
+from ..logging import get_logger
+
+_logger = get_logger(__name__)
+
+SAMPLE_PROPERTIES = ("position", "normal", "curvature")
+
+DEFAULT_SAMPLE_GRID = (5, 5)
+
+# Largest number of samples (faces x points) accepted in one call
+_MAX_SAMPLES = 200_000
+
+
+def _grid_params(nu: int, nv: int) -> list[float]:
+    """Normalized (u, v) cell centers of an nu x nv grid, u varying fastest."""
+    return [
+        value for j in range(nv) for i in range(nu) for value in ((i + 0.5) / nu, (j + 0.5) / nv)
+    ]
+
+
+def _out_array(result: Any, buffer: Any) -> list[float]:
+    """Read an out-array: from the returned tuple when pywin32 gives one, else the buffer."""
+    if isinstance(result, tuple) and len(result) >= 2:
+        return list(result[-1])
+    return list(buffer.value if hasattr(buffer, "value") else buffer)
+
+
+class SurfaceSamplingMixin:
+    """Mixin providing gridded face evaluation with one COM call per property."""
+
+    doc_manager: Any
+
+    @staticmethod
+    def _face_param_range(face: Any) -> tuple[float, float, float, float] | None:
+        """(u_min, v_min, u_max, v_max) from Face.GetParamRange, or None if unavailable."""
+        import pythoncom
+        from win32com.client import VARIANT
+
+        lo = VARIANT(pythoncom.VT_ARRAY | pythoncom.VT_R8, [0.0, 0.0])
+        hi = VARIANT(pythoncom.VT_ARRAY | pythoncom.VT_R8, [0.0, 0.0])
+        try:
+            result = face.GetParamRange(lo, hi)
+            if isinstance(result, tuple) and len(result) >= 2:
+                low, high = list(result[-2]), list(result[-1])
+            else:
+                low, high = list(lo.value), list(hi.value)
+            return low[0], low[1], high[0], high[1]
+        except Exception:
+            return None
+
+    def _sample_face(
+        self, face: Any, normalized: list[float], properties: set[str]
+    ) -> dict[str, Any]:
+        """Evaluate the requested properties at every normalized (u, v) of one face."""
+        import pythoncom
+        from win32com.client import VARIANT
+
+        count = len(normalized) // 2
+        bounds = self._face_param_range(face)
+        if bounds is None:
+            params = list(normalized)
+        else:
+            u0, v0, u1, v1 = bounds
+            params = [
+                value
+                for k in range(count)
+                for value in (
+                    u0 + (u1 - u0) * normalized[2 * k],
+                    v0 + (v1 - v0) * normalized[2 * k + 1],
+                )
+            ]
+
+        def doubles(size: int) -> Any:
+            return VARIANT(pythoncom.VT_ARRAY | pythoncom.VT_R8, [0.0] * size)
+
+        params_arr = VARIANT(pythoncom.VT_ARRAY | pythoncom.VT_R8, params)
+        entry: dict[str, Any] = {"count": count, "params": params}
+        if bounds is not None:
+            entry["param_range"] = list(bounds)
+        errors: dict[str, str] = {}
+
+        if "position" in properties:
+            try:
+                points = doubles(3 * count)
+                entry["positions"] = _out_array(
+                    face.GetPointAtParam(count, params_arr, points), points
+                )[: 3 * count]
+            except Exception as e:
+                errors["position"] = str(e)
+
+        if "normal" in properties:
+            try:
+                normals = doubles(3 * count)
+                entry["normals"] = _out_array(face.GetNormal(count, params_arr, normals), normals)[
+                    : 3 * count
+                ]
+            except Exception as e:
+                errors["normal"] = str(e)
+
+        if "curvature" in properties:
+            try:
+                tangents, max_c, min_c = doubles(3 * count), doubles(count), doubles(count)
+                result = face.GetCurvatures(count, params_arr, tangents, max_c, min_c)
+                if isinstance(result, tuple) and len(result) >= 3:
+                    outs = [list(result[i]) for i in range(3)]
+                else:
+                    outs = [list(b.value) for b in (tangents, max_c, min_c)]
+                entry["max_tangents"] = outs[0][: 3 * count]
+                entry["max_curvatures"] = outs[1][:count]
+                entry["min_curvatures"] = outs[2][:count]
+            except Exception as e:
+                errors["curvature"] = str(e)
+
+        if errors:
+            entry["errors"] = errors
+        return entry
+
+    def sample_face_properties(
+        self,
+        face_indices: list[int] | None = None,
+        grid: list[int] | None = None,
+        params: list[float] | None = None,
+        properties: list[str] | None = None,
+    ) -> dict[str, Any]:
+        """
+        Sample positions, normals and principal curvatures over many face points.
+
+        Each face is evaluated with one GetPointAtParam, one GetNormal and
+        one GetCurvatures call carrying every sample point, instead of one
+        call per point. Parameters are normalized to 0..1 and mapped onto
+        each face's parameter range (Face.GetParamRange); if a face does not
+        report its range they are passed through unchanged. Points of the
+        grid may fall outside a trimmed face; they are evaluated on the
+        underlying surface.
+
+        Args:
+            face_indices: 0-based faces to sample (default: every face)
+            grid: [nu, nv] grid of cell-center samples (default: [5, 5])
+            params: Flat normalized [u, v, u, v, ...] list used instead of the grid
+            properties: Any of 'position', 'normal', 'curvature' (default: all)
+
+        Returns:
+            Dict with one entry per face holding flat arrays: params (face
+            parameters), positions and normals (3 per sample), max_curvatures
+            and min_curvatures (1/m), max_tangents (3 per sample)
+        """
+        wanted = set(properties or SAMPLE_PROPERTIES)
+        invalid = sorted(wanted - set(SAMPLE_PROPERTIES))
+        if invalid:
+            return {
+                "error": f"Invalid properties: {', '.join(invalid)}. "
+                f"Valid: {', '.join(SAMPLE_PROPERTIES)}"
+            }
+        if params is not None:
+            if not params or len(params) % 2:
+                return {"error": "params must be a flat list of (u, v) pairs"}
+            normalized = [float(p) for p in params]
+        else:
+            nu, nv = grid or DEFAULT_SAMPLE_GRID
+            if nu < 1 or nv < 1:
+                return {"error": "grid sizes must be at least 1"}
+            normalized = _grid_params(nu, nv)
+
+        try:
+            _doc, _model, body = self._get_body()
+            faces = body.Faces(FaceQueryConstants.igQueryAll)
+            indices = list(range(faces.Count)) if face_indices is None else list(face_indices)
+            bad = [i for i in indices if i < 0 or i >= faces.Count]
+            if bad:
+                return {"error": f"Invalid face indices: {bad}. Body has {faces.Count} faces."}
+            total = len(indices) * (len(normalized) // 2)
+            if total > _MAX_SAMPLES:
+                return {"error": f"Too many samples: {total}. Maximum: {_MAX_SAMPLES}"}
+
+            start = time.perf_counter()
+            results = []
+            for index in indices:
+                entry: dict[str, Any] = {"face_index": index}
+                try:
+                    face = faces.Item(index + 1)
+                    with contextlib.suppress(Exception):
+                        entry["face_id"] = face.ID
+                    entry.update(self._sample_face(face, normalized, wanted))
+                except Exception as e:
+                    entry["error"] = str(e)
+                results.append(entry)
+
+            elapsed = time.perf_counter() - start
+            _logger.info(f"Sampled {total} points on {len(indices)} faces in {elapsed:.2f}s")
+            return {
+                "face_count": len(results),
+                "samples_per_face": len(normalized) // 2,
+                "properties": [p for p in SAMPLE_PROPERTIES if p in wanted],
+                "faces": results,
+                "seconds": round(elapsed, 4),
+            }
+        except Exception as e:
+            return {"error": str(e), "traceback": traceback.format_exc()}
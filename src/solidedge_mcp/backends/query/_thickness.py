@@ -0,0 +1,217 @@
+"""Wall-thickness analysis: inward rays from facet centroids through a cached BVH."""
+
+import math
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any
+
+from ..logging import get_logger
+from ._mesh import BVH, TriangleMesh
+
+_logger = get_logger(__name__)
+
+DEFAULT_THICKNESS_SAMPLES = 50_000
+
+# Hotspots listed by default (thinnest sample points)
+DEFAULT_HOTSPOTS = 20
+# Ray origins are pushed this far into the material (meters)
+_RAY_LIFT = 1e-7
+# Rays per task sent to a worker process
+_WORKER_CHUNK = 2_000
+
+# BVH of the body being analyzed, set once per worker process
+_worker_bvh: BVH | None = None
+
+
+def _init_worker(bvh: BVH) -> None:
+    global _worker_bvh
+    _worker_bvh = bvh
+
+
+def _trace_inward(bvh: BVH, rays: list[float]) -> list[float | None]:
+    """Nearest hit distance for each (origin, direction) ray in a flat list."""
+    distances: list[float | None] = []
+    for k in range(0, len(rays), 6):
+        hit = bvh.first_hit(rays[k : k + 3], rays[k + 3 : k + 6])
+        distances.append(hit[0] if hit else None)
+    return distances
+
+
+def _trace_in_worker(rays: list[float]) -> list[float | None]:
+    assert _worker_bvh is not None
+    return _trace_inward(_worker_bvh, rays)
+
+
+def _sample_facets(mesh: TriangleMesh, areas: Any, faces: set[int] | None, limit: int) -> list[int]:
+    """Facets to measure: all of them under the limit, else the largest per face.
+
+    Each face keeps a share of the budget proportional to its facet count,
+    and at least one facet, so small faces are never skipped.
+    """
+    by_face: dict[int, list[int]] = {}
+    for t in range(len(mesh)):
+        face_id = mesh.face_ids[t]
+        if areas[t] > 0.0 and (faces is None or face_id in faces):
+            by_face.setdefault(face_id, []).append(t)
+    total = sum(len(ts) for ts in by_face.values())
+    if total <= limit:
+        return [t for ts in by_face.values() for t in ts]
+    sampled = []
+    for ts in by_face.values():
+        keep = max(1, len(ts) * limit // total)
+        ts.sort(key=areas.__getitem__, reverse=True)
+        sampled.extend(ts[:keep])
+    return sampled
+
+
+class ThicknessMixin:
+    """Mixin providing wall-thickness measurement over the whole body."""
+
+    doc_manager: Any
+
+    def analyze_wall_thickness(
+        self,
+        min_thickness: float | None = None,
+        face_indices: list[int] | None = None,
+        max_samples: int = DEFAULT_THICKNESS_SAMPLES,
+        max_hotspots: int = DEFAULT_HOTSPOTS,
+        tolerance: float = 0.0,
+        workers: int = 0,
+    ) -> dict[str, Any]:
+        """
+        Measure wall thickness by casting rays inward from the body surface.
+
+        The body is tessellated once (GetFacetData) and a BVH is built in
+        Python; the BVH is cached and reused while the tessellation stays
+        the same. From the centroid of each sampled facet a ray is cast
+        against its outward normal, and the distance to the first surface
+        it meets is the local wall thickness. Faces with more facets than
+        the sample budget allows are measured on their largest facets.
+
+        Args:
+            min_thickness: Flag samples thinner than this (meters); hotspots
+                are then only those samples
+            face_indices: 0-based faces to measure (default: every face)
+            max_samples: Largest number of rays cast
+            max_hotspots: Thinnest sample points to list
+            tolerance: Tessellation tolerance (meters, <= 0 uses the cached mesh)
+            workers: Worker processes for ray tracing (0 or 1: in-process)
+
+        Returns:
+            Dict with per-face min/avg (area-weighted) thickness, the global
+            minimum and the thinnest sample points (hotspots)
+        """
+        if max_samples < 1:
+            return {"error": "max_samples must be at least 1"}
+        if min_thickness is not None and min_thickness <= 0:
+            return {"error": "min_thickness must be positive"}
+        if workers < 0:
+            return {"error": "workers must not be negative"}
+
+        try:
+            doc, _model, body = self._get_body()
+            start = time.perf_counter()
+            mesh = self._body_mesh(body, tolerance, doc)
+            if not len(mesh):
+                return {"error": "Body has no tessellation"}
+            face_index = self._face_index_by_id(body)
+            wanted: set[int] | None = None
+            if face_indices is not None:
+                by_index = {i: face_id for face_id, i in face_index.items()}
+                bad = [i for i in face_indices if i not in by_index]
+                if bad:
+                    return {"error": f"Invalid face indices: {bad}"}
+                wanted = {by_index[i] for i in face_indices}
+
+            normals, areas = mesh.facet_normals()
+            bvh, cached = self._cached_bvh(doc, mesh, tolerance)
+            build_seconds = time.perf_counter() - start
+
+            sampled = _sample_facets(mesh, areas, wanted, max_samples)
+            rays: list[float] = []
+            for t in sampled:
+                cx, cy, cz = mesh.centroid(t)
+                nx, ny, nz = normals[3 * t], normals[3 * t + 1], normals[3 * t + 2]
+                rays.extend(
+                    (cx - nx * _RAY_LIFT, cy - ny * _RAY_LIFT, cz - nz * _RAY_LIFT, -nx, -ny, -nz)
+                )
+
+            if workers > 1 and len(sampled) > _WORKER_CHUNK:
+                chunks = [
+                    rays[k : k + 6 * _WORKER_CHUNK] for k in range(0, len(rays), 6 * _WORKER_CHUNK)
+                ]
+                with ProcessPoolExecutor(
+                    workers, initializer=_init_worker, initargs=(bvh,)
+                ) as pool:
+                    distances = [d for part in pool.map(_trace_in_worker, chunks) for d in part]
+            else:
+                distances = _trace_inward(bvh, rays)
+
+            per_face: dict[int, dict[str, Any]] = {}
+            samples: list[tuple[float, int]] = []
+            misses = 0
+            for t, dist in zip(sampled, distances, strict=True):
+                if dist is None:
+                    misses += 1
+                    continue
+                thickness = dist + _RAY_LIFT
+                samples.append((thickness, t))
+                s = per_face.setdefault(
+                    mesh.face_ids[t], {"min": math.inf, "weighted": 0.0, "area": 0.0, "count": 0}
+                )
+                s["min"] = min(s["min"], thickness)
+                s["weighted"] += thickness * areas[t]
+                s["area"] += areas[t]
+                s["count"] += 1
+
+            faces = []
+            for face_id, s in per_face.items():
+                entry = {
+                    "face_index": face_index.get(face_id),
+                    "face_id": face_id,
+                    "min_thickness": s["min"],
+                    "avg_thickness": s["weighted"] / s["area"],
+                    "samples": s["count"],
+                }
+                if min_thickness is not None:
+                    entry["thin"] = s["min"] < min_thickness
+                faces.append(entry)
+            faces.sort(key=lambda f: (f["face_index"] is None, f["face_index"] or 0))
+
+            samples.sort()
+            if min_thickness is not None:
+                thin = [sample for sample in samples if sample[0] < min_thickness]
+            else:
+                thin = samples
+            hotspots = [
+                {
+                    "face_index": face_index.get(mesh.face_ids[t]),
+                    "thickness": thickness,
+                    "point": list(mesh.centroid(t)),
+                }
+                for thickness, t in thin[:max_hotspots]
+            ]
+
+            elapsed = time.perf_counter() - start
+            _logger.info(
+                f"Wall thickness: {len(sampled)} rays on {len(mesh)} facets in {elapsed:.2f}s "
+                f"(BVH {'cached' if cached else 'built'})"
+            )
+            result: dict[str, Any] = {
+                "facet_count": len(mesh),
+                "sample_count": len(sampled),
+                "missed_rays": misses,
+                "min_thickness": samples[0][0] if samples else None,
+                "faces": faces,
+                "hotspots": hotspots,
+                "bvh_cached": cached,
+                "build_seconds": round(build_seconds, 4),
+                "seconds": round(elapsed, 4),
+            }
+            if min_thickness is not None:
+                result["thin_sample_count"] = len(thin)
+                result["thin_face_count"] = sum(1 for f in faces if f["thin"])
+            return result
+        except Exception as e:
+            return {"error": str(e), "traceback": traceback.format_exc()}
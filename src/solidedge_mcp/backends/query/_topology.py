@@ -0,0 +1,259 @@
+"""Cached topology snapshot of the active body and selector-based face/edge lookup."""
+
+import time
+import traceback
+from typing import Any
+
+from ..constants import FaceQueryConstants
+from ..logging import get_logger
+from ._selectors import parse_selector
+
+_logger = get_logger(__name__)
+
+_FACE_TYPES = {
+    "Plane": "plane",
+    "Cylinder": "cylinder",
+    "Cone": "cone",
+    "Sphere": "sphere",
+    "Torus": "torus",
+    "BSplineSurface": "spline",
+}
+
+_EDGE_TYPES = {
+    "Line": "line",
+    "Circle": "circle",
+    "Ellipse": "ellipse",
+    "BSplineCurve": "spline",
+}
+
+# Geometry values copied from the geometry probes into snapshot records
+_FACE_FIELDS = ("radius", "minor_radius", "half_angle", "axis", "normal")
+_EDGE_FIELDS = ("radius", "axis", "center")
+
+
+def _read(obj: Any, attr: str) -> Any:
+    """Read one COM property, None if unavailable."""
+    try:
+        return getattr(obj, attr)
+    except Exception:
+        return None
+
+
+class TopologyMixin:
+    """Mixin providing a cached face/edge snapshot and selector queries over it."""
+
+    doc_manager: Any
+    _topology_snapshot: dict[str, Any] | None
+
+    @staticmethod
+    def _topology_fingerprint(faces: Any) -> list[tuple[Any, Any]]:
+        """(ID, area) of every face: changes with any edit that touches the body."""
+        fingerprint = []
+        for i in range(1, faces.Count + 1):
+            face = faces.Item(i)
+            fingerprint.append((_read(face, "ID"), _read(face, "Area")))
+        return fingerprint
+
+    def _edge_record(
+        self, edge: Any, index: int, face_index: int, edge_index: int
+    ) -> dict[str, Any]:
+        import pythoncom
+        from win32com.client import VARIANT
+
+        record: dict[str, Any] = {
+            "index": index,
+            "id": _read(edge, "ID"),
+            "face_index": face_index,
+            "edge_index": edge_index,
+            "faces": [face_index],
+            "length": _read(edge, "Length"),
+        }
+        geom = _read(edge, "Geometry")
+        data = self._edge_geometry_data(geom) if geom is not None else {}
+        record["type"] = _EDGE_TYPES.get(data.get("geometry_type", ""), "spline")
+        for field in _EDGE_FIELDS:
+            if field in data:
+                record[field] = data[field]
+
+        try:
+            start_arr = VARIANT(pythoncom.VT_ARRAY | pythoncom.VT_R8, [0.0, 0.0, 0.0])
+            end_arr = VARIANT(pythoncom.VT_ARRAY | pythoncom.VT_R8, [0.0, 0.0, 0.0])
+            result = edge.GetEndPoints(start_arr, end_arr)
+            if isinstance(result, tuple) and len(result) >= 2:
+                start, end = list(result[0])[:3], list(result[1])[:3]
+            else:
+                start, end = list(start_arr.value)[:3], list(end_arr.value)[:3]
+            record["start"], record["end"] = start, end
+            if record["type"] == "line":
+                record["direction"] = [e - s for s, e in zip(start, end, strict=True)]
+        except Exception:
+            pass
+        return record
+
+    def _capture_topology(self, doc: Any, body: Any) -> dict[str, Any]:
+        """Walk every face and its edges once; shared edges are recorded once."""
+        start = time.perf_counter()
+        faces = body.Faces(FaceQueryConstants.igQueryAll)
+        face_records: list[dict[str, Any]] = []
+        edge_records: list[dict[str, Any]] = []
+        edge_by_key: dict[Any, int] = {}
+
+        for fi in range(1, faces.Count + 1):
+            face = faces.Item(fi)
+            record: dict[str, Any] = {
+                "index": fi - 1,
+                "id": _read(face, "ID"),
+                "area": _read(face, "Area"),
+            }
+            geom = _read(face, "Geometry")
+            data = self._face_geometry_data(geom) if geom is not None else {}
+            record["type"] = _FACE_TYPES.get(data.get("geometry_type", ""), "unknown")
+            if "major_radius" in data:
+                data["radius"] = data["major_radius"]
+            for field in _FACE_FIELDS:
+                if field in data:
+                    record[field] = data[field]
+
+            edge_indices: list[int] = []
+            edges = _read(face, "Edges")
+            count = _read(edges, "Count") or 0
+            for ei in range(1, count + 1):
+                edge = edges.Item(ei)
+                edge_id = _read(edge, "ID")
+                key = edge_id if edge_id is not None else (fi - 1, ei - 1)
+                if key in edge_by_key:
+                    shared = edge_records[edge_by_key[key]]
+                    if fi - 1 not in shared["faces"]:
+                        shared["faces"].append(fi - 1)
+                else:
+                    edge_by_key[key] = len(edge_records)
+                    edge_records.append(self._edge_record(edge, len(edge_records), fi - 1, ei - 1))
+                edge_indices.append(edge_by_key[key])
+            record["edges"] = edge_indices
+            record["edge_count"] = len(edge_indices)
+            face_records.append(record)
+
+        for edge_record in edge_records:
+            edge_record["face_count"] = len(edge_record["faces"])
+        for record in face_records:
+            neighbours = {f for e in record["edges"] for f in edge_records[e]["faces"]}
+            neighbours.discard(record["index"])
+            record["adjacent"] = sorted(neighbours)
+
+        elapsed = time.perf_counter() - start
+        _logger.info(
+            f"Captured topology: {len(face_records)} faces, {len(edge_records)} edges "
+            f"in {elapsed:.2f}s"
+        )
+        return {
+            "document": _read(doc, "FullName") or _read(doc, "Name"),
+            "fingerprint": [(r["id"], r["area"]) for r in face_records],
+            "captured_at": time.time(),
+            "capture_seconds": round(elapsed, 4),
+            "faces": face_records,
+            "edges": edge_records,
+        }
+
+    def _get_topology_snapshot(self, refresh: bool = False) -> tuple[dict[str, Any], bool]:
+        """Return (snapshot, cached). Re-captures when refreshed or the body changed."""
+        doc, _model, body = self._get_body()
+        snapshot = self._topology_snapshot
+        if not refresh and snapshot is not None:
+            doc_key = _read(doc, "FullName") or _read(doc, "Name")
+            if snapshot["document"] == doc_key:
+                faces = body.Faces(FaceQueryConstants.igQueryAll)
+                if snapshot["fingerprint"] == self._topology_fingerprint(faces):
+                    return snapshot, True
+        snapshot = self._capture_topology(doc, body)
+        self._topology_snapshot = snapshot
+        return snapshot, False
+
+    def select_topology(
+        self,
+        selector: str,
+        refresh: bool = False,
+        include_details: bool = False,
+        add_to_select_set: bool = False,
+    ) -> dict[str, Any]:
+        """
+        Find faces or edges matching a selector in one call.
+
+        The body's faces and edges are captured once into a snapshot (type,
+        area, length, radius, axis/normal, endpoints, adjacency) and reused
+        until the faces' IDs or areas change. Selectors read like
+        "edges where type=line and parallel to Z and length>10mm" or
+        "faces of type cylinder with radius<3mm"; see _selectors.py for
+        the grammar.
+
+        Args:
+            selector: Selector text starting with 'faces' or 'edges'
+            refresh: Re-capture the snapshot even if it looks current
+            include_details: Also return the snapshot record of each match
+            add_to_select_set: Add the matches to the document selection
+
+        Returns:
+            Dict with 0-based 'indices' (face indices, or snapshot edge
+            indices); for edges also 'edges' as [face_index, edge_index]
+            pairs usable with the per-edge query tools
+        """
+        try:
+            parsed = parse_selector(selector)
+        except ValueError as e:
+            return {"error": f"Invalid selector: {e}"}
+
+        try:
+            snapshot, cached = self._get_topology_snapshot(refresh)
+            records = snapshot[parsed.kind]
+            indices = parsed.matching(records)
+            result: dict[str, Any] = {
+                "selector": selector,
+                "entity": parsed.kind,
+                "indices": indices,
+                "count": len(indices),
+            }
+            if parsed.kind == "edges":
+                result["edges"] = [
+                    [records[i]["face_index"], records[i]["edge_index"]] for i in indices
+                ]
+            if include_details:
+                result["details"] = [dict(records[i]) for i in indices]
+            if add_to_select_set:
+                result.update(self._select_snapshot_items(parsed.kind, records, indices))
+            result["snapshot"] = {
+                "faces": len(snapshot["faces"]),
+                "edges": len(snapshot["edges"]),
+                "cached": cached,
+                "capture_seconds": snapshot["capture_seconds"],
+            }
+            return result
+        except Exception as e:
+            return {"error": str(e), "traceback": traceback.format_exc()}
+
+    def _select_snapshot_items(
+        self, kind: str, records: list[dict[str, Any]], indices: list[int]
+    ) -> dict[str, Any]:
+        """Add matched faces/edges to the selection set in one pass."""
+        doc, _model, body = self._get_body()
+        faces = body.Faces(FaceQueryConstants.igQueryAll)
+        select_set = doc.SelectSet
+        added = 0
+        errors = []
+        with self.doc_manager.connection.performance_scope():
+            for i in indices:
+                try:
+                    if kind == "faces":
+                        obj = faces.Item(i + 1)
+                    else:
+                        face = faces.Item(records[i]["face_index"] + 1)
+                        obj = face.Edges.Item(records[i]["edge_index"] + 1)
+                    select_set.Add(obj)
+                    added += 1
+                except Exception as e:
+                    errors.append({"index": i, "error": str(e)})
+        selection: dict[str, Any] = {
+            "selected": added,
+            "selection_count": _read(select_set, "Count"),
+        }
+        if errors:
+            selection["select_errors"] = errors
+        return selection
@@ -261,10 +261,11 @@ class SketchManager:
                 points.append((x, y))
 
             # Draw lines connecting vertices
-            for i in range(sides):
-                x1, y1 = points[i]
-                x2, y2 = points[(i + 1) % sides]
-                lines.AddBy2Points(x1, y1, x2, y2)
+            with self.doc_manager.connection.performance_scope():
+                for i in range(sides):
+                    x1, y1 = points[i]
+                    x2, y2 = points[(i + 1) % sides]
+                    lines.AddBy2Points(x1, y1, x2, y2)
 
             return {
                 "status": "created",
@@ -499,13 +500,14 @@ class SketchManager:
                 return {"error": "No B-spline curves to mirror"}
 
             mirror_count = 0
-            for i in range(1, splines.Count + 1):
-                try:
-                    spline = splines.Item(i)
-                    spline.Mirror(axis_x1, axis_y1, axis_x2, axis_y2, copy)
-                    mirror_count += 1
-                except Exception:
-                    pass
+            with self.doc_manager.connection.performance_scope():
+                for i in range(1, splines.Count + 1):
+                    try:
+                        spline = splines.Item(i)
+                        spline.Mirror(axis_x1, axis_y1, axis_x2, axis_y2, copy)
+                        mirror_count += 1
+                    except Exception:
+                        pass
 
             return {
                 "status": "created",
@@ -911,14 +913,15 @@ class SketchManager:
 
             fillet_count = 0
             # Try to fillet between consecutive line pairs
-            for i in range(1, lines.Count):
-                try:
-                    line1 = lines.Item(i)
-                    line2 = lines.Item(i + 1)
-                    profile.Arcs2d.AddByFillet(line1, line2, radius)
-                    fillet_count += 1
-                except Exception:
-                    pass
+            with self.doc_manager.connection.performance_scope():
+                for i in range(1, lines.Count):
+                    try:
+                        line1 = lines.Item(i)
+                        line2 = lines.Item(i + 1)
+                        profile.Arcs2d.AddByFillet(line1, line2, radius)
+                        fillet_count += 1
+                    except Exception:
+                        pass
 
             return {
                 "status": "created",
@@ -952,14 +955,15 @@ class SketchManager:
                 return {"error": "Need at least 2 lines to create a chamfer"}
 
             chamfer_count = 0
-            for i in range(1, lines.Count):
-                try:
-                    line1 = lines.Item(i)
-                    line2 = lines.Item(i + 1)
-                    profile.Lines2d.AddByChamfer(line1, line2, distance, distance)
-                    chamfer_count += 1
-                except Exception:
-                    pass
+            with self.doc_manager.connection.performance_scope():
+                for i in range(1, lines.Count):
+                    try:
+                        line1 = lines.Item(i)
+                        line2 = lines.Item(i + 1)
+                        profile.Lines2d.AddByChamfer(line1, line2, distance, distance)
+                        chamfer_count += 1
+                    except Exception:
+                        pass
 
             return {
                 "status": "created",
@@ -1001,25 +1005,26 @@ class SketchManager:
                 return {"error": "No sketch geometry to offset"}
 
             offset_count = 0
-            for i in range(1, lines.Count + 1):
-                try:
-                    line = lines.Item(i)
-                    x1 = line.StartPoint.X
-                    y1 = line.StartPoint.Y
-                    x2 = line.EndPoint.X
-                    y2 = line.EndPoint.Y
-
-                    # Calculate normal offset
-                    dx = x2 - x1
-                    dy = y2 - y1
-                    length = math.sqrt(dx * dx + dy * dy)
-                    if length > 0:
-                        nx = -dy / length * distance
-                        ny = dx / length * distance
-                        profile.Lines2d.AddBy2Points(x1 + nx, y1 + ny, x2 + nx, y2 + ny)
-                        offset_count += 1
-                except Exception:
-                    pass
+            with self.doc_manager.connection.performance_scope():
+                for i in range(1, lines.Count + 1):
+                    try:
+                        line = lines.Item(i)
+                        x1 = line.StartPoint.X
+                        y1 = line.StartPoint.Y
+                        x2 = line.EndPoint.X
+                        y2 = line.EndPoint.Y
+
+                        # Calculate normal offset
+                        dx = x2 - x1
+                        dy = y2 - y1
+                        length = math.sqrt(dx * dx + dy * dy)
+                        if length > 0:
+                            nx = -dy / length * distance
+                            ny = dx / length * distance
+                            profile.Lines2d.AddBy2Points(x1 + nx, y1 + ny, x2 + nx, y2 + ny)
+                            offset_count += 1
+                    except Exception:
+                        pass
 
             return {
                 "status": "created",
@@ -1050,40 +1055,41 @@ class SketchManager:
             profile = self.active_profile
             mirror_count = 0
 
-            # Mirror lines
-            lines = profile.Lines2d
-            for i in range(1, lines.Count + 1):
-                try:
-                    line = lines.Item(i)
-                    x1 = line.StartPoint.X
-                    y1 = line.StartPoint.Y
-                    x2 = line.EndPoint.X
-                    y2 = line.EndPoint.Y
-
-                    if axis.upper() == "X":
-                        profile.Lines2d.AddBy2Points(x1, -y1, x2, -y2)
-                    else:
-                        profile.Lines2d.AddBy2Points(-x1, y1, -x2, y2)
-                    mirror_count += 1
-                except Exception:
-                    pass
+            with self.doc_manager.connection.performance_scope():
+                # Mirror lines
+                lines = profile.Lines2d
+                for i in range(1, lines.Count + 1):
+                    try:
+                        line = lines.Item(i)
+                        x1 = line.StartPoint.X
+                        y1 = line.StartPoint.Y
+                        x2 = line.EndPoint.X
+                        y2 = line.EndPoint.Y
+
+                        if axis.upper() == "X":
+                            profile.Lines2d.AddBy2Points(x1, -y1, x2, -y2)
+                        else:
+                            profile.Lines2d.AddBy2Points(-x1, y1, -x2, y2)
+                        mirror_count += 1
+                    except Exception:
+                        pass
 
-            # Mirror circles
-            circles = profile.Circles2d
-            for i in range(1, circles.Count + 1):
-                try:
-                    circle = circles.Item(i)
-                    cx = circle.CenterPoint.X
-                    cy = circle.CenterPoint.Y
-                    r = circle.Radius
-
-                    if axis.upper() == "X":
-                        profile.Circles2d.AddByCenterRadius(cx, -cy, r)
-                    else:
-                        profile.Circles2d.AddByCenterRadius(-cx, cy, r)
-                    mirror_count += 1
-                except Exception:
-                    pass
+                # Mirror circles
+                circles = profile.Circles2d
+                for i in range(1, circles.Count + 1):
+                    try:
+                        circle = circles.Item(i)
+                        cx = circle.CenterPoint.X
+                        cy = circle.CenterPoint.Y
+                        r = circle.Radius
+
+                        if axis.upper() == "X":
+                            profile.Circles2d.AddByCenterRadius(cx, -cy, r)
+                        else:
+                            profile.Circles2d.AddByCenterRadius(-cx, cy, r)
+                        mirror_count += 1
+                    except Exception:
+                        pass
 
             return {
                 "status": "created",
@@ -1329,49 +1335,50 @@ class SketchManager:
             profile = self.active_profile
             rotated = 0
 
-            # Rotate lines
-            lines = profile.Lines2d
-            original_count = lines.Count
-            new_lines = []
-            for i in range(1, original_count + 1):
-                try:
-                    line = lines.Item(i)
-                    x1, y1 = line.StartPoint.X, line.StartPoint.Y
-                    x2, y2 = line.EndPoint.X, line.EndPoint.Y
-                    rx1, ry1 = rotate_point(x1, y1)
-                    rx2, ry2 = rotate_point(x2, y2)
-                    new_lines.append((rx1, ry1, rx2, ry2))
-                except Exception:
-                    pass
-
-            # Remove old lines and add rotated ones
-            for i in range(original_count, 0, -1):
-                with contextlib.suppress(Exception):
-                    lines.Item(i).Delete()
-            for coords in new_lines:
-                lines.AddBy2Points(*coords)
-                rotated += 1
-
-            # Rotate circles
-            circles = profile.Circles2d
-            original_count = circles.Count
-            new_circles = []
-            for i in range(1, original_count + 1):
-                try:
-                    circle = circles.Item(i)
-                    ccx, ccy = circle.CenterPoint.X, circle.CenterPoint.Y
-                    r = circle.Radius
-                    rx, ry = rotate_point(ccx, ccy)
-                    new_circles.append((rx, ry, r))
-                except Exception:
-                    pass
+            with self.doc_manager.connection.performance_scope():
+                # Rotate lines
+                lines = profile.Lines2d
+                original_count = lines.Count
+                new_lines = []
+                for i in range(1, original_count + 1):
+                    try:
+                        line = lines.Item(i)
+                        x1, y1 = line.StartPoint.X, line.StartPoint.Y
+                        x2, y2 = line.EndPoint.X, line.EndPoint.Y
+                        rx1, ry1 = rotate_point(x1, y1)
+                        rx2, ry2 = rotate_point(x2, y2)
+                        new_lines.append((rx1, ry1, rx2, ry2))
+                    except Exception:
+                        pass
 
-            for i in range(original_count, 0, -1):
-                with contextlib.suppress(Exception):
-                    circles.Item(i).Delete()
-            for c in new_circles:
-                circles.AddByCenterRadius(*c)
-                rotated += 1
+                # Remove old lines and add rotated ones
+                for i in range(original_count, 0, -1):
+                    with contextlib.suppress(Exception):
+                        lines.Item(i).Delete()
+                for coords in new_lines:
+                    lines.AddBy2Points(*coords)
+                    rotated += 1
+
+                # Rotate circles
+                circles = profile.Circles2d
+                original_count = circles.Count
+                new_circles = []
+                for i in range(1, original_count + 1):
+                    try:
+                        circle = circles.Item(i)
+                        ccx, ccy = circle.CenterPoint.X, circle.CenterPoint.Y
+                        r = circle.Radius
+                        rx, ry = rotate_point(ccx, ccy)
+                        new_circles.append((rx, ry, r))
+                    except Exception:
+                        pass
+
+                for i in range(original_count, 0, -1):
+                    with contextlib.suppress(Exception):
+                        circles.Item(i).Delete()
+                for c in new_circles:
+                    circles.AddByCenterRadius(*c)
+                    rotated += 1
 
             return {
                 "status": "rotated",
@@ -1411,48 +1418,49 @@ class SketchManager:
             profile = self.active_profile
             scaled = 0
 
-            # Scale lines
-            lines = profile.Lines2d
-            original_count = lines.Count
-            new_lines = []
-            for i in range(1, original_count + 1):
-                try:
-                    line = lines.Item(i)
-                    x1, y1 = line.StartPoint.X, line.StartPoint.Y
-                    x2, y2 = line.EndPoint.X, line.EndPoint.Y
-                    sx1, sy1 = scale_point(x1, y1)
-                    sx2, sy2 = scale_point(x2, y2)
-                    new_lines.append((sx1, sy1, sx2, sy2))
-                except Exception:
-                    pass
-
-            for i in range(original_count, 0, -1):
-                with contextlib.suppress(Exception):
-                    lines.Item(i).Delete()
-            for coords in new_lines:
-                lines.AddBy2Points(*coords)
-                scaled += 1
-
-            # Scale circles
-            circles = profile.Circles2d
-            original_count = circles.Count
-            new_circles = []
-            for i in range(1, original_count + 1):
-                try:
-                    circle = circles.Item(i)
-                    ccx, ccy = circle.CenterPoint.X, circle.CenterPoint.Y
-                    r = circle.Radius
-                    sx, sy = scale_point(ccx, ccy)
-                    new_circles.append((sx, sy, r * scale_factor))
-                except Exception:
-                    pass
-
-            for i in range(original_count, 0, -1):
-                with contextlib.suppress(Exception):
-                    circles.Item(i).Delete()
-            for c in new_circles:
-                circles.AddByCenterRadius(*c)
-                scaled += 1
+            with self.doc_manager.connection.performance_scope():
+                # Scale lines
+                lines = profile.Lines2d
+                original_count = lines.Count
+                new_lines = []
+                for i in range(1, original_count + 1):
+                    try:
+                        line = lines.Item(i)
+                        x1, y1 = line.StartPoint.X, line.StartPoint.Y
+                        x2, y2 = line.EndPoint.X, line.EndPoint.Y
+                        sx1, sy1 = scale_point(x1, y1)
+                        sx2, sy2 = scale_point(x2, y2)
+                        new_lines.append((sx1, sy1, sx2, sy2))
+                    except Exception:
+                        pass
+
+                for i in range(original_count, 0, -1):
+                    with contextlib.suppress(Exception):
+                        lines.Item(i).Delete()
+                for coords in new_lines:
+                    lines.AddBy2Points(*coords)
+                    scaled += 1
+
+                # Scale circles
+                circles = profile.Circles2d
+                original_count = circles.Count
+                new_circles = []
+                for i in range(1, original_count + 1):
+                    try:
+                        circle = circles.Item(i)
+                        ccx, ccy = circle.CenterPoint.X, circle.CenterPoint.Y
+                        r = circle.Radius
+                        sx, sy = scale_point(ccx, ccy)
+                        new_circles.append((sx, sy, r * scale_factor))
+                    except Exception:
+                        pass
+
+                for i in range(original_count, 0, -1):
+                    with contextlib.suppress(Exception):
+                        circles.Item(i).Delete()
+                for c in new_circles:
+                    circles.AddByCenterRadius(*c)
+                    scaled += 1
 
             return {
                 "status": "scaled",
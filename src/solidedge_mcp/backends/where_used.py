@@ -0,0 +1,453 @@
+"""
+Solid Edge Where-Used Index
+
+Scans a directory tree of Solid Edge files, records which documents each
+file links to, and stores the result in a local SQLite database so
+where-used / uses queries can be answered without opening any assembly.
+
+References are read through Revision Manager (RevisionManager.Application),
+which reads link tables straight from the files without loading geometry.
+Files are re-read only when their mtime or size changes.
+"""
+
+import contextlib
+import os
+import sqlite3
+import threading
+import time
+import traceback
+from collections.abc import Callable, Iterator
+from typing import Any
+
+from .logging import get_logger
+
+_logger = get_logger(__name__)
+
+INDEXED_EXTENSIONS = (".asm", ".par", ".psm", ".dft", ".pwd")
+
+# Files between commits during a scan; keeps the write lock short so
+# queries stay responsive while a background scan runs.
+_COMMIT_EVERY = 200
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS files (
+    path TEXT PRIMARY KEY,
+    name TEXT NOT NULL,
+    root TEXT NOT NULL,
+    mtime REAL NOT NULL,
+    size INTEGER NOT NULL,
+    scanned_at REAL NOT NULL,
+    error TEXT
+);
+CREATE TABLE IF NOT EXISTS refs (
+    parent TEXT NOT NULL,
+    child TEXT NOT NULL,
+    child_name TEXT NOT NULL,
+    PRIMARY KEY (parent, child)
+);
+CREATE INDEX IF NOT EXISTS refs_child ON refs (child);
+CREATE INDEX IF NOT EXISTS refs_child_name ON refs (child_name);
+CREATE INDEX IF NOT EXISTS files_root ON files (root);
+"""
+
+ReferenceReader = Callable[[str], list[str]]
+
+
+def _norm(path: str) -> str:
+    """Normalize a path for use as an index key."""
+    return os.path.normcase(os.path.normpath(os.path.abspath(path)))
+
+
+def _file_name(path: str) -> str:
+    """Case-insensitive file name key, tolerant of foreign path separators."""
+    return path.replace("\\", "/").rsplit("/", 1)[-1].lower()
+
+
+def _subtree_bounds(root: str) -> tuple[str, str]:
+    """Key range (exclusive) holding every path below root.
+
+    Paths sort between "root/" and "root0" (the character after the
+    separator), so the lookup uses the primary key index whichever root
+    the files were first indexed under.
+    """
+    prefix = os.path.join(root, "")
+    return prefix, prefix[:-1] + chr(ord(prefix[-1]) + 1)
+
+
+def _default_db_path() -> str:
+    base = os.environ.get("LOCALAPPDATA") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(base, "solidedge_mcp", "where_used.sqlite")
+
+
+class RevisionManagerReader:
+    """Reads document links via Revision Manager without opening Solid Edge documents."""
+
+    def __init__(self) -> None:
+        self._app: Any | None = None
+
+    def __call__(self, path: str) -> list[str]:
+        if self._app is None:
+            import win32com.client
+
+            self._app = win32com.client.Dispatch("RevisionManager.Application")
+        doc = self._app.Open(path)
+        try:
+            links = doc.LinkedDocuments
+            children = []
+            for i in range(1, links.Count + 1):
+                with contextlib.suppress(Exception):
+                    children.append(links.Item(i).FullName)
+            return children
+        finally:
+            with contextlib.suppress(Exception):
+                doc.Close()
+
+
+class WhereUsedIndex:
+    """SQLite-backed where-used index over a local CAD library"""
+
+    def __init__(
+        self,
+        db_path: str | None = None,
+        reference_reader: ReferenceReader | None = None,
+    ) -> None:
+        self.db_path = db_path or _default_db_path()
+        self._reader = reference_reader
+        self._scan_lock = threading.Lock()
+        self._scan_thread: threading.Thread | None = None
+        self._progress: dict[str, Any] = {"state": "idle"}
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open a connection; each call/thread gets its own."""
+        db_dir = os.path.dirname(self.db_path)
+        if db_dir:
+            os.makedirs(db_dir, exist_ok=True)
+        conn = sqlite3.connect(self.db_path, timeout=30)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.executescript(_SCHEMA)
+        return conn
+
+    def _walk(self, root: str, extensions: tuple[str, ...]) -> Iterator[os.DirEntry[str]]:
+        stack = [root]
+        while stack:
+            current = stack.pop()
+            try:
+                entries = list(os.scandir(current))
+            except OSError as e:
+                _logger.warning(f"Cannot read directory {current}: {e}")
+                continue
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.name.lower().endswith(extensions):
+                    yield entry
+
+    def _run_scan(self, root: str, extensions: tuple[str, ...]) -> dict[str, Any]:
+        """Incrementally rescan root; only changed or new files are read."""
+        start = time.perf_counter()
+        reader = self._reader or RevisionManagerReader()
+        counts = {"seen": 0, "updated": 0, "unchanged": 0, "removed": 0, "errors": 0}
+        self._progress = {"state": "running", "root": root, **counts}
+
+        conn = self._connect()
+        try:
+            # By path, not by root, so overlapping roots share unchanged rows
+            known = {
+                path: (mtime, size)
+                for path, mtime, size in conn.execute(
+                    "SELECT path, mtime, size FROM files WHERE path > ? AND path < ?",
+                    _subtree_bounds(root),
+                )
+            }
+            seen: set[str] = set()
+            pending = 0
+
+            for entry in self._walk(root, extensions):
+                path = _norm(entry.path)
+                seen.add(path)
+                counts["seen"] += 1
+                try:
+                    stat = entry.stat()
+                except OSError:
+                    continue
+
+                if known.get(path) == (stat.st_mtime, stat.st_size):
+                    counts["unchanged"] += 1
+                else:
+                    error = None
+                    try:
+                        children = [_norm(c) for c in reader(entry.path) if c]
+                    except Exception as e:
+                        children = []
+                        error = str(e)
+                        counts["errors"] += 1
+
+                    conn.execute("DELETE FROM refs WHERE parent = ?", (path,))
+                    conn.executemany(
+                        "INSERT OR IGNORE INTO refs (parent, child, child_name) VALUES (?, ?, ?)",
+                        [(path, c, _file_name(c)) for c in children],
+                    )
+                    conn.execute(
+                        "INSERT OR REPLACE INTO files "
+                        "(path, name, root, mtime, size, scanned_at, error) "
+                        "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                        (
+                            path,
+                            os.path.normcase(entry.name),
+                            root,
+                            # A failed read is retried on the next scan
+                            stat.st_mtime if error is None else -1.0,
+                            stat.st_size,
+                            time.time(),
+                            error,
+                        ),
+                    )
+                    counts["updated"] += 1
+                    pending += 1
+                    if pending >= _COMMIT_EVERY:
+                        conn.commit()
+                        pending = 0
+
+                self._progress.update(counts)
+
+            # Only files of the extensions walked in this pass can be missing
+            removed = [p for p in known if p not in seen and p.lower().endswith(extensions)]
+            for path in removed:
+                conn.execute("DELETE FROM refs WHERE parent = ?", (path,))
+                conn.execute("DELETE FROM files WHERE path = ?", (path,))
+            counts["removed"] = len(removed)
+            conn.commit()
+        finally:
+            conn.close()
+
+        elapsed = time.perf_counter() - start
+        _logger.info(
+            f"Where-used scan of {root}: {counts['updated']} updated, "
+            f"{counts['unchanged']} unchanged in {elapsed:.2f}s"
+        )
+        return {"status": "scanned", "root": root, **counts, "seconds": round(elapsed, 3)}
+
+    def scan(
+        self,
+        root: str,
+        extensions: list[str] | None = None,
+        background: bool = False,
+    ) -> dict[str, Any]:
+        """
+        Index a directory tree of Solid Edge files.
+
+        Re-reading is incremental: files whose mtime and size match the
+        index are skipped, and files deleted from disk are dropped.
+
+        Args:
+            root: Directory to scan recursively
+            extensions: File extensions to index (default: .asm/.par/.psm/.dft/.pwd)
+            background: If True, scan in a worker thread and return immediately;
+                poll get_status() for progress
+
+        Returns:
+            Dict with scan counts, or 'started' status for background scans
+        """
+        if not os.path.isdir(root):
+            return {"error": f"Directory not found: {root}"}
+
+        exts = tuple(
+            (e if e.startswith(".") else f".{e}").lower()
+            for e in (extensions or INDEXED_EXTENSIONS)
+        )
+        norm_root = _norm(root)
+
+        if not self._scan_lock.acquire(blocking=False):
+            return {"error": "A scan is already running", "progress": dict(self._progress)}
+
+        if not background:
+            try:
+                result = self._run_scan(norm_root, exts)
+                self._progress = {"state": "idle", "last_scan": result}
+                return result
+            except Exception as e:
+                self._progress = {"state": "failed", "error": str(e)}
+                return {"error": str(e), "traceback": traceback.format_exc()}
+            finally:
+                self._scan_lock.release()
+
+        def worker() -> None:
+            com_initialized = False
+            try:
+                with contextlib.suppress(ImportError):
+                    import pythoncom
+
+                    pythoncom.CoInitialize()
+                    com_initialized = True
+                result = self._run_scan(norm_root, exts)
+                self._progress = {"state": "idle", "last_scan": result}
+            except Exception as e:
+                _logger.error(f"Background where-used scan failed: {e}")
+                self._progress = {"state": "failed", "error": str(e)}
+            finally:
+                if com_initialized:
+                    import pythoncom
+
+                    pythoncom.CoUninitialize()
+                self._scan_lock.release()
+
+        self._progress = {"state": "running", "root": norm_root}
+        self._scan_thread = threading.Thread(target=worker, name="where-used-scan", daemon=True)
+        self._scan_thread.start()
+        return {"status": "started", "root": norm_root}
+
+    def wait(self, timeout: float | None = None) -> bool:
+        """Block until a background scan finishes. Returns False on timeout."""
+        thread = self._scan_thread
+        if thread is None:
+            return True
+        thread.join(timeout)
+        return not thread.is_alive()
+
+    def _related(self, path: str, recursive: bool, direction: str) -> list[dict[str, Any]]:
+        if direction == "parents":
+            select, match = "parent", "child"
+        else:
+            select, match = "child", "parent"
+
+        conn = self._connect()
+        try:
+            if not recursive:
+                rows = conn.execute(
+                    f"""
+                    SELECT r.{select}, 1, f.path IS NOT NULL
+                    FROM refs r LEFT JOIN files f ON f.path = r.{select}
+                    WHERE r.{match} = ? ORDER BY r.{select}
+                    """,
+                    (path,),
+                ).fetchall()
+            else:
+                rows = conn.execute(
+                    f"""
+                    WITH RECURSIVE walk(p, depth) AS (
+                        SELECT {select}, 1 FROM refs WHERE {match} = :path
+                        UNION
+                        SELECT r.{select}, w.depth + 1
+                        FROM refs r JOIN walk w ON r.{match} = w.p
+                        WHERE w.depth < 64
+                    )
+                    SELECT w.p, MIN(w.depth), f.path IS NOT NULL
+                    FROM walk w LEFT JOIN files f ON f.path = w.p
+                    WHERE w.p != :path
+                    GROUP BY w.p ORDER BY MIN(w.depth), w.p
+                    """,
+                    {"path": path},
+                ).fetchall()
+        finally:
+            conn.close()
+        return [{"path": p, "depth": d, "indexed": bool(i)} for p, d, i in rows]
+
+    def where_used(self, file_path: str, recursive: bool = False) -> dict[str, Any]:
+        """
+        List indexed documents that reference a file.
+
+        Args:
+            file_path: File to look up
+            recursive: If True, include indirect parents (assemblies of assemblies)
+
+        Returns:
+            Dict with parent documents and their depth above the file
+        """
+        try:
+            path = _norm(file_path)
+            parents = self._related(path, recursive, "parents")
+            return {
+                "path": path,
+                "recursive": recursive,
+                "count": len(parents),
+                "used_by": parents,
+            }
+        except Exception as e:
+            return {"error": str(e), "traceback": traceback.format_exc()}
+
+    def uses(self, file_path: str, recursive: bool = False) -> dict[str, Any]:
+        """
+        List documents a file references, as recorded in the index.
+
+        Args:
+            file_path: Indexed parent document
+            recursive: If True, expand through sub-assemblies
+
+        Returns:
+            Dict with child documents and their depth below the file
+        """
+        try:
+            path = _norm(file_path)
+            children = self._related(path, recursive, "children")
+            return {
+                "path": path,
+                "recursive": recursive,
+                "count": len(children),
+                "uses": children,
+            }
+        except Exception as e:
+            return {"error": str(e), "traceback": traceback.format_exc()}
+
+    def find_by_name(self, file_name: str) -> dict[str, Any]:
+        """
+        Where-used lookup by file name only.
+
+        Useful when links were saved on another machine or drive mapping,
+        so the stored full path differs from the local one.
+
+        Args:
+            file_name: Base file name, e.g. 'bracket.par'
+
+        Returns:
+            Dict with referencing parents and the stored child paths
+        """
+        try:
+            conn = self._connect()
+            try:
+                rows = conn.execute(
+                    "SELECT parent, child FROM refs WHERE child_name = ? ORDER BY parent",
+                    (_file_name(file_name),),
+                ).fetchall()
+            finally:
+                conn.close()
+            return {
+                "name": file_name,
+                "count": len(rows),
+                "used_by": [{"path": p, "child_path": c} for p, c in rows],
+            }
+        except Exception as e:
+            return {"error": str(e), "traceback": traceback.format_exc()}
+
+    def get_status(self) -> dict[str, Any]:
+        """
+        Summarize the index and any running scan.
+
+        Returns:
+            Dict with database path, file/reference counts, and scan progress
+        """
+        try:
+            conn = self._connect()
+            try:
+                files, errors, last = conn.execute(
+                    "SELECT COUNT(*), COUNT(error), MAX(scanned_at) FROM files"
+                ).fetchone()
+                refs = conn.execute("SELECT COUNT(*) FROM refs").fetchone()[0]
+                roots = [
+                    {"root": r, "files": n}
+                    for r, n in conn.execute(
+                        "SELECT root, COUNT(*) FROM files GROUP BY root ORDER BY root"
+                    )
+                ]
+            finally:
+                conn.close()
+            return {
+                "db_path": self.db_path,
+                "files": files,
+                "references": refs,
+                "read_errors": errors,
+                "last_scanned_at": last,
+                "roots": roots,
+                "scan": dict(self._progress),
+            }
+        except Exception as e:
+            return {"error": str(e), "traceback": traceback.format_exc()}
@@ -6,8 +6,10 @@ from solidedge_mcp.backends.diagnostics import diagnose_document, diagnose_featu
 from solidedge_mcp.backends.documents import DocumentManager
 from solidedge_mcp.backends.export import ExportManager, ViewModel
 from solidedge_mcp.backends.features import FeatureManager
+from solidedge_mcp.backends.print_queue import PrintQueue
 from solidedge_mcp.backends.query import QueryManager
 from solidedge_mcp.backends.sketching import SketchManager
+from solidedge_mcp.backends.where_used import WhereUsedIndex
 
 # Initialize managers (global state)
 connection = SolidEdgeConnection()
@@ -19,6 +21,8 @@ assembly_manager = AssemblyManager(doc_manager, sketch_manager)
 query_manager = QueryManager(doc_manager)
 export_manager = ExportManager(doc_manager)
 view_manager = ViewModel(doc_manager)
+where_used_index = WhereUsedIndex()
+print_queue = PrintQueue()
 
 # Re-export diagnostics functions if needed by tools directly
 __all__ = [
@@ -30,6 +34,8 @@ __all__ = [
     "query_manager",
     "export_manager",
     "view_manager",
+    "where_used_index",
+    "print_queue",
     "diagnose_document",
     "diagnose_feature",
 ]
@@ -24,14 +24,25 @@ def add_assembly_component(
     template_name: str = "",
     matrix: list[float] | None = None,
     segment_indices: list[int] | None = None,
+    transforms: list[list[float]] | None = None,
+    pattern: dict[str, Any] | None = None,
 ) -> dict[str, Any]:
     """Add a component to the active assembly.
 
     method: 'basic' | 'with_transform' | 'family'
       | 'family_with_transform' | 'family_with_matrix'
-      | 'by_template' | 'adjustable' | 'tube'
+      | 'by_template' | 'adjustable' | 'tube' | 'batch'
 
     Positions in meters. Angles in degrees. Matrix is 16-element 4x4.
+
+    batch: places many instances of file_path in one pass. transforms is a
+    list of [x,y,z], [x,y,z,rx,ry,rz] or 16-element matrices. pattern is
+    {'type': 'linear', 'count', 'spacing', 'direction'}
+    | {'type': 'rectangular', 'count_1', 'count_2', 'spacing_1', 'spacing_2',
+       'direction_1', 'direction_2'}
+    | {'type': 'circular', 'count', 'center', 'axis', 'total_angle'}
+    | {'type': 'along_curve', 'points', 'count', 'align'};
+    matrix (if given) is the first pattern instance's placement.
     """
     if file_path:
         file_path, err = validate_path(file_path, must_exist=True)
@@ -82,6 +93,10 @@ def add_assembly_component(
                 segment_indices or [],
                 file_path,
             )
+        case "batch":
+            return assembly_manager.place_components_batch(
+                file_path, transforms, pattern, matrix,
+            )
         case _:
             return {
                 "error": f"Unknown method: {method}"
@@ -105,14 +120,18 @@ def manage_component(
     count: int = 1,
     spacing: float = 0.0,
     direction: str = "X",
+    active: bool = True,
+    component_indices: list[int] | None = None,
 ) -> dict[str, Any]:
     """Manage an assembly component.
 
     action: 'delete' | 'replace' | 'suppress' | 'reorder'
       | 'make_writable' | 'swap_family' | 'ground'
-      | 'pattern' | 'mirror'
+      | 'pattern' | 'mirror' | 'activate'
 
     Spacing in meters. plane_index: 1=Top, 2=Front, 3=Right.
+    activate: load (active=True) or unload (active=False) occurrence
+    geometry; component_indices overrides component_index, [] = all.
     """
     if action == "replace" and new_file_path:
         new_file_path, err = validate_path(new_file_path, must_exist=True)
@@ -158,6 +177,12 @@ def manage_component(
             return assembly_manager.mirror_component(
                 component_index, plane_index
             )
+        case "activate":
+            if component_indices is None:
+                component_indices = [component_index]
+            return assembly_manager.set_occurrence_activation(
+                component_indices or None, active
+            )
         case _:
             return {
                 "error": f"Unknown action: {action}"
@@ -181,9 +206,11 @@ def query_component(
       | 'is_subassembly' | 'display_name' | 'document'
       | 'sub_occurrences' | 'bodies' | 'style'
       | 'is_tube' | 'adjustable_part' | 'face_style'
-      | 'occurrence' | 'interference' | 'tube'
+      | 'occurrence' | 'interference' | 'tube' | 'load_state'
 
     0-based component_index. 'occurrence' uses internal_id instead.
+    'load_state' reports active/simplified occurrences without loading
+    geometry.
     """
     match property:
         case "list":
@@ -252,6 +279,8 @@ def query_component(
             )
         case "tube":
             return assembly_manager.get_tube(component_index)
+        case "load_state":
+            return assembly_manager.get_occurrence_load_state()
         case _:
             return {
                 "error": f"Unknown property: {property}"
@@ -871,6 +900,105 @@ def wiring(
             }
 
 
+# ================================================================
+# Group 84: analyze_relations (relation graph diagnostics)
+# ================================================================
+
+
+def analyze_relations(
+    query: str = "graph",
+    component_index: int = -1,
+    max_cycles: int = 50,
+) -> dict[str, Any]:
+    """Analyze the assembly relation graph in one pass.
+
+    query: 'graph' | 'dof' | 'redundant' | 'rigid_groups'
+
+    'dof' reports all components unless component_index >= 0.
+    'redundant' returns over-constrained pairs and loops (max_cycles=0 for all).
+    """
+    match query:
+        case "graph":
+            return assembly_manager.get_relation_graph()
+        case "dof":
+            return assembly_manager.get_relation_dof(
+                component_index if component_index >= 0 else None
+            )
+        case "redundant":
+            return assembly_manager.find_redundant_relations(
+                max_cycles
+            )
+        case "rigid_groups":
+            return assembly_manager.get_rigid_groups()
+        case _:
+            return {
+                "error": f"Unknown query: {query}"
+            }
+
+
+# ================================================================
+# Group 85: generate_path_members (batch frames/tubes/wires)
+# ================================================================
+
+
+def generate_path_members(
+    kind: str = "frame",
+    part_filename: str = "",
+    segments: list[Any] | None = None,
+    polylines: list[Any] | None = None,
+    nodes: dict[str, Any] | None = None,
+    edges: list[Any] | None = None,
+    csv_path: str = "",
+    sections: dict[str, str] | None = None,
+    end_treatment: dict[str, float] | None = None,
+    tube_options: dict[str, Any] | None = None,
+    tolerance: float = 1e-6,
+    description: str = "",
+) -> dict[str, Any]:
+    """Generate many frame/tube/wire members from centerline data in one pass.
+
+    kind: 'frame' | 'tube' | 'wire'
+
+    Path input (meters), any combination:
+      segments: [[[x1,y1,z1],[x2,y2,z2]], ...] or
+        [{"start":[...],"end":[...],"section":"name"}]
+      polylines: [[[x,y,z], ...], ...] or [{"points":[...],"section":"name"}]
+      nodes + edges: {"id":[x,y,z]} with [["a","b"], ...] or
+        [{"from":"a","to":"b","section":"name"}]
+      csv_path: columns x1,y1,z1,x2,y2,z2 or polyline,x,y,z (+ optional section)
+    sections: section name -> part file; unnamed segments use part_filename.
+    end_treatment (frames): miter_clearance, trim_extend_length,
+      cope_clearance, notch_plate_length.
+    tube_options: outer_diameter, wall_thickness, bend_radius, is_solid.
+    Endpoints within tolerance are joined into shared nodes.
+    """
+    if part_filename:
+        part_filename, err = validate_path(part_filename, must_exist=True)
+        if err:
+            return err
+    if csv_path:
+        csv_path, err = validate_path(csv_path, must_exist=True)
+        if err:
+            return err
+    err = validate_numerics(tolerance=tolerance)
+    if err:
+        return err
+    return assembly_manager.generate_path_members(
+        kind,
+        part_filename,
+        segments,
+        polylines,
+        nodes,
+        edges,
+        csv_path,
+        sections,
+        end_treatment,
+        tube_options,
+        tolerance,
+        description,
+    )
+
+
 # ================================================================
 # Registration
 # ================================================================
@@ -892,3 +1020,5 @@ def register(mcp: Any) -> None:
     mcp.tool()(virtual_component)
     mcp.tool()(structural_frame)
     mcp.tool()(wiring)
+    mcp.tool()(analyze_relations)
+    mcp.tool()(generate_path_members)
@@ -3,7 +3,7 @@
 from typing import Any
 
 from solidedge_mcp.backends.validation import validate_path
-from solidedge_mcp.managers import doc_manager
+from solidedge_mcp.managers import doc_manager, where_used_index
 
 # === Composite: create_document ===
 
@@ -40,12 +40,20 @@ def open_document(
     template: str = "",
     filename: str | None = None,
     dialog_title: str | None = None,
+    activation: str = "inactive",
+    simplification: str = "simplified",
+    background: bool = True,
 ) -> dict[str, Any]:
     """Open a document.
 
     method: 'foreground' | 'background' | 'with_template' | 'dialog'
+      | 'lightweight'
+
+    lightweight (.asm only): activation 'inactive' | 'active' | 'last_saved',
+    simplification 'simplified' | 'designed' | 'last_saved'. Occurrences are
+    activated on demand by geometry queries.
     """
-    if method in ("foreground", "background", "with_template") and file_path:
+    if method in ("foreground", "background", "with_template", "lightweight") and file_path:
         file_path, err = validate_path(file_path, must_exist=True)
         if err:
             return err
@@ -62,6 +70,10 @@ def open_document(
             return doc_manager.open_with_file_open_dialog(
                 filename, dialog_title
             )
+        case "lightweight":
+            return doc_manager.open_assembly_lightweight(
+                file_path, activation, simplification, background
+            )
         case _:
             return {"error": f"Unknown method: {method}"}
 
@@ -129,6 +141,43 @@ def undo_redo(action: str = "undo") -> dict[str, Any]:
             return {"error": f"Unknown action: {action}"}
 
 
+# === Composite: where_used ===
+
+
+def where_used(
+    action: str = "parents",
+    file_path: str = "",
+    root: str = "",
+    recursive: bool = False,
+    extensions: list[str] | None = None,
+    background: bool = True,
+) -> dict[str, Any]:
+    """Query the where-used index of a local CAD library.
+
+    action: 'scan' | 'parents' | 'children' | 'by_name' | 'status'
+
+    scan: index root (incremental, only changed files are re-read);
+    background=True returns immediately, poll 'status'.
+    parents: assemblies/drafts that reference file_path.
+    children: documents file_path references.
+    by_name: parents matched on file name only (links from other machines).
+    recursive: follow references through sub-assemblies.
+    """
+    match action:
+        case "scan":
+            return where_used_index.scan(root, extensions, background)
+        case "parents":
+            return where_used_index.where_used(file_path, recursive)
+        case "children":
+            return where_used_index.uses(file_path, recursive)
+        case "by_name":
+            return where_used_index.find_by_name(file_path)
+        case "status":
+            return where_used_index.get_status()
+        case _:
+            return {"error": f"Unknown action: {action}"}
+
+
 # === Standalone tools ===
 
 
@@ -156,6 +205,7 @@ def register(mcp: Any) -> None:
     mcp.tool()(close_document)
     mcp.tool()(save_document)
     mcp.tool()(undo_redo)
+    mcp.tool()(where_used)
     # Standalone tools
     mcp.tool()(activate_document)
     mcp.tool()(import_file)
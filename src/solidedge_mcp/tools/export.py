@@ -2,8 +2,9 @@
 
 from typing import Any
 
-from solidedge_mcp.backends.validation import validate_path
+from solidedge_mcp.backends.validation import validate_numerics, validate_path
 from solidedge_mcp.managers import export_manager, view_manager
+from solidedge_mcp.managers import print_queue as print_spooler
 
 # ================================================================
 # Group 47: export_file (8 → 1)
@@ -16,12 +17,19 @@ def export_file(
     ini_file_path: str = "",
     width: int = 800,
     height: int = 600,
+    tolerance: float = 0.0,
+    include_colors: bool = True,
 ) -> dict[str, Any]:
     """Export the active document to a file.
 
     format: 'step' | 'stl' | 'iges' | 'pdf' | 'dxf'
             | 'parasolid' | 'jt' | 'flat_dxf'
-            | 'prc' | 'plmxml' | 'image'
+            | 'prc' | 'plmxml' | 'image' | 'gltf'
+
+    'gltf' writes binary glTF 2.0 (.glb) with colors; assemblies keep
+    their occurrence tree and share one mesh per unique part.
+    tolerance: gltf tessellation tolerance in meters (0 = Solid Edge default).
+    include_colors: gltf body/face colors (False = one default material).
     """
     if file_path:
         file_path, err = validate_path(file_path, must_exist=False)
@@ -50,6 +58,8 @@ def export_file(
             return export_manager.export_to_plmxml(file_path, ini_file_path)
         case "image":
             return export_manager.capture_screenshot(file_path, width, height)
+        case "gltf":
+            return export_manager.export_to_gltf(file_path, tolerance, include_colors)
         case _:
             return {"error": f"Unknown format: {format}"}
 
@@ -762,6 +772,407 @@ def create_table(
             return {"error": f"Unknown type: {type}"}
 
 
+# ================================================================
+# Group 86: draft_snapshot (3 → 1)
+# ================================================================
+
+
+def draft_snapshot(
+    action: str = "summary",
+    table: str = "dimensions",
+    filters: dict[str, Any] | None = None,
+    columns: list[str] | None = None,
+    offset: int = 0,
+    limit: int = 100,
+    refresh: bool = False,
+) -> dict[str, Any]:
+    """Query a cached snapshot of the whole active draft.
+
+    The first call walks every sheet once; later queries page through the
+    cached columnar tables, re-walking only when sheet, view, dimension,
+    balloon, text or 2D element counts (or view up-to-date flags) change.
+
+    action: 'summary' | 'query' | 'clear'
+
+    table (query): 'sheets' | 'views' | 'dimensions' | 'balloons'
+                   | 'text_boxes' | 'lines' | 'circles' | 'arcs'
+    filters: {column: value | [values] | {"min", "max", "contains"}}
+    columns: subset of columns to return. refresh re-walks the draft.
+    """
+    match action:
+        case "summary":
+            return export_manager.get_draft_snapshot_summary(refresh)
+        case "query":
+            return export_manager.query_draft_snapshot(
+                table, filters, columns, offset, limit, refresh
+            )
+        case "clear":
+            return export_manager.clear_draft_snapshot()
+        case _:
+            return {"error": f"Unknown action: {action}"}
+
+
+# ================================================================
+# Group 87: schedule_view_updates (4 → 1)
+# ================================================================
+
+
+def schedule_view_updates(
+    action: str = "status",
+    view_indices: list[int] | None = None,
+    sheet_index: int | None = None,
+    stale_only: bool = True,
+    dry_run: bool = False,
+) -> dict[str, Any]:
+    """Incrementally update drawing views whose source model changed.
+
+    action: 'status' | 'request' | 'flush' | 'update_stale'
+
+    'request' queues view_indices (0-based, on sheet_index or the active
+    sheet); repeated requests coalesce until 'flush'. 'update_stale' updates
+    every stale view (optionally one sheet) and reports per-view timing.
+    """
+    match action:
+        case "status":
+            return export_manager.get_view_update_status(sheet_index)
+        case "request":
+            if not view_indices:
+                return {"error": "view_indices is required for 'request'"}
+            return export_manager.request_view_updates(view_indices, sheet_index)
+        case "flush":
+            return export_manager.flush_view_updates(stale_only)
+        case "update_stale":
+            return export_manager.update_stale_views(sheet_index, dry_run)
+        case _:
+            return {"error": f"Unknown action: {action}"}
+
+
+# ================================================================
+# Group 88: generate_drawings
+# ================================================================
+
+
+def generate_drawings(
+    model_paths: list[str],
+    output_dir: str,
+    layout: dict[str, Any] | None = None,
+    layout_path: str = "",
+    export_pdf: bool = False,
+    overwrite: bool = False,
+    results_path: str = "",
+) -> dict[str, Any]:
+    """Generate one draft per part/assembly from a view-layout template.
+
+    layout: {"views": [{"orientation", "x", "y", "scale"?}], "scale",
+             "template", "parts_list": {...}, "properties": {name: value}}
+    or layout_path to a JSON file with the same keys. Property values may
+    use {stem}, {name}, {folder}, {path} of each model.
+
+    Drafts are saved as <output_dir>/<stem>.dft (optionally also .pdf).
+    results_path: JSONL file that receives one line per finished model.
+    """
+    output_dir, err = validate_path(output_dir, must_exist=False)
+    if err:
+        return err
+    checked = []
+    for path in model_paths:
+        path, err = validate_path(path, must_exist=True)
+        if err:
+            return err
+        checked.append(path)
+    if layout_path:
+        layout_path, err = validate_path(layout_path, must_exist=True)
+        if err:
+            return err
+    if results_path:
+        results_path, err = validate_path(results_path, must_exist=False)
+        if err:
+            return err
+    return export_manager.generate_drawings(
+        checked,
+        output_dir,
+        layout if layout is not None else (layout_path or None),
+        export_pdf,
+        overwrite,
+        results_path or None,
+    )
+
+
+# ================================================================
+# Group 89: add_annotations_bulk
+# ================================================================
+
+
+def add_annotations_bulk(
+    annotations: list[dict[str, Any]],
+    sheet_index: int | None = None,
+    view_index: int | None = None,
+    stop_on_error: bool = False,
+) -> dict[str, Any]:
+    """Place many annotations on a draft sheet in one call.
+
+    Each item: {"type": ..., <same params as the single-annotation tools>}.
+    type: 'text_box' | 'note' | 'leader' | 'balloon' | 'dimension'
+          | 'angular_dimension' | 'radial_dimension' | 'diameter_dimension'
+          | 'ordinate_dimension' | 'center_mark' | 'centerline'
+          | 'surface_finish' | 'weld_symbol' | 'geometric_tolerance'
+
+    sheet_index (0-based) defaults to the active sheet. With view_index,
+    coordinates are offsets from that view's origin. All values in meters.
+    """
+    return export_manager.add_annotations_bulk(annotations, sheet_index, view_index, stop_on_error)
+
+
+# ================================================================
+# Group 90: auto_balloon
+# ================================================================
+
+
+def auto_balloon(
+    items: list[dict[str, Any]],
+    view_index: int = 0,
+    sheet_index: int | None = None,
+    radius: float = 0.004,
+    gap: float = 0.002,
+    margin: float = 0.01,
+    max_rings: int = 4,
+    view_box: list[float] | None = None,
+    dry_run: bool = False,
+) -> dict[str, Any]:
+    """Lay out balloons around a drawing view without overlaps and place them.
+
+    items: [{"text": "3", "x": ..., "y": ...}] - x/y is the leader anchor on
+    the part in sheet coordinates. Balloons go on rings outside the view range,
+    avoiding sheet lines/circles/arcs and each other.
+
+    view_box: [xmin, ymin, xmax, ymax] if the view range cannot be read.
+    dry_run returns the layout without placing. All values in meters.
+    """
+    err = validate_numerics(radius=radius, gap=gap, margin=margin)
+    if err:
+        return err
+    if radius <= 0 or gap < 0 or max_rings < 1:
+        return {"error": "radius must be > 0, gap >= 0 and max_rings >= 1"}
+    return export_manager.auto_balloon_view(
+        view_index, items, sheet_index, radius, gap, margin, max_rings, view_box, dry_run
+    )
+
+
+# ================================================================
+# Group 91: publish_drafts
+# ================================================================
+
+
+def publish_drafts(
+    paths: list[str],
+    output_dir: str,
+    formats: list[str] | None = None,
+    sheets: list[int | str] | None = None,
+    update_views: bool = False,
+    package_name: str = "",
+    workers: int = 1,
+    queue_size: int = 8,
+    overwrite: bool = True,
+) -> dict[str, Any]:
+    """Publish many drafts to PDF/DXF, optionally merged into one package PDF.
+
+    paths: .dft files, folders or glob patterns ('C:/release/**/*.dft').
+    formats: 'pdf' and/or 'dxf' (default pdf).
+    sheets: 0-based indices or names; each selected sheet becomes
+    <stem>_<sheet>.<ext>. update_views refreshes out-of-date views first.
+    package_name: merge the PDFs into <output_dir>/<package_name>.pdf.
+    workers > 1 publishes on that many hidden Solid Edge instances fed by a
+    bounded queue of queue_size drafts.
+    """
+    output_dir, err = validate_path(output_dir, must_exist=False)
+    if err:
+        return err
+    checked = []
+    for path in paths:
+        path, err = validate_path(path, must_exist=False)
+        if err:
+            return err
+        checked.append(path)
+    return export_manager.publish_drafts(
+        checked,
+        output_dir,
+        formats,
+        sheets,
+        update_views,
+        package_name or None,
+        workers,
+        queue_size,
+        overwrite,
+    )
+
+
+# ================================================================
+# Group 92: print_queue
+# ================================================================
+
+
+def print_queue(
+    action: str = "status",
+    documents: list[str | dict[str, Any]] | None = None,
+    printer_name: str = "",
+    copies: int = 1,
+    all_sheets: bool = True,
+    paper_width: float = 0.0,
+    paper_height: float = 0.0,
+    orientation: str = "Landscape",
+    job_ids: list[int] | None = None,
+    job_id: int = 0,
+) -> dict[str, Any]:
+    """Spool documents to a background print queue.
+
+    action: 'submit' | 'status' | 'job' | 'cancel' | 'clear'
+
+    submit: documents are paths or {"path", "printer"?, "copies"?,
+    "all_sheets"?, "paper"?} dicts; returns job IDs immediately. Jobs print
+    on a hidden Solid Edge instance; transient failures are retried.
+    paper_width/paper_height in meters (0 = keep the document's paper).
+    cancel: queued job_ids (all queued jobs if omitted). clear: forget
+    finished jobs. Status is also available at solidedge://drawing/print-queue.
+    """
+    match action:
+        case "submit":
+            checked: list[str | dict[str, Any]] = []
+            for document in documents or []:
+                path = document if isinstance(document, str) else document.get("path", "")
+                path, err = validate_path(path, must_exist=True)
+                if err:
+                    return err
+                checked.append(path if isinstance(document, str) else {**document, "path": path})
+            paper = None
+            if paper_width or paper_height:
+                err = validate_numerics(paper_width=paper_width, paper_height=paper_height)
+                if err:
+                    return err
+                paper = {"width": paper_width, "height": paper_height, "orientation": orientation}
+            return print_spooler.submit(checked, printer_name or None, copies, all_sheets, paper)
+        case "status":
+            return print_spooler.get_status()
+        case "job":
+            return print_spooler.get_job(job_id)
+        case "cancel":
+            return print_spooler.cancel(job_ids)
+        case "clear":
+            return print_spooler.clear_finished()
+        case _:
+            return {"error": f"Unknown action: {action}"}
+
+
+# ================================================================
+# Group 93: dimension_report
+# ================================================================
+
+
+def dimension_report(
+    output_path: str,
+    drafts: list[str] | None = None,
+    output_format: str = "",
+    start_number: int = 1,
+    restart_numbering: bool = False,
+    include_background: bool = False,
+    append: bool = False,
+) -> dict[str, Any]:
+    """Extract every drawing dimension to a numbered inspection table.
+
+    Rows: draft, characteristic, sheet, sheet_name, view, name, type, value,
+    units, display_text, upper/lower_tolerance, display_type.
+    drafts: .dft files, folders or glob patterns (default: active draft).
+    output_format: 'csv' | 'jsonl' (default: from the output_path extension).
+    Characteristic numbers run across all drafts unless restart_numbering.
+    """
+    output_path, err = validate_path(output_path, must_exist=False)
+    if err:
+        return err
+    checked = []
+    for path in drafts or []:
+        path, err = validate_path(path, must_exist=False)
+        if err:
+            return err
+        checked.append(path)
+    return export_manager.export_dimension_report(
+        output_path,
+        checked or None,
+        output_format or None,
+        start_number,
+        restart_numbering,
+        include_background,
+        append,
+    )
+
+
+# ================================================================
+# Group 94: sync_parts_list
+# ================================================================
+
+
+def sync_parts_list(
+    parts_list_index: int = 0,
+    sheet_index: int | None = None,
+    key_column: str = "",
+    quantity_column: str = "",
+    dry_run: bool = False,
+) -> dict[str, Any]:
+    """Diff a parts list against its assembly BOM and update only what changed.
+
+    Rows match on key_column (default File Name / Document Number / Part
+    Number / Name); columns other than File Name / Name match the part
+    document's property of the same name. Quantity changes are written to the
+    affected cells only; added or removed parts regenerate the existing list
+    with PartsList.Update(), since rows cannot be added or deleted one at a
+    time. Keys found on several rows are returned as conflicts and skipped.
+    dry_run reports added/removed/changed rows without touching the list.
+    """
+    return export_manager.sync_parts_list(
+        parts_list_index, sheet_index, key_column or None, quantity_column or None, dry_run
+    )
+
+
+# ================================================================
+# Group 95: draft_templates
+# ================================================================
+
+
+def draft_templates(
+    action: str = "stats",
+    symbols: list[dict[str, Any]] | None = None,
+    frames: list[dict[str, Any]] | None = None,
+    sheet_index: int | None = None,
+    max_entries: int | None = None,
+) -> dict[str, Any]:
+    """Bulk-place symbols and smart frames through a session template cache.
+
+    action: 'place_symbols' | 'place_frames' | 'stats' | 'clear'
+
+    place_symbols: symbols=[{"file_path", "x", "y", "insertion_type"?}];
+    each source file is resolved once and reused (keyed by path + mtime).
+    place_frames: frames=[{"style", "x1", "y1", "x2", "y2"}] or
+    [{"style", "x", "y", "top", "bottom", "left", "right"}].
+    clear: forget cached templates; max_entries resizes the LRU.
+    Coordinates in meters.
+    """
+    match action:
+        case "place_symbols":
+            for spec in symbols or []:
+                if "file_path" in spec:
+                    path, err = validate_path(spec["file_path"], must_exist=False)
+                    if err:
+                        return err
+                    spec["file_path"] = path
+            return export_manager.place_symbols_bulk(symbols or [], sheet_index)
+        case "place_frames":
+            return export_manager.place_smart_frames_bulk(frames or [], sheet_index)
+        case "stats":
+            return export_manager.get_template_cache_stats()
+        case "clear":
+            return export_manager.clear_template_cache(max_entries)
+        case _:
+            return {"error": f"Unknown action: {action}"}
+
+
 # ================================================================
 # Registration
 # ================================================================
@@ -786,3 +1197,13 @@ def register(mcp: Any) -> None:
     mcp.tool()(add_smart_frame)
     mcp.tool()(draft_config)
     mcp.tool()(create_table)
+    mcp.tool()(draft_snapshot)
+    mcp.tool()(schedule_view_updates)
+    mcp.tool()(generate_drawings)
+    mcp.tool()(add_annotations_bulk)
+    mcp.tool()(auto_balloon)
+    mcp.tool()(publish_drafts)
+    mcp.tool()(print_queue)
+    mcp.tool()(dimension_report)
+    mcp.tool()(sync_parts_list)
+    mcp.tool()(draft_templates)
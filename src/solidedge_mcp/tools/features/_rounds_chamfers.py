@@ -3,7 +3,23 @@
 from typing import Any
 
 from solidedge_mcp.backends.validation import validate_numerics
-from solidedge_mcp.managers import feature_manager
+from solidedge_mcp.managers import feature_manager, query_manager
+
+
+def _edge_set(
+    edges: list[list[int]] | None, selector: str
+) -> tuple[list[list[int]], dict[str, Any] | None]:
+    """Explicit [face_index, edge_index] pairs, or the edges a selector matches."""
+    if edges:
+        return edges, None
+    if not selector:
+        return [], {"error": "method 'edges' needs edges or a selector"}
+    selected = query_manager.select_topology(selector)
+    if "error" in selected:
+        return [], selected
+    if "edges" not in selected:
+        return [], {"error": "Selector must select edges"}
+    return selected["edges"], None
 
 
 def create_round(
@@ -13,18 +29,30 @@ def create_round(
     radii: list[float] | None = None,
     face_index1: int = 0,
     face_index2: int = 0,
+    edges: list[list[int]] | None = None,
+    selector: str = "",
 ) -> dict[str, Any]:
     """Round (fillet) edges of the active body.
 
     method: 'all_edges' | 'on_face' | 'variable' | 'blend'
-        | 'surface_blend'
+        | 'surface_blend' | 'edges'
 
-    radius/radii in meters.
+    radius/radii in meters. For 'edges': edges as
+    [[face_index, edge_index], ...] or a select_topology edge
+    selector; radii (one per edge) or radius; edges are grouped
+    by radius into as few round features as possible.
     """
     err = validate_numerics(radius=radius)
     if err:
         return err
     match method:
+        case "edges":
+            edge_set, err = _edge_set(edges, selector)
+            if err:
+                return err
+            if radii:
+                return feature_manager.create_rounds_bulk(edge_set, radii=radii)
+            return feature_manager.create_rounds_bulk(edge_set, radius=radius)
         case "all_edges":
             return feature_manager.create_round(radius)
         case "on_face":
@@ -46,13 +74,19 @@ def create_chamfer(
     distance1: float = 0.0,
     distance2: float = 0.0,
     angle: float = 0.0,
+    edges: list[list[int]] | None = None,
+    selector: str = "",
+    distances: list[float] | None = None,
 ) -> dict[str, Any]:
     """Chamfer edges of the active body.
 
     method: 'equal' | 'on_face' | 'unequal'
-        | 'unequal_on_face' | 'angle'
+        | 'unequal_on_face' | 'angle' | 'edges'
 
-    Distances in meters. angle in degrees.
+    Distances in meters. angle in degrees. For 'edges': edges as
+    [[face_index, edge_index], ...] or a select_topology edge
+    selector; distances (one per edge) or distance; one chamfer
+    feature is created per distance.
     """
     err = validate_numerics(
         distance=distance, distance1=distance1,
@@ -61,6 +95,13 @@ def create_chamfer(
     if err:
         return err
     match method:
+        case "edges":
+            edge_set, err = _edge_set(edges, selector)
+            if err:
+                return err
+            if distances:
+                return feature_manager.create_chamfers_bulk(edge_set, distances=distances)
+            return feature_manager.create_chamfers_bulk(edge_set, distance=distance)
         case "equal":
             return feature_manager.create_chamfer(distance)
         case "on_face":
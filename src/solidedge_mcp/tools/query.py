@@ -500,6 +500,153 @@ def recompute(scope: str = "model") -> dict[str, Any]:
             return {"error": f"Unknown scope: {scope}"}
 
 
+# ── Group 96: query_body_batch ────────────────────────────────────
+
+
+def query_body_batch(
+    property: str,
+    values: list[float],
+    method: str = "com",
+    first_hit_only: bool = False,
+    tolerance: float = 0.0,
+) -> dict[str, Any]:
+    """Run many ray casts or point-in-body tests against the body in one call.
+
+    property: 'faces_by_rays' | 'points_inside'
+
+    values: flat list - [ox, oy, oz, dx, dy, dz, ...] for faces_by_rays,
+    [x, y, z, ...] for points_inside (meters).
+    method: 'com' (exact, one COM call each) | 'mesh' (tessellate once,
+    BVH in Python) | 'auto' (mesh from 500 queries up).
+    tolerance: tessellation tolerance for the mesh method (meters).
+    """
+    match property:
+        case "faces_by_rays":
+            return query_manager.get_faces_by_rays(values, method, first_hit_only, tolerance)
+        case "points_inside":
+            return query_manager.are_points_inside_body(values, method, tolerance)
+        case _:
+            return {"error": f"Unknown property: {property}"}
+
+
+# ── Group 97: sample_faces ────────────────────────────────────────
+
+
+def sample_faces(
+    face_indices: list[int] | None = None,
+    grid_u: int = 5,
+    grid_v: int = 5,
+    params: list[float] | None = None,
+    properties: list[str] | None = None,
+) -> dict[str, Any]:
+    """Sample positions, normals and principal curvatures over a grid on faces.
+
+    face_indices: 0-based faces (default: all faces of the body).
+    grid_u, grid_v: samples per face in u and v (cell centers).
+    params: flat normalized [u, v, ...] list (0.0-1.0) used instead of the grid.
+    properties: any of 'position' | 'normal' | 'curvature' (default: all).
+    """
+    return query_manager.sample_face_properties(face_indices, [grid_u, grid_v], params, properties)
+
+
+# ── Group 98: analyze_draft ───────────────────────────────────────
+
+
+def analyze_draft(
+    pull_direction: list[float] | None = None,
+    min_draft: float = 1.0,
+    check_undercuts: bool = True,
+    tolerance: float = 0.0,
+    only_problems: bool = True,
+    color_faces: bool = False,
+) -> dict[str, Any]:
+    """Moldability check: classify faces by draft angle and find undercuts.
+
+    pull_direction: mold opening direction [x, y, z] (default: [0, 0, 1]).
+    min_draft: required draft in degrees.
+    check_undercuts: ray-test whether faces can release along the pull.
+    tolerance: tessellation tolerance in meters (<= 0 uses the cached mesh).
+    only_problems: list only 'insufficient' and 'undercut' faces.
+    color_faces: color faces green (+), blue (-), yellow (insufficient), red (undercut).
+    """
+    return query_manager.analyze_draft(
+        pull_direction, min_draft, check_undercuts, tolerance, only_problems, color_faces
+    )
+
+
+# ── Group 99: analyze_wall_thickness ──────────────────────────────
+
+
+def analyze_wall_thickness(
+    min_thickness: float | None = None,
+    face_indices: list[int] | None = None,
+    max_samples: int = 50_000,
+    max_hotspots: int = 20,
+    tolerance: float = 0.0,
+    workers: int = 0,
+) -> dict[str, Any]:
+    """Wall-thickness check: per-face min/avg thickness and the thinnest spots.
+
+    min_thickness: flag samples thinner than this (meters).
+    face_indices: 0-based faces to measure (default: all faces).
+    max_samples: largest number of inward rays cast.
+    max_hotspots: thinnest sample points to list.
+    tolerance: tessellation tolerance in meters (<= 0 uses the cached mesh).
+    workers: worker processes for ray tracing (0 or 1: in-process).
+    """
+    return query_manager.analyze_wall_thickness(
+        min_thickness, face_indices, max_samples, max_hotspots, tolerance, workers
+    )
+
+
+# ── Group 100: select_topology ────────────────────────────────────
+
+
+def select_topology(
+    selector: str,
+    refresh: bool = False,
+    include_details: bool = False,
+    add_to_select_set: bool = False,
+) -> dict[str, Any]:
+    """Find faces or edges with a selector instead of inspecting them one by one.
+
+    selector examples:
+      "edges where type=line and parallel to Z and length>10mm"
+      "faces of type cylinder with radius<3mm"
+      "edges on face 4 and not (type=circle or length<=2mm)"
+    Types: faces plane|cylinder|cone|sphere|torus|spline; edges
+    line|circle|ellipse|spline. Attributes: area, radius, diameter,
+    minor_radius, half_angle, edge_count (faces); length, radius, diameter,
+    face_count (edges). Units mm|cm|m|in (default m). Also 'parallel to',
+    'perpendicular to' X|Y|Z|[x,y,z], 'on face N', 'adjacent to face N'.
+    Returns face indices, or edges as [face_index, edge_index] pairs.
+    refresh: re-capture the topology snapshot.
+    include_details: return each match's snapshot record.
+    add_to_select_set: add the matches to the selection set.
+    """
+    return query_manager.select_topology(selector, refresh, include_details, add_to_select_set)
+
+
+# ── Group 101: manage_facet_cache ─────────────────────────────────
+
+
+def manage_facet_cache(action: str = "status") -> dict[str, Any]:
+    """Inspect or clear the on-disk tessellation cache.
+
+    action: 'status' | 'clear'
+
+    Tessellations of saved documents are cached per file content, body
+    and tolerance, and reused by facet_data, ray queries and analyses.
+    """
+    match action:
+        case "status":
+            return query_manager.get_facet_cache_status()
+        case "clear":
+            return query_manager.clear_facet_cache()
+        case _:
+            return {"error": f"Unknown action: {action}"}
+
+
 # ── Registration ──────────────────────────────────────────────────
 
 
@@ -519,3 +666,9 @@ def register(mcp: Any) -> None:
     mcp.tool()(query_body)
     mcp.tool()(query_bspline)
     mcp.tool()(recompute)
+    mcp.tool()(query_body_batch)
+    mcp.tool()(sample_faces)
+    mcp.tool()(analyze_draft)
+    mcp.tool()(analyze_wall_thickness)
+    mcp.tool()(select_topology)
+    mcp.tool()(manage_facet_cache)
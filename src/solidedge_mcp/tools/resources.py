@@ -12,17 +12,19 @@ from solidedge_mcp.managers import (
     doc_manager,
     export_manager,
     feature_manager,
+    print_queue,
     query_manager,
     sketch_manager,
     view_manager,
+    where_used_index,
 )
 
 
 def register(mcp: Any) -> None:
-    """Register read-only MCP resources (37 static + 15 templates)."""
+    """Register read-only MCP resources (39 static + 16 templates)."""
 
     # ===================================================================
-    # Tier 1: Static Resources (no parameters) — 37 resources
+    # Tier 1: Static Resources (no parameters) — 39 resources
     # ===================================================================
 
     # --- Application (4) ---
@@ -212,7 +214,7 @@ def register(mcp: Any) -> None:
         """Constraints in the active sketch."""
         return json.dumps(sketch_manager.get_sketch_constraints())
 
-    # --- Drawing (2) ---
+    # --- Drawing (3) ---
 
     @mcp.resource("solidedge://drawing/sheets")
     def drawing_sheets() -> str:
@@ -224,8 +226,20 @@ def register(mcp: Any) -> None:
         """Number of drawing views on the active sheet."""
         return json.dumps(export_manager.get_drawing_view_count())
 
+    @mcp.resource("solidedge://drawing/print-queue")
+    def drawing_print_queue() -> str:
+        """Background print queue: job states, attempts and errors."""
+        return json.dumps(print_queue.get_status())
+
+    # --- Library (1) ---
+
+    @mcp.resource("solidedge://library/where-used-status")
+    def library_where_used_status() -> str:
+        """Where-used index size and background scan progress."""
+        return json.dumps(where_used_index.get_status())
+
     # ===================================================================
-    # Tier 2: Resource Templates (parameterized) — 15 templates
+    # Tier 2: Resource Templates (parameterized) — 16 templates
     # ===================================================================
 
     # --- Model Feature Templates (5) ---
@@ -308,9 +322,14 @@ def register(mcp: Any) -> None:
         """Specific property of a material."""
         return json.dumps(query_manager.get_material_property(name, int(index)))
 
-    # --- Mass Properties Template (1) ---
+    # --- Mass Properties Templates (2) ---
 
     @mcp.resource("solidedge://geometry/mass-properties/{density}")
     def geometry_mass_properties(density: float) -> str:
         """Mass properties for a given density (kg/m3)."""
         return json.dumps(query_manager.get_mass_properties(float(density)))
+
+    @mcp.resource("solidedge://assembly/mass-properties/{density}")
+    def assembly_mass_properties(density: float) -> str:
+        """Mass properties of the active assembly, rolled up from its parts."""
+        return json.dumps(query_manager.get_assembly_mass_properties(float(density)))
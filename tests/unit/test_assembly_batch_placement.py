@@ -0,0 +1,155 @@
+"""
+Unit tests for AssemblyManager batch placement backend methods.
+
+Tests batch placement mixin: PlaceComponentsBatch with explicit transforms
+and linear/rectangular/circular/along-curve pattern generators.
+Uses unittest.mock to simulate COM objects.
+"""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+
+@pytest.fixture
+def asm_mgr():
+    """Create AssemblyManager with mocked doc and application."""
+    from solidedge_mcp.backends.assembly import AssemblyManager
+
+    dm = MagicMock()
+    doc = MagicMock()
+    app = MagicMock()
+    app.Documents.Count = 0
+    app.ScreenUpdating = True
+    dm.get_active_document.return_value = doc
+    dm.connection.get_application.return_value = app
+
+    occurrences = MagicMock()
+    occurrences.Count = 2
+    placed = []
+
+    def add_with_matrix(path, matrix):
+        occ = MagicMock()
+        occ.Name = f"screw.par:{len(placed) + 1}"
+        placed.append(list(matrix))
+        return occ
+
+    occurrences.AddWithMatrix.side_effect = add_with_matrix
+    doc.Occurrences = occurrences
+    return AssemblyManager(dm), doc, app, placed
+
+
+def _run(am, **kwargs):
+    with patch("os.path.exists", return_value=True):
+        return am.place_components_batch("C:/parts/screw.par", **kwargs)
+
+
+class TestPlaceComponentsBatch:
+    def test_explicit_transforms(self, asm_mgr):
+        am, doc, app, placed = asm_mgr
+        result = _run(am, transforms=[[0.01, 0, 0], [0, 0.02, 0, 0, 0, 90]])
+        assert result["status"] == "placed"
+        assert result["placed_count"] == 2
+        assert result["first_index"] == 2
+        assert placed[0][12:15] == [0.01, 0.0, 0.0]
+        # 90 degrees about Z turns local X onto +Y
+        assert placed[1][0:3] == pytest.approx([0.0, 1.0, 0.0])
+        assert placed[1][12:15] == [0.0, 0.02, 0.0]
+
+    def test_linear_pattern(self, asm_mgr):
+        am, _, _, placed = asm_mgr
+        result = _run(am, pattern={"type": "linear", "count": 4, "spacing": 0.01, "direction": "Y"})
+        assert result["placed_count"] == 4
+        assert [m[13] for m in placed] == pytest.approx([0.0, 0.01, 0.02, 0.03])
+
+    def test_rectangular_pattern(self, asm_mgr):
+        am, _, _, placed = asm_mgr
+        result = _run(
+            am,
+            pattern={
+                "type": "rectangular",
+                "count_1": 3,
+                "count_2": 2,
+                "spacing_1": 0.01,
+                "spacing_2": 0.02,
+            },
+        )
+        assert result["placed_count"] == 6
+        assert placed[-1][12:14] == pytest.approx([0.02, 0.02])
+
+    def test_circular_pattern(self, asm_mgr):
+        am, _, _, placed = asm_mgr
+        base = [0.1, 0.0, 0.0]
+        _run(am, pattern={"type": "circular", "count": 4}, base_transform=base)
+        assert placed[1][12:15] == pytest.approx([0.0, 0.1, 0.0], abs=1e-12)
+        assert placed[2][12:15] == pytest.approx([-0.1, 0.0, 0.0], abs=1e-12)
+        # Orientation rotates with the instance
+        assert placed[1][0:3] == pytest.approx([0.0, 1.0, 0.0], abs=1e-12)
+
+    def test_partial_circular_arc_includes_end(self, asm_mgr):
+        am, _, _, placed = asm_mgr
+        _run(
+            am,
+            pattern={"type": "circular", "count": 3, "total_angle": 90},
+            base_transform=[0.1, 0.0, 0.0],
+        )
+        assert placed[-1][12:15] == pytest.approx([0.0, 0.1, 0.0], abs=1e-12)
+
+    def test_along_curve_aligned(self, asm_mgr):
+        am, _, _, placed = asm_mgr
+        points = [[0, 0, 0], [0.1, 0, 0], [0.1, 0.1, 0]]
+        _run(am, pattern={"type": "along_curve", "points": points, "count": 5, "align": True})
+        expected = [[0, 0, 0], [0.05, 0, 0], [0.1, 0, 0], [0.1, 0.05, 0], [0.1, 0.1, 0]]
+        for matrix, point in zip(placed, expected, strict=True):
+            assert matrix[12:15] == pytest.approx(point)
+        assert placed[-1][0:3] == pytest.approx([0.0, 1.0, 0.0], abs=1e-12)
+
+    def test_screen_updating_restored(self, asm_mgr):
+        am, _, app, _ = asm_mgr
+        _run(am, transforms=[[0, 0, 0]])
+        assert app.ScreenUpdating is True
+        am.doc_manager.connection.performance_scope.assert_called_once_with()
+
+    def test_holds_and_closes_source_document(self, asm_mgr):
+        am, _, app, _ = asm_mgr
+        _run(am, transforms=[[0, 0, 0], [0.01, 0, 0]])
+        app.Documents.Open.assert_called_once_with("C:/parts/screw.par", 0x8)
+        app.Documents.Open.return_value.Close.assert_called_once()
+
+    def test_per_instance_errors(self, asm_mgr):
+        am, doc, _, _ = asm_mgr
+        doc.Occurrences.AddWithMatrix.side_effect = [MagicMock(), Exception("boom")]
+        result = _run(am, transforms=[[0, 0, 0], [0.01, 0, 0]])
+        assert result["status"] == "partial"
+        assert result["errors"] == [{"instance": 1, "error": "boom"}]
+
+    def test_invalid_transform(self, asm_mgr):
+        am, _, _, _ = asm_mgr
+        result = _run(am, transforms=[[1, 2]])
+        assert "error" in result
+
+    def test_unknown_pattern(self, asm_mgr):
+        am, _, _, _ = asm_mgr
+        result = _run(am, pattern={"type": "spiral", "count": 2})
+        assert "error" in result
+
+    def test_too_many_instances(self, asm_mgr):
+        am, _, _, _ = asm_mgr
+        result = _run(am, pattern={"type": "linear", "count": 10**6, "spacing": 0.01})
+        assert "error" in result
+
+    def test_empty(self, asm_mgr):
+        am, _, _, _ = asm_mgr
+        result = _run(am)
+        assert "error" in result
+
+    def test_file_not_found(self, asm_mgr):
+        am, _, _, _ = asm_mgr
+        result = am.place_components_batch("C:/missing.par", transforms=[[0, 0, 0]])
+        assert "error" in result
+
+    def test_not_assembly(self, asm_mgr):
+        am, doc, _, _ = asm_mgr
+        del doc.Occurrences
+        result = _run(am, transforms=[[0, 0, 0]])
+        assert "error" in result
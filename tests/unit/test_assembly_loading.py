@@ -0,0 +1,124 @@
+"""
+Unit tests for AssemblyManager on-demand occurrence loading.
+
+Tests occurrence loading mixin: GetOccurrenceLoadState, SetOccurrenceActivation,
+and the lazy activation performed by geometry queries (bounding box, bodies).
+Uses unittest.mock to simulate COM objects.
+"""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+
+def _make_occurrence(name, active):
+    occ = MagicMock()
+    occ.Name = name
+    occ.Activate = active
+    occ.UseSimplified = not active
+    occ.Subassembly = ".asm:" in name
+    return occ
+
+
+@pytest.fixture
+def asm_mgr():
+    """Create AssemblyManager with a mix of active and inactive occurrences."""
+    from solidedge_mcp.backends.assembly import AssemblyManager
+
+    dm = MagicMock()
+    doc = MagicMock()
+    dm.get_active_document.return_value = doc
+
+    occs = [
+        _make_occurrence("base.par:1", True),
+        _make_occurrence("frame.asm:1", False),
+        _make_occurrence("bolt.par:1", False),
+    ]
+    occurrences = MagicMock()
+    occurrences.Count = len(occs)
+    occurrences.Item.side_effect = lambda i: occs[i - 1]
+    doc.Occurrences = occurrences
+    return AssemblyManager(dm), doc, occs
+
+
+# ============================================================================
+# LOAD STATE
+# ============================================================================
+
+
+class TestGetOccurrenceLoadState:
+    def test_reports_counts(self, asm_mgr):
+        am, _, _ = asm_mgr
+        result = am.get_occurrence_load_state()
+        assert result["count"] == 3
+        assert result["active_count"] == 1
+        assert result["inactive_count"] == 2
+        assert result["occurrences"][1]["is_subassembly"] is True
+        assert result["occurrences"][1]["simplified"] is True
+
+    def test_not_assembly(self, asm_mgr):
+        am, doc, _ = asm_mgr
+        del doc.Occurrences
+        result = am.get_occurrence_load_state()
+        assert "error" in result
+
+
+# ============================================================================
+# SET ACTIVATION
+# ============================================================================
+
+
+class TestSetOccurrenceActivation:
+    def test_activate_all(self, asm_mgr):
+        am, _, occs = asm_mgr
+        result = am.set_occurrence_activation()
+        assert result["changed"] == [1, 2]
+        assert result["unchanged"] == [0]
+        assert all(o.Activate is True for o in occs)
+
+    def test_deactivate_selected(self, asm_mgr):
+        am, _, occs = asm_mgr
+        result = am.set_occurrence_activation([0], active=False)
+        assert result["status"] == "deactivated"
+        assert result["changed"] == [0]
+        assert occs[0].Activate is False
+
+    def test_invalid_index_reported(self, asm_mgr):
+        am, _, _ = asm_mgr
+        result = am.set_occurrence_activation([5, 2])
+        assert result["changed"] == [2]
+        assert result["errors"][0]["index"] == 5
+
+
+# ============================================================================
+# LAZY ACTIVATION FROM GEOMETRY QUERIES
+# ============================================================================
+
+
+class TestLazyActivation:
+    def test_bounding_box_activates_only_target(self, asm_mgr):
+        am, _, occs = asm_mgr
+        am.get_occurrence_bounding_box(2)
+        assert occs[2].Activate is True
+        assert occs[1].Activate is False
+        occs[2].GetRangeBox.assert_called_once()
+
+        state = am.get_occurrence_load_state()
+        assert state["activated_on_demand"] == ["bolt.par:1"]
+        assert state["occurrences"][2]["activated_on_demand"] is True
+
+    def test_bodies_activates_target(self, asm_mgr):
+        am, _, occs = asm_mgr
+        occs[1].Bodies.Count = 0
+        am.get_occurrence_bodies(1)
+        assert occs[1].Activate is True
+
+    def test_active_occurrence_untouched(self, asm_mgr):
+        am, _, _ = asm_mgr
+        assert am._ensure_occurrences_loaded([_make_occurrence("x.par:1", True)]) == []
+
+    def test_deactivate_clears_on_demand_record(self, asm_mgr):
+        am, _, _ = asm_mgr
+        am.get_occurrence_bounding_box(2)
+        am.set_occurrence_activation([2], active=False)
+        assert am.get_occurrence_load_state()["activated_on_demand"] == []
@@ -0,0 +1,250 @@
+"""
+Unit tests for AssemblyManager batch path member generation.
+
+Tests path members mixin: path input parsing (segments, polylines, node/edge
+graphs, CSV), endpoint welding, chain decomposition, and
+GeneratePathMembers for frames, tubes and wires.
+Uses unittest.mock to simulate COM objects.
+"""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from solidedge_mcp.backends.assembly._path_members import (
+    _chains,
+    _collect_segments,
+    _read_path_csv,
+    _weld_segments,
+)
+
+# A rectangular frame with one diagonal brace, as a node/edge graph
+NODES = {"a": [0, 0, 0], "b": [1, 0, 0], "c": [1, 1, 0], "d": [0, 1, 0]}
+EDGES = [
+    ["a", "b"],
+    ["b", "c"],
+    ["c", "d"],
+    ["d", "a"],
+    {"from": "a", "to": "c", "section": "brace"},
+]
+
+
+@pytest.fixture
+def asm_mgr():
+    """Create AssemblyManager with mocked doc, 3D sketch and application."""
+    from solidedge_mcp.backends.assembly import AssemblyManager
+
+    dm = MagicMock()
+    doc = MagicMock()
+    app = MagicMock()
+    app.ScreenUpdating = True
+    globals_ = {3: 0.0, 4: 0.0, 5: 0.0, 6: 0.0}
+    app.GetGlobalParameter.side_effect = globals_.get
+    app.SetGlobalParameter.side_effect = globals_.__setitem__
+    dm.get_active_document.return_value = doc
+    dm.connection.get_application.return_value = app
+
+    drawn = []
+
+    def add_line(*coords):
+        line = MagicMock()
+        line.coords = coords
+        drawn.append(coords)
+        return line
+
+    doc.Sketches3D.Add.return_value.Lines3D.Add.side_effect = add_line
+    return AssemblyManager(dm), doc, app, drawn, globals_
+
+
+# ============================================================================
+# PATH INPUT PARSING
+# ============================================================================
+
+
+class TestCollectSegments:
+    def test_segment_pairs_and_dicts(self):
+        out = _collect_segments(
+            segments=[
+                [[0, 0, 0], [1, 0, 0]],
+                {"start": [1, 0, 0], "end": [1, 1, 0], "section": "hss"},
+            ]
+        )
+        assert out == [((0, 0, 0), (1, 0, 0), ""), ((1, 0, 0), (1, 1, 0), "hss")]
+
+    def test_polyline_chains(self):
+        polyline = {"points": [[0, 0, 0], [1, 0, 0], [1, 1, 0]], "section": "p"}
+        out = _collect_segments(polylines=[polyline])
+        assert len(out) == 2
+        assert out[1] == ((1, 0, 0), (1, 1, 0), "p")
+
+    def test_graph(self):
+        out = _collect_segments(nodes=NODES, edges=EDGES)
+        assert len(out) == 5
+        assert out[4][2] == "brace"
+
+    def test_unknown_node(self):
+        with pytest.raises(ValueError, match="unknown node"):
+            _collect_segments(nodes=NODES, edges=[["a", "z"]])
+
+    def test_bad_point(self):
+        with pytest.raises(ValueError):
+            _collect_segments(segments=[[[0, 0], [1, 0, 0]]])
+
+
+class TestReadPathCsv:
+    def test_segment_rows(self, tmp_path):
+        f = tmp_path / "frame.csv"
+        f.write_text("X1,Y1,Z1,X2,Y2,Z2,Section\n0,0,0,1,0,0,hss\n1,0,0,1,1,0,\n")
+        out = _read_path_csv(str(f))
+        assert out == [((0, 0, 0), (1, 0, 0), "hss"), ((1, 0, 0), (1, 1, 0), "")]
+
+    def test_polyline_rows(self, tmp_path):
+        f = tmp_path / "runs.csv"
+        f.write_text("polyline,x,y,z\nA,0,0,0\nB,5,5,5\nA,1,0,0\nA,1,1,0\nB,6,5,5\n")
+        out = _read_path_csv(str(f))
+        assert len(out) == 3
+        assert ((5, 5, 5), (6, 5, 5), "") in out
+
+    def test_unknown_columns(self, tmp_path):
+        f = tmp_path / "bad.csv"
+        f.write_text("a,b\n1,2\n")
+        with pytest.raises(ValueError, match="CSV needs columns"):
+            _read_path_csv(str(f))
+
+
+# ============================================================================
+# WELDING AND CHAINS
+# ============================================================================
+
+
+class TestWeldSegments:
+    def test_merges_near_endpoints(self):
+        raw = [((0, 0, 0), (1, 0, 0), ""), ((1 + 1e-7, 0, 0), (1, 1, 0), "")]
+        points, edges, dropped = _weld_segments(raw, 1e-6)
+        assert len(points) == 3
+        assert edges[0][1] == edges[1][0]
+        assert dropped == 0
+
+    def test_drops_zero_length_and_duplicates(self):
+        raw = [
+            ((0, 0, 0), (1, 0, 0), ""),
+            ((1, 0, 0), (0, 0, 0), ""),
+            ((2, 0, 0), (2, 0, 0), ""),
+            ((0, 0, 0), (1, 0, 0), "other"),
+        ]
+        _, edges, dropped = _weld_segments(raw, 1e-6)
+        assert len(edges) == 2
+        assert dropped == 2
+
+
+class TestChains:
+    def test_open_polyline_is_one_chain(self):
+        edges = [(0, 1, ""), (2, 1, ""), (2, 3, "")]
+        chains = _chains(edges)
+        assert len(chains) == 1
+        assert [i for i, _ in chains[0]] == [0, 1, 2]
+        assert [f for _, f in chains[0]] == [True, False, True]
+
+    def test_branch_splits_chains(self):
+        # T junction at node 1
+        edges = [(0, 1, ""), (1, 2, ""), (1, 3, "")]
+        chains = _chains(edges)
+        assert sorted(len(c) for c in chains) == [1, 1, 1]
+
+    def test_closed_loop(self):
+        edges = [(0, 1, ""), (1, 2, ""), (2, 0, "")]
+        chains = _chains(edges)
+        assert len(chains) == 1
+        assert len(chains[0]) == 3
+
+
+# ============================================================================
+# GENERATE PATH MEMBERS
+# ============================================================================
+
+
+class TestGeneratePathMembers:
+    def test_frames_grouped_by_section(self, asm_mgr):
+        am, doc, app, drawn, globals_ = asm_mgr
+        with patch("os.path.exists", return_value=True):
+            result = am.generate_path_members(
+                "frame",
+                part_filename="C:\\frames\\hss.par",
+                nodes=NODES,
+                edges=EDGES,
+                sections={"brace": "C:\\frames\\angle.par"},
+                end_treatment={"miter_clearance": 0.002},
+            )
+        assert result["status"] == "created"
+        assert result["segments"] == 5
+        assert result["nodes"] == 4
+        assert len(drawn) == 5
+        assert doc.StructuralFrames.Add.call_count == 2
+        files = sorted(c.args[0] for c in doc.StructuralFrames.Add.call_args_list)
+        assert files == ["C:\\frames\\angle.par", "C:\\frames\\hss.par"]
+        # End treatment applied during creation, then restored
+        assert call_args_contains(app.SetGlobalParameter, (3, 0.002))
+        assert globals_[3] == 0.0
+        assert app.ScreenUpdating is True
+
+    def test_tubes_per_chain(self, asm_mgr):
+        am, doc, _, _, _ = asm_mgr
+        with patch("os.path.exists", return_value=True):
+            result = am.generate_path_members(
+                "tube",
+                part_filename="C:\\tube.par",
+                polylines=[[[0, 0, 0], [1, 0, 0], [1, 1, 0]], [[5, 0, 0], [6, 0, 0]]],
+                tube_options={"outer_diameter": 0.02},
+            )
+        assert result["member_count"] == 2
+        assert doc.Occurrences.AddTube.call_count == 2
+
+    def test_wires_carry_directions(self, asm_mgr):
+        am, doc, _, _, _ = asm_mgr
+        result = am.generate_path_members(
+            "wire", segments=[[[0, 0, 0], [1, 0, 0]], [[2, 0, 0], [1, 0, 0]]], description="W1"
+        )
+        assert result["member_count"] == 1
+        args = doc.Wires.Add.call_args.args
+        assert args[0] == 2
+        assert args[3] == "W1"
+
+    def test_frame_member_error_is_partial(self, asm_mgr):
+        am, doc, _, _, _ = asm_mgr
+        doc.StructuralFrames.Add.side_effect = [MagicMock(), Exception("bad profile")]
+        with patch("os.path.exists", return_value=True):
+            result = am.generate_path_members(
+                "frame",
+                part_filename="C:\\hss.par",
+                nodes=NODES,
+                edges=EDGES,
+                sections={"brace": "C:\\angle.par"},
+            )
+        assert result["status"] == "partial"
+        assert result["member_count"] == 1
+        assert "bad profile" in result["errors"][0]["error"]
+
+    def test_missing_section_file(self, asm_mgr):
+        am, _, _, _, _ = asm_mgr
+        result = am.generate_path_members("frame", part_filename="", nodes=NODES, edges=EDGES)
+        assert "No part file" in result["error"]
+
+    def test_invalid_kind(self, asm_mgr):
+        am, _, _, _, _ = asm_mgr
+        result = am.generate_path_members("beam", segments=[[[0, 0, 0], [1, 0, 0]]])
+        assert "Invalid kind" in result["error"]
+
+    def test_no_segments(self, asm_mgr):
+        am, _, _, _, _ = asm_mgr
+        result = am.generate_path_members("wire")
+        assert "No path segments" in result["error"]
+
+    def test_not_assembly(self, asm_mgr):
+        am, doc, _, _, _ = asm_mgr
+        del doc.Occurrences
+        result = am.generate_path_members("wire", segments=[[[0, 0, 0], [1, 0, 0]]])
+        assert "not an assembly" in result["error"]
+
+
+def call_args_contains(mock, args):
+    return any(c.args == args for c in mock.call_args_list)
@@ -0,0 +1,244 @@
+"""
+Unit tests for AssemblyManager relation graph backend methods.
+
+Tests relation graph mixin: GetRelationGraph, GetRelationDof,
+FindRedundantRelations, GetRigidGroups.
+Uses unittest.mock to simulate COM objects.
+"""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+
+@pytest.fixture
+def asm_mgr():
+    """Create AssemblyManager with mocked dependencies."""
+    from solidedge_mcp.backends.assembly import AssemblyManager
+
+    dm = MagicMock()
+    doc = MagicMock()
+    dm.get_active_document.return_value = doc
+    return AssemblyManager(dm), doc
+
+
+def _occ(name):
+    occ = MagicMock()
+    occ.Name = name
+    occ.OccurrenceFileName = f"C:/parts/{name}.par"
+    return occ
+
+
+def _rel(rel_type, occ1, occ2=None, suppressed=False):
+    rel = MagicMock()
+    rel.Type = rel_type
+    rel.Status = 1
+    rel.Suppressed = suppressed
+    rel.OccurrencePart1 = occ1
+    rel.OccurrencePart2 = occ2
+    return rel
+
+
+def _setup(doc, occs, rels):
+    occurrences = MagicMock()
+    occurrences.Count = len(occs)
+    occurrences.Item.side_effect = lambda i: occs[i - 1]
+    doc.Occurrences = occurrences
+
+    relations = MagicMock()
+    relations.Count = len(rels)
+    relations.Item.side_effect = lambda i: rels[i - 1]
+    doc.Relations3d = relations
+
+
+@pytest.fixture
+def chain(asm_mgr):
+    """Base grounded; A axial+planar to base; B planar to A; C unrelated."""
+    am, doc = asm_mgr
+    base, a, b, c = _occ("base"), _occ("a"), _occ("b"), _occ("c")
+    rels = [
+        _rel(0, base),  # Ground
+        _rel(1, a, base),  # Axial
+        _rel(2, a, base),  # Planar
+        _rel(2, b, a),  # Planar
+    ]
+    _setup(doc, [base, a, b, c], rels)
+    return am, doc
+
+
+# ============================================================================
+# RELATION GRAPH
+# ============================================================================
+
+
+class TestGetRelationGraph:
+    def test_success(self, chain):
+        am, _ = chain
+        result = am.get_relation_graph()
+        assert result["node_count"] == 4
+        assert result["edge_count"] == 4
+        assert result["grounded_count"] == 1
+        assert result["nodes"][0]["grounded"] is True
+        assert result["relation_type_counts"] == {"Ground": 1, "Axial": 1, "Planar": 2}
+        edge = result["edges"][1]
+        assert edge["type_name"] == "Axial"
+        assert edge["occurrence1_index"] == 1
+        assert edge["occurrence2_index"] == 0
+        assert edge["dof_removed"] == 4
+
+    def test_unresolved_occurrence(self, asm_mgr):
+        am, doc = asm_mgr
+        a = _occ("a")
+        _setup(doc, [a], [_rel(2, a, _occ("sub:1"))])
+        result = am.get_relation_graph()
+        assert result["unresolved_count"] == 1
+        assert result["edges"][0]["occurrence2_index"] is None
+        assert result["edges"][0]["occurrence2_name"] == "sub:1"
+
+    def test_not_assembly(self, asm_mgr):
+        am, doc = asm_mgr
+        del doc.Relations3d
+        result = am.get_relation_graph()
+        assert "error" in result
+
+
+# ============================================================================
+# DEGREES OF FREEDOM
+# ============================================================================
+
+
+class TestGetRelationDof:
+    def test_all_components(self, chain):
+        am, _ = chain
+        result = am.get_relation_dof()
+        dof = {d["index"]: d["remaining_dof"] for d in result["components"]}
+        # Axial + Planar insert leaves rotation about the axis free
+        assert dof == {0: 0, 1: 1, 2: 3, 3: 6}
+        assert result["under_constrained"] == [1, 2, 3]
+        assert result["over_constrained"] == []
+
+    def test_single_component(self, chain):
+        am, _ = chain
+        result = am.get_relation_dof(2)
+        assert result["index"] == 2
+        assert result["relation_count"] == 1
+
+    def test_excess_constraints(self, asm_mgr):
+        am, doc = asm_mgr
+        a, b = _occ("a"), _occ("b")
+        _setup(doc, [a, b], [_rel(1, a, b), _rel(1, a, b)])
+        result = am.get_relation_dof()
+        # a is placed first; b carries both axials relative to it
+        assert result["components"][0]["remaining_dof"] == 6
+        assert result["components"][1]["remaining_dof"] == 0
+        assert result["components"][1]["excess_constraints"] == 1
+        assert result["over_constrained"] == [1]
+
+    def test_suppressed_ignored(self, asm_mgr):
+        am, doc = asm_mgr
+        a, b = _occ("a"), _occ("b")
+        _setup(doc, [a, b], [_rel(1, a, b, suppressed=True)])
+        result = am.get_relation_dof(0)
+        assert result["remaining_dof"] == 6
+
+    def test_invalid_index(self, chain):
+        am, _ = chain
+        result = am.get_relation_dof(10)
+        assert "error" in result
+
+
+# ============================================================================
+# REDUNDANT RELATIONS
+# ============================================================================
+
+
+class TestFindRedundantRelations:
+    def test_tree_has_no_cycles(self, chain):
+        am, _ = chain
+        result = am.find_redundant_relations()
+        assert result["cycle_count"] == 0
+        assert result["redundant_pair_count"] == 0
+
+    def test_redundant_pair(self, asm_mgr):
+        am, doc = asm_mgr
+        a, b = _occ("a"), _occ("b")
+        _setup(doc, [a, b], [_rel(1, a, b), _rel(1, a, b)])
+        result = am.find_redundant_relations()
+        pair = result["redundant_pairs"][0]
+        assert pair["occurrence1_index"] == 0
+        assert pair["occurrence2_index"] == 1
+        assert pair["relation_indices"] == [0, 1]
+        assert pair["excess_constraints"] == 1
+
+    def test_overconstrained_loop(self, asm_mgr):
+        am, doc = asm_mgr
+        a, b, c = _occ("a"), _occ("b"), _occ("c")
+        rels = [_rel(1, a, b), _rel(1, b, c), _rel(1, c, a), _rel(2, c, a)]
+        _setup(doc, [a, b, c], rels)
+        result = am.find_redundant_relations()
+        assert result["overconstrained_cycle_count"] >= 1
+        worst = result["cycles"][0]
+        assert worst["classification"] == "overconstrained"
+        assert worst["mobility"] < 0
+
+    def test_grounded_parts_merge(self, asm_mgr):
+        am, doc = asm_mgr
+        g1, g2, a = _occ("g1"), _occ("g2"), _occ("a")
+        rels = [_rel(0, g1), _rel(0, g2), _rel(1, a, g1), _rel(1, a, g2)]
+        _setup(doc, [g1, g2, a], rels)
+        result = am.find_redundant_relations()
+        # Both axials act between a and the same (ground) body
+        assert result["cycle_count"] == 0
+        pair = result["redundant_pairs"][0]
+        assert pair["includes_ground"] is True
+        assert pair["occurrence2_index"] == 2
+
+    def test_loop_through_ground(self, asm_mgr):
+        am, doc = asm_mgr
+        g, a, b = _occ("g"), _occ("a"), _occ("b")
+        rels = [_rel(0, g), _rel(1, a, g), _rel(1, b, g), _rel(2, a, b)]
+        _setup(doc, [g, a, b], rels)
+        result = am.find_redundant_relations()
+        assert result["cycle_count"] == 1
+        assert result["cycles"][0]["includes_ground"] is True
+        assert result["cycles"][0]["occurrence_indices"] == [1, 2]
+
+    def test_max_cycles(self, asm_mgr):
+        am, doc = asm_mgr
+        occs = [_occ(n) for n in "abcd"]
+        rels = [_rel(1, occs[i], occs[j]) for i in range(4) for j in range(i + 1, 4)]
+        _setup(doc, occs, rels)
+        assert am.find_redundant_relations(max_cycles=0)["cycle_count"] == 3
+        assert am.find_redundant_relations(max_cycles=2)["cycle_count"] == 2
+
+
+# ============================================================================
+# RIGID GROUPS
+# ============================================================================
+
+
+class TestGetRigidGroups:
+    def test_groups(self, chain):
+        am, _ = chain
+        result = am.get_rigid_groups()
+        assert result["rigid_groups"] == [{"occurrence_indices": [0], "grounded": True}]
+        assert result["connected_groups"][0] == {
+            "occurrence_indices": [0, 1, 2],
+            "grounded": True,
+        }
+        assert result["floating_groups"] == [[3]]
+
+    def test_fully_constrained_pair_is_rigid(self, asm_mgr):
+        am, doc = asm_mgr
+        a, b, c = _occ("a"), _occ("b"), _occ("c")
+        rels = [_rel(2, a, b), _rel(2, a, b), _rel(2, a, b), _rel(3, b, c)]
+        _setup(doc, [a, b, c], rels)
+        result = am.get_rigid_groups()
+        assert result["rigid_groups"] == [{"occurrence_indices": [0, 1], "grounded": False}]
+        assert result["floating_groups"] == [[0, 1, 2]]
+
+    def test_not_assembly(self, asm_mgr):
+        am, doc = asm_mgr
+        del doc.Occurrences
+        result = am.get_rigid_groups()
+        assert "error" in result
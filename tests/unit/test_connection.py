@@ -369,3 +369,113 @@ class TestRunMacro:
         conn.application.RunMacro.side_effect = Exception("Macro not found")
         result = conn.run_macro("C:/macros/nonexistent.bas")
         assert "error" in result
+
+
+# ============================================================================
+# PERFORMANCE SCOPE
+# ============================================================================
+
+
+class _FlagApp:
+    """Application stand-in with real attribute values and optional COM failures."""
+
+    def __init__(self, fail_set=(), fail_get=()):
+        object.__setattr__(self, "log", [])
+        object.__setattr__(self, "fail_set", set(fail_set))
+        object.__setattr__(self, "fail_get", set(fail_get))
+        object.__setattr__(
+            self,
+            "values",
+            {
+                "DelayCompute": False,
+                "ScreenUpdating": True,
+                "Interactive": True,
+                "DisplayAlerts": True,
+            },
+        )
+
+    def __getattr__(self, name):
+        if name in self.fail_get:
+            raise Exception(f"COM error reading {name}")
+        return self.values[name]
+
+    def __setattr__(self, name, value):
+        if name in self.fail_set:
+            raise Exception(f"COM error setting {name}")
+        self.log.append((name, value))
+        self.values[name] = value
+
+
+@pytest.fixture
+def flag_conn():
+    c = SolidEdgeConnection()
+    c.application = _FlagApp()
+    c._is_connected = True
+    return c
+
+
+class TestPerformanceScope:
+    def test_defaults_and_restore(self, flag_conn):
+        app = flag_conn.application
+        with flag_conn.performance_scope() as applied:
+            assert app.values["ScreenUpdating"] is False
+            assert app.values["DisplayAlerts"] is False
+            assert app.values["DelayCompute"] is False
+            assert applied == {"screen_updating": False, "display_alerts": False}
+        assert app.values["ScreenUpdating"] is True
+        assert app.values["DisplayAlerts"] is True
+
+    def test_restores_on_exception(self, flag_conn):
+        app = flag_conn.application
+        with pytest.raises(RuntimeError), flag_conn.performance_scope(delay_compute=True):
+            assert app.values["DelayCompute"] is True
+            raise RuntimeError("boom")
+        assert app.values["DelayCompute"] is False
+        assert app.values["ScreenUpdating"] is True
+
+    def test_nested_scope_skips_held_flags(self, flag_conn):
+        app = flag_conn.application
+        with flag_conn.performance_scope():
+            app.log.clear()
+            with flag_conn.performance_scope() as inner:
+                assert inner == {}
+            assert app.log == []
+            assert app.values["ScreenUpdating"] is False
+        assert app.values["ScreenUpdating"] is True
+
+    def test_nested_scope_restores_only_its_own_flags(self, flag_conn):
+        app = flag_conn.application
+        with flag_conn.performance_scope():
+            with flag_conn.performance_scope(delay_compute=True, screen_updating=True):
+                assert app.values["DelayCompute"] is True
+                assert app.values["ScreenUpdating"] is True
+            assert app.values["DelayCompute"] is False
+            assert app.values["ScreenUpdating"] is False
+            with flag_conn.performance_scope() as again:
+                assert again == {}
+        assert app.values["ScreenUpdating"] is True
+
+    def test_com_error_on_set_is_skipped(self):
+        c = SolidEdgeConnection()
+        c.application = _FlagApp(fail_set={"ScreenUpdating"})
+        c._is_connected = True
+        with c.performance_scope() as applied:
+            assert applied == {"display_alerts": False}
+        assert c.application.values["DisplayAlerts"] is True
+        assert c._performance_state == {}
+
+    def test_com_error_on_read_is_skipped(self):
+        c = SolidEdgeConnection()
+        c.application = _FlagApp(fail_get={"DisplayAlerts"})
+        c._is_connected = True
+        with c.performance_scope() as applied:
+            assert applied == {"screen_updating": False}
+        assert c.application.values["DisplayAlerts"] is True
+
+    def test_not_connected_runs_block(self):
+        c = SolidEdgeConnection()
+        ran = False
+        with c.performance_scope() as applied:
+            ran = True
+        assert ran
+        assert applied == {}
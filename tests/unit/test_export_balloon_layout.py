@@ -0,0 +1,143 @@
+"""
+Unit tests for ExportManager automatic balloon layout.
+
+Tests layout_balloons (ring candidates, collision avoidance against
+geometry and other balloons, sheet bounds, timing on large item counts) and
+BalloonLayoutMixin.auto_balloon_view (view range, geometry collection,
+dry run, bulk placement). Uses unittest.mock to simulate COM objects.
+"""
+
+import math
+import random
+import time
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+from solidedge_mcp.backends.export._balloon_layout import layout_balloons
+
+VIEW = (0.10, 0.10, 0.25, 0.20)
+
+
+def _min_separation(placed):
+    return min(
+        math.hypot(a["x"] - b["x"], a["y"] - b["y"])
+        for i, a in enumerate(placed)
+        for b in placed[i + 1 :]
+    )
+
+
+def _outside(p, box):
+    return not (box[0] < p["x"] < box[2] and box[1] < p["y"] < box[3])
+
+
+class TestLayoutBalloons:
+    def test_hundreds_of_items_fast_and_separated(self):
+        rng = random.Random(7)
+        anchors = [(rng.uniform(0.1, 0.25), rng.uniform(0.1, 0.2)) for _ in range(300)]
+        start = time.perf_counter()
+        result = layout_balloons(VIEW, anchors, radius=0.003, gap=0.001)
+        elapsed = time.perf_counter() - start
+
+        assert all(r is not None for r in result)
+        assert _min_separation(result) >= 2 * 0.003 + 0.001 - 1e-9
+        assert all(_outside(r, VIEW) for r in result)
+        assert elapsed < 0.5
+
+    def test_balloon_near_its_anchor(self):
+        result = layout_balloons(VIEW, [(0.25, 0.15)], margin=0.01)
+        assert result[0]["ring"] == 0
+        assert result[0]["x"] > 0.25
+        assert result[0]["y"] == pytest.approx(0.15, abs=0.01)
+
+    def test_avoids_geometry(self):
+        # A dimension line running just right of the view, through ring 0
+        line = ("segment", 0.264, 0.0, 0.264, 0.3)
+        result = layout_balloons(VIEW, [(0.25, 0.15)], [line], radius=0.004, margin=0.01)
+        assert abs(result[0]["x"] - 0.264) >= 0.004
+
+    def test_avoids_circles(self):
+        circle = ("circle", 0.30, 0.15, 0.036)
+        result = layout_balloons(VIEW, [(0.25, 0.15)], [circle], radius=0.004, margin=0.01)
+        d = math.hypot(result[0]["x"] - 0.30, result[0]["y"] - 0.15)
+        assert abs(d - 0.036) >= 0.004
+
+    def test_respects_sheet_bounds(self):
+        sheet = (0.0, 0.0, 0.27, 0.3)
+        anchors = [(0.25, 0.12 + i * 0.005) for i in range(10)]
+        result = layout_balloons(VIEW, anchors, sheet_box=sheet)
+        assert all(r["x"] <= 0.27 - 0.004 for r in result)
+
+    def test_unplaceable_returns_none(self):
+        anchors = [(0.2, 0.15)] * 50
+        result = layout_balloons((0, 0, 0.01, 0.01), anchors, max_rings=1)
+        assert None in result
+
+
+@pytest.fixture
+def export_mgr():
+    """ExportManager over a draft with one view and some sheet geometry."""
+    from solidedge_mcp.backends.export import ExportManager
+
+    dm = MagicMock()
+    doc = MagicMock()
+    dm.get_active_document.return_value = doc
+    dm.connection.get_application.return_value.ScreenUpdating = True
+
+    sheet = doc.ActiveSheet
+    sheet.SheetWidth, sheet.SheetHeight = 0.42, 0.297
+    view = MagicMock()
+    view.Range.return_value = (0.25, 0.20, 0.10, 0.10)
+    sheet.DrawingViews.Count = 1
+    sheet.DrawingViews.Item.return_value = view
+
+    lines = [
+        SimpleNamespace(StartX=0.0, StartY=0.08, EndX=0.4, EndY=0.08),
+        SimpleNamespace(StartX=0.9, StartY=0.9, EndX=1.0, EndY=1.0),
+    ]
+    sheet.Lines2d.Count = len(lines)
+    sheet.Lines2d.Item.side_effect = lambda i: lines[i - 1]
+    sheet.Circles2d.Count = 0
+    sheet.Arcs2d.Count = 0
+    sheet.Balloons.Count = 0
+    return ExportManager(dm), sheet
+
+
+class TestAutoBalloonView:
+    ITEMS = [{"text": str(i), "x": 0.1 + i * 0.01, "y": 0.15} for i in range(1, 10)]
+
+    def test_dry_run(self, export_mgr):
+        em, sheet = export_mgr
+        result = em.auto_balloon_view(0, self.ITEMS, dry_run=True)
+        assert result["status"] == "dry_run"
+        assert result["view_box"] == [0.10, 0.10, 0.25, 0.20]
+        assert result["obstacles"] == 1  # far-away line filtered out
+        assert len(result["layout"]) == 9
+        sheet.Balloons.Add.assert_not_called()
+
+    def test_places_in_bulk(self, export_mgr):
+        em, sheet = export_mgr
+        result = em.auto_balloon_view(0, self.ITEMS)
+        assert result["status"] == "placed"
+        assert result["added"] == 9
+        assert sheet.Balloons.Add.call_count == 9
+        # Leader runs from the anchor to the balloon
+        first = result["layout"][0]
+        sheet.Balloons.Add.assert_any_call(*first["anchor"], 0, *first["position"], 0)
+
+    def test_view_box_override(self, export_mgr):
+        em, sheet = export_mgr
+        sheet.DrawingViews.Item.return_value.Range.side_effect = Exception("no range")
+        assert "view_box" in em.auto_balloon_view(0, self.ITEMS)["error"]
+        result = em.auto_balloon_view(0, self.ITEMS, view_box=[0.1, 0.1, 0.2, 0.2], dry_run=True)
+        assert result["view_box"] == [0.1, 0.1, 0.2, 0.2]
+
+    def test_bad_items(self, export_mgr):
+        em, _ = export_mgr
+        assert "error" in em.auto_balloon_view(0, [{"text": "1"}])
+        assert "error" in em.auto_balloon_view(0, [])
+
+    def test_invalid_view(self, export_mgr):
+        em, _ = export_mgr
+        assert "Invalid view index" in em.auto_balloon_view(3, self.ITEMS)["error"]
@@ -0,0 +1,215 @@
+"""
+Unit tests for ExportManager batch drawing generation.
+
+Tests BatchDraftingMixin: layout loading and validation, per-model draft
+creation (views, parts list, title-block properties, save, PDF), skipping
+existing drafts, error isolation, and JSONL result streaming.
+Uses unittest.mock to simulate COM objects.
+"""
+
+import json
+from unittest.mock import MagicMock
+
+import pytest
+
+from solidedge_mcp.backends.export._batch_drafting import _draft_stems, _load_layout
+
+
+@pytest.fixture
+def batch(tmp_path):
+    """ExportManager whose application creates mock drafts."""
+    from solidedge_mcp.backends.export import ExportManager
+
+    models = tmp_path / "models"
+    models.mkdir()
+    for name in ("bracket.par", "frame.asm"):
+        (models / name).write_text(name)
+
+    drafts = []
+
+    def add_draft(template):
+        draft = MagicMock()
+        draft.template = template
+        custom = MagicMock()
+        custom.Name = "Custom"
+        custom.Count = 0
+        draft.Properties.Count = 1
+        draft.Properties.Item.return_value = custom
+        drafts.append(draft)
+        return draft
+
+    dm = MagicMock()
+    app = dm.connection.get_application.return_value
+    app.ScreenUpdating = True
+    app.Documents.Add.side_effect = add_draft
+    return ExportManager(dm), app, drafts, models, tmp_path / "out"
+
+
+# ============================================================================
+# LAYOUT
+# ============================================================================
+
+
+class TestLoadLayout:
+    def test_default(self):
+        layout = _load_layout(None)
+        assert [v["orientation"] for v in layout["views"]] == [
+            "Front",
+            "Top",
+            "Right",
+            "Isometric",
+        ]
+
+    def test_from_file_merges_defaults(self, tmp_path):
+        f = tmp_path / "layout.json"
+        f.write_text(json.dumps({"views": [{"orientation": "Iso", "x": 0.2, "y": 0.1}]}))
+        layout = _load_layout(str(f))
+        assert len(layout["views"]) == 1
+        assert layout["scale"] == 1.0
+
+    def test_invalid_orientation(self):
+        with pytest.raises(ValueError, match="invalid orientation"):
+            _load_layout({"views": [{"orientation": "Diagonal", "x": 0, "y": 0}]})
+
+    def test_missing_position(self):
+        with pytest.raises(ValueError, match="required"):
+            _load_layout({"views": [{"orientation": "Top"}]})
+
+    def test_malformed_views(self):
+        with pytest.raises(ValueError, match="must be a list"):
+            _load_layout({"views": "Front"})
+        with pytest.raises(ValueError, match="must be an object"):
+            _load_layout({"views": ["Front"]})
+
+
+class TestDraftStems:
+    def test_unique_stems_unchanged(self):
+        assert _draft_stems(["C:/m/a.par", "C:/m/b.asm"]) == {"C:/m/a.par": "a", "C:/m/b.asm": "b"}
+
+    def test_extension_added(self):
+        stems = _draft_stems(["C:/m/bracket.par", "C:/m/Bracket.psm"])
+        assert stems == {"C:/m/bracket.par": "bracket_par", "C:/m/Bracket.psm": "Bracket_psm"}
+
+    def test_folder_added(self):
+        stems = _draft_stems(["C:/a/bracket.par", "C:/b/bracket.par"])
+        assert stems == {"C:/a/bracket.par": "a_bracket_par", "C:/b/bracket.par": "b_bracket_par"}
+
+    def test_counter_as_last_resort(self):
+        stems = _draft_stems(["C:/m/x_par.asm", "C:/m/x.par", "C:/m/x.psm"])
+        assert sorted(stems.values(), key=str.lower) == ["x_par", "x_par_2", "x_psm"]
+
+
+# ============================================================================
+# GENERATE DRAWINGS
+# ============================================================================
+
+
+class TestGenerateDrawings:
+    def test_one_draft_per_model(self, batch):
+        em, app, drafts, models, out = batch
+        result = em.generate_drawings(
+            [str(models / "bracket.par"), str(models / "frame.asm")],
+            str(out),
+            layout={
+                "views": [
+                    {"orientation": "Front", "x": 0.1, "y": 0.1},
+                    {"orientation": "Top", "x": 0.1, "y": 0.2, "scale": 0.5},
+                ],
+                "parts_list": {"auto_balloon": False},
+                "properties": {"Title": "{stem}", "Drawn By": "cad"},
+            },
+            export_pdf=True,
+        )
+        assert result["status"] == "completed"
+        assert result["counts"] == {"created": 2}
+        assert out.is_dir()
+
+        part, asm = drafts
+        assert part.ActiveSheet.DrawingViews.AddPartView.call_count == 2
+        scales = [c.args[2] for c in part.ActiveSheet.DrawingViews.AddPartView.call_args_list]
+        assert scales == [1.0, 0.5]
+        assert asm.ActiveSheet.DrawingViews.AddAssemblyView.call_count == 2
+        asm.ActiveSheet.PartsLists.Add.assert_called_once()
+        part.ActiveSheet.PartsLists.Add.assert_not_called()
+
+        assert part.SummaryInfo.Title == "bracket"
+        part.Properties.Item.return_value.Add.assert_called_once_with("Drawn By", "cad")
+
+        saved = [c.args[0] for c in part.SaveAs.call_args_list]
+        assert saved == [str(out / "bracket.dft"), str(out / "bracket.pdf")]
+        part.Close.assert_called_once_with(False)
+        assert app.ScreenUpdating is True
+
+    def test_existing_draft_skipped(self, batch):
+        em, _, drafts, models, out = batch
+        out.mkdir()
+        (out / "bracket.dft").write_text("old")
+        result = em.generate_drawings([str(models / "bracket.par")], str(out))
+        assert result["results"][0]["status"] == "skipped"
+        assert drafts == []
+
+        result = em.generate_drawings([str(models / "bracket.par")], str(out), overwrite=True)
+        assert result["results"][0]["status"] == "created"
+
+    def test_failure_isolated_and_streamed(self, batch, tmp_path):
+        em, app, drafts, models, out = batch
+        log = tmp_path / "results.jsonl"
+
+        def add_draft(template):
+            draft = MagicMock()
+            if not drafts:
+                draft.ModelLinks.Add.side_effect = Exception("link failed")
+            drafts.append(draft)
+            return draft
+
+        app.Documents.Add.side_effect = add_draft
+        result = em.generate_drawings(
+            [str(models / "bracket.par"), str(models / "missing.par"), str(models / "frame.asm")],
+            str(out),
+            results_path=str(log),
+        )
+        statuses = [r["status"] for r in result["results"]]
+        assert statuses == ["error", "error", "created"]
+        assert "link failed" in result["results"][0]["error"]
+        drafts[0].Close.assert_called_once_with(False)
+
+        lines = [json.loads(line) for line in log.read_text().splitlines()]
+        assert [line["status"] for line in lines] == statuses
+
+    def test_duplicate_stems_get_unique_drafts(self, batch):
+        em, _, drafts, models, out = batch
+        (models / "bracket.psm").write_text("sheet metal")
+        other = models.parent / "left"
+        other.mkdir()
+        (other / "bracket.par").write_text("other")
+        paths = [
+            str(models / "bracket.par"),
+            str(models / "bracket.psm"),
+            str(other / "bracket.par"),
+        ]
+        result = em.generate_drawings(paths, str(out), overwrite=True)
+        assert result["counts"] == {"created": 3}
+        saved = [d.SaveAs.call_args.args[0] for d in drafts]
+        assert saved == [
+            str(out / "models_bracket_par.dft"),
+            str(out / "models_bracket_psm.dft"),
+            str(out / "left_bracket_par.dft"),
+        ]
+
+    def test_template_used(self, batch, tmp_path):
+        em, _, drafts, models, out = batch
+        template = tmp_path / "A3.dft"
+        template.write_text("t")
+        em.generate_drawings(
+            [str(models / "bracket.par")], str(out), layout={"template": str(template)}
+        )
+        assert drafts[0].template == str(template)
+
+    def test_invalid_layout(self, batch):
+        em, _, _, models, out = batch
+        result = em.generate_drawings([str(models / "bracket.par")], str(out), layout="nope.json")
+        assert "Invalid layout" in result["error"]
+
+    def test_no_models(self, batch):
+        em, _, _, _, out = batch
+        assert "No model paths" in em.generate_drawings([], str(out))["error"]
@@ -0,0 +1,122 @@
+"""
+Unit tests for ExportManager bulk annotation placement.
+
+Tests BulkAnnotationsMixin: heterogeneous specs mapped to the right sheet
+collections and COM calls, view-relative offsets, sheet selection,
+per-item errors, and screen-update suspension.
+Uses unittest.mock to simulate COM objects.
+"""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+
+@pytest.fixture
+def export_mgr():
+    """Create ExportManager with a mocked draft and application."""
+    from solidedge_mcp.backends.export import ExportManager
+
+    dm = MagicMock()
+    doc = MagicMock()
+    app = MagicMock()
+    app.ScreenUpdating = True
+    dm.get_active_document.return_value = doc
+    dm.connection.get_application.return_value = app
+    return ExportManager(dm), doc, app
+
+
+class TestAddAnnotationsBulk:
+    def test_mixed_specs(self, export_mgr):
+        em, doc, app = export_mgr
+        sheet = doc.ActiveSheet
+        sheet.Balloons.Count = 1
+        sheet.Dimensions.Count = 2
+        specs = [
+            {"type": "balloon", "x": 0.1, "y": 0.2, "text": "7", "leader_x": 0.05, "leader_y": 0.1},
+            {"type": "dimension", "x1": 0.0, "y1": 0.0, "x2": 0.05, "y2": 0.0},
+            {
+                "type": "radial_dimension",
+                "center_x": 0.1,
+                "center_y": 0.1,
+                "point_x": 0.12,
+                "point_y": 0.1,
+            },
+            {"type": "center_mark", "x": 0.1, "y": 0.1},
+            {"type": "geometric_tolerance", "x": 0.2, "y": 0.2, "tolerance_text": "0.05 A"},
+        ]
+        result = em.add_annotations_bulk(specs)
+
+        assert result["status"] == "added"
+        assert result["added"] == 5
+        sheet.Balloons.Add.assert_called_once_with(0.05, 0.1, 0, 0.1, 0.2, 0)
+        assert sheet.Balloons.Add.return_value.BalloonText == "7"
+        sheet.Dimensions.AddLength.assert_called_once_with(
+            0.0, 0.0, 0, 0.05, 0.0, 0, 0.025, 0.02, 0
+        )
+        sheet.Dimensions.AddRadial.assert_called_once()
+        sheet.CenterMarks.Add.assert_called_once_with(0.1, 0.1, 0)
+        assert sheet.FCFs.Add.return_value.Text == "0.05 A"
+        assert result["created"][0]["collection"] == "Balloons"
+        assert result["created"][0]["collection_index"] == 0
+        assert app.ScreenUpdating is True
+        em.doc_manager.connection.performance_scope.assert_called_once_with()
+
+    def test_view_offset(self, export_mgr):
+        em, doc, _ = export_mgr
+        sheet = doc.ActiveSheet
+        sheet.DrawingViews.Count = 1
+        view = sheet.DrawingViews.Item.return_value
+        view.OriginX, view.OriginY = 0.1, 0.2
+        em.add_annotations_bulk(
+            [{"type": "centerline", "x1": 0.0, "y1": 0.0, "x2": 0.01, "y2": 0.0}], view_index=0
+        )
+        sheet.Centerlines.Add.assert_called_once_with(0.1, 0.2, 0, pytest.approx(0.11), 0.2, 0)
+
+    def test_sheet_index(self, export_mgr):
+        em, doc, _ = export_mgr
+        doc.Sheets.Count = 2
+        em.add_annotations_bulk([{"type": "note", "x": 0, "y": 0, "text": "A"}], sheet_index=1)
+        doc.Sheets.Item.assert_called_with(2)
+        doc.Sheets.Item.return_value.TextBoxes.Add.assert_called_once()
+
+    def test_per_item_errors(self, export_mgr):
+        em, doc, _ = export_mgr
+        doc.ActiveSheet.Leaders.Add.side_effect = Exception("COM failure")
+        specs = [
+            {"type": "hatch"},
+            {"type": "dimension", "x1": 0, "y1": 0},
+            {"type": "weld_symbol", "x": 0, "y": 0, "weld_type": "laser"},
+            {"type": "leader", "x1": 0, "y1": 0, "x2": 1, "y2": 1},
+            {"type": "center_mark", "x": 0, "y": 0},
+        ]
+        result = em.add_annotations_bulk(specs)
+        assert result["status"] == "partial"
+        assert result["added"] == 1
+        messages = [e["error"] for e in result["errors"]]
+        assert "Unknown annotation type" in messages[0]
+        assert "Missing coordinate" in messages[1]
+        assert "Invalid weld_type" in messages[2]
+        assert "COM failure" in messages[3]
+
+    def test_stop_on_error(self, export_mgr):
+        em, _, _ = export_mgr
+        specs = [{"type": "hatch"}, {"type": "center_mark", "x": 0, "y": 0}]
+        result = em.add_annotations_bulk(specs, stop_on_error=True)
+        assert result["added"] == 0
+        assert len(result["errors"]) == 1
+
+    def test_invalid_view(self, export_mgr):
+        em, doc, _ = export_mgr
+        doc.ActiveSheet.DrawingViews.Count = 0
+        result = em.add_annotations_bulk([{"type": "note", "x": 0, "y": 0}], view_index=0)
+        assert "Invalid view index" in result["error"]
+
+    def test_empty(self, export_mgr):
+        em, _, _ = export_mgr
+        assert "No annotation specs" in em.add_annotations_bulk([])["error"]
+
+    def test_not_draft(self, export_mgr):
+        em, doc, _ = export_mgr
+        del doc.Sheets
+        assert "not a draft" in em.add_annotations_bulk([{"type": "note"}])["error"]
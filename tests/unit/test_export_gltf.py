@@ -0,0 +1,269 @@
+"""
+Unit tests for the glTF/GLB export backend.
+
+Tests GltfBuilder output (GLB framing, one aligned buffer, materials),
+matrix and color conversion, and export_to_gltf on parts and assemblies
+(instancing of repeated part files, hierarchy, face colors, facet cache).
+Uses unittest.mock to simulate COM objects.
+"""
+
+import json
+import struct
+from unittest.mock import MagicMock
+
+import pytest
+
+from solidedge_mcp.backends.export._gltf import GltfBuilder, node_matrix, ole_rgb
+from solidedge_mcp.backends.facet_cache import FacetArrays, FacetCache, split_facet_data
+
+# Two triangles in the XY plane on faces 7 and 8, per-facet normals
+_SQUARE = (
+    2,
+    (0.0, 0.0, 0.0, 1.0, 0.0, 0.0, 1.0, 1.0, 0.0, 0.0, 0.0, 0.0, 1.0, 1.0, 0.0, 0.0, 1.0, 0.0),
+    (0.0, 0.0, 1.0, 0.0, 0.0, 1.0),
+    (),
+    (),
+    (7, 8),
+)
+_RED = 0x0000FF
+_BLUE = 0xFF0000
+_IDENTITY = tuple(float(i % 5 == 0) for i in range(16))
+
+
+def _read_glb(data):
+    """(json document, binary chunk) of a GLB file."""
+    magic, version, length = struct.unpack_from("<III", data, 0)
+    assert magic == 0x46546C67
+    assert version == 2
+    assert length == len(data)
+    json_len, json_type = struct.unpack_from("<II", data, 12)
+    assert json_type == 0x4E4F534A
+    document = json.loads(data[20 : 20 + json_len])
+    binary = b""
+    if 20 + json_len < len(data):
+        bin_len, bin_type = struct.unpack_from("<II", data, 20 + json_len)
+        assert bin_type == 0x004E4942
+        binary = data[28 + json_len : 28 + json_len + bin_len]
+    return document, binary
+
+
+def _body(face_styles=None, color=_RED):
+    body = MagicMock()
+    body.Style.ForegroundColor = color
+    body.Volume = 0.001
+    body.GetRange.return_value = ((0.0, 0.0, 0.0), (1.0, 1.0, 0.0))
+    body.GetFacetData.return_value = _SQUARE
+    faces = []
+    for face_id, style in zip((7, 8), face_styles or (None, None), strict=True):
+        face = MagicMock()
+        face.ID = face_id
+        if style is None:
+            face.Style = None
+        else:
+            face.Style.ForegroundColor = style
+        faces.append(face)
+    body.Faces.return_value.Count = len(faces)
+    body.Faces.return_value.Item.side_effect = lambda i: faces[i - 1]
+    return body
+
+
+def _part_doc(body, full_name=""):
+    doc = MagicMock(spec=["Models", "Name", "FullName", "Dirty"])
+    doc.Name = "block.par"
+    doc.FullName = full_name
+    doc.Dirty = False
+    doc.Models.Count = 1
+    doc.Models.Item.return_value.Body = body
+    return doc
+
+
+def _occurrence(name, file_name, doc, matrix=None):
+    occ = MagicMock()
+    occ.Name = name
+    occ.IsSuppressed = False
+    occ.OccurrenceFileName = file_name
+    occ.OccurrenceDocument = doc
+    occ.GetMatrix.return_value = matrix or _IDENTITY
+    return occ
+
+
+def _collection(items):
+    collection = MagicMock()
+    collection.Count = len(items)
+    collection.Item.side_effect = lambda i: items[i - 1]
+    return collection
+
+
+@pytest.fixture
+def export_mgr(tmp_path):
+    """ExportManager with mocked dependencies and a private facet cache."""
+    from solidedge_mcp.backends.export import ExportManager
+
+    dm = MagicMock()
+    em = ExportManager(dm)
+    em._facet_cache = FacetCache(str(tmp_path / "facets"))
+    return em, dm
+
+
+class TestHelpers:
+    def test_ole_rgb(self):
+        assert ole_rgb(0x00336699) == (0x99, 0x66, 0x33)
+
+    def test_identity_matrix_omitted(self):
+        assert node_matrix([1, 0, 0, 0, 0, 1, 0, 0, 0, 0, 1, 0, 0, 0, 0, 1]) is None
+
+    def test_translation_column_major(self):
+        matrix = node_matrix([1, 0, 0, 0, 0, 1, 0, 0, 0, 0, 1, 0, 0.1, 0.2, 0.3, 1])
+        assert matrix[12:15] == [0.1, 0.2, 0.3]
+
+    def test_bad_matrix(self):
+        with pytest.raises(ValueError):
+            node_matrix([1.0, 0.0])
+
+
+class TestGltfBuilder:
+    def test_primitives_by_color(self):
+        builder = GltfBuilder()
+        facets = FacetArrays.from_arrays(*split_facet_data(_SQUARE))
+        primitives = []
+        builder.add_primitives(primitives, facets, (255, 0, 0), {8: (0, 0, 255)})
+        assert len(primitives) == 2
+        assert len(builder.materials) == 2
+        assert builder.accessors[primitives[0]["attributes"]["POSITION"]]["count"] == 3
+        assert builder.facet_count == 2
+
+    def test_single_aligned_buffer(self):
+        builder = GltfBuilder()
+        facets = FacetArrays.from_arrays(*split_facet_data(_SQUARE))
+        primitives = []
+        builder.add_primitives(primitives, facets, (255, 0, 0))
+        mesh = builder.add_mesh("block", primitives)
+        document, binary = _read_glb(builder.to_glb(builder.add_node({"mesh": mesh})))
+        assert len(document["buffers"]) == 1
+        assert document["buffers"][0]["byteLength"] <= len(binary)
+        assert len(binary) % 4 == 0
+        assert all(view["byteOffset"] % 4 == 0 for view in document["bufferViews"])
+        position = document["accessors"][0]
+        assert position["min"] == [0.0, 0.0, 0.0]
+        assert position["max"] == [1.0, 1.0, 0.0]
+        # Normals come out unit length along +Z
+        normal_view = document["bufferViews"][1]
+        offset = normal_view["byteOffset"]
+        normals = struct.unpack_from("<18f", binary, offset)
+        assert normals[:3] == (0.0, 0.0, 1.0)
+
+    def test_empty_mesh(self):
+        builder = GltfBuilder()
+        facets = FacetArrays.from_arrays(*split_facet_data((0, ())))
+        primitives = []
+        builder.add_primitives(primitives, facets, (255, 0, 0))
+        assert builder.add_mesh("empty", primitives) is None
+
+
+class TestExportToGltf:
+    def test_part(self, export_mgr, tmp_path):
+        em, dm = export_mgr
+        dm.get_active_document.return_value = _part_doc(_body(face_styles=(None, _BLUE)))
+        result = em.export_to_gltf(str(tmp_path / "block"))
+        assert result["status"] == "exported"
+        assert result["path"].endswith(".glb")
+        assert result["mesh_count"] == 1
+        assert result["material_count"] == 2
+        with open(result["path"], "rb") as f:
+            document, _binary = _read_glb(f.read())
+        root = document["nodes"][document["scenes"][0]["nodes"][0]]
+        assert root["mesh"] == 0
+        assert root["rotation"][0] < 0
+        names = {m["name"] for m in document["materials"]}
+        assert names == {"#ff0000", "#0000ff"}
+
+    def test_without_colors(self, export_mgr, tmp_path):
+        em, dm = export_mgr
+        dm.get_active_document.return_value = _part_doc(_body(face_styles=(None, _BLUE)))
+        result = em.export_to_gltf(str(tmp_path / "block.glb"), include_colors=False)
+        assert result["material_count"] == 1
+
+    def test_assembly_instances_repeated_parts(self, export_mgr, tmp_path):
+        em, dm = export_mgr
+        bolt_body = _body()
+        bolt = _part_doc(bolt_body)
+        plate = _part_doc(_body(color=_BLUE))
+        moved = (1.0, 0, 0, 0, 0, 1.0, 0, 0, 0, 0, 1.0, 0, 0.05, 0, 0, 1.0)
+        sub = MagicMock()
+        sub.Occurrences = _collection([_occurrence("bolt:3", "C:/p/bolt.par", bolt, moved)])
+        asm = MagicMock(spec=["Occurrences", "Name", "FullName"])
+        asm.Name = "top.asm"
+        asm.Occurrences = _collection(
+            [
+                _occurrence("bolt:1", "C:/p/bolt.par", bolt),
+                _occurrence("bolt:2", "C:/p/bolt.par", bolt, moved),
+                _occurrence("plate:1", "C:/p/plate.par", plate),
+                _occurrence("sub:1", "C:/p/sub.asm", sub),
+            ]
+        )
+        dm.get_active_document.return_value = asm
+
+        result = em.export_to_gltf(str(tmp_path / "top.glb"))
+        assert result["status"] == "exported"
+        assert result["occurrence_count"] == 4
+        assert result["unique_parts"] == 2
+        assert result["mesh_count"] == 2
+        bolt_body.GetFacetData.assert_called_once()
+
+        with open(result["path"], "rb") as f:
+            document, _binary = _read_glb(f.read())
+        nodes = {n["name"]: n for n in document["nodes"]}
+        assert nodes["bolt:1"]["mesh"] == nodes["bolt:2"]["mesh"] == nodes["bolt:3"]["mesh"]
+        assert nodes["plate:1"]["mesh"] != nodes["bolt:1"]["mesh"]
+        assert "matrix" not in nodes["bolt:1"]
+        assert nodes["bolt:2"]["matrix"][12] == 0.05
+        sub_children = nodes["sub:1"]["children"]
+        assert [document["nodes"][i]["name"] for i in sub_children] == ["bolt:3"]
+        assert len(nodes["top.asm"]["children"]) == 4
+
+    def test_suppressed_and_failing_occurrences(self, export_mgr, tmp_path):
+        em, dm = export_mgr
+        good = _occurrence("bolt:1", "C:/p/bolt.par", _part_doc(_body()))
+        hidden = _occurrence("bolt:2", "C:/p/bolt.par", _part_doc(_body()))
+        hidden.IsSuppressed = True
+        broken = _occurrence("bad:1", "C:/p/bad.par", _part_doc(_body()))
+        broken.GetMatrix.side_effect = Exception("no matrix")
+        asm = MagicMock(spec=["Occurrences", "Name", "FullName"])
+        asm.Name = "top.asm"
+        asm.Occurrences = _collection([good, hidden, broken])
+        dm.get_active_document.return_value = asm
+
+        result = em.export_to_gltf(str(tmp_path / "top.glb"))
+        assert result["occurrence_count"] == 1
+        assert result["skipped"] == [{"name": "bad:1", "error": "no matrix"}]
+
+    def test_inactive_occurrences_loaded(self, export_mgr, tmp_path):
+        em, dm = export_mgr
+        occ = _occurrence("bolt:1", "C:/p/bolt.par", _part_doc(_body()))
+        occ.Activate = False
+        asm = MagicMock(spec=["Occurrences", "Name", "FullName"])
+        asm.Name = "top.asm"
+        asm.Occurrences = _collection([occ])
+        dm.get_active_document.return_value = asm
+
+        result = em.export_to_gltf(str(tmp_path / "top.glb"))
+        assert occ.Activate is True
+        assert result["occurrence_count"] == 1
+        assert result["skipped"] == []
+
+    def test_reads_through_facet_cache(self, export_mgr, tmp_path):
+        em, dm = export_mgr
+        part = tmp_path / "block.par"
+        part.write_bytes(b"part file")
+        body = _body()
+        dm.get_active_document.return_value = _part_doc(body, str(part))
+        assert em.export_to_gltf(str(tmp_path / "a.glb"))["cached_bodies"] == 0
+        assert em.export_to_gltf(str(tmp_path / "b.glb"))["cached_bodies"] == 1
+        body.GetFacetData.assert_called_once()
+
+    def test_no_bodies(self, export_mgr, tmp_path):
+        em, dm = export_mgr
+        doc = _part_doc(_body())
+        doc.Models.Count = 0
+        dm.get_active_document.return_value = doc
+        assert "error" in em.export_to_gltf(str(tmp_path / "empty.glb"))
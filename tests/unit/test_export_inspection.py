@@ -0,0 +1,171 @@
+"""
+Unit tests for ExportManager dimension inspection reports.
+
+Tests InspectionReportMixin: one-pass extraction over sheets and views,
+view attribution of sheet dimensions, characteristic numbering across and
+per draft, CSV and JSON Lines output, background sheets, multi-draft runs
+with error isolation. Uses unittest.mock to simulate COM objects.
+"""
+
+import csv
+import json
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+
+def _dim(name, value, dim_type=1, **extra):
+    return SimpleNamespace(
+        Name=name,
+        Value=value,
+        DimensionType=dim_type,
+        PrefixString=extra.get("prefix", ""),
+        SuffixString="",
+        OverrideString=extra.get("override", ""),
+        PrimaryUpperTolerance=extra.get("upper"),
+        PrimaryLowerTolerance=extra.get("lower"),
+        DisplayType=extra.get("display", 0),
+    )
+
+
+def _collection(items):
+    coll = MagicMock()
+    coll.Count = len(items)
+    coll.Item.side_effect = lambda i: items[i - 1]
+    return coll
+
+
+def _make_draft(name="bracket.dft"):
+    """Two working sheets and one background sheet."""
+    d1 = _dim("D1", 0.05, upper="+0.1", lower="-0.1", display=2)
+    d2 = _dim("D2", 0.785398, dim_type=3)
+    d3 = _dim("D3", 0.01, dim_type=4, prefix="Ø")
+    loose = _dim("D4", 0.2, override="200 REF")
+
+    front = SimpleNamespace(Name="Front", Dimensions=_collection([d1, d2]))
+    detail = SimpleNamespace(Name="Detail A", Dimensions=_collection([d3]))
+    sheet1 = SimpleNamespace(
+        Name="Sheet1",
+        Background=False,
+        DrawingViews=_collection([front]),
+        Dimensions=_collection([d1, d2, loose]),
+    )
+    sheet2 = SimpleNamespace(
+        Name="Sheet2",
+        Background=False,
+        DrawingViews=_collection([detail]),
+        Dimensions=_collection([d3]),
+    )
+    background = SimpleNamespace(
+        Name="A3 Background",
+        Background=True,
+        DrawingViews=_collection([]),
+        Dimensions=_collection([_dim("B1", 1.0)]),
+    )
+    doc = MagicMock()
+    doc.FullName = name
+    doc.Sheets = _collection([sheet1, sheet2, background])
+    return doc
+
+
+@pytest.fixture
+def export_mgr():
+    from solidedge_mcp.backends.export import ExportManager
+
+    dm = MagicMock()
+    dm.get_active_document.return_value = _make_draft()
+    return ExportManager(dm), dm
+
+
+class TestActiveDraft:
+    def test_csv_rows(self, export_mgr, tmp_path):
+        em, _ = export_mgr
+        out = tmp_path / "report.csv"
+        result = em.export_dimension_report(str(out))
+        assert result["status"] == "completed"
+        assert result["rows"] == 4
+
+        rows = list(csv.DictReader(out.open(encoding="utf-8")))
+        assert [r["name"] for r in rows] == ["D1", "D2", "D4", "D3"]
+        assert [r["characteristic"] for r in rows] == ["1", "2", "3", "4"]
+        assert [r["view"] for r in rows] == ["Front", "Front", "", "Detail A"]
+        assert rows[0]["upper_tolerance"] == "+0.1"
+        assert rows[0]["type"] == "Linear"
+        assert rows[1]["units"] == "rad"
+        assert rows[2]["display_text"] == "200 REF"
+        assert rows[3]["display_text"] == "Ø0.01"
+        assert rows[3]["sheet_name"] == "Sheet2"
+
+    def test_jsonl_with_background(self, export_mgr, tmp_path):
+        em, _ = export_mgr
+        out = tmp_path / "report.jsonl"
+        result = em.export_dimension_report(str(out), include_background=True, start_number=100)
+        assert result["format"] == "jsonl"
+        rows = [json.loads(line) for line in out.read_text(encoding="utf-8").splitlines()]
+        assert len(rows) == 5
+        assert rows[-1]["name"] == "B1"
+        assert rows[-1]["characteristic"] == 104
+        assert rows[0]["draft"] == "bracket.dft"
+
+    def test_not_draft(self, export_mgr, tmp_path):
+        em, dm = export_mgr
+        dm.get_active_document.return_value = MagicMock(spec=["Name"])
+        result = em.export_dimension_report(str(tmp_path / "r.csv"))
+        assert "not a draft" in result["error"]
+
+    def test_invalid_format(self, export_mgr, tmp_path):
+        em, _ = export_mgr
+        assert "Invalid format" in em.export_dimension_report(str(tmp_path / "r.xlsx"))["error"]
+
+
+class TestManyDrafts:
+    @pytest.fixture
+    def vault(self, tmp_path):
+        vault = tmp_path / "vault"
+        (vault / "sub").mkdir(parents=True)
+        for name in ("a.dft", "sub/b.dft"):
+            (vault / name).write_text(name)
+        return vault
+
+    def test_numbering_and_isolation(self, export_mgr, vault, tmp_path):
+        em, dm = export_mgr
+        app = dm.connection.get_application.return_value
+        opened = []
+
+        def open_draft(path, flags):
+            if path.endswith("b.dft"):
+                raise Exception("corrupt")
+            doc = _make_draft(path)
+            opened.append((doc, flags))
+            return doc
+
+        app.Documents.Open.side_effect = open_draft
+        out = tmp_path / "r.csv"
+        result = em.export_dimension_report(
+            str(out), drafts=[str(vault / "**" / "*.dft"), str(vault / "missing.dft")]
+        )
+        statuses = [d["status"] for d in result["drafts"]]
+        assert statuses == ["extracted", "error", "error"]
+        assert result["rows"] == 4
+        doc, flags = opened[0]
+        assert flags == 0x8
+        doc.Close.assert_called_once_with(False)
+
+    def test_restart_numbering_and_append(self, export_mgr, vault, tmp_path):
+        em, dm = export_mgr
+        app = dm.connection.get_application.return_value
+        app.Documents.Open.side_effect = lambda path, flags: _make_draft(path)
+        out = tmp_path / "r.csv"
+        drafts = [str(vault / "a.dft"), str(vault / "sub" / "b.dft")]
+        em.export_dimension_report(str(out), drafts=drafts, restart_numbering=True)
+        em.export_dimension_report(str(out), drafts=drafts[:1], append=True)
+
+        rows = list(csv.DictReader(out.open(encoding="utf-8")))
+        assert len(rows) == 12
+        assert [r["characteristic"] for r in rows] == ["1", "2", "3", "4"] * 3
+
+    def test_no_match(self, export_mgr, vault, tmp_path):
+        em, _ = export_mgr
+        result = em.export_dimension_report(str(tmp_path / "r.csv"), drafts=[str(vault / "*.x")])
+        assert "No draft files" in result["error"]
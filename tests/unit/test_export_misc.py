@@ -1257,6 +1257,95 @@ class TestOpenInBackground:
         assert "not found" in result["error"]
 
 
+# ============================================================================
+# DOCUMENTS: OPEN ASSEMBLY LIGHTWEIGHT
+# ============================================================================
+
+
+class TestOpenAssemblyLightweight:
+    @pytest.fixture
+    def doc_mgr(self):
+        from solidedge_mcp.backends.documents import DocumentManager
+
+        conn = MagicMock()
+        app = MagicMock()
+        conn.get_application.return_value = app
+        params = {
+            "seApplicationGlobalAssemblyFileOpenPartActivation": 501,
+            "seApplicationGlobalAssemblyFileOpenSimplification": 502,
+        }
+        conn.resolve_constant.side_effect = params.get
+        globals_ = {501: 2, 502: 2}
+        app.GetGlobalParameter.side_effect = globals_.get
+        app.SetGlobalParameter.side_effect = globals_.__setitem__
+        doc = MagicMock()
+        doc.Name = "big.asm"
+        doc.Type = 3
+        app.Documents.Open.return_value = doc
+        return DocumentManager(conn), app, conn, globals_
+
+    @pytest.fixture
+    def asm_file(self, tmp_path):
+        f = tmp_path / "big.asm"
+        f.write_text("")
+        return str(f)
+
+    def test_sets_and_restores_globals(self, doc_mgr, asm_file):
+        dm, app, _, globals_ = doc_mgr
+        seen = {}
+        app.Documents.Open.side_effect = lambda *a: (
+            seen.update(globals_) or app.Documents.Open.return_value
+        )
+
+        result = dm.open_assembly_lightweight(asm_file)
+        assert result["status"] == "opened_lightweight"
+        assert result["type"] == "Assembly"
+        # InactivateAll=1, AllSimplified=0 while Open runs
+        assert seen == {501: 1, 502: 0}
+        # Previous LastSaved values restored afterwards
+        assert globals_ == {501: 2, 502: 2}
+        app.Documents.Open.assert_called_once_with(asm_file, 0x8)
+        assert dm.active_document is app.Documents.Open.return_value
+
+    def test_foreground_open(self, doc_mgr, asm_file):
+        dm, app, _, _ = doc_mgr
+        dm.open_assembly_lightweight(asm_file, "active", "designed", background=False)
+        app.Documents.Open.assert_called_once_with(asm_file)
+
+    def test_restores_globals_when_open_fails(self, doc_mgr, asm_file):
+        dm, app, _, globals_ = doc_mgr
+        app.Documents.Open.side_effect = Exception("open failed")
+        result = dm.open_assembly_lightweight(asm_file)
+        assert "error" in result
+        assert globals_ == {501: 2, 502: 2}
+
+    def test_unresolved_globals_are_reported(self, doc_mgr, asm_file):
+        dm, app, conn, _ = doc_mgr
+        conn.resolve_constant.side_effect = None
+        conn.resolve_constant.return_value = None
+        result = dm.open_assembly_lightweight(asm_file)
+        assert result["status"] == "opened_lightweight"
+        assert len(result["skipped_options"]) == 2
+        app.SetGlobalParameter.assert_not_called()
+
+    def test_invalid_activation(self, doc_mgr, asm_file):
+        dm, _, _, _ = doc_mgr
+        result = dm.open_assembly_lightweight(asm_file, activation="partial")
+        assert "error" in result
+
+    def test_rejects_non_assembly(self, doc_mgr, tmp_path):
+        dm, _, _, _ = doc_mgr
+        f = tmp_path / "p.par"
+        f.write_text("")
+        result = dm.open_assembly_lightweight(str(f))
+        assert "error" in result
+
+    def test_file_not_found(self, doc_mgr):
+        dm, _, _, _ = doc_mgr
+        result = dm.open_assembly_lightweight("C:\\nonexistent\\big.asm")
+        assert "not found" in result["error"]
+
+
 # ============================================================================
 # DOCUMENTS: CLOSE ALL DOCUMENTS
 # ============================================================================
@@ -1306,6 +1395,14 @@ class TestCloseAllDocuments:
         assert result["status"] == "closed_all"
         doc1.Save.assert_called_once()
         doc1.Close.assert_called_once()
+        dm.connection.performance_scope.assert_called_once_with(display_alerts=None)
+
+    def test_alerts_suppressed_when_discarding(self, doc_mgr):
+        dm, app = doc_mgr
+        app.Documents.Count = 1
+
+        dm.close_all_documents(save=False)
+        dm.connection.performance_scope.assert_called_once_with(display_alerts=False)
 
 
 # ============================================================================
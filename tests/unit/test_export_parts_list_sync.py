@@ -0,0 +1,208 @@
+"""
+Unit tests for ExportManager parts list sync.
+
+Tests PartsListSyncMixin: column detection, key normalization, BOM
+aggregation (excluded and pattern occurrences), diff of added, removed and
+changed rows, duplicate-key conflicts, cell-only quantity updates, in-place
+list update, dry run and opening an unloaded linked assembly. Uses
+unittest.mock to simulate COM objects.
+"""
+
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+from solidedge_mcp.backends.export._parts_list_sync import _part_key
+
+
+def _occ(path, include=True, pattern=False, document_number=None):
+    occ = SimpleNamespace(OccurrenceFileName=path, IncludeInBom=include, IsPatternItem=pattern)
+    if document_number is not None:
+        props = _Collection([SimpleNamespace(Name="Document Number", Value=document_number)])
+        props.Name = "ProjectInformation"
+        occ.OccurrenceDocument = SimpleNamespace(Properties=_Collection([props]))
+    return occ
+
+
+class _Collection:
+    """1-based COM-style collection."""
+
+    def __init__(self, items):
+        self._items = list(items)
+        self.Count = len(self._items)
+
+    def Item(self, i):
+        return self._items[i - 1]
+
+
+def _assembly(occurrences):
+    asm = MagicMock()
+    asm.Occurrences.Count = len(occurrences)
+    asm.Occurrences.Item.side_effect = lambda i: occurrences[i - 1]
+    return asm
+
+
+def _parts_list(headers, rows):
+    pl = MagicMock()
+    columns = [SimpleNamespace(HeaderRowValue=h) for h in headers]
+    pl.Columns.Count = len(columns)
+    pl.Columns.Item.side_effect = lambda c: columns[c - 1]
+    cells = {
+        (r + 1, c + 1): SimpleNamespace(value=v)
+        for r, row in enumerate(rows)
+        for c, v in enumerate(row)
+    }
+    pl.Rows.Count = len(rows)
+    pl.Cell.side_effect = lambda r, c: cells[(r, c)]
+    pl.cells = cells
+    return pl
+
+
+BOM = [
+    _occ("C:\\lib\\bolt.par"),
+    _occ("C:\\lib\\bolt.par"),
+    _occ("C:\\lib\\bolt.par", pattern=True),
+    _occ("C:\\lib\\plate.par"),
+    _occ("C:\\lib\\ref.par", include=False),
+]
+
+
+@pytest.fixture
+def export_mgr():
+    """Draft whose first parts list is linked to a loaded assembly."""
+    from solidedge_mcp.backends.export import ExportManager
+
+    dm = MagicMock()
+    doc = MagicMock()
+    dm.get_active_document.return_value = doc
+    pl = _parts_list(
+        ["Item Number", "File Name", "Quantity"],
+        [["1", "bolt.par", "2"], ["2", "plate.par", "1"]],
+    )
+    pl.DrawingView.ModelLink.ModelDocument = _assembly(list(BOM))
+    doc.ActiveSheet.PartsLists.Count = 1
+    doc.ActiveSheet.PartsLists.Item.return_value = pl
+    return ExportManager(dm), dm, pl
+
+
+class TestPartKey:
+    def test_normalizes(self):
+        assert _part_key("C:\\Lib\\Bolt.PAR") == "bolt"
+        assert _part_key("/lib/frame.asm") == "frame"
+        assert _part_key(" PN-100.A ") == "pn-100.a"
+        assert _part_key(None) == ""
+
+
+class TestSyncPartsList:
+    def test_in_sync_touches_nothing(self, export_mgr):
+        em, _, pl = export_mgr
+        result = em.sync_parts_list()
+        assert result["status"] == "in_sync"
+        assert result["unchanged"] == 2
+        assert result["key_column"] == "File Name"
+        pl.Update.assert_not_called()
+
+    def test_quantity_change_writes_only_that_cell(self, export_mgr):
+        em, _, pl = export_mgr
+        pl.DrawingView.ModelLink.ModelDocument = _assembly(
+            [*BOM, _occ("C:\\lib\\plate.par"), _occ("C:\\lib\\plate.par")]
+        )
+        result = em.sync_parts_list()
+        assert result["status"] == "updated_rows"
+        assert result["changed"] == [
+            {"key": "plate", "row": 1, "old_quantity": "1", "new_quantity": 3}
+        ]
+        assert result["rows_touched"] == 1
+        assert pl.cells[(2, 3)].value == "3"
+        assert pl.cells[(1, 3)].value == "2"
+        pl.Update.assert_not_called()
+
+    def test_added_and_removed_update_list(self, export_mgr):
+        em, _, pl = export_mgr
+        pl.DrawingView.ModelLink.ModelDocument = _assembly(
+            [_occ("C:\\lib\\bolt.par"), _occ("C:\\lib\\bolt.par"), _occ("C:\\lib\\nut.par")]
+        )
+        result = em.sync_parts_list()
+        assert result["status"] == "updated_list"
+        assert [a["key"] for a in result["added"]] == ["nut"]
+        assert [r["key"] for r in result["removed"]] == ["plate"]
+        pl.Update.assert_called_once()
+
+    def test_duplicate_keys_reported_as_conflicts(self, export_mgr):
+        em, _, _ = export_mgr
+        dup_pl = _parts_list(
+            ["Item Number", "File Name", "Quantity"],
+            [["1", "bolt.par", "2"], ["2", "plate.par", "5"], ["3", "C:\\old\\Plate.par", "1"]],
+        )
+        dup_pl.DrawingView.ModelLink.ModelDocument = _assembly(list(BOM))
+        sheet = em.doc_manager.get_active_document.return_value.ActiveSheet
+        sheet.PartsLists.Item.return_value = dup_pl
+        result = em.sync_parts_list()
+        assert result["conflicts"] == [{"key": "plate", "rows": [1, 2]}]
+        assert result["added"] == result["removed"] == result["changed"] == []
+        assert result["status"] == "in_sync"
+        assert dup_pl.cells[(2, 3)].value == "5"
+        dup_pl.Update.assert_not_called()
+
+    def test_dry_run(self, export_mgr):
+        em, _, pl = export_mgr
+        pl.DrawingView.ModelLink.ModelDocument = _assembly([_occ("C:\\lib\\bolt.par")])
+        result = em.sync_parts_list(dry_run=True)
+        assert result["status"] == "dry_run"
+        assert len(result["changed"]) == 1
+        assert pl.cells[(1, 3)].value == "2"
+        pl.Update.assert_not_called()
+
+    def test_opens_unloaded_assembly(self, export_mgr, tmp_path):
+        em, dm, pl = export_mgr
+        asm_path = tmp_path / "top.asm"
+        asm_path.write_text("asm")
+        link = pl.DrawingView.ModelLink
+        link.ModelDocument = None
+        link.FileName = str(asm_path)
+        opened = _assembly(list(BOM))
+        app = dm.connection.get_application.return_value
+        app.Documents.Open.return_value = opened
+
+        assert em.sync_parts_list()["status"] == "in_sync"
+        app.Documents.Open.assert_called_once_with(str(asm_path), 0x8)
+        opened.Close.assert_called_once_with(False)
+
+    def test_explicit_columns(self, export_mgr):
+        em, _, _ = export_mgr
+        result = em.sync_parts_list(key_column="file name", quantity_column="Quantity")
+        assert result["status"] == "in_sync"
+        assert (
+            "Column not found: Part Number" in em.sync_parts_list(key_column="Part Number")["error"]
+        )
+
+    def test_keyed_by_document_number(self, export_mgr):
+        em, _, _ = export_mgr
+        doc_pl = _parts_list(
+            ["Item Number", "Document Number", "Quantity"],
+            [["1", "PN-100", "2"], ["2", "PN-200", "1"]],
+        )
+        doc_pl.DrawingView.ModelLink.ModelDocument = _assembly(
+            [
+                _occ("C:\\lib\\bolt.par", document_number="PN-100"),
+                _occ("C:\\lib\\bolt.par", document_number="PN-100"),
+                _occ("C:\\lib\\plate.par", document_number="PN-200"),
+                _occ("C:\\lib\\plate.par", document_number="PN-200"),
+            ]
+        )
+        sheet = em.doc_manager.get_active_document.return_value.ActiveSheet
+        sheet.PartsLists.Item.return_value = doc_pl
+        result = em.sync_parts_list()
+        assert result["key_column"] == "Document Number"
+        assert result["added"] == []
+        assert result["removed"] == []
+        assert result["changed"] == [
+            {"key": "pn-200", "row": 1, "old_quantity": "1", "new_quantity": 2}
+        ]
+        assert result["status"] == "updated_rows"
+        doc_pl.Update.assert_not_called()
+
+    def test_invalid_index(self, export_mgr):
+        em, _, _ = export_mgr
+        assert "Invalid parts list index" in em.sync_parts_list(3)["error"]
@@ -0,0 +1,234 @@
+"""
+Unit tests for ExportManager batch draft publishing.
+
+Tests PublishingMixin: input expansion (folders, globs, duplicates), whole
+draft and per-sheet PDF/DXF export, view updates, skipping existing outputs,
+error isolation, the multi-instance worker pool and package PDF merging.
+Uses unittest.mock to simulate COM objects.
+"""
+
+import sys
+import threading
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+from solidedge_mcp.backends.export._publishing import _expand_draft_paths
+
+
+def _make_app(opened):
+    """Application mock whose Documents.Open returns a two-sheet draft."""
+    app = MagicMock()
+    app.ScreenUpdating = True
+
+    def open_draft(path):
+        doc = MagicMock()
+        doc.path = path
+        sheets = [MagicMock(), MagicMock()]
+        sheets[0].Name, sheets[1].Name = "Sheet1", "Detail: A"
+        doc.Sheets.Count = 2
+        doc.Sheets.Item.side_effect = lambda i: sheets[i - 1]
+        doc.sheets = sheets
+
+        def save_as(target):
+            with open(target, "w") as f:
+                f.write("%PDF" if target.endswith(".pdf") else "DXF")
+
+        doc.SaveAs.side_effect = save_as
+        opened.append(doc)
+        return doc
+
+    app.Documents.Open.side_effect = open_draft
+    return app
+
+
+@pytest.fixture
+def publisher(tmp_path):
+    """ExportManager over a folder of draft files."""
+    from solidedge_mcp.backends.export import ExportManager
+
+    release = tmp_path / "release"
+    release.mkdir()
+    for name in ("a.dft", "b.dft", "c.dft", "notes.txt"):
+        (release / name).write_text(name)
+
+    opened = []
+    dm = MagicMock()
+    dm.connection.get_application.return_value = _make_app(opened)
+    dm.connection.resolve_constant.return_value = None
+    return ExportManager(dm), dm, opened, release, tmp_path / "out"
+
+
+class TestExpandDraftPaths:
+    def test_folder_glob_and_duplicates(self, tmp_path):
+        for name in ("a.dft", "b.dft", "x.par"):
+            (tmp_path / name).write_text(name)
+        paths = _expand_draft_paths([str(tmp_path), str(tmp_path / "*.*"), str(tmp_path / "a.dft")])
+        assert paths == [str(tmp_path / "a.dft"), str(tmp_path / "b.dft")]
+
+    def test_explicit_missing_path_kept(self, tmp_path):
+        assert _expand_draft_paths([str(tmp_path / "gone.dft")]) == [str(tmp_path / "gone.dft")]
+
+
+class TestPublishDrafts:
+    def test_whole_drafts(self, publisher):
+        em, dm, opened, release, out = publisher
+        result = em.publish_drafts([str(release)], str(out), formats=["pdf", "DXF"])
+        assert result["status"] == "completed"
+        assert result["counts"] == {"published": 3}
+
+        saved = [c.args[0] for c in opened[0].SaveAs.call_args_list]
+        assert saved == [str(out / "a.pdf"), str(out / "a.dxf")]
+        opened[0].Close.assert_called_once_with(False)
+        opened[0].UpdateAll.assert_not_called()
+        assert dm.connection.get_application.return_value.ScreenUpdating is True
+
+    def test_selected_sheets(self, publisher):
+        em, dm, opened, release, out = publisher
+        dm.connection.resolve_constant.side_effect = lambda name: {
+            "seApplicationGlobalDraftSaveAsPDFSheetOptions": 77
+        }.get(name)
+        app = dm.connection.get_application.return_value
+        app.GetGlobalParameter.return_value = 1
+
+        result = em.publish_drafts([str(release / "a.dft")], str(out), sheets=["detail: a", 0])
+        outputs = result["results"][0]["outputs"]
+        assert [o["path"] for o in outputs] == [
+            str(out / "a_Detail_ A.pdf"),
+            str(out / "a_Sheet1.pdf"),
+        ]
+        assert outputs[0]["sheet"] == "Detail: A"
+        opened[0].sheets[1].Activate.assert_called_once()
+        app.SetGlobalParameter.assert_any_call(77, 0)
+        assert app.SetGlobalParameter.call_args.args == (77, 1)
+
+    def test_missing_sheet_global_warns(self, publisher):
+        em, _, _, release, out = publisher
+        result = em.publish_drafts([str(release / "a.dft")], str(out), sheets=[1])
+        assert "PDFs may contain every sheet" in result["results"][0]["warnings"][0]
+
+    def test_invalid_sheet_isolated(self, publisher):
+        em, _, opened, release, out = publisher
+        result = em.publish_drafts([str(release / "a.dft")], str(out), sheets=[5])
+        assert "Invalid sheet index" in result["results"][0]["error"]
+        opened[0].Close.assert_called_once_with(False)
+
+    def test_update_views(self, publisher):
+        em, _, opened, release, out = publisher
+        em.publish_drafts([str(release / "b.dft")], str(out), update_views=True)
+        opened[0].UpdateAll.assert_called_once_with(False)
+
+    def test_existing_outputs_skipped(self, publisher):
+        em, _, opened, release, out = publisher
+        out.mkdir()
+        (out / "a.pdf").write_text("old")
+        result = em.publish_drafts([str(release / "a.dft")], str(out), overwrite=False)
+        assert result["results"][0]["status"] == "skipped"
+        assert opened == []
+
+    def test_errors_isolated(self, publisher):
+        em, dm, _, release, out = publisher
+        app = dm.connection.get_application.return_value
+        open_draft = app.Documents.Open.side_effect
+
+        def flaky(path):
+            if path.endswith("b.dft"):
+                raise Exception("corrupt draft")
+            return open_draft(path)
+
+        app.Documents.Open.side_effect = flaky
+        paths = [str(release / "a.dft"), str(release / "b.dft"), str(release / "zz.dft")]
+        result = em.publish_drafts(paths, str(out))
+        statuses = [r["status"] for r in result["results"]]
+        assert statuses == ["published", "error", "error"]
+        assert "corrupt draft" in result["results"][1]["error"]
+        assert "not found" in result["results"][2]["error"]
+
+    def test_invalid_arguments(self, publisher):
+        em, _, _, release, out = publisher
+        assert "Invalid formats" in em.publish_drafts([str(release)], str(out), ["step"])["error"]
+        assert "at least 1" in em.publish_drafts([str(release)], str(out), workers=0)["error"]
+        assert "No draft files" in em.publish_drafts([str(out / "*.dft")], str(out))["error"]
+
+
+class TestPublishPool:
+    def test_instances_share_queue(self, publisher, monkeypatch):
+        em, dm, opened, release, out = publisher
+        instances = []
+        lock = threading.Lock()
+
+        def new_instance():
+            with lock:
+                app = _make_app(opened)
+                instances.append(app)
+            return app
+
+        monkeypatch.setattr(em, "_new_publish_instance", new_instance)
+        result = em.publish_drafts([str(release)], str(out), workers=2, queue_size=1)
+
+        assert result["workers"] == 2
+        assert [r["draft"] for r in result["results"]] == [
+            str(release / n) for n in ("a.dft", "b.dft", "c.dft")
+        ]
+        assert result["counts"] == {"published": 3}
+        assert len(instances) == 2
+        for app in instances:
+            app.Quit.assert_called_once()
+        dm.connection.get_application.return_value.Documents.Open.assert_not_called()
+
+    def test_instance_start_failure(self, publisher, monkeypatch):
+        em, _, _, release, out = publisher
+
+        def fail():
+            raise Exception("license unavailable")
+
+        monkeypatch.setattr(em, "_new_publish_instance", fail)
+        result = em.publish_drafts([str(release)], str(out), workers=3, queue_size=1)
+        assert result["counts"] == {"error": 3}
+        assert "license unavailable" in result["results"][0]["error"]
+
+
+class TestPackageMerge:
+    def test_merged_with_pypdf(self, publisher, monkeypatch):
+        em, _, _, release, out = publisher
+        appended = []
+
+        class FakeWriter:
+            def append(self, path):
+                appended.append(path)
+
+            def write(self, f):
+                f.write(b"%PDF merged")
+
+        monkeypatch.setitem(sys.modules, "pypdf", SimpleNamespace(PdfWriter=FakeWriter))
+        result = em.publish_drafts([str(release)], str(out), package_name="REL-7")
+        assert result["merge"]["status"] == "merged"
+        assert appended == [str(out / f"{n}.pdf") for n in "abc"]
+        assert (out / "REL-7.pdf").read_bytes() == b"%PDF merged"
+
+    def test_skipped_drafts_included(self, publisher, monkeypatch):
+        em, _, opened, release, out = publisher
+        appended = []
+
+        class FakeWriter:
+            def append(self, path):
+                appended.append(path)
+
+            def write(self, f):
+                f.write(b"%PDF merged")
+
+        monkeypatch.setitem(sys.modules, "pypdf", SimpleNamespace(PdfWriter=FakeWriter))
+        out.mkdir()
+        (out / "a.pdf").write_text("old")
+        drafts = [str(release / "a.dft"), str(release / "b.dft")]
+        result = em.publish_drafts(drafts, str(out), overwrite=False, package_name="REL-7")
+        assert [r["status"] for r in result["results"]] == ["skipped", "published"]
+        assert [d.path for d in opened] == [str(release / "b.dft")]
+        assert appended == [str(out / "a.pdf"), str(out / "b.pdf")]
+
+    def test_without_pypdf(self, publisher, monkeypatch):
+        em, _, _, release, out = publisher
+        monkeypatch.setitem(sys.modules, "pypdf", None)
+        result = em.publish_drafts([str(release)], str(out), package_name="REL-7")
+        assert result["merge"] == {"status": "skipped", "reason": "pypdf is not installed"}
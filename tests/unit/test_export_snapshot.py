@@ -0,0 +1,219 @@
+"""
+Unit tests for ExportManager whole-draft snapshot.
+
+Tests DraftSnapshotMixin: single-traversal capture into columnar tables,
+dimension-to-view attribution, snapshot caching and refresh, and paged /
+filtered queries. Draft content is simulated with plain namespaces.
+"""
+
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+
+class _Collection:
+    """1-based COM-style collection with call counting."""
+
+    def __init__(self, items):
+        self._items = list(items)
+        self.Count = len(self._items)
+        self.calls = 0
+
+    def Item(self, i):
+        self.calls += 1
+        return self._items[i - 1]
+
+
+def _dim(name, value, dim_type=1):
+    return SimpleNamespace(
+        Name=name,
+        Value=value,
+        DimensionType=dim_type,
+        PrefixString="",
+        SuffixString="",
+        OverrideString="",
+    )
+
+
+def _view(name, dim_names, model="C:\\parts\\block.par"):
+    return SimpleNamespace(
+        Name=name,
+        Type=1,
+        ScaleFactor=0.5,
+        OriginX=0.1,
+        OriginY=0.2,
+        ModelLink=SimpleNamespace(FileName=model),
+        IsUpToDate=True,
+        Dimensions=_Collection([SimpleNamespace(Name=n) for n in dim_names]),
+    )
+
+
+def _sheet(name, views, dims, balloons=(), lines=()):
+    return SimpleNamespace(
+        Name=name,
+        SheetWidth=0.42,
+        SheetHeight=0.297,
+        Background=False,
+        DrawingViews=_Collection(views),
+        Dimensions=_Collection(dims),
+        Balloons=_Collection(balloons),
+        TextBoxes=_Collection([]),
+        Lines2d=_Collection(lines),
+        Circles2d=_Collection([]),
+        Arcs2d=_Collection([]),
+    )
+
+
+@pytest.fixture
+def draft():
+    """ExportManager over a two-sheet draft."""
+    from solidedge_mcp.backends.export import ExportManager
+
+    sheet1 = _sheet(
+        "Sheet1",
+        [_view("Front", ["D1", "D2"]), _view("Top", ["D3"])],
+        [_dim("D1", 0.05), _dim("D2", 0.12), _dim("D3", 0.3, dim_type=3), _dim("D9", 1.0)],
+        balloons=[SimpleNamespace(BalloonText="1", x=0.2, y=0.1)],
+        lines=[SimpleNamespace(StartX=0, StartY=0, EndX=0.1, EndY=0)],
+    )
+    sheet2 = _sheet(
+        "Sheet2",
+        [_view("Iso", [], model="C:\\parts\\bracket.par")],
+        [_dim(f"E{i}", i * 0.01) for i in range(1, 6)],
+    )
+    doc = SimpleNamespace(FullName="C:\\drafts\\block.dft", Sheets=_Collection([sheet1, sheet2]))
+
+    dm = MagicMock()
+    dm.get_active_document.return_value = doc
+    return ExportManager(dm), doc
+
+
+# ============================================================================
+# CAPTURE AND CACHING
+# ============================================================================
+
+
+class TestSnapshotSummary:
+    def test_counts(self, draft):
+        em, _ = draft
+        result = em.get_draft_snapshot_summary()
+        assert result["tables"]["sheets"] == 2
+        assert result["tables"]["views"] == 3
+        assert result["tables"]["dimensions"] == 9
+        assert result["tables"]["balloons"] == 1
+        assert result["sheets"][1] == {
+            "sheet": 1,
+            "name": "Sheet2",
+            "views": 1,
+            "dimensions": 5,
+            "balloons": 0,
+            "text_boxes": 0,
+            "lines": 0,
+            "circles": 0,
+            "arcs": 0,
+        }
+        assert result["capture_seconds"] >= 0
+
+    def test_cached_until_refresh(self, draft):
+        em, doc = draft
+        dims = doc.Sheets._items[0].Dimensions
+        em.get_draft_snapshot_summary()
+        em.query_draft_snapshot("dimensions")
+        assert dims.calls == 4
+
+        em.get_draft_snapshot_summary(refresh=True)
+        assert dims.calls == 8
+
+    def test_recaptured_when_draft_changes(self, draft):
+        em, doc = draft
+        sheet = doc.Sheets._items[0]
+        assert em.get_draft_snapshot_summary()["tables"]["balloons"] == 1
+        sheet.Balloons = _Collection(
+            [*sheet.Balloons._items, SimpleNamespace(BalloonText="2", x=0.3, y=0.1)]
+        )
+        assert em.get_draft_snapshot_summary()["tables"]["balloons"] == 2
+
+        sheet.DrawingViews._items[0].IsUpToDate = False
+        result = em.query_draft_snapshot("views", filters={"up_to_date": False})
+        assert result["total"] == 1
+
+    def test_recaptured_for_other_document(self, draft):
+        em, doc = draft
+        em.get_draft_snapshot_summary()
+        doc.FullName = "C:\\drafts\\other.dft"
+        em.get_draft_snapshot_summary()
+        assert doc.Sheets.calls == 4
+
+    def test_clear(self, draft):
+        em, _ = draft
+        em.get_draft_snapshot_summary()
+        assert em.clear_draft_snapshot()["had_snapshot"] is True
+        assert em._draft_snapshot is None
+
+    def test_not_draft(self, draft):
+        em, _ = draft
+        em.doc_manager.get_active_document.return_value = SimpleNamespace(Name="a.par")
+        assert "not a draft" in em.get_draft_snapshot_summary()["error"]
+
+
+# ============================================================================
+# QUERIES
+# ============================================================================
+
+
+class TestSnapshotQuery:
+    def test_dimension_view_attribution(self, draft):
+        em, _ = draft
+        result = em.query_draft_snapshot(
+            "dimensions", filters={"sheet": 0}, columns=["name", "view", "type_name"]
+        )
+        assert result["rows"] == [
+            ["D1", "Front", "Linear"],
+            ["D2", "Front", "Linear"],
+            ["D3", "Top", "Angular"],
+            ["D9", None, "Linear"],
+        ]
+
+    def test_range_filter_and_paging(self, draft):
+        em, _ = draft
+        result = em.query_draft_snapshot(
+            "dimensions",
+            filters={"value": {"min": 0.02, "max": 0.2}},
+            columns=["name"],
+            offset=1,
+            limit=2,
+        )
+        # Matches: D1 (0.05), D2 (0.12), E2..E5 (0.02..0.05)
+        assert result["total"] == 6
+        assert result["rows"] == [["D2"], ["E2"]]
+        assert result["has_more"] is True
+
+    def test_contains_and_list_filters(self, draft):
+        em, _ = draft
+        result = em.query_draft_snapshot(
+            "views", filters={"model_path": {"contains": "BRACKET"}}, columns=["name"]
+        )
+        assert result["rows"] == [["Iso"]]
+        result = em.query_draft_snapshot("views", filters={"name": ["Front", "Iso"]})
+        assert result["total"] == 2
+
+    def test_geometry_table(self, draft):
+        em, _ = draft
+        result = em.query_draft_snapshot("lines")
+        assert result["columns"] == ["sheet", "index", "x1", "y1", "x2", "y2"]
+        assert result["rows"] == [[0, 0, 0, 0, 0.1, 0]]
+
+    def test_unknown_table(self, draft):
+        em, _ = draft
+        assert "Unknown table" in em.query_draft_snapshot("notes")["error"]
+
+    def test_unknown_column(self, draft):
+        em, _ = draft
+        assert "Unknown column" in em.query_draft_snapshot("views", columns=["bogus"])["error"]
+        result = em.query_draft_snapshot("views", filters={"bogus": 1})
+        assert "Invalid filter" in result["error"]
+
+    def test_bad_paging(self, draft):
+        em, _ = draft
+        assert "error" in em.query_draft_snapshot("views", limit=0)
@@ -0,0 +1,160 @@
+"""
+Unit tests for the draft symbol and smart-frame template cache.
+
+Tests TemplateCache (LRU order, eviction with release, reload on mtime
+change) and TemplateCacheMixin: bulk symbol placement resolving each source
+once, smart-frame style validation, per-item errors and cache management.
+Uses unittest.mock to simulate COM objects.
+"""
+
+import os
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+from solidedge_mcp.backends.export._template_cache import TemplateCache
+
+
+class TestTemplateCache:
+    def test_lru_eviction_releases(self):
+        cache = TemplateCache(max_entries=2)
+        closed = []
+
+        def loader(name):
+            return lambda: {"name": name, "close": lambda: closed.append(name)}
+
+        cache.get("a", loader("a"))
+        cache.get("b", loader("b"))
+        cache.get("a", loader("a"))  # a becomes most recent
+        cache.get("c", loader("c"))
+        assert closed == ["b"]
+        assert cache.stats()["evictions"] == 1
+        assert (cache.hits, cache.loads) == (1, 3)
+        assert cache.clear() == 2
+        assert sorted(closed) == ["a", "b", "c"]
+
+    def test_changed_file_reloaded(self, tmp_path):
+        path = tmp_path / "weld.sym"
+        path.write_text("v1")
+        cache = TemplateCache()
+        closed = []
+        load = lambda: {"close": lambda: closed.append(1)}  # noqa: E731
+
+        cache.get(TemplateCache.file_key(str(path)), load)
+        cache.get(TemplateCache.file_key(str(path)), load)
+        stat = path.stat()
+        path.write_text("version 2")
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        cache.get(TemplateCache.file_key(str(path)), load)
+
+        assert cache.loads == 2
+        assert closed == [1]
+        assert cache.stats()["entries"] == 1
+
+    def test_missing_file(self, tmp_path):
+        with pytest.raises(FileNotFoundError):
+            TemplateCache.file_key(str(tmp_path / "gone.sym"))
+
+
+@pytest.fixture
+def export_mgr(tmp_path):
+    """ExportManager over a mocked draft plus two symbol files on disk."""
+    from solidedge_mcp.backends.export import ExportManager
+
+    weld = tmp_path / "weld.sym"
+    finish = tmp_path / "finish.sym"
+    weld.write_text("weld")
+    finish.write_text("finish")
+
+    dm = MagicMock()
+    doc = MagicMock()
+    doc.FullName = "C:/drafts/frame.dft"
+    styles = [SimpleNamespace(Name="A3"), SimpleNamespace(Name="A4")]
+    doc.SmartFrame2dStyles.Count = len(styles)
+    doc.SmartFrame2dStyles.Item.side_effect = lambda i: styles[i - 1]
+    dm.get_active_document.return_value = doc
+    app = dm.connection.get_application.return_value
+    app.ScreenUpdating = True
+    app.ActiveDocument = doc
+    return ExportManager(dm), doc, app, str(weld), str(finish)
+
+
+class TestPlaceSymbolsBulk:
+    def test_each_source_loaded_once(self, export_mgr):
+        em, doc, app, weld, finish = export_mgr
+        placements = [{"file_path": weld, "x": i * 0.01, "y": 0.1} for i in range(100)]
+        placements.append({"file_path": finish, "x": 0.2, "y": 0.2, "insertion_type": 1})
+        result = em.place_symbols_bulk(placements)
+
+        assert result["status"] == "placed"
+        assert result["placed"] == 101
+        assert result["template_loads"] == 2
+        assert result["cache_hits"] == 99
+        assert doc.ActiveSheet.Symbols.Add.call_count == 101
+        doc.ActiveSheet.Symbols.Add.assert_called_with(1, finish, 0.2, 0.2)
+        app.Documents.Open.assert_not_called()
+        assert app.ScreenUpdating is True
+
+    def test_library_path_not_cached(self, export_mgr):
+        em, doc, app, _, _ = export_mgr
+        result = em.place_symbols_bulk([{"file_path": "Weld Symbols\\fillet.sym", "x": 0, "y": 0}])
+        assert result["placed"] == 1
+        app.Documents.Open.assert_not_called()
+
+    def test_per_item_errors(self, export_mgr):
+        em, doc, _, weld, _ = export_mgr
+        doc.ActiveSheet.Symbols.Add.side_effect = [None, Exception("COM failure")]
+        result = em.place_symbols_bulk(
+            [
+                {"file_path": weld, "x": 0},
+                {"file_path": weld, "x": 0, "y": 0},
+                {"file_path": weld, "x": 0, "y": 0},
+            ]
+        )
+        assert result["status"] == "partial"
+        assert "Missing field" in result["errors"][0]["error"]
+        assert "COM failure" in result["errors"][1]["error"]
+
+    def test_clear(self, export_mgr):
+        em, _, _, weld, _ = export_mgr
+        em.place_symbols_bulk([{"file_path": weld, "x": 0, "y": 0}])
+        result = em.clear_template_cache(max_entries=4)
+        assert result == {"status": "cleared", "removed": 1, "max_entries": 4}
+        assert em.get_template_cache_stats()["entries"] == 0
+        assert "at least 1" in em.clear_template_cache(max_entries=0)["error"]
+
+
+class TestPlaceSmartFramesBulk:
+    def test_styles_checked_once(self, export_mgr):
+        em, doc, _, _, _ = export_mgr
+        frames = [{"style": "A3", "x1": 0, "y1": 0, "x2": 0.42, "y2": 0.297}] * 3
+        margins = {"top": 0.01, "bottom": 0.01, "left": 0.02, "right": 0.01}
+        frames.append({"style": "A4", "x": 0, "y": 0, **margins})
+        frames.append({"style": "Z9", "x1": 0, "y1": 0, "x2": 1, "y2": 1})
+        result = em.place_smart_frames_bulk(frames)
+
+        assert result["placed"] == 4
+        assert result["template_loads"] == 2
+        assert "style not found" in result["errors"][0]["error"]
+        assert doc.ActiveSheet.SmartFrames2d.AddBy2Points.call_count == 3
+        doc.ActiveSheet.SmartFrames2d.AddByOrigin.assert_called_once_with(
+            "A4", 0, 0, 0.01, 0.01, 0.02, 0.01
+        )
+
+    def test_alternating_styles_hit(self, export_mgr):
+        em, _, _, _, _ = export_mgr
+        frames = [
+            {"style": style, "x1": 0, "y1": 0, "x2": 0.42, "y2": 0.297}
+            for style in ("A3", "A4", "A3", "A4")
+        ]
+        result = em.place_smart_frames_bulk(frames)
+        assert result["template_loads"] == 2
+        assert result["cache_hits"] == 2
+        assert em.get_template_cache_stats()["entries"] == 2
+
+    def test_empty_and_not_draft(self, export_mgr):
+        em, doc, _, _, _ = export_mgr
+        assert "No placements" in em.place_smart_frames_bulk([])["error"]
+        del doc.Sheets
+        assert "not a draft" in em.place_smart_frames_bulk([{"style": "A3"}])["error"]
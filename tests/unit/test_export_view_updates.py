@@ -0,0 +1,189 @@
+"""
+Unit tests for ExportManager incremental view updates.
+
+Tests ViewUpdateSchedulerMixin: stale detection from IsUpToDate and model
+file generations, coalesced update requests, stale-only flushing and
+per-view timing. Model files are real temp files so their mtime can change.
+"""
+
+import os
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+
+class _Collection:
+    def __init__(self, items):
+        self._items = list(items)
+        self.Count = len(self._items)
+
+    def Item(self, i):
+        return self._items[i - 1]
+
+
+class _View:
+    def __init__(self, name, model, up_to_date=None):
+        self.Name = name
+        self.ModelLink = SimpleNamespace(FileName=model) if model else None
+        if up_to_date is not None:
+            self.IsUpToDate = up_to_date
+        self.updates = 0
+
+    def Update(self):
+        self.updates += 1
+
+
+@pytest.fixture
+def draft(tmp_path):
+    """ExportManager over a draft with three model views and one 2D view."""
+    from solidedge_mcp.backends.export import ExportManager
+
+    block = tmp_path / "block.par"
+    bracket = tmp_path / "bracket.par"
+    block.write_text("v1")
+    bracket.write_text("v1")
+
+    views1 = [_View("Front", str(block)), _View("Top", str(block)), _View("Sketch", None)]
+    views2 = [_View("Iso", str(bracket))]
+    sheet1 = SimpleNamespace(Name="Sheet1", DrawingViews=_Collection(views1))
+    sheet2 = SimpleNamespace(Name="Sheet2", DrawingViews=_Collection(views2))
+    doc = SimpleNamespace(
+        FullName="C:\\drafts\\block.dft",
+        Sheets=_Collection([sheet1, sheet2]),
+        ActiveSheet=sheet1,
+    )
+
+    dm = MagicMock()
+    dm.get_active_document.return_value = doc
+    app = dm.connection.get_application.return_value
+    app.Documents.Count = 0
+    app.ScreenUpdating = True
+    return ExportManager(dm), views1 + views2, block, app
+
+
+def _touch(path):
+    path.write_text(path.read_text() + "x")
+    st = os.stat(path)
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+
+
+# ============================================================================
+# STALE DETECTION
+# ============================================================================
+
+
+class TestUpdateStaleViews:
+    def test_first_run_updates_untracked(self, draft):
+        em, views, _, app = draft
+        result = em.update_stale_views()
+        assert result["updated"] == 3
+        assert [v.updates for v in views] == [1, 1, 0, 1]
+        assert all(r["reason"] == "untracked" for r in result["views"])
+        assert all(r["seconds"] >= 0 for r in result["views"])
+        assert app.ScreenUpdating is True
+
+    def test_second_run_is_noop(self, draft):
+        em, views, _, _ = draft
+        em.update_stale_views()
+        result = em.update_stale_views()
+        assert result["updated"] == 0
+        assert [v.updates for v in views] == [1, 1, 0, 1]
+
+    def test_model_change_marks_only_its_views(self, draft):
+        em, views, block, _ = draft
+        em.update_stale_views()
+        _touch(block)
+        result = em.update_stale_views()
+        assert sorted(r["name"] for r in result["views"]) == ["Front", "Top"]
+        assert all(r["reason"] == "model_changed" for r in result["views"])
+        assert views[3].updates == 1
+
+    def test_is_up_to_date_respected(self, draft):
+        em, views, _, _ = draft
+        views[0].IsUpToDate = False
+        views[1].IsUpToDate = True
+        views[3].IsUpToDate = True
+        result = em.update_stale_views()
+        assert [r["name"] for r in result["views"]] == ["Front"]
+        assert result["views"][0]["reason"] == "out_of_date"
+
+    def test_sheet_filter_and_dry_run(self, draft):
+        em, views, _, _ = draft
+        result = em.update_stale_views(sheet_index=1, dry_run=True)
+        assert result["status"] == "dry_run"
+        assert [s["name"] for s in result["stale"]] == ["Iso"]
+        assert views[3].updates == 0
+
+    def test_update_error_reported(self, draft):
+        em, views, _, _ = draft
+        views[0].Update = MagicMock(side_effect=Exception("model missing"))
+        result = em.update_stale_views()
+        assert result["updated"] == 2
+        assert result["views"][0]["status"] == "error"
+
+    def test_not_draft(self, draft):
+        em, _, _, _ = draft
+        em.doc_manager.get_active_document.return_value = SimpleNamespace(Name="a.par")
+        assert "not a draft" in em.update_stale_views()["error"]
+
+
+# ============================================================================
+# REQUEST / FLUSH
+# ============================================================================
+
+
+class TestRequestAndFlush:
+    def test_requests_coalesce(self, draft):
+        em, views, _, _ = draft
+        em.request_view_updates([0, 1])
+        em.request_view_updates([0])
+        queued = em.request_view_updates([0], sheet_index=1)
+        assert queued["pending_views"] == 3
+        assert queued["pending_requests"] == 4
+
+        result = em.flush_view_updates()
+        assert result["requests"] == 4
+        assert result["coalesced"] == 1
+        assert result["updated"] == 3
+        assert [v.updates for v in views] == [1, 1, 0, 1]
+        assert em.get_view_update_status()["pending"] == []
+
+    def test_flush_skips_current_views(self, draft):
+        em, views, _, _ = draft
+        em.update_stale_views()
+        em.request_view_updates([0])
+        result = em.flush_view_updates()
+        assert result["updated"] == 0
+        assert result["skipped_current"][0]["name"] == "Front"
+
+        em.request_view_updates([0])
+        result = em.flush_view_updates(stale_only=False)
+        assert result["updated"] == 1
+        assert views[0].updates == 2
+
+    def test_requests_kept_per_draft(self, draft):
+        em, views, _, _ = draft
+        doc = em.doc_manager.get_active_document.return_value
+        em.request_view_updates([0])
+        other = SimpleNamespace(FullName="C:\\drafts\\other.dft", Sheets=doc.Sheets)
+        em.doc_manager.get_active_document.return_value = other
+        assert em.get_view_update_status()["pending"] == []
+        assert em.flush_view_updates()["requests"] == 0
+        assert views[0].updates == 0
+
+        em.doc_manager.get_active_document.return_value = doc
+        assert em.flush_view_updates()["updated"] == 1
+        assert views[0].updates == 1
+
+    def test_invalid_view_index(self, draft):
+        em, _, _, _ = draft
+        assert "Invalid view index" in em.request_view_updates([7])["error"]
+
+    def test_status(self, draft):
+        em, _, block, _ = draft
+        em.update_stale_views()
+        _touch(block)
+        status = em.get_view_update_status()
+        assert status["count"] == 4
+        assert status["stale_count"] == 2
@@ -0,0 +1,200 @@
+"""
+Unit tests for the on-disk tessellation cache backend.
+
+Tests FacetCache: round trips through mapped entry files, keys (file
+hash, body, tolerance), stamp checks, LRU eviction by size and corrupt
+entries; and the query paths that read through it.
+"""
+
+import os
+import time
+from array import array
+from unittest.mock import MagicMock
+
+import pytest
+
+from solidedge_mcp.backends.facet_cache import FacetCache, split_facet_data
+
+# One triangle in the XY plane, face ID 7
+_TRIANGLE = (1, (0.0, 0.0, 0.0, 1.0, 0.0, 0.0, 0.0, 1.0, 0.0), (0.0, 0.0, 1.0) * 3, (), (), (7,))
+
+
+def _arrays(facets=1):
+    points = array("d", [float(i) for i in range(9 * facets)])
+    normals = array("d", [0.0, 0.0, 1.0] * facets)
+    face_ids = array("q", range(facets))
+    return points, normals, face_ids
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return FacetCache(str(tmp_path / "facets"), max_bytes=1 << 20)
+
+
+class TestSplitFacetData:
+    def test_vertex_normals_and_ids(self):
+        points, normals, face_ids = split_facet_data(_TRIANGLE)
+        assert len(points) == 9
+        assert len(normals) == 9
+        assert face_ids.tolist() == [7]
+
+    def test_missing_ids(self):
+        _points, normals, face_ids = split_facet_data(_TRIANGLE[:3])
+        assert face_ids.tolist() == [-1]
+        assert len(normals) == 9
+
+    def test_bad_result(self):
+        with pytest.raises(ValueError):
+            split_facet_data(None)
+
+
+class TestFacetCache:
+    def test_round_trip(self, cache):
+        points, normals, face_ids = _arrays(3)
+        cache.put("abc", "model1", 0.0, points, normals, face_ids, {"stamp": "s"}).close()
+        with cache.get("abc", "model1", 0.0, "s") as facets:
+            assert len(facets) == 3
+            assert facets.points.tolist() == points.tolist()
+            assert facets.normals.tolist() == normals.tolist()
+            assert facets.face_ids.tolist() == [0, 1, 2]
+            assert facets.meta["stamp"] == "s"
+        assert cache.hits == 1
+
+    def test_key_includes_body_and_tolerance(self, cache):
+        cache.put("abc", "model1", 0.0, *_arrays()).close()
+        assert cache.get("abc", "model1", 0.001) is None
+        assert cache.get("abc", "model2", 0.0) is None
+        assert cache.get("xyz", "model1", 0.0) is None
+        assert cache.misses == 3
+
+    def test_stamp_mismatch_misses(self, cache):
+        cache.put("abc", "model1", 0.0, *_arrays(), {"stamp": "old"}).close()
+        assert cache.get("abc", "model1", 0.0, "new") is None
+
+    def test_empty_mesh(self, cache):
+        empty = (array("d"), array("d"), array("q"))
+        cache.put("abc", "model1", 0.0, *empty).close()
+        with cache.get("abc", "model1", 0.0) as facets:
+            assert len(facets) == 0
+
+    def test_lru_eviction(self, tmp_path):
+        points, normals, face_ids = _arrays(100)
+        cache = FacetCache(str(tmp_path))
+        for i, name in enumerate(("a", "b", "c")):
+            cache.put(name, "model1", 0.0, points, normals, face_ids).close()
+            # Distinct access times: a, b, c
+            path = cache._entry_path(name, "model1", 0.0)
+            os.utime(path, (time.time() - 100 + i, time.time() - 100 + i))
+        # Room for three entries
+        cache.max_bytes = 3 * os.path.getsize(path)
+        cache.get("a", "model1", 0.0).close()
+        cache.put("d", "model1", 0.0, points, normals, face_ids).close()
+        status = cache.get_status()
+        assert status["bytes"] <= cache.max_bytes
+        assert cache.get("b", "model1", 0.0) is None
+        for name in ("a", "d"):
+            entry = cache.get(name, "model1", 0.0)
+            assert entry is not None
+            entry.close()
+
+    def test_corrupt_entry_discarded(self, cache):
+        cache.put("abc", "model1", 0.0, *_arrays()).close()
+        path = cache._entry_path("abc", "model1", 0.0)
+        with open(path, "r+b") as f:
+            f.truncate(40)
+        assert cache.get("abc", "model1", 0.0) is None
+        assert not os.path.exists(path)
+
+    def test_file_hash_follows_content(self, cache, tmp_path):
+        part = tmp_path / "block.par"
+        part.write_bytes(b"one")
+        first = cache.file_hash(str(part))
+        assert cache.file_hash(str(part)) == first
+        part.write_bytes(b"two!")
+        assert cache.file_hash(str(part)) != first
+        assert cache.file_hash(str(tmp_path / "missing.par")) is None
+
+    def test_clear(self, cache):
+        cache.put("abc", "model1", 0.0, *_arrays()).close()
+        cache.put("abc", "model1", 0.5, *_arrays()).close()
+        assert cache.clear() == 2
+        assert cache.get_status()["entries"] == 0
+
+
+@pytest.fixture
+def query_mgr(tmp_path):
+    """QueryManager on a saved part whose body tessellates to one triangle."""
+    from solidedge_mcp.backends.query import QueryManager
+
+    part = tmp_path / "block.par"
+    part.write_bytes(b"part file")
+    dm = MagicMock()
+    doc = MagicMock()
+    doc.FullName = str(part)
+    doc.Dirty = False
+    dm.get_active_document.return_value = doc
+    model = MagicMock()
+    doc.Models.Count = 1
+    doc.Models.Item.return_value = model
+    body = model.Body
+    body.Volume = 0.001
+    body.GetRange.return_value = ((0.0, 0.0, 0.0), (1.0, 1.0, 0.0))
+    body.GetFacetData.return_value = _TRIANGLE
+    qm = QueryManager(dm)
+    qm._facet_cache = FacetCache(str(tmp_path / "facets"))
+    return qm, doc, body
+
+
+class TestBodyFacetData:
+    def test_reused_across_managers(self, query_mgr, tmp_path):
+        from solidedge_mcp.backends.query import QueryManager
+
+        qm, doc, body = query_mgr
+        first = qm.get_body_facet_data()
+        assert first["facet_count"] == 1
+        assert first["cached"] is False
+        # A new session with the same cache directory
+        other = QueryManager(qm.doc_manager)
+        other._facet_cache = FacetCache(qm._facet_cache.cache_dir)
+        second = other.get_body_facet_data(include_data=True)
+        assert second["cached"] is True
+        assert second["face_ids"] == [7]
+        assert second["points"][3] == 1.0
+        body.GetFacetData.assert_called_once_with(0.0)
+
+    def test_unsaved_edit_misses(self, query_mgr):
+        qm, _doc, body = query_mgr
+        qm.get_body_facet_data()
+        body.Volume = 0.002
+        assert qm.get_body_facet_data()["cached"] is False
+        assert body.GetFacetData.call_count == 2
+
+    def test_dirty_document_bypasses_cache(self, query_mgr):
+        qm, doc, body = query_mgr
+        qm.get_body_facet_data()
+        doc.Dirty = True
+        result = qm.get_body_facet_data()
+        assert result["cached"] is False
+        assert body.GetFacetData.call_count == 2
+        assert qm.get_facet_cache_status()["entries"] == 1
+
+    def test_unsaved_document_not_cached(self, query_mgr):
+        qm, doc, body = query_mgr
+        doc.FullName = ""
+        result = qm.get_body_facet_data()
+        assert result["cached"] is False
+        assert result["cache_file"] is None
+        assert qm.get_facet_cache_status()["entries"] == 0
+
+    def test_mesh_queries_read_through_cache(self, query_mgr):
+        qm, _doc, body = query_mgr
+        qm.get_body_facet_data()
+        qm._mesh_cache.clear()
+        result = qm.get_faces_by_rays([0.2, 0.2, 1.0, 0.0, 0.0, -1.0], method="mesh")
+        assert "error" not in result
+        body.GetFacetData.assert_called_once()
+
+    def test_clear(self, query_mgr):
+        qm, _doc, _body = query_mgr
+        qm.get_body_facet_data()
+        assert qm.clear_facet_cache()["removed"] == 1
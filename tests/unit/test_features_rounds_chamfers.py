@@ -515,3 +515,103 @@ class TestCreateBlendSurface:
         result = feature_mgr.create_blend_surface(0, 99)
         assert "error" in result
         assert "Invalid face_index2" in result["error"]
+
+
+# ============================================================================
+# BULK ROUNDS / CHAMFERS ON EDGE SETS
+# ============================================================================
+
+
+class TestCreateRoundsBulk:
+    def test_single_radius_one_feature(self, feature_mgr, managers):
+        doc_mgr, _, _, _, model, _ = managers
+        result = feature_mgr.create_rounds_bulk([[0, 0], [0, 1]], radius=0.002)
+        assert result["status"] == "created"
+        assert result["feature_count"] == 1
+        assert result["edge_count"] == 2
+        model.Rounds.Add.assert_called_once()
+        assert model.Rounds.Add.call_args[0][0] == 2
+        doc_mgr.connection.performance_scope.assert_called_once_with(delay_compute=True)
+
+    def test_mixed_radii_combined(self, feature_mgr, managers):
+        _, _, _, _, model, _ = managers
+        result = feature_mgr.create_rounds_bulk([[0, 0], [0, 1]], radii=[0.001, 0.002])
+        assert result["feature_count"] == 1
+        assert [f["radius"] for f in result["features"]] == [0.001, 0.002]
+        model.Rounds.Add.assert_called_once()
+
+    def test_mixed_radii_fall_back_per_radius(self, feature_mgr, managers):
+        _, _, _, _, model, _ = managers
+        model.Rounds.Add.side_effect = [Exception("rejected"), None, None]
+        result = feature_mgr.create_rounds_bulk([[0, 0], [0, 1]], radii=[0.001, 0.002])
+        assert result["status"] == "created"
+        assert result["feature_count"] == 2
+        assert model.Rounds.Add.call_count == 3
+
+    def test_not_combined(self, feature_mgr, managers):
+        _, _, _, _, model, _ = managers
+        result = feature_mgr.create_rounds_bulk(
+            [[0, 0], [0, 1]], radii=[0.001, 0.002], combine=False
+        )
+        assert result["feature_count"] == 2
+        assert model.Rounds.Add.call_count == 2
+
+    def test_duplicate_edge_counted_once(self, feature_mgr, managers):
+        result = feature_mgr.create_rounds_bulk([[0, 0], [0, 0]], radius=0.002)
+        assert result["edge_count"] == 1
+        assert result["errors"] == []
+
+    def test_duplicate_edge_conflicting_radius(self, feature_mgr, managers):
+        result = feature_mgr.create_rounds_bulk([[0, 0], [0, 0]], radii=[0.001, 0.002])
+        assert result["status"] == "partial"
+        assert result["errors"][0]["index"] == 1
+
+    def test_invalid_edge_reported(self, feature_mgr, managers):
+        _, _, _, _, model, _ = managers
+        result = feature_mgr.create_rounds_bulk([[0, 0], [0, 9], [5, 0]], radius=0.002)
+        assert result["status"] == "partial"
+        assert result["edge_count"] == 1
+        assert [e["index"] for e in result["errors"]] == [1, 2]
+
+    def test_all_edges_invalid(self, feature_mgr, managers):
+        _, _, _, _, model, _ = managers
+        result = feature_mgr.create_rounds_bulk([[3, 0]], radius=0.002)
+        assert "error" in result
+        model.Rounds.Add.assert_not_called()
+
+    def test_validation(self, feature_mgr):
+        assert "error" in feature_mgr.create_rounds_bulk([], radius=0.002)
+        assert "error" in feature_mgr.create_rounds_bulk([[0, 0]])
+        assert "error" in feature_mgr.create_rounds_bulk([[0, 0]], radii=[0.1, 0.2])
+        assert "error" in feature_mgr.create_rounds_bulk([[0, 0]], radius=-1.0)
+
+    def test_no_base_feature(self, feature_mgr, managers):
+        _, _, _, models, _, _ = managers
+        models.Count = 0
+        result = feature_mgr.create_rounds_bulk([[0, 0]], radius=0.002)
+        assert "error" in result
+
+
+class TestCreateChamfersBulk:
+    def test_one_feature_per_distance(self, feature_mgr, managers):
+        _, _, _, _, model, _ = managers
+        result = feature_mgr.create_chamfers_bulk([[0, 0], [0, 1]], distances=[0.001, 0.002])
+        assert result["status"] == "created"
+        assert result["type"] == "chamfer"
+        assert result["feature_count"] == 2
+        assert model.Chamfers.AddEqualSetback.call_count == 2
+
+    def test_same_distance_grouped(self, feature_mgr, managers):
+        _, _, _, _, model, _ = managers
+        result = feature_mgr.create_chamfers_bulk([[0, 0], [0, 1]], distance=0.001)
+        assert result["feature_count"] == 1
+        args = model.Chamfers.AddEqualSetback.call_args[0]
+        assert args[0] == 2
+        assert args[2] == 0.001
+
+    def test_feature_failure(self, feature_mgr, managers):
+        _, _, _, _, model, _ = managers
+        model.Chamfers.AddEqualSetback.side_effect = Exception("COM error")
+        result = feature_mgr.create_chamfers_bulk([[0, 0]], distance=0.001)
+        assert result["status"] == "failed"
+        assert result["errors"][0]["error"] == "COM error"
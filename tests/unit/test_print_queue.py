@@ -0,0 +1,217 @@
+"""
+Unit tests for the background print queue.
+
+Tests PrintQueue: job submission and validation, printing through
+DraftPrintUtility (printer, paper, copies) and PrintOut, retry of transient
+COM failures with instance restart, permanent failures, cancellation and
+status reporting. A fake application factory stands in for the hidden
+Solid Edge instance.
+"""
+
+import threading
+from unittest.mock import MagicMock
+
+import pytest
+
+from solidedge_mcp.backends.print_queue import (
+    _RPC_E_CALL_REJECTED,
+    _RPC_S_SERVER_UNAVAILABLE,
+    PrintQueue,
+)
+
+
+class FakeComError(Exception):
+    """Shaped like pywintypes.com_error: hresult is the first argument."""
+
+
+@pytest.fixture
+def drawings(tmp_path):
+    paths = []
+    for name in ("a.dft", "b.dft", "c.par"):
+        (tmp_path / name).write_text(name)
+        paths.append(str(tmp_path / name))
+    return paths
+
+
+@pytest.fixture
+def spooler():
+    """PrintQueue whose factory hands out mock applications."""
+    apps = []
+    opened = []
+
+    def factory():
+        app = MagicMock()
+
+        def open_doc(path):
+            doc = MagicMock()
+            doc.path = path
+            if path.endswith(".par"):
+                del doc.DraftPrintUtility
+            opened.append(doc)
+            return doc
+
+        app.Documents.Open.side_effect = open_doc
+        apps.append(app)
+        return app
+
+    pq = PrintQueue(app_factory=factory, max_retries=2, retry_delay=0, idle_timeout=0.05)
+    return pq, apps, opened
+
+
+class TestSubmit:
+    def test_prints_in_background(self, spooler, drawings):
+        pq, apps, opened = spooler
+        result = pq.submit(
+            drawings,
+            printer="Plotter",
+            copies=2,
+            paper={"width": 0.42, "height": 0.297, "orientation": "Portrait"},
+        )
+        assert result["status"] == "queued"
+        assert result["job_ids"] == [1, 2, 3]
+        assert pq.wait(5)
+
+        status = pq.get_status()
+        assert status["counts"] == {"done": 3}
+        assert [j["id"] for j in status["jobs"]] == [3, 2, 1]
+
+        dpu = opened[0].DraftPrintUtility
+        assert dpu.Printer == "Plotter"
+        assert dpu.Copies == 2
+        assert dpu.PaperWidth == 0.42
+        assert dpu.Orientation == 1
+        dpu.PrintOut.assert_called_once()
+        opened[2].PrintOut.assert_called_once_with(Printer="Plotter", NumCopies=2)
+        for doc in opened:
+            doc.Close.assert_called_once_with(False)
+        # One hidden instance for the whole batch
+        assert len(apps) == 1
+
+    def test_per_document_overrides(self, spooler, drawings):
+        pq, _, opened = spooler
+        pq.submit([drawings[0], {"path": drawings[1], "copies": 5, "printer": "Shop"}])
+        pq.wait(5)
+        assert opened[0].DraftPrintUtility.Copies == 1
+        assert opened[1].DraftPrintUtility.Copies == 5
+        assert opened[1].DraftPrintUtility.Printer == "Shop"
+
+    def test_instance_released_when_idle(self, spooler, drawings):
+        pq, apps, _ = spooler
+        pq.submit(drawings[:1])
+        pq.wait(5)
+        for _ in range(100):
+            if pq.get_status()["state"] == "idle":
+                break
+            threading.Event().wait(0.02)
+        assert pq.get_status()["state"] == "idle"
+        apps[0].Quit.assert_called_once()
+
+        pq.submit(drawings[1:2])
+        assert pq.wait(5)
+        assert len(apps) == 2
+
+    def test_validation(self, spooler, drawings):
+        pq, _, _ = spooler
+        assert "No documents" in pq.submit([])["error"]
+        assert "'path' is required" in pq.submit([{"copies": 2}])["error"]
+        assert "copies" in pq.submit(drawings, copies=0)["error"]
+        bad_paper = {"width": 0.2, "height": 0.1, "orientation": "Diagonal"}
+        assert "invalid orientation" in pq.submit(drawings, paper=bad_paper)["error"]
+        assert "'width' and 'height'" in pq.submit(drawings, paper={"width": 0.2})["error"]
+        assert pq.get_status()["counts"] == {}
+
+
+class TestRetry:
+    def test_transient_failure_retried(self, spooler, drawings):
+        pq, _, opened = spooler
+        failures = [FakeComError(_RPC_E_CALL_REJECTED, "Call was rejected by callee.")]
+
+        def factory_hook():
+            app = MagicMock()
+
+            def open_doc(path):
+                if failures:
+                    raise failures.pop()
+                doc = MagicMock()
+                opened.append(doc)
+                return doc
+
+            app.Documents.Open.side_effect = open_doc
+            return app
+
+        pq._app_factory = factory_hook
+        pq.submit(drawings[:1])
+        pq.wait(5)
+        job = pq.get_job(1)
+        assert job["state"] == "done"
+        assert job["attempts"] == 2
+        assert "error" not in job
+
+    def test_lost_instance_restarted(self, spooler, drawings):
+        pq, apps, _ = spooler
+        created = []
+
+        def factory_hook():
+            app = MagicMock()
+            if not created:
+                app.Documents.Open.side_effect = FakeComError(
+                    _RPC_S_SERVER_UNAVAILABLE, "The RPC server is unavailable."
+                )
+            created.append(app)
+            return app
+
+        pq._app_factory = factory_hook
+        pq.submit(drawings[:1])
+        pq.wait(5)
+        assert pq.get_job(1)["state"] == "done"
+        assert len(created) == 2
+        created[0].Quit.assert_called_once()
+
+    def test_gives_up_after_max_retries(self, spooler, drawings):
+        pq, _, _ = spooler
+        app = MagicMock()
+        app.Documents.Open.side_effect = FakeComError(_RPC_E_CALL_REJECTED, "busy")
+        pq._app_factory = lambda: app
+        pq.submit(drawings[:1])
+        pq.wait(5)
+        job = pq.get_job(1)
+        assert job["state"] == "failed"
+        assert job["attempts"] == 3
+
+    def test_permanent_failure_not_retried(self, spooler, drawings, tmp_path):
+        pq, _, _ = spooler
+        pq.submit([str(tmp_path / "gone.dft"), drawings[0]])
+        pq.wait(5)
+        missing = pq.get_job(1)
+        assert missing["state"] == "failed"
+        assert missing["attempts"] == 1
+        assert "File not found" in missing["error"]
+        assert pq.get_job(2)["state"] == "done"
+
+
+class TestCancelAndStatus:
+    def test_cancel_queued(self, spooler, drawings):
+        pq, _, _ = spooler
+        release = threading.Event()
+        app = MagicMock()
+        app.Documents.Open.side_effect = lambda path: release.wait(5) and MagicMock()
+        pq._app_factory = lambda: app
+
+        pq.submit(drawings)
+        for _ in range(100):
+            if pq.get_status()["state"] == "printing":
+                break
+            threading.Event().wait(0.01)
+        assert pq.cancel([2, 3])["job_ids"] == [2, 3]
+        release.set()
+        pq.wait(5)
+        assert pq.get_status()["counts"] == {"done": 1, "cancelled": 2}
+        assert app.Documents.Open.call_count == 1
+
+    def test_clear_and_unknown_job(self, spooler, drawings):
+        pq, _, _ = spooler
+        pq.submit(drawings[:2])
+        pq.wait(5)
+        assert pq.clear_finished()["removed"] == 2
+        assert pq.get_status()["jobs"] == []
+        assert "Unknown print job" in pq.get_job(1)["error"]
@@ -0,0 +1,318 @@
+"""
+Unit tests for the mass-properties cache and assembly rollup (_mass.py).
+
+Uses unittest.mock to simulate COM objects.
+"""
+
+import math
+import os
+from unittest.mock import MagicMock
+
+import pytest
+
+from solidedge_mcp.backends.query._mass import (
+    MassPropertiesCache,
+    aggregate,
+    compose,
+    inertia_tensor,
+    matrix_parts,
+    principal_moments,
+)
+
+# Rotation of 90 degrees about Z in Solid Edge's matrix layout
+_ROT_Z90 = [0, 1, 0, 0, -1, 0, 0, 0, 0, 0, 1, 0, 0, 0, 0, 1]
+
+
+def _props(mass=1.0, cog=(0.0, 0.0, 0.0), moments=(1.0, 2.0, 3.0, 0.0, 0.0, 0.0)):
+    return {
+        "volume": mass / 1000.0,
+        "surface_area": 0.01,
+        "mass": mass,
+        "center_of_gravity": list(cog),
+        "moments": list(moments),
+        "principal_moments": sorted(moments[:3]),
+    }
+
+
+def _translation(x, y, z):
+    return [1, 0, 0, 0, 0, 1, 0, 0, 0, 0, 1, 0, x, y, z, 1]
+
+
+def _physical_result(volume=0.001, mass=7.85, cog=(0.0, 0.0, 0.0)):
+    return (volume, 0.06, mass, cog, cog, (1.0, 2.0, 3.0, 0.0, 0.0, 0.0), (1.0, 2.0, 3.0))
+
+
+@pytest.fixture
+def query_mgr():
+    """QueryManager on a part document whose body can be edited."""
+    from solidedge_mcp.backends.query import QueryManager
+
+    dm = MagicMock()
+    doc = MagicMock()
+    doc.FullName = "C:/parts/block.par"
+    doc.Dirty = False
+    dm.get_active_document.return_value = doc
+    model = MagicMock()
+    models = MagicMock()
+    models.Count = 1
+    models.Item.return_value = model
+    doc.Models = models
+    model.Body.Volume = 0.001
+    model.Body.GetRange.return_value = ((0.0, 0.0, 0.0), (0.1, 0.1, 0.1))
+    model.ComputePhysicalPropertiesWithSpecifiedDensity.return_value = _physical_result()
+    return QueryManager(dm), doc, model
+
+
+# ============================================================================
+# PURE MATH
+# ============================================================================
+
+
+class TestTransforms:
+    def test_matrix_parts(self):
+        rotation, translation = matrix_parts(_ROT_Z90[:12] + [1.0, 2.0, 3.0, 1.0])
+        assert rotation == [0, -1, 0, 1, 0, 0, 0, 0, 1]
+        assert translation == [1.0, 2.0, 3.0]
+
+    def test_compose(self):
+        shift = matrix_parts(_translation(1.0, 0.0, 0.0))
+        turn = matrix_parts(_ROT_Z90)
+        rotation, translation = compose(turn, shift)
+        # Translate first, then rotate: (1, 0, 0) -> (0, 1, 0)
+        assert translation == pytest.approx([0.0, 1.0, 0.0])
+        assert rotation == [0, -1, 0, 1, 0, 0, 0, 0, 1]
+
+    def test_principal_moments_diagonal(self):
+        assert principal_moments(inertia_tensor([3.0, 1.0, 2.0, 0, 0, 0])) == [1.0, 2.0, 3.0]
+
+    def test_principal_moments_with_products(self):
+        # [[2, -1, 0], [-1, 2, 0], [0, 0, 5]] has eigenvalues 1, 3, 5
+        values = principal_moments(inertia_tensor([2.0, 2.0, 5.0, 1.0, 0.0, 0.0]))
+        assert values == pytest.approx([1.0, 3.0, 5.0])
+
+
+class TestAggregate:
+    def test_parallel_axis(self):
+        part = _props(mass=2.0, moments=(0.0, 0.0, 0.0, 0.0, 0.0, 0.0))
+        left = (part, matrix_parts(_translation(-1.0, 0, 0)))
+        right = (part, matrix_parts(_translation(1.0, 0, 0)))
+        total = aggregate([left, right])
+        assert total["mass"] == 4.0
+        assert total["center_of_gravity"] == pytest.approx([0.0, 0.0, 0.0])
+        ixx, iyy, izz = total["moments"][:3]
+        # Two 2 kg point masses 1 m either side of the center on X
+        assert (ixx, iyy, izz) == pytest.approx((0.0, 4.0, 4.0))
+
+    def test_rotation_swaps_axes(self):
+        total = aggregate([(_props(), matrix_parts(_ROT_Z90))])
+        assert total["moments"][:3] == pytest.approx([2.0, 1.0, 3.0])
+
+    def test_offset_cog_is_placed(self):
+        part = _props(cog=(0.5, 0.0, 0.0))
+        total = aggregate([(part, matrix_parts(_translation(0.0, 1.0, 0.0)))])
+        assert total["center_of_gravity"] == pytest.approx([0.5, 1.0, 0.0])
+
+    def test_products_of_inertia(self):
+        part = _props(mass=1.0, moments=(0.0, 0.0, 0.0, 0.0, 0.0, 0.0))
+        a = (part, matrix_parts(_translation(1.0, 1.0, 0.0)))
+        b = (part, matrix_parts(_translation(-1.0, -1.0, 0.0)))
+        total = aggregate([a, b])
+        # Ixy as integral(xy dm): 1*1*1 + 1*(-1)*(-1)
+        assert total["moments"][3] == pytest.approx(2.0)
+
+
+class TestMassPropertiesCache:
+    def test_hit_requires_same_generation(self):
+        cache = MassPropertiesCache()
+        cache.put("doc", 1, 7850.0, 0.99, _props())
+        assert cache.get("doc", 1, 7850.0, 0.99) is not None
+        assert cache.get("doc", 2, 7850.0, 0.99) is None
+
+    def test_other_density_is_scaled(self):
+        cache = MassPropertiesCache()
+        cache.put("doc", 1, 1000.0, 0.99, _props(mass=1.0))
+        scaled = cache.get("doc", 1, 2000.0, 0.99)
+        assert scaled["mass"] == 2.0
+        assert scaled["moments"][:3] == [2.0, 4.0, 6.0]
+        assert scaled["volume"] == 0.001
+
+    def test_any_density(self):
+        cache = MassPropertiesCache()
+        cache.put("doc", 1, 1000.0, 0.99, _props())
+        assert cache.get("doc", 1, None, 0.99)["volume"] == 0.001
+        assert cache.get("doc", 1, None, 0.5) is None
+
+    def test_lru_eviction(self):
+        cache = MassPropertiesCache(max_entries=2)
+        for name in ("a", "b", "c"):
+            cache.put(name, 1, 1.0, 0.99, _props())
+        assert cache.get("a", 1, 1.0, 0.99) is None
+        assert cache.get("c", 1, 1.0, 0.99) is not None
+        assert cache.clear() == 2
+
+
+# ============================================================================
+# PART PROPERTIES SERVED FROM THE CACHE
+# ============================================================================
+
+
+class TestCachedPartProperties:
+    def test_five_queries_compute_once(self, query_mgr):
+        qm, _doc, model = query_mgr
+        first = qm.get_mass_properties(7850)
+        assert first["cached"] is False
+        assert qm.get_mass_properties(7850)["cached"] is True
+        assert qm.get_volume()["volume"] == 0.001
+        assert qm.get_surface_area()["surface_area"] == 0.06
+        assert qm.get_center_of_gravity()["center_of_gravity"] == [0.0, 0.0, 0.0]
+        assert qm.get_moments_of_inertia()["moments_of_inertia"][:3] == [1.0, 2.0, 3.0]
+        model.ComputePhysicalPropertiesWithSpecifiedDensity.assert_called_once_with(7850, 0.99)
+
+    def test_edit_invalidates(self, query_mgr):
+        qm, _doc, model = query_mgr
+        qm.get_mass_properties()
+        model.Body.Volume = 0.002
+        assert qm.get_mass_properties()["cached"] is False
+        assert model.ComputePhysicalPropertiesWithSpecifiedDensity.call_count == 2
+
+    def test_unsaved_edit_keeping_volume_invalidates(self, query_mgr):
+        qm, doc, model = query_mgr
+        doc.Dirty = True
+        faces = [MagicMock(ID=1, Area=0.01), MagicMock(ID=2, Area=0.02)]
+        model.Body.Faces.return_value = _collection(faces)
+        qm.get_mass_properties()
+        assert qm.get_mass_properties()["cached"] is True
+        faces[1].Area = 0.025
+        assert qm.get_mass_properties()["cached"] is False
+        assert model.ComputePhysicalPropertiesWithSpecifiedDensity.call_count == 2
+
+    def test_saved_file_change_invalidates(self, query_mgr, tmp_path):
+        qm, doc, model = query_mgr
+        part = tmp_path / "block.par"
+        part.write_text("v1")
+        doc.FullName = str(part)
+        qm.get_mass_properties()
+        assert qm.get_mass_properties()["cached"] is True
+        stat = part.stat()
+        os.utime(part, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        assert qm.get_mass_properties()["cached"] is False
+
+    def test_refresh(self, query_mgr):
+        qm, _doc, model = query_mgr
+        qm.get_mass_properties()
+        qm.get_mass_properties(refresh=True)
+        assert model.ComputePhysicalPropertiesWithSpecifiedDensity.call_count == 2
+
+    def test_other_density_derived(self, query_mgr):
+        qm, _doc, model = query_mgr
+        qm.get_mass_properties(7850.0)
+        result = qm.get_mass_properties(2700.0)
+        assert result["cached"] is True
+        assert result["mass"] == pytest.approx(7.85 * 2700.0 / 7850.0)
+        model.ComputePhysicalPropertiesWithSpecifiedDensity.assert_called_once()
+
+
+# ============================================================================
+# ASSEMBLY ROLLUP
+# ============================================================================
+
+
+def _part_occurrence(file_name, matrix, part_doc):
+    occ = MagicMock()
+    occ.Name = file_name
+    occ.IsSuppressed = False
+    occ.OccurrenceFileName = file_name
+    occ.GetMatrix.return_value = matrix
+    occ.OccurrenceDocument = part_doc
+    return occ
+
+
+def _part_doc(file_name, mass):
+    part_doc = MagicMock()
+    part_doc.FullName = file_name
+    part_doc.Dirty = False
+    model = MagicMock()
+    model.Body.Volume = mass / 7850.0
+    model.Body.GetRange.return_value = ((0.0, 0.0, 0.0), (0.1, 0.1, 0.1))
+    model.ComputePhysicalPropertiesWithSpecifiedDensity.return_value = _physical_result(
+        volume=mass / 7850.0, mass=mass
+    )
+    part_doc.Models.Count = 1
+    part_doc.Models.Item.return_value = model
+    return part_doc, model
+
+
+def _collection(items):
+    coll = MagicMock()
+    coll.Count = len(items)
+    coll.Item.side_effect = lambda i: items[i - 1]
+    return coll
+
+
+class TestAssemblyMassProperties:
+    def test_instances_compute_once_per_file(self, query_mgr):
+        qm, doc, _model = query_mgr
+        bolt_doc, bolt_model = _part_doc("bolt.par", 0.5)
+        plate_doc, plate_model = _part_doc("plate.par", 3.0)
+        doc.Occurrences = _collection(
+            [
+                _part_occurrence("bolt.par", _translation(-1.0, 0, 0), bolt_doc),
+                _part_occurrence("bolt.par", _translation(1.0, 0, 0), bolt_doc),
+                _part_occurrence("plate.par", _translation(0, 0, 0), plate_doc),
+            ]
+        )
+        result = qm.get_assembly_mass_properties()
+        assert result["occurrence_count"] == 3
+        assert result["unique_parts"] == 2
+        assert result["mass"] == pytest.approx(4.0)
+        assert result["center_of_gravity"] == pytest.approx([0.0, 0.0, 0.0])
+        bolt_model.ComputePhysicalPropertiesWithSpecifiedDensity.assert_called_once()
+        plate_model.ComputePhysicalPropertiesWithSpecifiedDensity.assert_called_once()
+        # Parallel axis: 2 x 0.5 kg at 1 m adds 1.0 to Iyy over the summed part moments
+        assert result["moments_of_inertia"]["Iyy"] == pytest.approx(3 * 2.0 + 1.0)
+
+        again = qm.get_assembly_mass_properties()
+        assert again["computed_parts"] == 0
+        bolt_model.ComputePhysicalPropertiesWithSpecifiedDensity.assert_called_once()
+
+    def test_subassembly_transforms_compose(self, query_mgr):
+        qm, doc, _model = query_mgr
+        part_doc, _ = _part_doc("pin.par", 1.0)
+        sub_doc = MagicMock()
+        sub_doc.Occurrences = _collection(
+            [_part_occurrence("pin.par", _translation(0, 1.0, 0), part_doc)]
+        )
+        sub = _part_occurrence("sub.asm", _translation(2.0, 0, 0), sub_doc)
+        doc.Occurrences = _collection([sub])
+        result = qm.get_assembly_mass_properties()
+        assert result["center_of_gravity"] == pytest.approx([2.0, 1.0, 0.0])
+
+    def test_suppressed_and_unreadable(self, query_mgr):
+        qm, doc, _model = query_mgr
+        part_doc, _ = _part_doc("pin.par", 1.0)
+        suppressed = _part_occurrence("pin.par", _translation(5.0, 0, 0), part_doc)
+        suppressed.IsSuppressed = True
+        broken = _part_occurrence("gone.par", _translation(0, 0, 0), part_doc)
+        broken.GetMatrix.side_effect = Exception("missing file")
+        ok = _part_occurrence("pin.par", _translation(0, 0, 0), part_doc)
+        doc.Occurrences = _collection([suppressed, broken, ok])
+        result = qm.get_assembly_mass_properties()
+        assert result["occurrence_count"] == 1
+        assert result["skipped"][0]["error"] == "missing file"
+        assert math.isclose(result["mass"], 1.0)
+
+    def test_inactive_occurrences_loaded(self, query_mgr):
+        qm, doc, _model = query_mgr
+        part_doc, _ = _part_doc("pin.par", 1.0)
+        occ = _part_occurrence("pin.par", _translation(0, 0, 0), part_doc)
+        occ.Activate = False
+        doc.Occurrences = _collection([occ])
+        result = qm.get_assembly_mass_properties()
+        assert occ.Activate is True
+        assert result["occurrence_count"] == 1
+        assert result["skipped"] == []
+
+    def test_empty_assembly(self, query_mgr):
+        qm, doc, _model = query_mgr
+        doc.Occurrences = _collection([])
+        assert "error" in qm.get_assembly_mass_properties()
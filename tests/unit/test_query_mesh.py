@@ -0,0 +1,156 @@
+"""
+Unit tests for the triangle mesh, BVH and BVH cache (_mesh.py).
+
+Pure Python geometry; meshes are built in the test instead of from COM.
+"""
+
+import math
+
+import pytest
+
+from solidedge_mcp.backends.query._mesh import BVH, MeshCache, TriangleMesh
+
+
+def _box_mesh(size=(1.0, 1.0, 1.0), origin=(0.0, 0.0, 0.0)):
+    """Closed, outward-wound box; face IDs 1..6 = -Z, +Z, -Y, +Y, +X, -X."""
+    sx, sy, sz = size
+    ox, oy, oz = origin
+    v = [
+        (ox + x * sx, oy + y * sy, oz + z * sz)
+        for x, y, z in [
+            (0, 0, 0),
+            (1, 0, 0),
+            (1, 1, 0),
+            (0, 1, 0),
+            (0, 0, 1),
+            (1, 0, 1),
+            (1, 1, 1),
+            (0, 1, 1),
+        ]
+    ]
+    quads = [(0, 3, 2, 1), (4, 5, 6, 7), (0, 1, 5, 4), (2, 3, 7, 6), (1, 2, 6, 5), (3, 0, 4, 7)]
+    coords, ids = [], []
+    for face_id, (a, b, c, d) in enumerate(quads, start=1):
+        for tri in ((a, b, c), (a, c, d)):
+            for k in tri:
+                coords.extend(v[k])
+            ids.append(face_id)
+    return TriangleMesh(coords, ids)
+
+
+def _sphere_mesh(radius=1.0, nu=40, nv=20):
+    def p(i, j):
+        theta, phi = 2 * math.pi * i / nu, math.pi * j / nv
+        return (
+            radius * math.sin(phi) * math.cos(theta),
+            radius * math.sin(phi) * math.sin(theta),
+            radius * math.cos(phi),
+        )
+
+    coords, ids = [], []
+    for i in range(nu):
+        for j in range(nv):
+            a, b, c, d = p(i, j), p(i + 1, j), p(i + 1, j + 1), p(i, j + 1)
+            coords.extend(a + c + b)
+            coords.extend(a + d + c)
+            ids.extend((j, j))
+    return TriangleMesh(coords, ids)
+
+
+class TestTriangleMesh:
+    def test_from_facet_data(self):
+        box = _box_mesh()
+        data = (len(box), tuple(box.coords), (), (), (), tuple(box.face_ids))
+        mesh = TriangleMesh.from_facet_data(data)
+        assert len(mesh) == 12
+        assert list(mesh.face_ids) == list(box.face_ids)
+
+    def test_from_facet_data_without_face_ids(self):
+        data = (1, (0, 0, 0, 1, 0, 0, 0, 1, 0), ())
+        mesh = TriangleMesh.from_facet_data(data)
+        assert list(mesh.face_ids) == [-1]
+
+    def test_rejects_bad_lengths(self):
+        with pytest.raises(ValueError):
+            TriangleMesh([0.0] * 8, [1])
+        with pytest.raises(ValueError):
+            TriangleMesh.from_facet_data(None)
+
+    def test_facet_normals(self):
+        normals, areas = _box_mesh(size=(2.0, 1.0, 1.0)).facet_normals()
+        assert list(normals[0:3]) == [0.0, 0.0, -1.0]
+        assert list(normals[3 * 2 : 3 * 2 + 3]) == [0.0, 0.0, 1.0]
+        assert sum(areas) == pytest.approx(2 * (2 + 2 + 1))
+
+
+class TestBVH:
+    def test_first_hit(self):
+        bvh = BVH(_box_mesh())
+        dist, tri = bvh.first_hit((0.3, 0.4, -1.0), (0.0, 0.0, 1.0))
+        assert dist == pytest.approx(1.0)
+        assert bvh.face_ids[tri] == 1
+
+    def test_all_hits_sorted(self):
+        bvh = BVH(_box_mesh())
+        hits = bvh.ray_hits((0.3, 0.4, -1.0), (0.0, 0.0, 1.0))
+        assert [round(d, 9) for d, _ in hits] == [1.0, 2.0]
+        assert [bvh.face_ids[t] for _, t in hits] == [1, 2]
+
+    def test_miss(self):
+        bvh = BVH(_box_mesh())
+        assert bvh.first_hit((2.0, 2.0, -1.0), (0.0, 0.0, 1.0)) is None
+        assert bvh.first_hit((0.5, 0.5, -1.0), (0.0, 0.0, -1.0)) is None
+
+    def test_occluded(self):
+        bvh = BVH(_box_mesh())
+        assert bvh.occluded((0.5, 0.5, -1.0), (0.0, 0.0, 1.0))
+        assert not bvh.occluded((0.5, 0.5, -1.0), (0.0, 0.0, 1.0), max_distance=0.5)
+        assert not bvh.occluded((0.5, 0.5, 1.0 + 1e-7), (0.0, 0.0, 1.0))
+        assert len(bvh.ray_hits((0.5, 0.5, -1.0), (0.0, 0.0, 1.0), any_hit=True)) == 1
+
+    def test_contains_box(self):
+        bvh = BVH(_box_mesh())
+        assert bvh.contains((0.5, 0.5, 0.5))
+        assert bvh.contains((0.01, 0.99, 0.5))
+        assert not bvh.contains((1.5, 0.5, 0.5))
+        assert not bvh.contains((-0.01, 0.5, 0.5))
+
+    def test_contains_sphere_matches_distance(self):
+        bvh = BVH(_sphere_mesh())
+        assert bvh.node_count > 1
+        for i in range(200):
+            p = (math.sin(i) * 1.3, math.cos(i * 1.7) * 1.3, math.sin(i * 0.3) * 1.3)
+            r = math.dist(p, (0, 0, 0))
+            if abs(r - 1.0) > 0.02:
+                assert bvh.contains(p) == (r < 1.0), p
+
+    def test_empty_mesh(self):
+        bvh = BVH(TriangleMesh([], []))
+        assert bvh.first_hit((0, 0, 0), (1, 0, 0)) is None
+        assert not bvh.contains((0, 0, 0))
+
+
+class TestMeshCache:
+    def test_reuses_unchanged_mesh(self):
+        cache = MeshCache()
+        first, cached = cache.bvh(("part", 0.0), _box_mesh())
+        assert not cached
+        again, cached = cache.bvh(("part", 0.0), _box_mesh())
+        assert cached
+        assert again is first
+        assert (cache.builds, cache.hits) == (1, 1)
+
+    def test_rebuilds_changed_geometry(self):
+        cache = MeshCache()
+        cache.bvh(("part", 0.0), _box_mesh())
+        bvh, cached = cache.bvh(("part", 0.0), _box_mesh(size=(2.0, 1.0, 1.0)))
+        assert not cached
+        assert bvh.first_hit((1.5, 0.5, -1.0), (0.0, 0.0, 1.0)) is not None
+
+    def test_lru_eviction(self):
+        cache = MeshCache(max_entries=2)
+        for name in ("a", "b", "c"):
+            cache.bvh((name, 0.0), _box_mesh())
+        assert not cache.bvh(("a", 0.0), _box_mesh())[1]
+        assert cache.bvh(("c", 0.0), _box_mesh())[1]
+        assert cache.clear() == 2
@@ -0,0 +1,117 @@
+"""
+Unit tests for draft-angle and undercut analysis (_moldability.py mixin).
+
+The active body is mocked; its tessellation is a real mesh of boxes.
+"""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from solidedge_mcp.backends.query._mesh import TriangleMesh
+
+from .test_query_mesh import _box_mesh
+
+
+def _make_query_mgr(mesh):
+    from solidedge_mcp.backends.query import QueryManager
+
+    dm = MagicMock()
+    doc = MagicMock()
+    dm.get_active_document.return_value = doc
+    model = MagicMock()
+    doc.Models.Count = 1
+    doc.Models.Item.return_value = model
+    body = model.Body
+
+    face_ids = sorted(set(mesh.face_ids))
+    faces = [MagicMock(ID=100 + i) for i in face_ids]
+    body.Faces.return_value.Count = len(faces)
+    body.Faces.return_value.Item.side_effect = lambda i: faces[i - 1]
+    body.GetFacetData.return_value = (
+        len(mesh),
+        tuple(mesh.coords),
+        (),
+        (),
+        (),
+        tuple(100 + i for i in mesh.face_ids),
+    )
+    return QueryManager(dm), dm, body, faces
+
+
+def _stacked_boxes():
+    """Unit box with a second box hovering above it (face IDs 1..6 and 7..12)."""
+    lower, upper = _box_mesh(), _box_mesh(origin=(0.0, 0.0, 2.0))
+    return TriangleMesh(
+        list(lower.coords) + list(upper.coords),
+        list(lower.face_ids) + [i + 6 for i in upper.face_ids],
+    )
+
+
+class TestAnalyzeDraft:
+    def test_box_classes(self):
+        qm, _, body, _ = _make_query_mgr(_box_mesh())
+        result = qm.analyze_draft(only_problems=False)
+        assert result["counts"] == {"positive": 1, "negative": 1, "insufficient": 4, "undercut": 0}
+        by_index = {f["face_index"]: f for f in result["faces"]}
+        assert by_index[0]["class"] == "negative"
+        assert by_index[0]["min_draft"] == pytest.approx(-90.0)
+        assert by_index[1]["class"] == "positive"
+        assert by_index[2]["class"] == "insufficient"
+        assert by_index[2]["max_draft"] == pytest.approx(0.0)
+        assert by_index[2]["insufficient_area"] == pytest.approx(1.0)
+        assert result["facet_count"] == 12
+        body.GetFacetData.assert_called_once_with(0.0)
+
+    def test_only_problems(self):
+        qm, _, _, _ = _make_query_mgr(_box_mesh())
+        result = qm.analyze_draft()
+        assert [f["face_index"] for f in result["faces"]] == [2, 3, 4, 5]
+
+    def test_side_pull_direction(self):
+        qm, _, _, _ = _make_query_mgr(_box_mesh())
+        result = qm.analyze_draft(pull_direction=[2.0, 0.0, 0.0], only_problems=False)
+        by_index = {f["face_index"]: f["class"] for f in result["faces"]}
+        assert by_index[4] == "positive"
+        assert by_index[5] == "negative"
+        assert result["pull_direction"] == [1.0, 0.0, 0.0]
+
+    def test_undercut_detected(self):
+        qm, _, _, _ = _make_query_mgr(_stacked_boxes())
+        result = qm.analyze_draft()
+        undercuts = sorted(f["face_index"] for f in result["faces"] if f["class"] == "undercut")
+        # Top of the lower box looks up into the upper one, and vice versa
+        assert undercuts == [1, 6]
+        assert result["undercut_rays"] > 0
+
+    def test_skip_undercuts(self):
+        qm, _, _, _ = _make_query_mgr(_stacked_boxes())
+        result = qm.analyze_draft(check_undercuts=False)
+        assert result["counts"]["undercut"] == 0
+        assert result["undercut_rays"] == 0
+
+    def test_color_faces(self):
+        qm, dm, _, faces = _make_query_mgr(_box_mesh())
+        result = qm.analyze_draft(color_faces=True, check_undercuts=False)
+        assert result["colored"] == 6
+        faces[1].SetColor.assert_called_once_with(0, 170, 0)
+        faces[2].SetColor.assert_called_once_with(240, 200, 0)
+        dm.connection.performance_scope.assert_called_once_with()
+
+    def test_color_errors_reported(self):
+        qm, _, _, faces = _make_query_mgr(_box_mesh())
+        faces[0].SetColor.side_effect = Exception("no")
+        type(faces[0]).Color = property(lambda s: 0)  # read-only: fallback fails too
+        result = qm.analyze_draft(color_faces=True, check_undercuts=False)
+        assert result["colored"] == 5
+        assert result["color_errors"][0]["face_index"] == 0
+
+    def test_invalid_arguments(self):
+        qm, _, _, _ = _make_query_mgr(_box_mesh())
+        assert "error" in qm.analyze_draft(pull_direction=[0, 0, 0])
+        assert "error" in qm.analyze_draft(min_draft=95)
+
+    def test_empty_tessellation(self):
+        qm, _, body, _ = _make_query_mgr(_box_mesh())
+        body.GetFacetData.return_value = (0, (), (), (), (), ())
+        assert "error" in qm.analyze_draft()
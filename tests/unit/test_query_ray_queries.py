@@ -0,0 +1,137 @@
+"""
+Unit tests for batch ray casting and point containment (_ray_queries.py mixin).
+
+Uses unittest.mock to simulate COM objects; the mesh method runs on a real
+tessellated box.
+"""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from .test_query_mesh import _box_mesh
+
+
+@pytest.fixture
+def query_mgr():
+    """QueryManager whose active body is a unit box with face IDs 1..6."""
+    from solidedge_mcp.backends.query import QueryManager
+
+    dm = MagicMock()
+    doc = MagicMock()
+    dm.get_active_document.return_value = doc
+    model = MagicMock()
+    doc.Models.Count = 1
+    doc.Models.Item.return_value = model
+    body = model.Body
+
+    faces = [MagicMock(ID=100 + i) for i in range(1, 7)]
+    body.Faces.return_value.Count = 6
+    body.Faces.return_value.Item.side_effect = lambda i: faces[i - 1]
+
+    box = _box_mesh()
+    # Face IDs in the tessellation match the B-Rep face IDs
+    body.GetFacetData.return_value = (
+        len(box),
+        tuple(box.coords),
+        (),
+        (),
+        (),
+        tuple(100 + i for i in box.face_ids),
+    )
+    return QueryManager(dm), body, faces
+
+
+class TestGetFacesByRays:
+    def test_mesh_all_hits(self, query_mgr):
+        qm, body, _ = query_mgr
+        rays = [0.3, 0.4, -1.0, 0, 0, 1, 5, 5, 5, 1, 0, 0]
+        result = qm.get_faces_by_rays(rays, method="mesh")
+        assert result["method"] == "mesh"
+        assert result["hits"] == [[0, 1], []]
+        assert result["distances"][0] == [1.0, 2.0]
+        assert result["hit_count"] == 1
+        body.GetFacetData.assert_called_once_with(0.0)
+        body.FacesByRay.assert_not_called()
+
+    def test_mesh_first_hit(self, query_mgr):
+        qm, _, _ = query_mgr
+        rays = [2.0, 0.5, 0.5, -1, 0, 0, 5, 5, 5, 1, 0, 0]
+        result = qm.get_faces_by_rays(rays, method="mesh", first_hit_only=True)
+        assert result["hits"] == [4, -1]
+        assert result["distances"] == [1.0, None]
+
+    def test_com_resolves_body_once(self, query_mgr):
+        qm, body, faces = query_mgr
+        hit = MagicMock(Count=2)
+        hit.Item.side_effect = lambda i: [faces[0], faces[1]][i - 1]
+        body.FacesByRay.return_value = hit
+        result = qm.get_faces_by_rays([0, 0, 0, 0, 0, 1] * 3)
+        assert result["method"] == "com"
+        assert result["hits"] == [[0, 1]] * 3
+        assert body.FacesByRay.call_count == 3
+        body.Faces.assert_called_once()
+        qm.doc_manager.get_active_document.assert_called_once()
+
+    def test_com_ray_error_recorded(self, query_mgr):
+        qm, body, _ = query_mgr
+        body.FacesByRay.side_effect = Exception("bad ray")
+        result = qm.get_faces_by_rays([0, 0, 0, 0, 0, 0], first_hit_only=True)
+        assert result["hits"] == [-1]
+        assert result["errors"][0]["ray"] == 0
+
+    def test_auto_switches_to_mesh(self, query_mgr):
+        qm, _, _ = query_mgr
+        result = qm.get_faces_by_rays([0.5, 0.5, 0.5, 0, 0, 1] * 500, method="auto")
+        assert result["method"] == "mesh"
+        assert result["hits"][0] == [1]
+
+    @pytest.mark.parametrize(
+        "rays, method", [([], "com"), ([0, 0, 0, 1], "com"), ([0, 0, 0, 0, 0, 1], "fast")]
+    )
+    def test_invalid_input(self, query_mgr, rays, method):
+        qm, _, _ = query_mgr
+        assert "error" in qm.get_faces_by_rays(rays, method=method)
+
+
+class TestArePointsInsideBody:
+    def test_mesh(self, query_mgr):
+        qm, body, _ = query_mgr
+        result = qm.are_points_inside_body([0.5, 0.5, 0.5, 1.5, 0.5, 0.5], method="mesh")
+        assert result["inside"] == [1, 0]
+        assert result["inside_count"] == 1
+        body.Shells.Item.assert_not_called()
+
+    def test_com_reuses_buffer(self, query_mgr, monkeypatch):
+        qm, body, _ = query_mgr
+        buffers = []
+
+        class FakeVariant:
+            def __init__(self, vartype, value):
+                self.value = value
+                buffers.append(self)
+
+        import win32com.client
+
+        monkeypatch.setattr(win32com.client, "VARIANT", FakeVariant)
+        shell = body.Shells.Item.return_value
+        body.Shells.Count = 1
+        seen = []
+        shell.IsPointInside.side_effect = lambda buf: (
+            seen.append(list(buf.value)) or (buf.value[0] < 1)
+        )
+
+        result = qm.are_points_inside_body([0.5, 0.5, 0.5, 1.5, 0.5, 0.5])
+        assert result["method"] == "com"
+        assert result["inside"] == [1, 0]
+        assert len(buffers) == 1
+        assert seen == [[0.5, 0.5, 0.5], [1.5, 0.5, 0.5]]
+
+    def test_com_no_shells(self, query_mgr):
+        qm, body, _ = query_mgr
+        body.Shells.Count = 0
+        assert "error" in qm.are_points_inside_body([0, 0, 0])
+
+    def test_invalid_points(self, query_mgr):
+        qm, _, _ = query_mgr
+        assert "error" in qm.are_points_inside_body([0, 0])
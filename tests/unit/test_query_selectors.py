@@ -0,0 +1,148 @@
+"""
+Unit tests for the face/edge selector language (_selectors.py).
+
+Selectors are evaluated against hand-written snapshot records.
+"""
+
+import pytest
+
+from solidedge_mcp.backends.query._selectors import parse_selector
+
+EDGES = [
+    {
+        "index": 0,
+        "type": "line",
+        "length": 0.02,
+        "direction": [0, 0, 0.02],
+        "faces": [1, 2],
+        "face_count": 2,
+    },
+    {
+        "index": 1,
+        "type": "line",
+        "length": 0.005,
+        "direction": [0.005, 0, 0],
+        "faces": [1],
+        "face_count": 1,
+    },
+    {
+        "index": 2,
+        "type": "circle",
+        "radius": 0.002,
+        "axis": [0, 0, 1],
+        "length": 0.0126,
+        "faces": [2, 4],
+        "face_count": 2,
+    },
+]
+
+FACES = [
+    {
+        "index": 0,
+        "type": "plane",
+        "area": 4e-4,
+        "normal": [0, 0, 1],
+        "edge_count": 4,
+        "adjacent": [1, 2],
+    },
+    {
+        "index": 1,
+        "type": "cylinder",
+        "area": 1e-4,
+        "radius": 0.0015,
+        "axis": [0, 0, 1],
+        "edge_count": 2,
+        "adjacent": [0],
+    },
+    {
+        "index": 2,
+        "type": "cylinder",
+        "area": 3e-4,
+        "radius": 0.004,
+        "axis": [1, 0, 0],
+        "edge_count": 2,
+        "adjacent": [0],
+    },
+]
+
+
+def _select(text, records):
+    return parse_selector(text).matching(records)
+
+
+class TestEdgeSelectors:
+    def test_example_line_parallel_length(self):
+        assert _select("edges where type=line and parallel to Z and length>10mm", EDGES) == [0]
+
+    def test_all_edges(self):
+        assert _select("edges", EDGES) == [0, 1, 2]
+
+    def test_bare_type_and_alias(self):
+        assert _select("edges arc", EDGES) == [2]
+        assert _select("edge circular", EDGES) == [2]
+
+    def test_type_in_and_not_equal(self):
+        assert _select("edges type in (circle, ellipse)", EDGES) == [2]
+        assert _select("edges type != line", EDGES) == [2]
+
+    def test_units(self):
+        assert _select("edges length <= 5 mm", EDGES) == [1]
+        assert _select("edges length < 1 in", EDGES) == [0, 1, 2]
+        assert _select("edges diameter = 4mm", EDGES) == [2]
+
+    def test_between(self):
+        assert _select("edges length between 4mm and 13mm", EDGES) == [1, 2]
+
+    def test_boolean_operators(self):
+        assert _select("edges not (type=circle or length<=5mm)", EDGES) == [0]
+        assert _select("edges type=circle or length<6mm", EDGES) == [1, 2]
+
+    def test_direction_vectors(self):
+        assert _select("edges perpendicular to Z", EDGES) == [1]
+        assert _select("edges parallel to [0, 0, -3]", EDGES) == [0, 2]
+
+    def test_on_face(self):
+        assert _select("edges on face 2", EDGES) == [0, 2]
+
+    def test_face_count(self):
+        assert _select("edges with face_count=1", EDGES) == [1]
+
+
+class TestFaceSelectors:
+    def test_example_cylinder_radius(self):
+        assert _select("faces of type cylinder with radius<3mm", FACES) == [1]
+
+    def test_normal_and_axis_directions(self):
+        assert _select("faces parallel to z", FACES) == [0, 1]
+        assert _select("faces planar and perpendicular to X", FACES) == [0]
+
+    def test_area_units(self):
+        assert _select("faces area > 2 cm2", FACES) == [0, 2]
+        assert _select("faces area >= 300 mm^2", FACES) == [0, 2]
+
+    def test_adjacent(self):
+        assert _select("faces adjacent to face 0", FACES) == [1, 2]
+
+    def test_missing_attribute_does_not_match(self):
+        assert _select("faces radius > 0", FACES) == [1, 2]
+
+
+class TestSelectorErrors:
+    @pytest.mark.parametrize(
+        "text",
+        [
+            "",
+            "walls where type=line",
+            "edges type=cylinder",
+            "edges length>5mm2",
+            "edges length",
+            "faces on face 2",
+            "edges (type=line",
+            "edges parallel to W",
+            "edges length>5 extra",
+            "faces area<1deg",
+        ],
+    )
+    def test_invalid(self, text):
+        with pytest.raises(ValueError):
+            parse_selector(text)
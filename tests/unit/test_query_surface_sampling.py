@@ -0,0 +1,128 @@
+"""
+Unit tests for gridded surface sampling (_surface_sampling.py mixin).
+
+Uses unittest.mock to simulate COM objects; VARIANT is replaced by a plain
+buffer so the out-arrays can be filled by the fake face.
+"""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+
+class FakeVariant:
+    def __init__(self, vartype, value):
+        self.value = list(value)
+
+
+@pytest.fixture
+def query_mgr(monkeypatch):
+    """QueryManager whose body has two planar faces with u, v in [0, 2] x [10, 20]."""
+    import win32com.client
+
+    from solidedge_mcp.backends.query import QueryManager
+
+    monkeypatch.setattr(win32com.client, "VARIANT", FakeVariant)
+
+    dm = MagicMock()
+    doc = MagicMock()
+    dm.get_active_document.return_value = doc
+    doc.Models.Count = 1
+    body = doc.Models.Item.return_value.Body
+
+    def make_face(face_id):
+        face = MagicMock(ID=face_id)
+
+        def param_range(lo, hi):
+            lo.value, hi.value = [0.0, 10.0], [2.0, 20.0]
+
+        def points(n, params, out):
+            uv = params.value
+            out.value = [c for k in range(n) for c in (uv[2 * k], uv[2 * k + 1], 0.0)]
+
+        def normals(n, params, out):
+            out.value = [0.0, 0.0, 1.0] * n
+
+        def curvatures(n, params, tangents, max_c, min_c):
+            tangents.value = [1.0, 0.0, 0.0] * n
+            max_c.value = [0.5] * n
+            min_c.value = [0.25] * n
+
+        face.GetParamRange.side_effect = param_range
+        face.GetPointAtParam.side_effect = points
+        face.GetNormal.side_effect = normals
+        face.GetCurvatures.side_effect = curvatures
+        return face
+
+    faces = [make_face(11), make_face(12)]
+    body.Faces.return_value.Count = 2
+    body.Faces.return_value.Item.side_effect = lambda i: faces[i - 1]
+    return QueryManager(dm), faces
+
+
+class TestSampleFaceProperties:
+    def test_grid_all_faces(self, query_mgr):
+        qm, faces = query_mgr
+        result = qm.sample_face_properties(grid=[2, 1])
+
+        assert result["face_count"] == 2
+        assert result["samples_per_face"] == 2
+        entry = result["faces"][0]
+        assert entry["face_id"] == 11
+        assert entry["param_range"] == [0.0, 10.0, 2.0, 20.0]
+        # cell centers (0.25, 0.5), (0.75, 0.5) mapped onto the face range
+        assert entry["params"] == [0.5, 15.0, 1.5, 15.0]
+        assert entry["positions"] == [0.5, 15.0, 0.0, 1.5, 15.0, 0.0]
+        assert entry["normals"] == [0.0, 0.0, 1.0] * 2
+        assert entry["max_curvatures"] == [0.5, 0.5]
+        assert entry["min_curvatures"] == [0.25, 0.25]
+        assert entry["max_tangents"] == [1.0, 0.0, 0.0] * 2
+
+    def test_one_call_per_property(self, query_mgr):
+        qm, faces = query_mgr
+        qm.sample_face_properties(face_indices=[1], grid=[10, 10])
+        assert faces[1].GetNormal.call_count == 1
+        assert faces[1].GetNormal.call_args[0][0] == 100
+        assert faces[1].GetCurvatures.call_count == 1
+        faces[0].GetNormal.assert_not_called()
+
+    def test_params_and_property_subset(self, query_mgr):
+        qm, faces = query_mgr
+        result = qm.sample_face_properties(
+            face_indices=[0], params=[0.0, 0.0, 1.0, 1.0], properties=["normal"]
+        )
+        entry = result["faces"][0]
+        assert entry["params"] == [0.0, 10.0, 2.0, 20.0]
+        assert "normals" in entry
+        assert "positions" not in entry
+        faces[0].GetCurvatures.assert_not_called()
+
+    def test_unmapped_params_without_range(self, query_mgr):
+        qm, faces = query_mgr
+        faces[0].GetParamRange.side_effect = Exception("not supported")
+        result = qm.sample_face_properties(face_indices=[0], params=[0.3, 0.7])
+        entry = result["faces"][0]
+        assert entry["params"] == [0.3, 0.7]
+        assert "param_range" not in entry
+
+    def test_property_error_kept_per_face(self, query_mgr):
+        qm, faces = query_mgr
+        faces[0].GetCurvatures.side_effect = Exception("singular")
+        result = qm.sample_face_properties(face_indices=[0], grid=[1, 1])
+        entry = result["faces"][0]
+        assert entry["errors"] == {"curvature": "singular"}
+        assert entry["normals"] == [0.0, 0.0, 1.0]
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            {"face_indices": [5]},
+            {"grid": [0, 3]},
+            {"params": [0.5]},
+            {"properties": ["color"]},
+            {"grid": [1000, 1000]},
+        ],
+    )
+    def test_invalid(self, query_mgr, kwargs):
+        qm, _ = query_mgr
+        assert "error" in qm.sample_face_properties(**kwargs)
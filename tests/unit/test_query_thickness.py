@@ -0,0 +1,129 @@
+"""
+Unit tests for wall-thickness analysis (_thickness.py mixin).
+
+The active body is mocked; its tessellation is a real mesh of a flat plate.
+"""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from solidedge_mcp.backends.query._mesh import BVH
+from solidedge_mcp.backends.query._thickness import (
+    _init_worker,
+    _sample_facets,
+    _trace_in_worker,
+)
+
+from .test_query_mesh import _box_mesh
+
+
+@pytest.fixture
+def query_mgr():
+    """QueryManager whose active body is a 1 x 1 x 0.002 plate, face IDs 101..106."""
+    from solidedge_mcp.backends.query import QueryManager
+
+    dm = MagicMock()
+    doc = MagicMock()
+    doc.FullName = "C:/parts/plate.par"
+    dm.get_active_document.return_value = doc
+    model = MagicMock()
+    doc.Models.Count = 1
+    doc.Models.Item.return_value = model
+    body = model.Body
+
+    faces = [MagicMock(ID=100 + i) for i in range(1, 7)]
+    body.Faces.return_value.Count = 6
+    body.Faces.return_value.Item.side_effect = lambda i: faces[i - 1]
+
+    plate = _box_mesh(size=(1.0, 1.0, 0.002))
+    body.GetFacetData.return_value = (
+        len(plate),
+        tuple(plate.coords),
+        (),
+        (),
+        (),
+        tuple(100 + i for i in plate.face_ids),
+    )
+    return QueryManager(dm), body
+
+
+class TestAnalyzeWallThickness:
+    def test_plate_thickness(self, query_mgr):
+        qm, body = query_mgr
+        result = qm.analyze_wall_thickness()
+        assert result["min_thickness"] == pytest.approx(0.002)
+        assert result["sample_count"] == 12
+        assert result["missed_rays"] == 0
+        by_index = {f["face_index"]: f for f in result["faces"]}
+        assert by_index[0]["min_thickness"] == pytest.approx(0.002)
+        assert by_index[1]["avg_thickness"] == pytest.approx(0.002)
+        # Side walls measure across the plate
+        assert by_index[4]["min_thickness"] == pytest.approx(1.0)
+        assert result["hotspots"][0]["thickness"] == pytest.approx(0.002)
+        body.GetFacetData.assert_called_once_with(0.0)
+
+    def test_min_thickness_flags(self, query_mgr):
+        qm, _ = query_mgr
+        result = qm.analyze_wall_thickness(min_thickness=0.003)
+        assert result["thin_face_count"] == 2
+        assert result["thin_sample_count"] == 4
+        assert {h["face_index"] for h in result["hotspots"]} == {0, 1}
+        assert [f["face_index"] for f in result["faces"] if f["thin"]] == [0, 1]
+
+    def test_face_filter(self, query_mgr):
+        qm, _ = query_mgr
+        result = qm.analyze_wall_thickness(face_indices=[4])
+        assert [f["face_index"] for f in result["faces"]] == [4]
+        assert result["sample_count"] == 2
+
+    def test_bvh_cached_between_calls(self, query_mgr):
+        qm, _ = query_mgr
+        assert not qm.analyze_wall_thickness()["bvh_cached"]
+        assert qm.analyze_wall_thickness()["bvh_cached"]
+
+    def test_bvh_rebuilt_after_edit(self, query_mgr):
+        qm, body = query_mgr
+        qm.analyze_wall_thickness()
+        thicker = _box_mesh(size=(1.0, 1.0, 0.004))
+        ids = tuple(100 + i for i in thicker.face_ids)
+        body.GetFacetData.return_value = (len(thicker), tuple(thicker.coords), (), (), (), ids)
+        result = qm.analyze_wall_thickness()
+        assert not result["bvh_cached"]
+        assert result["min_thickness"] == pytest.approx(0.004)
+
+    def test_hotspot_limit(self, query_mgr):
+        qm, _ = query_mgr
+        assert len(qm.analyze_wall_thickness(max_hotspots=3)["hotspots"]) == 3
+
+    def test_invalid_arguments(self, query_mgr):
+        qm, _ = query_mgr
+        assert "error" in qm.analyze_wall_thickness(max_samples=0)
+        assert "error" in qm.analyze_wall_thickness(min_thickness=-1.0)
+        assert "error" in qm.analyze_wall_thickness(workers=-1)
+        assert "error" in qm.analyze_wall_thickness(face_indices=[9])
+
+
+class TestSampleFacets:
+    def test_all_under_limit(self):
+        box = _box_mesh()
+        areas = [0.5] * len(box)
+        assert _sample_facets(box, areas, None, 100) == list(range(12))
+
+    def test_budget_keeps_every_face(self):
+        box = _box_mesh()
+        areas = [0.5] * len(box)
+        sampled = _sample_facets(box, areas, None, 3)
+        assert sorted({box.face_ids[t] for t in sampled}) == [1, 2, 3, 4, 5, 6]
+
+    def test_face_subset(self):
+        box = _box_mesh()
+        sampled = _sample_facets(box, [0.5] * len(box), {2}, 100)
+        assert {box.face_ids[t] for t in sampled} == {2}
+
+
+class TestWorkerTracing:
+    def test_worker_uses_initialized_bvh(self):
+        _init_worker(BVH(_box_mesh()))
+        rays = [0.5, 0.5, 0.5, 0, 0, 1, 5, 5, 5, 1, 0, 0]
+        assert _trace_in_worker(rays) == [pytest.approx(0.5), None]
@@ -0,0 +1,154 @@
+"""
+Unit tests for the topology snapshot and selector queries (_topology.py mixin).
+
+Uses unittest.mock to simulate faces, edges and their geometry.
+"""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+_FACE_PROBES = (
+    "GetPlaneData",
+    "GetCylinderData",
+    "GetConeData",
+    "GetSphereData",
+    "GetTorusData",
+    "GetBSplineInfo",
+)
+_EDGE_PROBES = ("GetCircleData", "GetEllipseData", "GetBSplineInfo")
+
+
+def _geometry(probes, method=None, data=None):
+    """Geometry whose only working probe is `method` (none: every probe fails)."""
+    geom = MagicMock()
+    for name in probes:
+        getattr(geom, name).side_effect = Exception("not this type")
+    if method:
+        getattr(geom, method).side_effect = None
+        getattr(geom, method).return_value = data
+    return geom
+
+
+def _edge(edge_id, start, end, length, circle=None):
+    edge = MagicMock(ID=edge_id, Length=length)
+    if circle:
+        edge.Geometry = _geometry(_EDGE_PROBES, "GetCircleData", circle)
+    else:
+        edge.Geometry = _geometry(_EDGE_PROBES)
+    edge.GetEndPoints.return_value = (tuple(start), tuple(end))
+    return edge
+
+
+def _face(face_id, area, edges, method, data):
+    face = MagicMock(ID=face_id, Area=area)
+    face.Geometry = _geometry(_FACE_PROBES, method, data)
+    face.Edges.Count = len(edges)
+    face.Edges.Item.side_effect = lambda i: edges[i - 1]
+    return face
+
+
+@pytest.fixture
+def body_setup():
+    """Top plane, a 1.5 mm bore and a side plane sharing edges."""
+    from solidedge_mcp.backends.query import QueryManager
+
+    vertical = _edge(11, (0, 0, 0), (0, 0, 0.02), 0.02)
+    horizontal = _edge(12, (0, 0, 0.02), (0.03, 0, 0.02), 0.03)
+    rim = _edge(
+        13, (0.0015, 0, 0.02), (0.0015, 0, 0.02), 0.0094, circle=((0, 0, 0.02), (0, 0, 1), 0.0015)
+    )
+    faces = [
+        _face(1, 6e-4, [horizontal, rim], "GetPlaneData", ((0, 0, 0.02), (0, 0, 1))),
+        _face(2, 2e-4, [rim], "GetCylinderData", ((0, 0, 0), (0, 0, 1), 0.0015)),
+        _face(3, 6e-4, [vertical, horizontal], "GetPlaneData", ((0, 0, 0), (0, 1, 0))),
+    ]
+
+    dm = MagicMock()
+    doc = MagicMock(FullName="C:/parts/block.par")
+    dm.get_active_document.return_value = doc
+    model = MagicMock()
+    doc.Models.Count = 1
+    doc.Models.Item.return_value = model
+    body = model.Body
+    body.Faces.return_value.Count = len(faces)
+    body.Faces.return_value.Item.side_effect = lambda i: faces[i - 1]
+    return QueryManager(dm), dm, doc, faces
+
+
+class TestTopologySnapshot:
+    def test_records(self, body_setup):
+        qm, _, _, _ = body_setup
+        snapshot, cached = qm._get_topology_snapshot()
+        assert not cached
+        assert [f["type"] for f in snapshot["faces"]] == ["plane", "cylinder", "plane"]
+        assert snapshot["faces"][1]["radius"] == 0.0015
+        # Shared edges are recorded once, with every face they bound
+        assert len(snapshot["edges"]) == 3
+        horizontal = snapshot["edges"][0]
+        assert horizontal["faces"] == [0, 2]
+        assert horizontal["direction"] == [0.03, 0, 0]
+        assert snapshot["edges"][1]["type"] == "circle"
+        assert snapshot["faces"][0]["adjacent"] == [1, 2]
+
+    def test_reused_until_body_changes(self, body_setup):
+        qm, _, _, faces = body_setup
+        first, _ = qm._get_topology_snapshot()
+        again, cached = qm._get_topology_snapshot()
+        assert cached and again is first
+        faces[1].Area = 3e-4
+        _, cached = qm._get_topology_snapshot()
+        assert not cached
+
+    def test_refresh(self, body_setup):
+        qm, _, _, _ = body_setup
+        qm._get_topology_snapshot()
+        assert not qm._get_topology_snapshot(refresh=True)[1]
+
+
+class TestSelectTopology:
+    def test_edges_with_refs(self, body_setup):
+        qm, _, _, _ = body_setup
+        result = qm.select_topology("edges where type=line and parallel to Z and length>10mm")
+        assert result["indices"] == [2]
+        assert result["edges"] == [[2, 0]]
+        assert result["snapshot"]["edges"] == 3
+
+    def test_faces(self, body_setup):
+        qm, _, _, _ = body_setup
+        result = qm.select_topology("faces of type cylinder with radius<3mm")
+        assert result["indices"] == [1]
+        assert "edges" not in result
+
+    def test_details(self, body_setup):
+        qm, _, _, _ = body_setup
+        result = qm.select_topology("edges circle", include_details=True)
+        assert result["details"][0]["radius"] == 0.0015
+
+    def test_second_query_uses_cache(self, body_setup):
+        qm, _, _, faces = body_setup
+        qm.select_topology("faces")
+        calls = faces[0].Geometry.GetPlaneData.call_count
+        result = qm.select_topology("faces plane")
+        assert result["snapshot"]["cached"]
+        assert faces[0].Geometry.GetPlaneData.call_count == calls
+
+    def test_add_to_select_set(self, body_setup):
+        qm, dm, doc, faces = body_setup
+        doc.SelectSet.Count = 2
+        result = qm.select_topology("faces plane", add_to_select_set=True)
+        assert result["selected"] == 2
+        doc.SelectSet.Add.assert_any_call(faces[0])
+        doc.SelectSet.Add.assert_any_call(faces[2])
+        dm.connection.performance_scope.assert_called_once_with()
+
+    def test_add_edges_to_select_set(self, body_setup):
+        qm, _, doc, faces = body_setup
+        qm.select_topology("edges circle", add_to_select_set=True)
+        doc.SelectSet.Add.assert_called_once_with(faces[0].Edges.Item(2))
+
+    def test_invalid_selector(self, body_setup):
+        qm, _, _, faces = body_setup
+        result = qm.select_topology("edges type=cylinder")
+        assert "Invalid selector" in result["error"]
+        faces[0].Geometry.GetPlaneData.assert_not_called()
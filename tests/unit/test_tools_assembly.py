@@ -8,7 +8,9 @@ from solidedge_mcp.tools.assembly import (
     add_assembly_component,
     add_assembly_constraint,
     add_assembly_relation,
+    analyze_relations,
     assembly_feature,
+    generate_path_members,
     manage_component,
     manage_relation,
     query_component,
@@ -46,6 +48,7 @@ class TestAddAssemblyComponent:
         ("by_template", "add_by_template"),
         ("adjustable", "add_adjustable_part"),
         ("tube", "add_tube"),
+        ("batch", "place_components_batch"),
     ])
     def test_dispatch(self, mock_mgr, disc, method):
         getattr(mock_mgr, method).return_value = {"status": "ok"}
@@ -63,6 +66,12 @@ class TestAddAssemblyComponent:
         add_assembly_component(method="tube", file_path="tube.par")
         mock_mgr.add_tube.assert_called_once_with([], "tube.par")
 
+    def test_batch_passes_pattern(self, mock_mgr):
+        mock_mgr.place_components_batch.return_value = {"status": "placed"}
+        spec = {"type": "linear", "count": 3, "spacing": 0.01}
+        add_assembly_component(method="batch", file_path="s.par", pattern=spec)
+        mock_mgr.place_components_batch.assert_called_once_with("s.par", None, spec, None)
+
     def test_unknown(self, mock_mgr):
         result = add_assembly_component(method="bogus")
         assert "error" in result
@@ -81,6 +90,7 @@ class TestManageComponent:
         ("ground", "ground_component"),
         ("pattern", "pattern_component"),
         ("mirror", "mirror_component"),
+        ("activate", "set_occurrence_activation"),
     ])
     def test_dispatch(self, mock_mgr, disc, method):
         getattr(mock_mgr, method).return_value = {"status": "ok"}
@@ -92,6 +102,16 @@ class TestManageComponent:
         result = manage_component(action="bogus")
         assert "error" in result
 
+    def test_activate_indices(self, mock_mgr):
+        mock_mgr.set_occurrence_activation.return_value = {"status": "ok"}
+        manage_component(action="activate", component_indices=[1, 2], active=False)
+        mock_mgr.set_occurrence_activation.assert_called_once_with([1, 2], False)
+
+    def test_activate_all(self, mock_mgr):
+        mock_mgr.set_occurrence_activation.return_value = {"status": "ok"}
+        manage_component(action="activate", component_indices=[])
+        mock_mgr.set_occurrence_activation.assert_called_once_with(None, True)
+
 
 # === query_component ===
 
@@ -117,6 +137,7 @@ class TestQueryComponent:
         ("occurrence", "get_occurrence"),
         ("interference", "check_interference"),
         ("tube", "get_tube"),
+        ("load_state", "get_occurrence_load_state"),
     ])
     def test_dispatch(self, mock_mgr, disc, method):
         getattr(mock_mgr, method).return_value = {"status": "ok"}
@@ -321,6 +342,45 @@ class TestManageRelation:
         assert "error" in result
 
 
+# === analyze_relations ===
+
+class TestAnalyzeRelations:
+    @pytest.mark.parametrize("disc, method", [
+        ("graph", "get_relation_graph"),
+        ("dof", "get_relation_dof"),
+        ("redundant", "find_redundant_relations"),
+        ("rigid_groups", "get_rigid_groups"),
+    ])
+    def test_dispatch(self, mock_mgr, disc, method):
+        getattr(mock_mgr, method).return_value = {"status": "ok"}
+        result = analyze_relations(query=disc)
+        getattr(mock_mgr, method).assert_called_once()
+        assert result == {"status": "ok"}
+
+    def test_dof_all_components_by_default(self, mock_mgr):
+        analyze_relations(query="dof")
+        mock_mgr.get_relation_dof.assert_called_once_with(None)
+
+    def test_unknown(self, mock_mgr):
+        result = analyze_relations(query="bogus")
+        assert "error" in result
+
+
+# === generate_path_members ===
+
+class TestGeneratePathMembers:
+    def test_passes_args(self, mock_mgr):
+        mock_mgr.generate_path_members.return_value = {"status": "ok"}
+        segs = [[[0, 0, 0], [1, 0, 0]]]
+        result = generate_path_members(
+            kind="tube", part_filename="t.par", segments=segs, tolerance=1e-4
+        )
+        assert result == {"status": "ok"}
+        mock_mgr.generate_path_members.assert_called_once_with(
+            "tube", "t.par", segs, None, None, None, "", None, None, None, 1e-4, ""
+        )
+
+
 # === assembly_feature ===
 
 class TestAssemblyFeature:
@@ -12,6 +12,7 @@ from solidedge_mcp.tools.documents import (
     open_document,
     save_document,
     undo_redo,
+    where_used,
 )
 
 
@@ -56,6 +57,7 @@ class TestOpenDocument:
         ("background", "open_in_background"),
         ("with_template", "open_with_template"),
         ("dialog", "open_with_file_open_dialog"),
+        ("lightweight", "open_assembly_lightweight"),
     ])
     def test_dispatch(self, mock_mgr, disc, method):
         getattr(mock_mgr, method).return_value = {"status": "ok"}
@@ -77,6 +79,50 @@ class TestOpenDocument:
         open_document(method="with_template", file_path="f.par", template="t.par")
         mock_mgr.open_with_template.assert_called_once_with("f.par", "t.par")
 
+    def test_lightweight_passes_options(self, mock_mgr):
+        mock_mgr.open_assembly_lightweight.return_value = {"status": "ok"}
+        open_document(
+            method="lightweight",
+            file_path="a.asm",
+            activation="last_saved",
+            simplification="designed",
+            background=False,
+        )
+        mock_mgr.open_assembly_lightweight.assert_called_once_with(
+            "a.asm", "last_saved", "designed", False
+        )
+
+
+# === where_used ===
+
+class TestWhereUsed:
+    @pytest.fixture
+    def mock_index(self, monkeypatch):
+        index = MagicMock()
+        monkeypatch.setattr("solidedge_mcp.tools.documents.where_used_index", index)
+        return index
+
+    @pytest.mark.parametrize("disc, method", [
+        ("scan", "scan"),
+        ("parents", "where_used"),
+        ("children", "uses"),
+        ("by_name", "find_by_name"),
+        ("status", "get_status"),
+    ])
+    def test_dispatch(self, mock_index, disc, method):
+        getattr(mock_index, method).return_value = {"status": "ok"}
+        result = where_used(action=disc)
+        getattr(mock_index, method).assert_called_once()
+        assert result == {"status": "ok"}
+
+    def test_unknown(self, mock_index):
+        result = where_used(action="bogus")
+        assert "error" in result
+
+    def test_scan_passes_args(self, mock_index):
+        where_used(action="scan", root="C:/lib", extensions=["asm"], background=False)
+        mock_index.scan.assert_called_once_with("C:/lib", ["asm"], False)
+
 
 # === close_document ===
 
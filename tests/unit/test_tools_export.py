@@ -7,21 +7,31 @@ import pytest
 from solidedge_mcp.tools.export import (
     add_2d_dimension,
     add_annotation,
+    add_annotations_bulk,
     add_dimension_annotation,
     add_drawing_view,
     add_smart_frame,
     add_symbol_annotation,
+    auto_balloon,
     camera_control,
     create_table,
+    dimension_report,
     display_control,
     draft_config,
+    draft_snapshot,
+    draft_templates,
     export_file,
+    generate_drawings,
     manage_annotation_data,
     manage_drawing_view,
     manage_sheet,
     print_control,
+    print_queue,
+    publish_drafts,
     query_sheet,
+    schedule_view_updates,
     set_camera,
+    sync_parts_list,
 )
 
 
@@ -54,6 +64,7 @@ class TestExportFile:
         ("prc", "export_to_prc"),
         ("plmxml", "export_to_plmxml"),
         ("image", "capture_screenshot"),
+        ("gltf", "export_to_gltf"),
     ])
     def test_dispatch(self, mock_export, mock_view, disc, method):
         getattr(mock_export, method).return_value = {"status": "ok"}
@@ -71,6 +82,11 @@ class TestExportFile:
         export_file(format="image", file_path="out.png", width=1920, height=1080)
         mock_export.capture_screenshot.assert_called_once_with("out.png", 1920, 1080)
 
+    def test_gltf_passes_options(self, mock_export, mock_view):
+        mock_export.export_to_gltf.return_value = {"status": "ok"}
+        export_file(format="gltf", file_path="out.glb", tolerance=0.001, include_colors=False)
+        mock_export.export_to_gltf.assert_called_once_with("out.glb", 0.001, False)
+
     def test_unknown(self, mock_export, mock_view):
         result = export_file(format="bogus")
         assert "error" in result
@@ -449,3 +465,237 @@ class TestCreateTable:
     def test_unknown(self, mock_export, mock_view):
         result = create_table(type="bogus")
         assert "error" in result
+
+
+# === draft_snapshot ===
+
+class TestDraftSnapshot:
+    @pytest.mark.parametrize("disc, method", [
+        ("summary", "get_draft_snapshot_summary"),
+        ("query", "query_draft_snapshot"),
+        ("clear", "clear_draft_snapshot"),
+    ])
+    def test_dispatch(self, mock_export, mock_view, disc, method):
+        getattr(mock_export, method).return_value = {"status": "ok"}
+        result = draft_snapshot(action=disc)
+        getattr(mock_export, method).assert_called_once()
+        assert result == {"status": "ok"}
+
+    def test_query_forwards_paging(self, mock_export, mock_view):
+        draft_snapshot(action="query", table="views", filters={"sheet": 1}, offset=5, limit=2)
+        mock_export.query_draft_snapshot.assert_called_once_with(
+            "views", {"sheet": 1}, None, 5, 2, False
+        )
+
+    def test_unknown(self, mock_export, mock_view):
+        result = draft_snapshot(action="bogus")
+        assert "error" in result
+
+
+# === schedule_view_updates ===
+
+class TestScheduleViewUpdates:
+    @pytest.mark.parametrize("disc, method", [
+        ("status", "get_view_update_status"),
+        ("flush", "flush_view_updates"),
+        ("update_stale", "update_stale_views"),
+    ])
+    def test_dispatch(self, mock_export, mock_view, disc, method):
+        getattr(mock_export, method).return_value = {"status": "ok"}
+        result = schedule_view_updates(action=disc)
+        getattr(mock_export, method).assert_called_once()
+        assert result == {"status": "ok"}
+
+    def test_request(self, mock_export, mock_view):
+        schedule_view_updates(action="request", view_indices=[0, 2], sheet_index=1)
+        mock_export.request_view_updates.assert_called_once_with([0, 2], 1)
+
+    def test_request_requires_views(self, mock_export, mock_view):
+        result = schedule_view_updates(action="request")
+        assert "error" in result
+        mock_export.request_view_updates.assert_not_called()
+
+    def test_unknown(self, mock_export, mock_view):
+        result = schedule_view_updates(action="bogus")
+        assert "error" in result
+
+
+# === generate_drawings ===
+
+class TestGenerateDrawings:
+    @pytest.fixture
+    def no_validation(self, monkeypatch):
+        monkeypatch.setattr(
+            "solidedge_mcp.tools.export.validate_path", lambda p, **kw: (p, None)
+        )
+
+    def test_inline_layout(self, mock_export, mock_view, no_validation):
+        mock_export.generate_drawings.return_value = {"status": "completed"}
+        layout = {"views": [{"orientation": "Front", "x": 0.1, "y": 0.1}]}
+        result = generate_drawings(["a.par"], "out", layout=layout, export_pdf=True)
+        mock_export.generate_drawings.assert_called_once_with(
+            ["a.par"], "out", layout, True, False, None
+        )
+        assert result == {"status": "completed"}
+
+    def test_layout_path_and_results(self, mock_export, mock_view, no_validation):
+        generate_drawings(["a.asm"], "out", layout_path="l.json", results_path="r.jsonl")
+        mock_export.generate_drawings.assert_called_once_with(
+            ["a.asm"], "out", "l.json", False, False, "r.jsonl"
+        )
+
+    def test_invalid_model_path(self, mock_export, mock_view, monkeypatch):
+        monkeypatch.setattr(
+            "solidedge_mcp.tools.export.validate_path",
+            lambda p, **kw: (p, {"error": "bad"} if p == "x.par" else None),
+        )
+        result = generate_drawings(["x.par"], "out")
+        assert result == {"error": "bad"}
+        mock_export.generate_drawings.assert_not_called()
+
+
+# === add_annotations_bulk ===
+
+class TestAddAnnotationsBulk:
+    def test_forwards(self, mock_export, mock_view):
+        mock_export.add_annotations_bulk.return_value = {"status": "added"}
+        specs = [{"type": "center_mark", "x": 0.1, "y": 0.1}]
+        result = add_annotations_bulk(specs, sheet_index=1, view_index=0)
+        mock_export.add_annotations_bulk.assert_called_once_with(specs, 1, 0, False)
+        assert result == {"status": "added"}
+
+
+# === auto_balloon ===
+
+class TestAutoBalloon:
+    @pytest.fixture(autouse=True)
+    def no_validation(self, monkeypatch):
+        monkeypatch.setattr(
+            "solidedge_mcp.tools.export.validate_numerics", lambda **kw: None
+        )
+
+    def test_forwards(self, mock_export, mock_view):
+        mock_export.auto_balloon_view.return_value = {"status": "placed"}
+        items = [{"text": "1", "x": 0.1, "y": 0.1}]
+        result = auto_balloon(items, view_index=1, dry_run=True)
+        mock_export.auto_balloon_view.assert_called_once_with(
+            1, items, None, 0.004, 0.002, 0.01, 4, None, True
+        )
+        assert result == {"status": "placed"}
+
+    def test_bad_radius(self, mock_export, mock_view):
+        result = auto_balloon([{"x": 0, "y": 0}], radius=0)
+        assert "error" in result
+        mock_export.auto_balloon_view.assert_not_called()
+
+
+class TestPublishDrafts:
+    @pytest.fixture(autouse=True)
+    def no_validation(self, monkeypatch):
+        monkeypatch.setattr(
+            "solidedge_mcp.tools.export.validate_path", lambda p, **kw: (p, None)
+        )
+
+    def test_forwards(self, mock_export, mock_view):
+        mock_export.publish_drafts.return_value = {"status": "completed"}
+        result = publish_drafts(
+            ["rel/*.dft"], "out", formats=["pdf", "dxf"], sheets=[0], package_name="R1", workers=2
+        )
+        mock_export.publish_drafts.assert_called_once_with(
+            ["rel/*.dft"], "out", ["pdf", "dxf"], [0], False, "R1", 2, 8, True
+        )
+        assert result == {"status": "completed"}
+
+    def test_no_package(self, mock_export, mock_view):
+        publish_drafts(["a.dft"], "out")
+        assert mock_export.publish_drafts.call_args.args[5] is None
+
+
+class TestPrintQueue:
+    @pytest.fixture
+    def spooler(self, monkeypatch):
+        pq = MagicMock()
+        monkeypatch.setattr("solidedge_mcp.tools.export.print_spooler", pq)
+        monkeypatch.setattr(
+            "solidedge_mcp.tools.export.validate_path", lambda p, **kw: (p, None)
+        )
+        monkeypatch.setattr(
+            "solidedge_mcp.tools.export.validate_numerics", lambda **kw: None
+        )
+        return pq
+
+    def test_submit(self, spooler):
+        print_queue(
+            "submit",
+            documents=["a.dft", {"path": "b.dft", "copies": 3}],
+            printer_name="Plotter",
+            paper_width=0.42,
+            paper_height=0.297,
+        )
+        spooler.submit.assert_called_once_with(
+            ["a.dft", {"path": "b.dft", "copies": 3}],
+            "Plotter",
+            1,
+            True,
+            {"width": 0.42, "height": 0.297, "orientation": "Landscape"},
+        )
+
+    def test_status_and_cancel(self, spooler):
+        print_queue("status")
+        spooler.get_status.assert_called_once()
+        print_queue("cancel", job_ids=[4])
+        spooler.cancel.assert_called_once_with([4])
+
+    def test_unknown_action(self, spooler):
+        assert "error" in print_queue("pause")
+
+
+class TestDimensionReport:
+    @pytest.fixture(autouse=True)
+    def no_validation(self, monkeypatch):
+        monkeypatch.setattr(
+            "solidedge_mcp.tools.export.validate_path", lambda p, **kw: (p, None)
+        )
+
+    def test_active_draft(self, mock_export, mock_view):
+        dimension_report("report.csv")
+        mock_export.export_dimension_report.assert_called_once_with(
+            "report.csv", None, None, 1, False, False, False
+        )
+
+    def test_many_drafts(self, mock_export, mock_view):
+        dimension_report("r.jsonl", drafts=["vault/**/*.dft"], start_number=10, append=True)
+        mock_export.export_dimension_report.assert_called_once_with(
+            "r.jsonl", ["vault/**/*.dft"], None, 10, False, False, True
+        )
+
+
+class TestSyncPartsList:
+    def test_forwards(self, mock_export, mock_view):
+        mock_export.sync_parts_list.return_value = {"status": "in_sync"}
+        assert sync_parts_list(dry_run=True) == {"status": "in_sync"}
+        mock_export.sync_parts_list.assert_called_once_with(0, None, None, None, True)
+
+    def test_columns(self, mock_export, mock_view):
+        sync_parts_list(1, sheet_index=2, key_column="Part Number", quantity_column="Qty")
+        mock_export.sync_parts_list.assert_called_once_with(1, 2, "Part Number", "Qty", False)
+
+
+class TestDraftTemplates:
+    def test_place_symbols(self, mock_export, mock_view, monkeypatch):
+        monkeypatch.setattr(
+            "solidedge_mcp.tools.export.validate_path", lambda p, **kw: (p, None)
+        )
+        specs = [{"file_path": "weld.sym", "x": 0.1, "y": 0.1}]
+        draft_templates("place_symbols", symbols=specs, sheet_index=1)
+        mock_export.place_symbols_bulk.assert_called_once_with(specs, 1)
+
+    def test_place_frames_and_clear(self, mock_export, mock_view):
+        frames = [{"style": "A3", "x1": 0, "y1": 0, "x2": 0.42, "y2": 0.297}]
+        draft_templates("place_frames", frames=frames)
+        mock_export.place_smart_frames_bulk.assert_called_once_with(frames, None)
+        draft_templates("clear", max_entries=8)
+        mock_export.clear_template_cache.assert_called_once_with(8)
+
+    def test_unknown_action(self, mock_export, mock_view):
+        assert "error" in draft_templates("preload")
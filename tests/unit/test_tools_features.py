@@ -507,6 +507,25 @@ class TestCreateRound:
         result = create_round(method="bogus")
         assert "error" in result
 
+    def test_edges(self, mock_mgr):
+        mock_mgr.create_rounds_bulk.return_value = {"status": "created"}
+        result = create_round(method="edges", edges=[[0, 1]], radii=[0.002])
+        mock_mgr.create_rounds_bulk.assert_called_once_with([[0, 1]], radii=[0.002])
+        assert result == {"status": "created"}
+
+    def test_edges_from_selector(self, mock_mgr, monkeypatch):
+        qm = MagicMock()
+        qm.select_topology.return_value = {"edges": [[2, 0], [3, 1]]}
+        monkeypatch.setattr("solidedge_mcp.tools.features._rounds_chamfers.query_manager", qm)
+        create_round(method="edges", selector="edges of type circle", radius=0.001)
+        qm.select_topology.assert_called_once_with("edges of type circle")
+        mock_mgr.create_rounds_bulk.assert_called_once_with([[2, 0], [3, 1]], radius=0.001)
+
+    def test_edges_needs_edge_set(self, mock_mgr):
+        result = create_round(method="edges", radius=0.001)
+        assert "error" in result
+        mock_mgr.create_rounds_bulk.assert_not_called()
+
 
 # === create_chamfer ===
 
@@ -528,6 +547,20 @@ class TestCreateChamfer:
         result = create_chamfer(method="bogus")
         assert "error" in result
 
+    def test_edges(self, mock_mgr):
+        mock_mgr.create_chamfers_bulk.return_value = {"status": "created"}
+        result = create_chamfer(method="edges", edges=[[0, 1], [0, 2]], distance=0.001)
+        mock_mgr.create_chamfers_bulk.assert_called_once_with([[0, 1], [0, 2]], distance=0.001)
+        assert result == {"status": "created"}
+
+    def test_edges_selector_must_select_edges(self, mock_mgr, monkeypatch):
+        qm = MagicMock()
+        qm.select_topology.return_value = {"indices": [0]}
+        monkeypatch.setattr("solidedge_mcp.tools.features._rounds_chamfers.query_manager", qm)
+        result = create_chamfer(method="edges", selector="faces of type plane", distance=0.001)
+        assert "error" in result
+        mock_mgr.create_chamfers_bulk.assert_not_called()
+
 
 # === create_blend ===
 
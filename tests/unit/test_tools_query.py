@@ -5,7 +5,10 @@ from unittest.mock import MagicMock
 import pytest
 
 from solidedge_mcp.tools.query import (
+    analyze_draft,
+    analyze_wall_thickness,
     edit_feature_extent,
+    manage_facet_cache,
     manage_feature_tree,
     manage_layer,
     manage_material,
@@ -13,11 +16,14 @@ from solidedge_mcp.tools.query import (
     manage_variable,
     measure,
     query_body,
+    query_body_batch,
     query_bspline,
     query_edge,
     query_face,
     recompute,
+    sample_faces,
     select_set,
+    select_topology,
     set_appearance,
 )
 
@@ -381,3 +387,83 @@ class TestRecompute:
     def test_unknown(self, mock_mgr):
         result = recompute(scope="bogus")
         assert "error" in result
+
+
+# === query_body_batch ===
+
+class TestQueryBodyBatch:
+    def test_rays(self, mock_mgr):
+        mock_mgr.get_faces_by_rays.return_value = {"hits": []}
+        rays = [0, 0, -1, 0, 0, 1]
+        result = query_body_batch(property="faces_by_rays", values=rays, method="mesh",
+                                  first_hit_only=True)
+        mock_mgr.get_faces_by_rays.assert_called_once_with(rays, "mesh", True, 0.0)
+        assert result == {"hits": []}
+
+    def test_points(self, mock_mgr):
+        mock_mgr.are_points_inside_body.return_value = {"inside": [1]}
+        query_body_batch(property="points_inside", values=[0.1, 0.1, 0.1], tolerance=0.001)
+        mock_mgr.are_points_inside_body.assert_called_once_with([0.1, 0.1, 0.1], "com", 0.001)
+
+    def test_unknown(self, mock_mgr):
+        result = query_body_batch(property="bogus", values=[])
+        assert "error" in result
+
+
+# === sample_faces ===
+
+class TestSampleFaces:
+    def test_passes_grid(self, mock_mgr):
+        mock_mgr.sample_face_properties.return_value = {"faces": []}
+        result = sample_faces(face_indices=[2], grid_u=8, grid_v=4, properties=["normal"])
+        mock_mgr.sample_face_properties.assert_called_once_with([2], [8, 4], None, ["normal"])
+        assert result == {"faces": []}
+
+
+# === analyze_draft ===
+
+class TestAnalyzeDraft:
+    def test_passes_arguments(self, mock_mgr):
+        mock_mgr.analyze_draft.return_value = {"faces": []}
+        result = analyze_draft(pull_direction=[1, 0, 0], min_draft=2.0, color_faces=True)
+        mock_mgr.analyze_draft.assert_called_once_with([1, 0, 0], 2.0, True, 0.0, True, True)
+        assert result == {"faces": []}
+
+
+# === analyze_wall_thickness ===
+
+class TestAnalyzeWallThickness:
+    def test_passes_arguments(self, mock_mgr):
+        mock_mgr.analyze_wall_thickness.return_value = {"faces": []}
+        result = analyze_wall_thickness(min_thickness=0.002, face_indices=[1], workers=4)
+        mock_mgr.analyze_wall_thickness.assert_called_once_with(
+            0.002, [1], 50_000, 20, 0.0, 4
+        )
+        assert result == {"faces": []}
+
+
+# === select_topology ===
+
+class TestSelectTopology:
+    def test_passes_selector(self, mock_mgr):
+        mock_mgr.select_topology.return_value = {"indices": [1]}
+        result = select_topology("faces cylinder", add_to_select_set=True)
+        mock_mgr.select_topology.assert_called_once_with("faces cylinder", False, False, True)
+        assert result == {"indices": [1]}
+
+
+# === manage_facet_cache ===
+
+class TestManageFacetCache:
+    @pytest.mark.parametrize("disc, method", [
+        ("status", "get_facet_cache_status"),
+        ("clear", "clear_facet_cache"),
+    ])
+    def test_dispatch(self, mock_mgr, disc, method):
+        getattr(mock_mgr, method).return_value = {"status": "ok"}
+        result = manage_facet_cache(disc)
+        getattr(mock_mgr, method).assert_called_once()
+        assert result == {"status": "ok"}
+
+    def test_unknown(self, mock_mgr):
+        assert "error" in manage_facet_cache("bogus")
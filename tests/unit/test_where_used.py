@@ -0,0 +1,193 @@
+"""
+Unit tests for the where-used index backend.
+
+Tests WhereUsedIndex: incremental scanning (mtime/size caching, removal of
+deleted files), where-used / uses queries (direct and recursive), name-only
+lookup, and background scans. References are supplied by a fake reader in
+place of Revision Manager.
+"""
+
+import os
+
+import pytest
+
+from solidedge_mcp.backends.where_used import WhereUsedIndex
+
+
+@pytest.fixture
+def library(tmp_path):
+    """A small library: top.asm -> sub.asm -> (bolt.par, plate.par); top.dft -> top.asm."""
+    root = tmp_path / "lib"
+    (root / "sub").mkdir(parents=True)
+    files = {
+        "top.asm": ["sub/sub.asm", "bolt.par"],
+        "sub/sub.asm": ["bolt.par", "plate.par"],
+        "bolt.par": [],
+        "plate.par": [],
+        "top.dft": ["top.asm"],
+    }
+    for name in files:
+        (root / name).write_text(name)
+
+    links = {
+        os.path.normcase(str(root / name)): [str(root / c) for c in children]
+        for name, children in files.items()
+    }
+    calls = []
+
+    def reader(path):
+        calls.append(os.path.basename(path))
+        return links[os.path.normcase(path)]
+
+    index = WhereUsedIndex(str(tmp_path / "index.sqlite"), reader)
+    return index, root, links, calls
+
+
+def _names(items):
+    return sorted(os.path.basename(i["path"]) for i in items)
+
+
+# ============================================================================
+# SCAN
+# ============================================================================
+
+
+class TestScan:
+    def test_initial_scan(self, library):
+        index, root, _, calls = library
+        result = index.scan(str(root), background=False)
+        assert result["status"] == "scanned"
+        assert result["seen"] == 5
+        assert result["updated"] == 5
+        assert len(calls) == 5
+
+    def test_rescan_skips_unchanged(self, library):
+        index, root, _, calls = library
+        index.scan(str(root), background=False)
+        calls.clear()
+        result = index.scan(str(root), background=False)
+        assert result["unchanged"] == 5
+        assert result["updated"] == 0
+        assert calls == []
+
+    def test_rescan_reads_only_changed(self, library):
+        index, root, links, calls = library
+        index.scan(str(root), background=False)
+        calls.clear()
+
+        bolt = root / "bolt.par"
+        links[os.path.normcase(str(root / "top.asm"))] = [str(root / "plate.par")]
+        top = root / "top.asm"
+        top.write_text("top.asm changed")
+        os.utime(top, (1, 1))
+
+        result = index.scan(str(root), background=False)
+        assert result["updated"] == 1
+        assert calls == ["top.asm"]
+        assert _names(index.where_used(str(bolt))["used_by"]) == ["sub.asm"]
+
+    def test_deleted_file_removed(self, library):
+        index, root, _, _ = library
+        index.scan(str(root), background=False)
+        (root / "top.dft").unlink()
+        result = index.scan(str(root), background=False)
+        assert result["removed"] == 1
+        assert index.where_used(str(root / "top.asm"))["count"] == 0
+
+    def test_read_error_recorded_and_retried(self, library):
+        index, root, _, calls = library
+
+        def failing(path):
+            calls.append(os.path.basename(path))
+            raise RuntimeError("locked")
+
+        index._reader = failing
+        result = index.scan(str(root), background=False)
+        assert result["errors"] == 5
+        assert index.get_status()["read_errors"] == 5
+
+        calls.clear()
+        index.scan(str(root), background=False)
+        assert len(calls) == 5
+
+    def test_extension_filter(self, library):
+        index, root, _, _ = library
+        result = index.scan(str(root), extensions=["asm"], background=False)
+        assert result["seen"] == 2
+
+    def test_extension_filter_keeps_other_files(self, library):
+        index, root, _, _ = library
+        index.scan(str(root), background=False)
+        result = index.scan(str(root), extensions=["asm"], background=False)
+        assert result["removed"] == 0
+        assert index.get_status()["files"] == 5
+
+    def test_overlapping_roots_skip_unchanged(self, library):
+        index, root, _, calls = library
+        index.scan(str(root / "sub"), background=False)
+        index.scan(str(root), background=False)
+        calls.clear()
+        result = index.scan(str(root / "sub"), background=False)
+        assert result["unchanged"] == 1
+        assert calls == []
+        result = index.scan(str(root), background=False)
+        assert result["unchanged"] == 5
+        assert calls == []
+
+    def test_missing_root(self, library, tmp_path):
+        index, _, _, _ = library
+        result = index.scan(str(tmp_path / "nope"))
+        assert "error" in result
+
+    def test_background_scan(self, library):
+        index, root, _, _ = library
+        result = index.scan(str(root), background=True)
+        assert result["status"] == "started"
+        assert index.wait(timeout=10)
+        status = index.get_status()
+        assert status["scan"]["state"] == "idle"
+        assert status["scan"]["last_scan"]["updated"] == 5
+        assert status["files"] == 5
+
+
+# ============================================================================
+# QUERIES
+# ============================================================================
+
+
+class TestQueries:
+    @pytest.fixture
+    def scanned(self, library):
+        index, root, _, _ = library
+        index.scan(str(root), background=False)
+        return index, root
+
+    def test_where_used_direct(self, scanned):
+        index, root = scanned
+        result = index.where_used(str(root / "bolt.par"))
+        assert _names(result["used_by"]) == ["sub.asm", "top.asm"]
+        assert all(i["depth"] == 1 and i["indexed"] for i in result["used_by"])
+
+    def test_where_used_recursive(self, scanned):
+        index, root = scanned
+        result = index.where_used(str(root / "plate.par"), recursive=True)
+        depths = {os.path.basename(i["path"]): i["depth"] for i in result["used_by"]}
+        assert depths == {"sub.asm": 1, "top.asm": 2, "top.dft": 3}
+
+    def test_uses_recursive_takes_shortest_depth(self, scanned):
+        index, root = scanned
+        result = index.uses(str(root / "top.asm"), recursive=True)
+        depths = {os.path.basename(i["path"]): i["depth"] for i in result["uses"]}
+        assert depths == {"bolt.par": 1, "sub.asm": 1, "plate.par": 2}
+
+    def test_find_by_name(self, scanned):
+        index, _ = scanned
+        result = index.find_by_name(r"D:\other\machine\PLATE.par")
+        assert _names(result["used_by"]) == ["sub.asm"]
+
+    def test_status(self, scanned):
+        index, _ = scanned
+        status = index.get_status()
+        assert status["files"] == 5
+        assert status["references"] == 5
+        assert len(status["roots"]) == 1